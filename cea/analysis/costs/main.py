@@ -14,11 +14,13 @@ Data sources (sole source of truth):
 import os
 from math import log, ceil
 
+import numpy as np
 import pandas as pd
 
 import cea.config
 from cea.inputlocator import InputLocator
 from cea.analysis.costs.equations import calc_capex_annualized
+from cea.technologies.component_catalog import calc_cost_curves, get_catalog
 from cea.technologies.components import get_component_table
 from cea.technologies.energy_carriers import electricity_carrier
 
@@ -39,7 +41,8 @@ def _get_component_row(component_code, locator, capacity_W=None):
     to discover which CSV owns this code (scans every file under
     ``COMPONENTS/CONVERSION/``), then picks the piecewise-cost-curve
     segment matching ``capacity_W`` if the table has multiple rows per
-    code.
+    code. The rows come from the in-memory component catalog, so no CSV
+    is read per lookup.
     """
     table_name = get_component_table(component_code, locator)
     if table_name is None:
@@ -48,9 +51,7 @@ def _get_component_row(component_code, locator, capacity_W=None):
             f"COMPONENTS/CONVERSION/. Check the supply assembly for a typo, "
             f"or add a row for this code to the appropriate table."
         )
-    path = locator.get_db4_components_conversion_conversion_technology_csv(table_name)
-    df = pd.read_csv(path)
-    rows = df[df['code'] == component_code]
+    rows = get_catalog(locator).component_rows(table_name, component_code)
     if rows.empty:
         return None, table_name
     if capacity_W is None or len(rows) == 1:
@@ -130,11 +131,8 @@ def _mean_feedstock_price(carrier, locator):
     from cea.technologies.energy_carriers import available_carriers
     if carrier not in available_carriers(locator):
         return 0.0
-    path = locator.get_db4_components_feedstocks_feedstocks_csv(carrier)
-    if not os.path.exists(path):
-        return 0.0
-    df = pd.read_csv(path)
-    if 'Opex_var_buy_USD2015kWh' not in df.columns:
+    df = get_catalog(locator).feedstock(carrier)
+    if df is None or 'Opex_var_buy_USD2015kWh' not in df.columns:
         return 0.0
     return float(df['Opex_var_buy_USD2015kWh'].mean())
 
@@ -709,6 +707,12 @@ def _calc_solar_costs_for_scenario(
     return component_rows
 
 
+def _solar_cost_curves(comp, quantities):
+    """Cost curves of one solar component for an array of quantities, 0 where the curve is undefined."""
+    costs = calc_cost_curves(comp.to_frame().T, quantities)
+    return tuple(np.where(np.isfinite(cost), cost, 0.0) for cost in costs)
+
+
 def _solar_pv_costs(df, panel_type, service_prefix, locator):
     """Calculate PV panel costs from total_buildings DataFrame."""
     rows = []
@@ -716,9 +720,7 @@ def _solar_pv_costs(df, panel_type, service_prefix, locator):
         return rows
 
     try:
-        pv_db = pd.read_csv(
-            locator.get_db4_components_conversion_conversion_technology_csv('PHOTOVOLTAIC_PANELS')
-        )
+        pv_db = get_catalog(locator).table('PHOTOVOLTAIC_PANELS')
         comp = pv_db[pv_db['code'] == panel_type]
         if comp.empty:
             # Fall back to first PV component
@@ -732,18 +734,12 @@ def _solar_pv_costs(df, panel_type, service_prefix, locator):
     module_area_m2 = comp.get('module_area_m2', 1.76)
     wp_per_m2 = capacity_Wp / module_area_m2 if module_area_m2 > 0 else 185.0
 
-    for _, brow in df.iterrows():
-        building_name = brow['name']
-        area_m2 = brow.get('area_PV_m2', 0.0) or 0.0
-        if area_m2 <= 0:
-            continue
-
-        capacity_W = area_m2 * wp_per_m2
-        try:
-            capex_total, capex_a, opex_fixed_a = _calc_cost_curve(capacity_W, comp)
-        except (ValueError, ZeroDivisionError):
-            capex_total, capex_a, opex_fixed_a = 0.0, 0.0, 0.0
+    installed = df[~(df['area_PV_m2'] <= 0)]
+    capacities_W = installed['area_PV_m2'].to_numpy(dtype=float) * wp_per_m2
+    costs = _solar_cost_curves(comp, capacities_W)
 
+    for building_name, capacity_W, capex_total, capex_a, opex_fixed_a in zip(installed['name'], capacities_W,
+                                                                              *costs):
         tac = capex_a + opex_fixed_a
         rows.append({
             'name': building_name, 'service': f'PV_{panel_type}', 'scale': 'BUILDING',
@@ -763,9 +759,7 @@ def _solar_sc_costs(df, panel_type, locator):
         return rows
 
     try:
-        sc_db = pd.read_csv(
-            locator.get_db4_components_conversion_conversion_technology_csv('SOLAR_COLLECTORS')
-        )
+        sc_db = get_catalog(locator).table('SOLAR_COLLECTORS')
         # Match by type field (e.g., 'ET' or 'FP')
         comp = sc_db[sc_db['type'] == panel_type]
         if comp.empty:
@@ -774,18 +768,12 @@ def _solar_sc_costs(df, panel_type, locator):
     except Exception:
         return rows
 
-    for _, brow in df.iterrows():
-        building_name = brow['name']
-        area_m2 = brow.get('area_SC_m2', 0.0) or 0.0
-        if area_m2 <= 0:
-            continue
-
-        # SC cost curve uses m² directly (unit = 'm2')
-        try:
-            capex_total, capex_a, opex_fixed_a = _calc_cost_curve(area_m2, comp)
-        except (ValueError, ZeroDivisionError):
-            capex_total, capex_a, opex_fixed_a = 0.0, 0.0, 0.0
+    installed = df[~(df['area_SC_m2'] <= 0)]
+    areas_m2 = installed['area_SC_m2'].to_numpy(dtype=float)
+    # SC cost curve uses m² directly (unit = 'm2')
+    costs = _solar_cost_curves(comp, areas_m2)
 
+    for building_name, area_m2, capex_total, capex_a, opex_fixed_a in zip(installed['name'], areas_m2, *costs):
         tac = capex_a + opex_fixed_a
         rows.append({
             'name': building_name, 'service': f'SC_{panel_type}', 'scale': 'BUILDING',
@@ -805,11 +793,7 @@ def _solar_pvt_costs(df, pv_type, sc_type, locator):
         return rows
 
     try:
-        pvt_db = pd.read_csv(
-            locator.get_db4_components_conversion_conversion_technology_csv(
-                'PHOTOVOLTAIC_THERMAL_PANELS'
-            )
-        )
+        pvt_db = get_catalog(locator).table('PHOTOVOLTAIC_THERMAL_PANELS')
         comp_rows = pvt_db[pvt_db['code'] == pv_type]
         if comp_rows.empty:
             comp_rows = pvt_db.head(1)
@@ -819,9 +803,7 @@ def _solar_pvt_costs(df, pv_type, sc_type, locator):
 
     # Use PV component to get Wp/m² ratio for area → W conversion
     try:
-        pv_db = pd.read_csv(
-            locator.get_db4_components_conversion_conversion_technology_csv('PHOTOVOLTAIC_PANELS')
-        )
+        pv_db = get_catalog(locator).table('PHOTOVOLTAIC_PANELS')
         pv_comp = pv_db[pv_db['code'] == pv_type]
         if pv_comp.empty:
             pv_comp = pv_db.head(1)
@@ -832,19 +814,13 @@ def _solar_pvt_costs(df, pv_type, sc_type, locator):
     except Exception:
         wp_per_m2 = 185.0
 
-    for _, brow in df.iterrows():
-        building_name = brow['name']
-        area_m2 = brow.get('area_PVT_m2', 0.0) or 0.0
-        if area_m2 <= 0:
-            continue
-
-        capacity_W = area_m2 * wp_per_m2
-        try:
-            capex_total, capex_a, opex_fixed_a = _calc_cost_curve(capacity_W, comp)
-        except (ValueError, ZeroDivisionError):
-            capex_total, capex_a, opex_fixed_a = 0.0, 0.0, 0.0
+    installed = df[~(df['area_PVT_m2'] <= 0)]
+    capacities_W = installed['area_PVT_m2'].to_numpy(dtype=float) * wp_per_m2
+    costs = _solar_cost_curves(comp, capacities_W)
 
-        service_label = f'PVT_{pv_type}_{sc_type}' if sc_type else f'PVT_{pv_type}'
+    service_label = f'PVT_{pv_type}_{sc_type}' if sc_type else f'PVT_{pv_type}'
+    for building_name, capacity_W, capex_total, capex_a, opex_fixed_a in zip(installed['name'], capacities_W,
+                                                                              *costs):
         tac = capex_a + opex_fixed_a
         rows.append({
             'name': building_name, 'service': service_label, 'scale': 'BUILDING',
@@ -21,6 +21,7 @@ __maintainer__ = "Reynold Mok"
 __email__ = "cea@arch.ethz.ch"
 __status__ = "Production"
 
+import collections
 import os
 import pandas as pd
 import numpy as np
@@ -57,7 +58,8 @@ _DECLARED_CARRIER_CODES = frozenset({
 def calculate_building_final_energy(
     building_name: str,
     locator: cea.inputlocator.InputLocator,
-    config: cea.config.Configuration
+    config: cea.config.Configuration,
+    supply_config: Optional[Dict] = None
 ) -> pd.DataFrame:
     """
     Calculate hourly final energy consumption by carrier for one building.
@@ -75,6 +77,8 @@ def calculate_building_final_energy(
     :param building_name: Name of the building (e.g., 'B1001')
     :param locator: InputLocator instance
     :param config: Configuration instance
+    :param supply_config: Supply configuration of the building as returned by
+        :func:`load_supply_configuration` (loaded here if not given)
     :return: DataFrame with columns: date, Qhs_sys_kWh, ..., scale, case, case_description
     """
     # Step 1: Read demand
@@ -97,7 +101,8 @@ def calculate_building_final_energy(
     })
 
     # Step 2: Load supply configuration
-    supply_config = load_supply_configuration(building_name, locator, config)
+    if supply_config is None:
+        supply_config = load_supply_configuration(building_name, locator, config)
 
     # Step 2b: SC-primary sanity checks — must happen before any
     # downstream dispatch since a bad configuration should fail fast
@@ -299,7 +304,9 @@ def calculate_building_final_energy(
 def load_supply_configuration(
     building_name: str,
     locator: cea.inputlocator.InputLocator,
-    config: cea.config.Configuration
+    config: cea.config.Configuration,
+    supply_db=None,
+    supply_df: Optional[pd.DataFrame] = None
 ) -> Dict:
     """
     Load supply system configuration for a building.
@@ -316,11 +323,13 @@ def load_supply_configuration(
     :param building_name: Name of the building
     :param locator: InputLocator instance
     :param config: Configuration instance
+    :param supply_db: Preloaded supply assemblies database (``Supply.from_locator``), read if not given
+    :param supply_df: Preloaded supply.csv indexed by building name (production mode), read if not given
     :return: Supply configuration dict
     """
     if config.final_energy.overwrite_supply_settings:
         # What-if mode: use config parameters
-        return load_whatif_supply_configuration(building_name, locator, config)
+        return load_whatif_supply_configuration(building_name, locator, config, supply_db=supply_db)
     else:
         # Production mode: use supply.csv
         # Warn if user has set parameters but overwrite is disabled
@@ -343,13 +352,48 @@ def load_supply_configuration(
                 UserWarning
             )
 
-        return load_production_supply_configuration(building_name, locator, config)
+        return load_production_supply_configuration(building_name, locator, config,
+                                                    supply_db=supply_db, supply_df=supply_df)
+
+
+def load_supply_configurations(
+    buildings,
+    locator: cea.inputlocator.InputLocator,
+    config: cea.config.Configuration
+) -> Tuple[Dict[str, Dict], Dict[str, str]]:
+    """
+    Load the supply configuration of every building, reading supply.csv and the supply assemblies database once.
+
+    :param buildings: Names of the buildings
+    :param locator: InputLocator instance
+    :param config: Configuration instance
+    :return: (supply configuration of each building, error message of each building that failed)
+    """
+    from cea.datamanagement.database.assemblies import Supply
+
+    supply_db = Supply.from_locator(locator)
+    supply_df = None
+    if not config.final_energy.overwrite_supply_settings:
+        supply_df = pd.read_csv(locator.get_building_supply()).set_index('name')
+
+    supply_configs = {}
+    errors = {}
+    for building_name in buildings:
+        try:
+            supply_configs[building_name] = load_supply_configuration(
+                building_name, locator, config, supply_db=supply_db, supply_df=supply_df
+            )
+        except Exception as e:
+            errors[building_name] = str(e)
+    return supply_configs, errors
 
 
 def load_production_supply_configuration(
     building_name: str,
     locator: cea.inputlocator.InputLocator,
-    config: cea.config.Configuration
+    config: cea.config.Configuration,
+    supply_db=None,
+    supply_df: Optional[pd.DataFrame] = None
 ) -> Dict:
     """
     Load supply configuration from supply.csv (production mode).
@@ -357,19 +401,23 @@ def load_production_supply_configuration(
     :param building_name: Name of the building
     :param locator: InputLocator instance
     :param config: Configuration instance
+    :param supply_db: Preloaded supply assemblies database, read if not given
+    :param supply_df: Preloaded supply.csv indexed by building name, read if not given
     :return: Supply configuration dict
     """
     from cea.datamanagement.database.assemblies import Supply
 
     # Read supply.csv
-    supply_df = pd.read_csv(locator.get_building_supply()).set_index('name')
+    if supply_df is None:
+        supply_df = pd.read_csv(locator.get_building_supply()).set_index('name')
     if building_name not in supply_df.index:
         raise ValueError(f"Building {building_name} not found in Building properties/Supply")
 
     building_supply = supply_df.loc[building_name]
 
     # Load supply database
-    supply_db = Supply.from_locator(locator)
+    if supply_db is None:
+        supply_db = Supply.from_locator(locator)
 
     # Get network name from config (if specified)
     network_name = config.final_energy.network_name
@@ -657,7 +705,8 @@ def map_fuel_code_to_carrier(fuel_code: str, locator) -> str:
 def load_whatif_supply_configuration(
     building_name: str,
     locator: cea.inputlocator.InputLocator,
-    config: cea.config.Configuration
+    config: cea.config.Configuration,
+    supply_db=None
 ) -> Dict:
     """
     Load supply configuration from config parameters (what-if mode).
@@ -671,12 +720,14 @@ def load_whatif_supply_configuration(
     :param building_name: Name of the building
     :param locator: InputLocator instance
     :param config: Configuration instance
+    :param supply_db: Preloaded supply assemblies database, read if not given
     :return: Supply configuration dict
     """
     from cea.datamanagement.database.assemblies import Supply
     from cea.analysis.final_energy.supply_validation import load_network_connectivity
 
-    supply_db = Supply.from_locator(locator)
+    if supply_db is None:
+        supply_db = Supply.from_locator(locator)
     network_name = config.final_energy.network_name
 
     supply_config = {
@@ -1114,230 +1165,415 @@ def calculate_plant_final_energy(
     return result
 
 
-def aggregate_buildings_summary(
-    building_dfs: Dict[str, pd.DataFrame],
-    plant_dfs: Dict[str, pd.DataFrame],
-    locator: cea.inputlocator.InputLocator
-) -> pd.DataFrame:
+# Demand (service) columns of the building final energy files, aggregated as-is
+_DEMAND_COLUMNS = ['Qhs_sys_kWh', 'Qww_sys_kWh', 'Qcs_sys_kWh', 'E_sys_kWh']
+
+# name: building name
+# annual: annual demand [MWh], peak demand and case information of the building
+# carrier_totals_MWh: annual final energy of each carrier [MWh]
+# hourly_kWh: hourly demand and carrier columns of the building, summed by carrier (8760 values each) [kWh]
+# date: the date column of the building (8760 values)
+BuildingFinalEnergySummary = collections.namedtuple('BuildingFinalEnergySummary',
+                                                    ['name', 'annual', 'carrier_totals_MWh', 'hourly_kWh', 'date'])
+
+
+def _hourly_carrier_of_building_column(col: str) -> Optional[str]:
     """
-    Aggregate hourly data to annual summary (final_energy_buildings.csv).
+    Map a carrier column of a building final energy file to the carrier it is aggregated under in the hourly
+    timeseries, or ``None`` if the column is not a delivered carrier.
+
+    Formats:
+      Qhs_sys_NATURALGAS_kWh          -> NATURALGAS
+      PV_{facade}_kWh                 -> PV
+      PVT_{collector}_{facade}_E_kWh  -> PV  (electrical)
+      PVT_{collector}_{facade}_Q_kWh  -> SOLAR  (thermal)
+      SC_{collector}_{facade}_Q_kWh   -> SOLAR
+    """
+    if not col.endswith('_kWh') or col in _DEMAND_COLUMNS or col == 'date':
+        return None
+    # Skip raw-irradiation columns — they record incident solar
+    # energy, not useful delivered energy, and must NEVER be
+    # counted as a delivered carrier. Matches the filter in
+    # cea.analysis.lca.emission_time_dependent.
+    if '_radiation_' in col:
+        return None
+    # Skip diagnostic *_dumped_kWh columns — SC tank surplus
+    # dumped at the T_MAX cap, not a delivered carrier.
+    if col.endswith('_dumped_kWh'):
+        return None
+
+    if '_sys_' in col or '_booster_' in col:
+        # Service/booster carrier: Qhs_sys_NATURALGAS_kWh -> NATURALGAS
+        parts = col.split('_')
+        return parts[2] if len(parts) >= 3 else col
+    elif col.startswith('PV_'):
+        return 'PV'
+    elif col.startswith('PVT_') and col.endswith('_E_kWh'):
+        return 'PV'
+    elif col.startswith('PVT_') and col.endswith('_Q_kWh'):
+        return 'SOLAR'
+    elif col.startswith('SC_'):
+        return 'SOLAR'
+    return None
 
-    :param building_dfs: Dict of building_name -> final_energy DataFrame
-    :param plant_dfs: Dict of plant_name -> final_energy DataFrame
-    :param locator: InputLocator instance
-    :return: Summary DataFrame with one row per building/plant
+
+def _hourly_carrier_of_plant_column(col: str) -> Optional[str]:
+    """Map a carrier column of a plant final energy file to its carrier, or ``None`` if it is not a carrier."""
+    if not col.endswith('_kWh') or col == 'date':
+        return None
+    # Plant columns format: plant_primary_DH_NATURALGAS_kWh, plant_tertiary_DC_GRID_kWh
+    if col.startswith('plant_primary_') or col.startswith('plant_tertiary_'):
+        parts = col.split('_')
+        return parts[3] if len(parts) >= 4 else (parts[2] if len(parts) >= 3 else col)
+    elif col.startswith('plant_pumping_'):
+        parts = col.split('_')
+        if len(parts) < 3:
+            return None
+        return parts[2]
+    return None
+
+
+def summarise_building_final_energy(building_name: str, df: pd.DataFrame) -> BuildingFinalEnergySummary:
     """
-    import geopandas as gpd
+    Reduce the hourly final energy of a building to what the compilation files need: its annual totals and its
+    hourly demand and carrier columns summed by carrier.
 
-    # Read building metadata
-    zone_gdf = gpd.read_file(locator.get_zone_geometry())
-    zone_gdf = zone_gdf.set_index('name')
+    The summary is much smaller than ``df`` so it can be sent back from worker processes and aggregated as results
+    arrive (see :class:`FinalEnergyAggregator`).
 
-    # Read total demand for GFA
-    total_demand_df = pd.read_csv(locator.get_total_demand()).set_index('name')
+    :param building_name: Name of the building
+    :param df: Final energy DataFrame of the building as returned by :func:`calculate_building_final_energy`
+    :return: Summary of the building
+    """
+    # Sum carrier columns by type
+    carrier_totals = {}
+    for col in df.columns:
+        if col.endswith('_kWh') and col not in _DEMAND_COLUMNS:
+            # Skip diagnostic *_dumped_kWh columns — they record heat
+            # dumped at the SC tank pressure-relief cap, not carrier
+            # consumption delivered to a service.
+            if col.endswith('_dumped_kWh'):
+                continue
+            # Extract carrier from column name
+            # Format: Qhs_sys_NATURALGAS_kWh -> NATURALGAS
+            parts = col.split('_')
+            if len(parts) >= 3:
+                carrier = parts[2]  # Get carrier part
+                if carrier not in carrier_totals:
+                    carrier_totals[carrier] = 0.0
+                carrier_totals[carrier] += df[col].sum() / 1000.0  # kWh -> MWh
 
-    summary_rows = []
+    # Calculate peak demand
+    total_demand_kW = df['Qhs_sys_kWh'] + df['Qww_sys_kWh'] + df['Qcs_sys_kWh'] + df['E_sys_kWh']
+    if len(total_demand_kW) > 0:
+        peak_idx = total_demand_kW.idxmax()
+        peak_demand_kW = total_demand_kW.iloc[peak_idx]
+        peak_datetime = df.loc[peak_idx, 'date']
+    else:
+        peak_demand_kW = 0.0
+        peak_datetime = None
 
-    # Process buildings
-    for building_name, df in building_dfs.items():
-        # Get building metadata
-        if building_name in zone_gdf.index:
-            geom = zone_gdf.loc[building_name, 'geometry']
-            x_coord = geom.centroid.x
-            y_coord = geom.centroid.y
+    annual = {
+        'scale': df['scale'].iloc[0] if 'scale' in df.columns else 'BUILDING',
+        'case': df['case'].iloc[0] if 'case' in df.columns else None,
+        'case_description': df['case_description'].iloc[0] if 'case_description' in df.columns else None,
+        # Sum demand columns (kWh -> MWh)
+        'Qhs_sys_MWh': df['Qhs_sys_kWh'].sum() / 1000.0,
+        'Qww_sys_MWh': df['Qww_sys_kWh'].sum() / 1000.0,
+        'Qcs_sys_MWh': df['Qcs_sys_kWh'].sum() / 1000.0,
+        'E_sys_MWh': df['E_sys_kWh'].sum() / 1000.0,
+        'peak_demand_kW': peak_demand_kW,
+        'peak_datetime': peak_datetime,
+    }
+
+    hourly_kWh = {}
+    for col in _DEMAND_COLUMNS:
+        if col in df.columns:
+            hourly_kWh[col] = df[col].fillna(0).to_numpy(dtype=float)
+    for col in df.columns:
+        carrier = _hourly_carrier_of_building_column(col)
+        if carrier is None:
+            continue
+        carrier_col = f'{carrier}_kWh'
+        values = df[col].fillna(0).to_numpy(dtype=float)
+        if carrier_col in hourly_kWh:
+            hourly_kWh[carrier_col] = hourly_kWh[carrier_col] + values
         else:
-            x_coord = None
-            y_coord = None
+            hourly_kWh[carrier_col] = values
 
-        GFA_m2 = total_demand_df.loc[building_name, 'GFA_m2'] if building_name in total_demand_df.index else None
+    return BuildingFinalEnergySummary(name=building_name, annual=annual, carrier_totals_MWh=carrier_totals,
+                                      hourly_kWh=hourly_kWh, date=df['date'].to_numpy())
 
-        # Sum demand columns (kWh -> MWh)
-        Qhs_sys_MWh = df['Qhs_sys_kWh'].sum() / 1000.0
-        Qww_sys_MWh = df['Qww_sys_kWh'].sum() / 1000.0
-        Qcs_sys_MWh = df['Qcs_sys_kWh'].sum() / 1000.0
-        E_sys_MWh = df['E_sys_kWh'].sum() / 1000.0
 
-        # Sum carrier columns by type
-        carrier_totals = {}
-        for col in df.columns:
-            if col.endswith('_kWh') and col not in ['Qhs_sys_kWh', 'Qww_sys_kWh', 'Qcs_sys_kWh', 'E_sys_kWh']:
-                # Skip diagnostic *_dumped_kWh columns — they record heat
-                # dumped at the SC tank pressure-relief cap, not carrier
-                # consumption delivered to a service.
-                if col.endswith('_dumped_kWh'):
-                    continue
-                # Extract carrier from column name
-                # Format: Qhs_sys_NATURALGAS_kWh -> NATURALGAS
-                parts = col.split('_')
-                if len(parts) >= 3:
-                    carrier = parts[2]  # Get carrier part
-                    if carrier not in carrier_totals:
-                        carrier_totals[carrier] = 0.0
-                    carrier_totals[carrier] += df[col].sum() / 1000.0  # kWh -> MWh
-
-        # Calculate peak demand
-        total_demand_kW = df['Qhs_sys_kWh'] + df['Qww_sys_kWh'] + df['Qcs_sys_kWh'] + df['E_sys_kWh']
-        peak_idx = total_demand_kW.idxmax()
-        peak_demand_kW = total_demand_kW.iloc[peak_idx] if len(total_demand_kW) > 0 else 0.0
-        peak_datetime = df.loc[peak_idx, 'date'] if len(total_demand_kW) > 0 else None
-
-        # Get case info
-        scale = df['scale'].iloc[0] if 'scale' in df.columns else 'BUILDING'
-        case = df['case'].iloc[0] if 'case' in df.columns else None
-        case_description = df['case_description'].iloc[0] if 'case_description' in df.columns else None
-
-        # Build row
-        row = {
-            'name': building_name,
-            'type': 'building',
-            'GFA_m2': GFA_m2,
-            'x_coord': x_coord,
-            'y_coord': y_coord,
-            'scale': scale,
-            'case': case,
-            'case_description': case_description,
-            'Qhs_sys_MWh': Qhs_sys_MWh,
-            'Qww_sys_MWh': Qww_sys_MWh,
-            'Qcs_sys_MWh': Qcs_sys_MWh,
-            'E_sys_MWh': E_sys_MWh,
-        }
+def _summary_carriers(locator: cea.inputlocator.InputLocator) -> list:
+    """
+    Carrier columns written to final_energy_buildings.csv.
+
+    Data-driven via ENERGY_CARRIERS.csv; union in the routing-only carriers (DH,
+    DC) and SOLAR (on-site solar-thermal delivered to DHW via the
+    SC-DHW dispatch, booked as `Qww_sys_SOLAR_kWh`), which aren't
+    ``feedstock_file`` entries. Legacy solar PV/PVT electricity
+    offsets are still tracked separately via the emissions
+    offset path, not here.
+
+    ``_DECLARED_CARRIER_CODES`` is unioned in so every column the
+    schema (`get_final_energy_buildings_file` in `cea/schemas.yml`)
+    declares is always written — zero-filled for carriers the
+    scenario's database doesn't include. Without this, KPIs and
+    other consumers reading the schema's columns hit silent
+    missing-column errors when (e.g.) a district has no PV.
+    """
+    from cea.technologies.energy_carriers import available_carriers
+    return sorted(available_carriers(locator) | {'DH', 'DC', 'SOLAR'} | _DECLARED_CARRIER_CODES)
 
-        # Carrier columns delivered to services. Data-driven via
-        # ENERGY_CARRIERS.csv; union in the routing-only carriers (DH,
-        # DC) and SOLAR (on-site solar-thermal delivered to DHW via the
-        # SC-DHW dispatch, booked as `Qww_sys_SOLAR_kWh`), which aren't
-        # ``feedstock_file`` entries. Legacy solar PV/PVT electricity
-        # offsets are still tracked separately via the emissions
-        # offset path, not here.
-        #
-        # ``_DECLARED_CARRIER_CODES`` is unioned in so every column the
-        # schema (`get_final_energy_buildings_file` in `cea/schemas.yml`)
-        # declares is always written — zero-filled for carriers the
-        # scenario's database doesn't include. Without this, KPIs and
-        # other consumers reading the schema's columns hit silent
-        # missing-column errors when (e.g.) a district has no PV.
-        from cea.technologies.energy_carriers import available_carriers
-        all_carriers = (
-            available_carriers(locator) | {'DH', 'DC', 'SOLAR'} | _DECLARED_CARRIER_CODES
-        )
-        for carrier in sorted(all_carriers):
-            row[f'{carrier}_MWh'] = carrier_totals.get(carrier, 0.0)
 
-        # Roll up the per-carrier columns into the total declared in
-        # `cea/schemas.yml` for this file. Without this, downstream
-        # consumers (e.g. KPIs that read TOTAL_MWh) hit a missing-column
-        # error even though the schema promises the column.
-        row['TOTAL_MWh'] = sum(carrier_totals.values())
+def _plant_summary_row(plant_key: str, df: pd.DataFrame, locator: cea.inputlocator.InputLocator) -> Tuple[Dict, Dict]:
+    """Annual summary row (without carrier columns) and carrier totals [MWh] of a district plant."""
+    import geopandas as gpd
 
-        row['peak_demand_kW'] = peak_demand_kW
-        row['peak_datetime'] = peak_datetime
+    # Parse plant key: "DH_NODE5" or "DC_NODE1"
+    parts = plant_key.split('_', 1)
+    if len(parts) == 2:
+        network_type = parts[0]
+        plant_name = parts[1]
+    else:
+        plant_name = plant_key
+        network_type = df['network_type'].iloc[0] if 'network_type' in df.columns else 'UNKNOWN'
 
-        summary_rows.append(row)
+    # Get plant metadata
+    network_name = df['network_name'].iloc[0] if 'network_name' in df.columns else None
 
-    # Process plants
-    for plant_key, df in plant_dfs.items():
-        # Parse plant key: "DH_NODE5" or "DC_NODE1"
-        parts = plant_key.split('_', 1)
-        if len(parts) == 2:
-            network_type = parts[0]
-            plant_name = parts[1]
-        else:
-            plant_name = plant_key
-            network_type = df['network_type'].iloc[0] if 'network_type' in df.columns else 'UNKNOWN'
-
-        # Get plant metadata
-        network_name = df['network_name'].iloc[0] if 'network_name' in df.columns else None
-
-        # Get plant coordinates from network nodes.shp
-        x_coord = None
-        y_coord = None
-        if network_name:
-            try:
-                nodes_file = locator.get_network_layout_nodes_shapefile(network_type, network_name)
-                if os.path.exists(nodes_file):
-                    nodes_gdf = gpd.read_file(nodes_file)
-                    plant_node = nodes_gdf[nodes_gdf['name'] == plant_name]
-                    if not plant_node.empty:
-                        geom = plant_node.iloc[0]['geometry']
-                        x_coord = geom.x
-                        y_coord = geom.y
-            except Exception:
-                pass  # Coordinates not critical, can be None
-
-        # Sum thermal load
-        thermal_load_MWh = df['thermal_load_kWh'].sum() / 1000.0 if 'thermal_load_kWh' in df.columns else 0.0
-        pumping_MWh = df['pumping_load_kWh'].sum() / 1000.0 if 'pumping_load_kWh' in df.columns else 0.0
-
-        # Calculate peak demand (thermal + pumping)
-        thermal_load_kW = df['thermal_load_kWh'] if 'thermal_load_kWh' in df.columns else pd.Series([0] * len(df))
-        pumping_load_kW = df['pumping_load_kWh'] if 'pumping_load_kWh' in df.columns else pd.Series([0] * len(df))
-        total_load_kW = thermal_load_kW + pumping_load_kW
-
-        if len(total_load_kW) > 0 and total_load_kW.max() > 0:
-            peak_idx = total_load_kW.idxmax()
-            peak_demand_kW = total_load_kW.iloc[peak_idx]
-            peak_datetime = df.loc[peak_idx, 'date'] if 'date' in df.columns else None
+    # Get plant coordinates from network nodes.shp
+    x_coord = None
+    y_coord = None
+    if network_name:
+        try:
+            nodes_file = locator.get_network_layout_nodes_shapefile(network_type, network_name)
+            if os.path.exists(nodes_file):
+                nodes_gdf = gpd.read_file(nodes_file)
+                plant_node = nodes_gdf[nodes_gdf['name'] == plant_name]
+                if not plant_node.empty:
+                    geom = plant_node.iloc[0]['geometry']
+                    x_coord = geom.x
+                    y_coord = geom.y
+        except Exception:
+            pass  # Coordinates not critical, can be None
+
+    # Sum thermal load
+    thermal_load_MWh = df['thermal_load_kWh'].sum() / 1000.0 if 'thermal_load_kWh' in df.columns else 0.0
+    pumping_MWh = df['pumping_load_kWh'].sum() / 1000.0 if 'pumping_load_kWh' in df.columns else 0.0
+
+    # Calculate peak demand (thermal + pumping)
+    thermal_load_kW = df['thermal_load_kWh'] if 'thermal_load_kWh' in df.columns else pd.Series([0] * len(df))
+    pumping_load_kW = df['pumping_load_kWh'] if 'pumping_load_kWh' in df.columns else pd.Series([0] * len(df))
+    total_load_kW = thermal_load_kW + pumping_load_kW
+
+    if len(total_load_kW) > 0 and total_load_kW.max() > 0:
+        peak_idx = total_load_kW.idxmax()
+        peak_demand_kW = total_load_kW.iloc[peak_idx]
+        peak_datetime = df.loc[peak_idx, 'date'] if 'date' in df.columns else None
+    else:
+        peak_demand_kW = 0.0
+        peak_datetime = None
+
+    # Sum carrier columns by type
+    carrier_totals = {}
+    for col in df.columns:
+        if col.endswith('_kWh') and col not in ['thermal_load_kWh', 'pumping_load_kWh']:
+            # Extract carrier from column name
+            # Format: plant_{role}_{NT}_{CARRIER}_kWh -> CARRIER is parts[-2]
+            # e.g. plant_primary_DH_NATURALGAS_kWh, plant_pumping_DH_GRID_kWh
+            parts_col = col[:-len('_kWh')].split('_')
+            carrier = parts_col[-1] if len(parts_col) >= 4 else None
+            if not carrier:
+                continue
+            if carrier not in carrier_totals:
+                carrier_totals[carrier] = 0.0
+            carrier_totals[carrier] += df[col].sum() / 1000.0  # kWh -> MWh
+
+    row = {
+        'name': plant_name,
+        'type': 'plant',
+        'GFA_m2': 0,  # Not applicable for plants
+        'x_coord': x_coord,
+        'y_coord': y_coord,
+        'scale': 'DISTRICT',
+        'case': 5,  # Case 5: District plant
+        'case_description': f'{network_type} plant',
+        'Qhs_sys_MWh': thermal_load_MWh if network_type == 'DH' else 0.0,
+        'Qww_sys_MWh': 0.0,
+        'Qcs_sys_MWh': thermal_load_MWh if network_type == 'DC' else 0.0,
+        'E_sys_MWh': pumping_MWh,
+        'peak_demand_kW': peak_demand_kW,
+        'peak_datetime': peak_datetime,
+    }
+    return row, carrier_totals
+
+
+class FinalEnergyAggregator:
+    """
+    Incremental aggregation of building and plant final energy into the compilation files
+    (final_energy_buildings.csv and final_energy.csv).
+
+    Buildings are added as :class:`BuildingFinalEnergySummary` objects, in any order: the hourly totals are summed in
+    place and only one annual row is kept per building, so memory does not grow with the hourly data of each
+    building. The ``position`` of each building (its index in the list of buildings) keeps the row and column order
+    of the outputs independent of the order in which results arrive.
+    """
+
+    def __init__(self):
+        self.building_summaries = {}  # position -> (name, annual, carrier_totals_MWh)
+        self.plant_results = []  # [(plant_key, df)]
+        self.hourly_kWh = {}  # aggregated column -> hourly values
+        self.carrier_first_seen = {}  # carrier -> (position, column index) where it first appears
+        self.date = None
+        self.date_position = None
+
+    def add_building(self, summary: BuildingFinalEnergySummary, position: int):
+        """Add the final energy of a building (``position`` is its index in the list of buildings)."""
+        self.building_summaries[position] = (summary.name, summary.annual, summary.carrier_totals_MWh)
+        if self.date_position is None or position < self.date_position:
+            self.date = summary.date
+            self.date_position = position
+        for column_index, (col, values) in enumerate(summary.hourly_kWh.items()):
+            if col not in _DEMAND_COLUMNS:
+                self._register_carrier_column(col, (0, position, column_index))
+            self._add_hourly(col, values)
+
+    def add_plant(self, plant_key: str, df: pd.DataFrame):
+        """Add the final energy of a district plant (plants are added after all buildings)."""
+        plant_index = len(self.plant_results)
+        self.plant_results.append((plant_key, df))
+        for column_index, col in enumerate(df.columns):
+            carrier = _hourly_carrier_of_plant_column(col)
+            if carrier is None:
+                continue
+            carrier_col = f'{carrier}_kWh'
+            self._register_carrier_column(carrier_col, (1, plant_index, column_index))
+            self._add_hourly(carrier_col, df[col].fillna(0).to_numpy(dtype=float))
+
+    def _register_carrier_column(self, carrier_col, order):
+        if carrier_col not in self.carrier_first_seen or order < self.carrier_first_seen[carrier_col]:
+            self.carrier_first_seen[carrier_col] = order
+
+    def _add_hourly(self, col, values):
+        if col in self.hourly_kWh:
+            self.hourly_kWh[col] += values
         else:
-            peak_demand_kW = 0.0
-            peak_datetime = None
+            self.hourly_kWh[col] = np.array(values, dtype=float)
+
+    @property
+    def number_of_buildings(self) -> int:
+        return len(self.building_summaries)
+
+    @property
+    def total_demand_MWh(self) -> float:
+        """Total annual system demand (heating, hot water, cooling and electricity) of all buildings [MWh]."""
+        return sum(annual['Qhs_sys_MWh'] + annual['Qww_sys_MWh'] + annual['Qcs_sys_MWh'] + annual['E_sys_MWh']
+                   for _, annual, _ in self.building_summaries.values())
+
+    def summary_df(self, locator: cea.inputlocator.InputLocator) -> pd.DataFrame:
+        """Annual summary with one row per building/plant (final_energy_buildings.csv)."""
+        import geopandas as gpd
+
+        # Read building metadata
+        zone_gdf = gpd.read_file(locator.get_zone_geometry())
+        zone_gdf = zone_gdf.set_index('name')
+
+        # Read total demand for GFA
+        total_demand_df = pd.read_csv(locator.get_total_demand()).set_index('name')
+
+        all_carriers = _summary_carriers(locator)
+        summary_rows = []
+
+        # Process buildings
+        for position in sorted(self.building_summaries):
+            building_name, annual, carrier_totals = self.building_summaries[position]
+            # Get building metadata
+            if building_name in zone_gdf.index:
+                geom = zone_gdf.loc[building_name, 'geometry']
+                x_coord = geom.centroid.x
+                y_coord = geom.centroid.y
+            else:
+                x_coord = None
+                y_coord = None
 
-        # Sum carrier columns by type
-        carrier_totals = {}
-        for col in df.columns:
-            if col.endswith('_kWh') and col not in ['thermal_load_kWh', 'pumping_load_kWh']:
-                # Extract carrier from column name
-                # Format: plant_{role}_{NT}_{CARRIER}_kWh -> CARRIER is parts[-2]
-                # e.g. plant_primary_DH_NATURALGAS_kWh, plant_pumping_DH_GRID_kWh
-                parts_col = col[:-len('_kWh')].split('_')
-                carrier = parts_col[-1] if len(parts_col) >= 4 else None
-                if not carrier:
-                    continue
-                if carrier not in carrier_totals:
-                    carrier_totals[carrier] = 0.0
-                carrier_totals[carrier] += df[col].sum() / 1000.0  # kWh -> MWh
+            GFA_m2 = total_demand_df.loc[building_name, 'GFA_m2'] if building_name in total_demand_df.index else None
 
-        # Build row
-        row = {
-            'name': plant_name,
-            'type': 'plant',
-            'GFA_m2': 0,  # Not applicable for plants
-            'x_coord': x_coord,
-            'y_coord': y_coord,
-            'scale': 'DISTRICT',
-            'case': 5,  # Case 5: District plant
-            'case_description': f'{network_type} plant',
-            'Qhs_sys_MWh': thermal_load_MWh if network_type == 'DH' else 0.0,
-            'Qww_sys_MWh': 0.0,
-            'Qcs_sys_MWh': thermal_load_MWh if network_type == 'DC' else 0.0,
-            'E_sys_MWh': pumping_MWh,
-        }
+            row = {
+                'name': building_name,
+                'type': 'building',
+                'GFA_m2': GFA_m2,
+                'x_coord': x_coord,
+                'y_coord': y_coord,
+            }
+            row.update({key: value for key, value in annual.items() if not key.startswith('peak_')})
+            summary_rows.append(self._with_carrier_columns(row, carrier_totals, all_carriers, annual))
+
+        # Process plants
+        for plant_key, df in self.plant_results:
+            row, carrier_totals = _plant_summary_row(plant_key, df, locator)
+            peak = {'peak_demand_kW': row.pop('peak_demand_kW'), 'peak_datetime': row.pop('peak_datetime')}
+            summary_rows.append(self._with_carrier_columns(row, carrier_totals, all_carriers, peak))
 
-        # Carrier columns delivered to services. See building loop above
-        # for why DH/DC/SOLAR/_DECLARED_CARRIER_CODES are all unioned in
-        # — keeps the column set identical between building and plant
+        return pd.DataFrame(summary_rows)
+
+    @staticmethod
+    def _with_carrier_columns(row, carrier_totals, all_carriers, peak):
+        # Carrier columns delivered to services (see _summary_carriers) —
+        # keeps the column set identical between building and plant
         # rows so the resulting DataFrame's columns match the schema
         # declaration regardless of which carriers a given run uses.
-        from cea.technologies.energy_carriers import available_carriers
-        all_carriers = (
-            available_carriers(locator) | {'DH', 'DC', 'SOLAR'} | _DECLARED_CARRIER_CODES
-        )
-        for carrier in sorted(all_carriers):
+        for carrier in all_carriers:
             row[f'{carrier}_MWh'] = carrier_totals.get(carrier, 0.0)
 
-        # Same TOTAL_MWh rollup the building loop writes — keeps
-        # plant + building rows column-aligned and matches the
-        # `get_final_energy_buildings_file` schema.
+        # Roll up the per-carrier columns into the total declared in
+        # `cea/schemas.yml` for this file. Without this, downstream
+        # consumers (e.g. KPIs that read TOTAL_MWh) hit a missing-column
+        # error even though the schema promises the column.
         row['TOTAL_MWh'] = sum(carrier_totals.values())
 
-        row['peak_demand_kW'] = peak_demand_kW
-        row['peak_datetime'] = peak_datetime
+        row['peak_demand_kW'] = peak['peak_demand_kW']
+        row['peak_datetime'] = peak['peak_datetime']
+        return row
+
+    def timeseries_df(self) -> pd.DataFrame:
+        """Hourly totals of all buildings + plants (final_energy.csv, 8760 rows)."""
+        if not self.building_summaries:
+            raise ValueError("No building data to aggregate")
+
+        aggregated = {'date': self.date}
+        for col in _DEMAND_COLUMNS:
+            aggregated[col] = self.hourly_kWh.get(col, np.zeros(len(self.date)))
+        carrier_cols = sorted(self.carrier_first_seen, key=self.carrier_first_seen.get)
+        for col in carrier_cols:
+            aggregated[col] = self.hourly_kWh[col]
+        aggregated = pd.DataFrame(aggregated)
+
+        # Calculate total final energy (sum of all carriers)
+        aggregated['TOTAL_kWh'] = aggregated[carrier_cols].sum(axis=1)
+        return aggregated
 
-        summary_rows.append(row)
 
-    # Create summary DataFrame
-    summary_df = pd.DataFrame(summary_rows)
+def aggregate_buildings_summary(
+    building_dfs: Dict[str, pd.DataFrame],
+    plant_dfs: Dict[str, pd.DataFrame],
+    locator: cea.inputlocator.InputLocator
+) -> pd.DataFrame:
+    """
+    Aggregate hourly data to annual summary (final_energy_buildings.csv).
 
-    return summary_df
+    :param building_dfs: Dict of building_name -> final_energy DataFrame
+    :param plant_dfs: Dict of plant_name -> final_energy DataFrame
+    :param locator: InputLocator instance
+    :return: Summary DataFrame with one row per building/plant
+    """
+    aggregator = FinalEnergyAggregator()
+    for position, (building_name, df) in enumerate(building_dfs.items()):
+        aggregator.add_building(summarise_building_final_energy(building_name, df), position)
+    for plant_key, df in plant_dfs.items():
+        aggregator.add_plant(plant_key, df)
+    return aggregator.summary_df(locator)
 
 
 def create_hourly_timeseries_aggregation(
@@ -1368,98 +1604,12 @@ def create_hourly_timeseries_aggregation(
     if not building_dfs:
         raise ValueError("No building data to aggregate")
 
-    # Start with first building's date column
-    first_building_df = list(building_dfs.values())[0]
-    aggregated = pd.DataFrame({'date': first_building_df['date']})
-
-    # Initialize all possible columns with zeros
-    demand_columns = ['Qhs_sys_kWh', 'Qww_sys_kWh', 'Qcs_sys_kWh', 'E_sys_kWh']
-    for col in demand_columns:
-        aggregated[col] = 0.0
-
-    # Track all carrier types found
-    all_carriers = set()
-
-    # Aggregate building data
-    for building_name, df in building_dfs.items():
-        # Sum demand columns
-        for col in demand_columns:
-            if col in df.columns:
-                aggregated[col] += df[col].fillna(0)
-
-        # Sum carrier columns
-        for col in df.columns:
-            if col.endswith('_kWh') and col not in demand_columns and col != 'date':
-                # Skip raw-irradiation columns — they record incident solar
-                # energy, not useful delivered energy, and must NEVER be
-                # counted as a delivered carrier. Matches the filter in
-                # cea.analysis.lca.emission_time_dependent.
-                if '_radiation_' in col:
-                    continue
-                # Skip diagnostic *_dumped_kWh columns — SC tank surplus
-                # dumped at the T_MAX cap, not a delivered carrier.
-                if col.endswith('_dumped_kWh'):
-                    continue
-
-                # Extract carrier from column name
-                # Formats:
-                #   Qhs_sys_NATURALGAS_kWh          -> NATURALGAS
-                #   PV_{facade}_kWh                 -> PV
-                #   PVT_{collector}_{facade}_E_kWh  -> PV  (electrical)
-                #   PVT_{collector}_{facade}_Q_kWh  -> SOLAR  (thermal)
-                #   SC_{collector}_{facade}_Q_kWh   -> SOLAR
-                if '_sys_' in col or '_booster_' in col:
-                    # Service/booster carrier: Qhs_sys_NATURALGAS_kWh -> NATURALGAS
-                    parts = col.split('_')
-                    carrier = parts[2] if len(parts) >= 3 else col
-                elif col.startswith('PV_'):
-                    carrier = 'PV'
-                elif col.startswith('PVT_') and col.endswith('_E_kWh'):
-                    carrier = 'PV'
-                elif col.startswith('PVT_') and col.endswith('_Q_kWh'):
-                    carrier = 'SOLAR'
-                elif col.startswith('SC_'):
-                    carrier = 'SOLAR'
-                else:
-                    continue
-
-                # Aggregate by carrier type (not by service)
-                carrier_col = f'{carrier}_kWh'
-                if carrier_col not in aggregated.columns:
-                    aggregated[carrier_col] = 0.0
-                    all_carriers.add(carrier)
-
-                aggregated[carrier_col] += df[col].fillna(0)
-
-    # Aggregate plant data
-    for plant_name, df in plant_dfs.items():
-        # Plants contribute to carrier columns only (no demand columns)
-        for col in df.columns:
-            if col.endswith('_kWh') and col != 'date':
-                # Plant columns format: plant_primary_DH_NATURALGAS_kWh, plant_tertiary_DC_GRID_kWh
-                if col.startswith('plant_primary_') or col.startswith('plant_tertiary_'):
-                    parts = col.split('_')
-                    carrier = parts[3] if len(parts) >= 4 else (parts[2] if len(parts) >= 3 else col)
-                elif col.startswith('plant_pumping_'):
-                    parts = col.split('_')
-                    if len(parts) < 3:
-                        continue
-                    carrier = parts[2]
-                else:
-                    continue
-
-                carrier_col = f'{carrier}_kWh'
-                if carrier_col not in aggregated.columns:
-                    aggregated[carrier_col] = 0.0
-                    all_carriers.add(carrier)
-
-                aggregated[carrier_col] += df[col].fillna(0)
-
-    # Calculate total final energy (sum of all carriers)
-    carrier_cols = [f'{carrier}_kWh' for carrier in all_carriers]
-    aggregated['TOTAL_kWh'] = aggregated[carrier_cols].sum(axis=1)
-
-    return aggregated
+    aggregator = FinalEnergyAggregator()
+    for position, (building_name, df) in enumerate(building_dfs.items()):
+        aggregator.add_building(summarise_building_final_energy(building_name, df), position)
+    for plant_key, df in plant_dfs.items():
+        aggregator.add_plant(plant_key, df)
+    return aggregator.timeseries_df()
 
 
 def create_final_energy_breakdown(
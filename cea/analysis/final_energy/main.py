@@ -20,10 +20,13 @@ __status__ = "Production"
 import os
 import re
 import shutil
+from itertools import repeat
+
 import pandas as pd
 
 import cea.config
 import cea.inputlocator
+import cea.utilities.parallel
 
 
 def main(config: cea.config.Configuration):
@@ -125,6 +128,34 @@ def _group_errors_by_pattern(errors):
     return grouped
 
 
+def _calculate_building(building, supply_config, locator, config, whatif_name):
+    """
+    Calculate and save the final energy of one building and return its summary for aggregation.
+
+    Runs in a worker process when multiprocessing is enabled, so only the (small) summary is sent back.
+
+    :return: (building, summary or None, error message or None)
+    """
+    from cea.analysis.final_energy.calculation import (
+        calculate_building_final_energy,
+        summarise_building_final_energy,
+    )
+    try:
+        final_energy_df = calculate_building_final_energy(building, locator, config, supply_config=supply_config)
+
+        # Save individual building file
+        output_file = locator.get_final_energy_building_file(building, whatif_name)
+        locator.ensure_parent_folder_exists(output_file)
+        final_energy_df.to_csv(output_file, index=False, float_format='%.3f')
+
+        summary = summarise_building_final_energy(building, final_energy_df)
+    except Exception as e:
+        return building, None, str(e)
+
+    print(f"  ✓ {building}")
+    return building, summary, None
+
+
 def _run(config, locator, whatif_name, output_folder, buildings):
     """Inner implementation called by main() so folder cleanup can wrap it cleanly."""
 
@@ -200,43 +231,42 @@ def _run(config, locator, whatif_name, output_folder, buildings):
 
     # Step 4: Calculate final energy for each building
     print("\nCalculating building final energy...")
-    building_dfs = {}
     building_configs = {}
 
     from cea.analysis.final_energy.calculation import (
-        calculate_building_final_energy,
-        load_supply_configuration,
+        FinalEnergyAggregator,
+        load_supply_configurations,
         parse_solar_panel_configuration,
     )
     solar_panel_config = parse_solar_panel_configuration(config)
     solar_buildings = set(config.solar_technology.buildings) if config.solar_technology.buildings else set()
 
-    errors = {}
-    for building in buildings:
-        try:
-            # Load supply configuration
-            supply_config = load_supply_configuration(building, locator, config)
-            # Only attach solar config for buildings in solar-technology:buildings
-            if building in solar_buildings:
-                supply_config['solar'] = solar_panel_config
+    # Load the supply configuration of all buildings once (supply.csv and the assemblies database are read once)
+    supply_configs, errors = load_supply_configurations(buildings, locator, config)
+    for building, supply_config in supply_configs.items():
+        # Only attach solar config for buildings in solar-technology:buildings
+        if building in solar_buildings:
+            building_configs[building] = {**supply_config, 'solar': solar_panel_config}
+        else:
             building_configs[building] = supply_config
 
-            # Calculate final energy for this building
-            final_energy_df = calculate_building_final_energy(building, locator, config)
-
-            # Save individual building file
-            output_file = locator.get_final_energy_building_file(building, whatif_name)
-            locator.ensure_parent_folder_exists(output_file)
-            final_energy_df.to_csv(output_file, index=False, float_format='%.3f')
-
-            # Store for aggregation
-            building_dfs[building] = final_energy_df
-
-            print(f"  ✓ {building}")
+    # Calculate (and save) the buildings in parallel, aggregating the results as they arrive
+    aggregator = FinalEnergyAggregator()
+    positions = {building: position for position, building in enumerate(buildings)}
+    calculated_buildings = [building for building in buildings if building in supply_configs]
+    n = len(calculated_buildings)
+    results = cea.utilities.parallel.vectorize_as_completed(_calculate_building, config.get_number_of_processes())(
+        calculated_buildings,
+        [supply_configs[building] for building in calculated_buildings],
+        repeat(locator, n),
+        repeat(config, n),
+        repeat(whatif_name, n))
+    for building, summary, error in results:
+        if error is not None:
+            errors[building] = error
+        else:
+            aggregator.add_building(summary, positions[building])
 
-        except Exception as e:
-            errors[building] = str(e)
-    
     if errors:
         # Group errors by message pattern (strip building-specific details)
         # so N identical errors collapse into one block with the full
@@ -263,7 +293,6 @@ def _run(config, locator, whatif_name, output_folder, buildings):
             raise
 
     # Step 5: Calculate for district plants
-    plant_dfs = {}
     plant_configs = {}
     network_name = config.final_energy.network_name
     if network_name:
@@ -348,7 +377,7 @@ def _run(config, locator, whatif_name, output_folder, buildings):
 
                         # Store for aggregation (keyed by network_type for downstream)
                         plant_key = f"{network_type}_{plant_name}"
-                        plant_dfs[plant_key] = plant_df
+                        aggregator.add_plant(plant_key, plant_df)
 
                         # Register per-plant config keyed by plant_name
                         if type_pc:
@@ -388,16 +417,12 @@ def _run(config, locator, whatif_name, output_folder, buildings):
 
     summary_df = None
 
-    if building_dfs:
-        from cea.analysis.final_energy.calculation import (
-            aggregate_buildings_summary,
-            create_hourly_timeseries_aggregation,
-        )
+    if aggregator.number_of_buildings:
         from datetime import datetime
 
         try:
             # Generate buildings summary
-            summary_df = aggregate_buildings_summary(building_dfs, plant_dfs, locator)
+            summary_df = aggregator.summary_df(locator)
             summary_file = locator.get_final_energy_buildings_file(whatif_name)
             locator.ensure_parent_folder_exists(summary_file)
             summary_df.to_csv(summary_file, index=False, float_format='%.3f')
@@ -408,9 +433,7 @@ def _run(config, locator, whatif_name, output_folder, buildings):
 
         try:
             # Generate hourly timeseries aggregation (8760 rows)
-            timeseries_df = create_hourly_timeseries_aggregation(
-                building_dfs, plant_dfs
-            )
+            timeseries_df = aggregator.timeseries_df()
             timeseries_file = locator.get_final_energy_file(whatif_name)
             locator.ensure_parent_folder_exists(timeseries_file)
             timeseries_df.to_csv(timeseries_file, index=False, float_format='%.3f')
@@ -441,14 +464,14 @@ def _run(config, locator, whatif_name, output_folder, buildings):
         print("  - No buildings processed, skipping compilation files")
 
     # Step 8: Print summary statistics
-    if building_dfs:
+    if aggregator.number_of_buildings:
         print("\n" + "=" * 80)
         print("SUMMARY STATISTICS")
         print("=" * 80)
 
         # Count buildings processed
         total_buildings = len(buildings)
-        successful_buildings = len(building_dfs)
+        successful_buildings = aggregator.number_of_buildings
         failed_buildings = total_buildings - successful_buildings
 
         print(f"\nBuildings processed: {successful_buildings}/{total_buildings}")
@@ -473,11 +496,7 @@ def _run(config, locator, whatif_name, output_folder, buildings):
             print(f"  TOTAL: {total_final:,.2f} MWh/year")
 
         # Calculate total demand
-        total_demand = sum([
-            df['Qhs_sys_kWh'].sum() + df['Qww_sys_kWh'].sum() +
-            df['Qcs_sys_kWh'].sum() + df['E_sys_kWh'].sum()
-            for df in building_dfs.values()
-        ]) / 1000.0  # kWh -> MWh
+        total_demand = aggregator.total_demand_MWh
 
         print(f"\nTotal System Demand: {total_demand:,.2f} MWh/year")
 
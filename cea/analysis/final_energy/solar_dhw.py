@@ -82,6 +82,7 @@ import cea.config
 import cea.inputlocator
 from cea.demand.constants import TWW_SETPOINT
 from cea.demand.hotwater_loads import calc_water_temperature
+from cea.technologies.component_catalog import get_catalog
 
 
 __author__ = "Zhongming Shi"
@@ -138,10 +139,7 @@ def load_solar_component_info(
             f"{component_code!r}"
         )
 
-    component_file = locator.get_db4_components_conversion_conversion_technology_csv(
-        'SOLAR_COLLECTORS'
-    )
-    df = pd.read_csv(component_file)
+    df = get_catalog(locator).table('SOLAR_COLLECTORS')
     if (df['code'] == component_code).sum() == 0:
         raise ValueError(
             f"Component {component_code} not found in SOLAR_COLLECTORS database"
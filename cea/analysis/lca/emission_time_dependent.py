@@ -1,5 +1,6 @@
 import os
 import warnings
+from itertools import repeat
 
 import numpy as np
 import pandas as pd
@@ -9,11 +10,14 @@ from cea.analysis.lca.emission_timeline import BuildingYearlyEmissionTimeline as
 from cea.analysis.lca.hourly_operational_emission import OperationalHourlyTimeline
 from cea.config import Configuration
 from cea.constants import HOURS_IN_YEAR
-from cea.datamanagement.database.components import Feedstocks
+from cea.datamanagement.database.envelope_lookup import EnvelopeLookup
 from cea.demand.building_properties import BuildingProperties
 from cea.inputlocator import InputLocator
+from cea.technologies.component_catalog import get_catalog
 from cea.technologies.energy_carriers import electricity_carrier
 from cea.utilities import epwreader
+from cea.utilities.parallel import vectorize
+from cea.utilities.result_store import LIFECYCLE_EMISSIONS, OPERATIONAL_EMISSIONS, ResultStore
 
 __author__ = "Yiqiao Wang, Zhongming Shi"
 __copyright__ = "Copyright 2025, Architecture and Building Systems - ETH Zurich"
@@ -137,29 +141,22 @@ def operational_hourly(config: Configuration) -> None:
     weather_data = epwreader.epw_reader(weather_path)[
         ["year", "drybulb_C", "wetbulb_C", "relhum_percent", "windspd_ms", "skytemp_C"]
     ]
-    building_properties = BuildingProperties(locator, weather_data, buildings)
-    results: list[tuple[str, pd.DataFrame]] = []
     # Load optional GRID carbon intensity override once for all buildings
     override_grid_emission, grid_emission_final_g = _load_grid_emission_intensity_override(config)
     grid_emission_final = grid_emission_final_g / 1000.0 if grid_emission_final_g is not None else None  # convert g to kg
-    elec = electricity_carrier(locator)
-    for building in buildings:
-        bpr = building_properties[building]
-        hourly_timeline = OperationalHourlyTimeline(locator, bpr)
-
-        if override_grid_emission and grid_emission_final is not None:
-            hourly_timeline.emission_intensity_timeline[elec] = grid_emission_final
-
-        hourly_timeline.calculate_operational_emission()
-
-        if consider_pv:
-            hourly_timeline.apply_pv_offsetting(pv_codes)
-
-        hourly_timeline.save_results()
-        print(
-            f"Hourly operational emissions for {building} calculated and saved in: {locator.get_lca_operational_hourly_building(building)}."
-        )
-        results.append((building, hourly_timeline.operational_emission_timeline_extended))
+    if not override_grid_emission:
+        grid_emission_final = None
+
+    chunks = building_chunks(buildings, config.get_number_of_processes())
+    n = len(chunks)
+    chunk_results = vectorize(_operational_hourly_chunk, len(chunks))(
+        repeat(locator, n),
+        repeat(weather_data, n),
+        chunks,
+        repeat(grid_emission_final, n),
+        repeat(pv_codes if consider_pv else None, n),
+    )
+    results: list[tuple[str, pd.DataFrame]] = [result for chunk in chunk_results for result in chunk]
 
     # df_by_building = to_ton(sum_by_building(results))
     df_by_building = sum_by_building(results)
@@ -167,6 +164,8 @@ def operational_hourly(config: Configuration) -> None:
     df_by_hour = sum_by_hour([df for _, df in results])
     df_by_building.to_csv(locator.get_total_yearly_operational_building(), float_format='%.2f')
     df_by_hour.to_csv(locator.get_total_yearly_operational_hour(), index=False, float_format='%.2f')
+    ResultStore(locator).add_files(
+        OPERATIONAL_EMISSIONS, {b: locator.get_lca_operational_hourly_building(b) for b in buildings})
     print(
         f"District-level operational emissions saved in: {locator.get_lca_emissions_results_folder()}"
     )
@@ -231,7 +230,108 @@ def total_yearly(config: Configuration) -> None:
     weather_data = epwreader.epw_reader(weather_path)[
         ["year", "drybulb_C", "wetbulb_C", "relhum_percent", "windspd_ms", "skytemp_C"]
     ]
+    # Handle optional grid decarbonisation policy inputs
+    ref_yr = emissions_cfg.grid_decarbonise_reference_year
+    tar_yr = emissions_cfg.grid_decarbonise_target_year
+    tar_ef = emissions_cfg.grid_decarbonise_target_emission_factor
+
+    if ref_yr is not None and tar_yr is not None and tar_ef is not None: # all exist
+        feedstock_policies_arg = {electricity_carrier(locator): (ref_yr, tar_yr, tar_ef)}
+    elif ref_yr is None and tar_yr is None and tar_ef is None: # all None
+        feedstock_policies_arg = None
+    else:
+        raise ValueError(
+            "If one of grid_decarbonise_reference_year, grid_decarbonise_target_year, or grid_decarbonise_target_emission_factor is set, all must be set."
+        )
+
+    chunks = building_chunks(buildings, config.get_number_of_processes())
+    n = len(chunks)
+    chunk_results = vectorize(_total_yearly_chunk, len(chunks))(
+        repeat(locator, n),
+        repeat(weather_data, n),
+        chunks,
+        repeat(end_year, n),
+        repeat(pv_codes if consider_pv else None, n),
+        repeat(feedstock_policies_arg, n),
+    )
+    results: list[tuple[str, pd.DataFrame]] = [result for chunk in chunk_results for result in chunk]
+
+    # df_by_building = to_ton(sum_by_building(results))
+    df_by_building = sum_by_building(results)
+    # df_by_year = to_ton(sum_by_year([df for _, df in results]))
+    df_by_year = sum_by_year([df for _, df in results])
+    df_by_building.to_csv(locator.get_total_emissions_building_year_end(year_end=end_year), float_format='%.2f')
+    df_by_year.to_csv(locator.get_total_emissions_timeline_year_end(year_end=end_year), index=False, float_format='%.2f')
+    ResultStore(locator).add_files(
+        LIFECYCLE_EMISSIONS, {b: locator.get_lca_timeline_building(b) for b in buildings})
+    print(
+        f"District-level total emissions saved in: {locator.get_lca_timeline_folder()}"
+    )
+
+
+def building_chunks(buildings: list[str], number_of_chunks: int) -> list[list[str]]:
+    """Split the buildings into (at most) `number_of_chunks` contiguous, similarly sized chunks.
+
+    Each chunk is calculated by one process, which reads the building properties and the databases
+    once for all of its buildings.
+    """
+    number_of_chunks = max(1, min(int(number_of_chunks), len(buildings)))
+    return [[str(b) for b in chunk] for chunk in np.array_split(np.asarray(buildings, dtype=object), number_of_chunks)]
+
+
+def _operational_hourly_chunk(
+    locator: InputLocator,
+    weather_data: pd.DataFrame,
+    buildings: list[str],
+    grid_emission_final: np.ndarray | None,
+    pv_codes: list[str] | None,
+) -> list[tuple[str, pd.DataFrame]]:
+    """Calculate and save the hourly operational emissions of a chunk of buildings.
+
+    :param grid_emission_final: hourly GRID emission intensity (kgCO2e/kWh) overriding the database, if any.
+    :param pv_codes: the PV panel types to offset the emissions with, None to ignore PV.
+    :return: the building names and their extended hourly operational emission timelines.
+    """
     building_properties = BuildingProperties(locator, weather_data, buildings)
+    elec = electricity_carrier(locator)
+    results: list[tuple[str, pd.DataFrame]] = []
+    for building in buildings:
+        bpr = building_properties[building]
+        hourly_timeline = OperationalHourlyTimeline(locator, bpr)
+
+        if grid_emission_final is not None:
+            hourly_timeline.emission_intensity_timeline[elec] = grid_emission_final
+
+        hourly_timeline.calculate_operational_emission()
+
+        if pv_codes is not None:
+            hourly_timeline.apply_pv_offsetting(pv_codes)
+
+        hourly_timeline.save_results()
+        print(
+            f"Hourly operational emissions for {building} calculated and saved in: {locator.get_lca_operational_hourly_building(building)}."
+        )
+        results.append((building, hourly_timeline.operational_emission_timeline_extended))
+    return results
+
+
+def _total_yearly_chunk(
+    locator: InputLocator,
+    weather_data: pd.DataFrame,
+    buildings: list[str],
+    end_year: int,
+    pv_codes: list[str] | None,
+    feedstock_policies: dict[str, tuple[int, int, float]] | None,
+) -> list[tuple[str, pd.DataFrame]]:
+    """Calculate and save the yearly emission timelines of a chunk of buildings.
+
+    :param pv_codes: the PV panel types to include the embodied emissions of, None to ignore PV.
+    :param feedstock_policies: the decarbonisation policy of each feedstock, see
+        :py:meth:`BuildingEmissionTimeline.fill_operational_emissions`.
+    :return: the building names and their yearly emission timelines.
+    """
+    building_properties = BuildingProperties(locator, weather_data, buildings)
+    envelope_lookup = EnvelopeLookup.from_locator(locator)
     results: list[tuple[str, pd.DataFrame]] = []
     for building in buildings:
         timeline = BuildingEmissionTimeline(
@@ -239,25 +339,13 @@ def total_yearly(config: Configuration) -> None:
             building_name=building,
             locator=locator,
             end_year=end_year,
+            envelope_lookup=envelope_lookup,
         )
         timeline.fill_embodied_emissions()
-        if consider_pv:
+        if pv_codes is not None:
             timeline.fill_pv_embodied_emissions(pv_codes=pv_codes)
-        # Handle optional grid decarbonisation policy inputs
-        ref_yr = emissions_cfg.grid_decarbonise_reference_year
-        tar_yr = emissions_cfg.grid_decarbonise_target_year
-        tar_ef = emissions_cfg.grid_decarbonise_target_emission_factor
-
-        if ref_yr is not None and tar_yr is not None and tar_ef is not None: # all exist
-            feedstock_policies_arg = {electricity_carrier(locator): (ref_yr, tar_yr, tar_ef)}
-        elif ref_yr is None and tar_yr is None and tar_ef is None: # all None
-            feedstock_policies_arg = None
-        else:
-            raise ValueError(
-                "If one of grid_decarbonise_reference_year, grid_decarbonise_target_year, or grid_decarbonise_target_emission_factor is set, all must be set."
-            )
         timeline.fill_operational_emissions(
-            feedstock_policies=feedstock_policies_arg
+            feedstock_policies=feedstock_policies
         )
 
         timeline.demolish(demolition_year=end_year + 1)  # no demolition by default
@@ -266,16 +354,7 @@ def total_yearly(config: Configuration) -> None:
             f"Emission timeline for {building} calculated and saved in: {locator.get_lca_timeline_building(building)}."
         )
         results.append((building, timeline.timeline))
-    #
-    # df_by_building = to_ton(sum_by_building(results))
-    df_by_building = sum_by_building(results)
-    # df_by_year = to_ton(sum_by_year([df for _, df in results]))
-    df_by_year = sum_by_year([df for _, df in results])
-    df_by_building.to_csv(locator.get_total_emissions_building_year_end(year_end=end_year), float_format='%.2f')
-    df_by_year.to_csv(locator.get_total_emissions_timeline_year_end(year_end=end_year), index=False, float_format='%.2f')
-    print(
-        f"District-level total emissions saved in: {locator.get_lca_timeline_folder()}"
-    )
+    return results
 
 
 def sum_by_building(result_list: list[tuple[str, pd.DataFrame]]) -> pd.DataFrame:
@@ -309,24 +388,16 @@ def sum_by_building(result_list: list[tuple[str, pd.DataFrame]]) -> pd.DataFrame
     """
     # Create a new df: each row is the summed value for a building across all its df's indices.
     # Only numeric columns are aggregated (e.g., ignore free-text columns like 'Note').
-    sample_df = result_list[0][1].copy()
-    sample_df = sample_df.drop(columns=[c for c in ("date", "name") if c in sample_df.columns])
+    sample_df = result_list[0][1].drop(columns=["date", "name"], errors="ignore")
     numeric_cols = list(sample_df.select_dtypes(include="number").columns)
-    summed_df = pd.DataFrame(
-        data=0.0,
-        index=[building for building, _ in result_list],
-        columns=numeric_cols,
-    )
+    # one row per building, built at once (assigning row by row is slow for large districts)
+    sums = [
+        df.drop(columns=["date", "name"], errors="ignore").select_dtypes(include="number").sum(axis=0)
+        for _, df in result_list
+    ]
+    summed_df = pd.DataFrame(sums, index=[building for building, _ in result_list])
+    summed_df = summed_df.reindex(columns=numeric_cols, fill_value=0.0).fillna(0.0).astype(float)
     summed_df.index.rename("name", inplace=True)
-    for building, df in result_list:
-        df_copy = df.copy()
-        if "date" in df_copy.columns:
-            df_copy = df_copy.drop(columns=["date"])
-        if "name" in df_copy.columns:
-            df_copy = df_copy.drop(columns=["name"])
-
-        df_numeric = df_copy.select_dtypes(include="number")
-        summed_df.loc[building] = summed_df.loc[building].add(df_numeric.sum(axis=0), fill_value=0.0)
     return summed_df
 
 
@@ -670,7 +741,7 @@ def calculate_emissions_for_whatif(whatif_name: str, config: Configuration) -> N
     network_name = config_data.get('metadata', {}).get('network_name')
 
     # Emission intensity (8760 rows, kgCO2/kWh per carrier)
-    feedstock_db = Feedstocks.from_locator(locator)
+    feedstock_db = get_catalog(locator).feedstocks_database()
     emission_intensity = _expand_feedstock_emissions(feedstock_db)
     # Scenario's electricity carrier name (from ENERGY_CARRIERS.csv — 'GRID'
     # by default). Used below to route the grid-intensity override and to
@@ -710,6 +781,7 @@ def calculate_emissions_for_whatif(whatif_name: str, config: Configuration) -> N
     building_rows_df = summary_df[summary_df['type'] == 'building'] if 'type' in summary_df.columns else summary_df
     building_names = building_rows_df['name'].dropna().tolist()
     building_properties = BuildingProperties(locator, weather_data, building_names)
+    envelope_lookup = EnvelopeLookup.from_locator(locator)
 
     # --- Process buildings ---
     operational_results = []   # (name, hourly_df)
@@ -761,6 +833,7 @@ def calculate_emissions_for_whatif(whatif_name: str, config: Configuration) -> N
                 building_name=building_name,
                 locator=locator,
                 end_year=end_year,
+                envelope_lookup=envelope_lookup,
             )
             timeline.fill_embodied_emissions()
             solar_config = supply_cfg.get('solar', {})
@@ -18,6 +18,7 @@ from cea.constants import (
 )
 from cea.datamanagement.database.components import Feedstocks
 from cea.datamanagement.database.envelope_lookup import EnvelopeLookup
+from cea.technologies.component_catalog import get_catalog
 
 __author__ = "Yiqiao Wang, Zhongming Shi"
 __copyright__ = "Copyright 2025, Architecture and Building Systems - ETH Zurich"
@@ -231,23 +232,61 @@ def discount_over_year_indexed(
     Returns:
         pd.Series: The discounted series.
     """
+    series = base.reindex(base.index).astype(float)
+    factors = discount_factors(
+        years_from_index(base.index), ref_year=ref_year, tar_year=tar_year, tar_fraction=tar_fraction
+    )
+    return series * factors
+
+
+def discount_factors(
+    years: list[int] | np.ndarray,
+    *,
+    ref_year: int,
+    tar_year: int,
+    tar_fraction: float,
+) -> np.ndarray:
+    """The factors applied by :func:`discount_over_year_indexed` to each of `years`: 1.0 up to `ref_year`,
+    linearly decreasing to `tar_fraction` at `tar_year` and `tar_fraction` thereafter.
+
+    Computing the factors once lets a policy be applied to many columns (or buildings) with a single
+    multiplication.
+    """
     if tar_year <= ref_year:
         raise ValueError("Target year must be greater than reference year.")
     if tar_fraction < 0:
         raise ValueError("Target fraction must be non-negative.")
 
-    years = years_from_index(base.index)
-    series = base.reindex(base.index).astype(float)
-
-    years_arr = np.array(years, dtype=int)
-    factors = np.ones(len(base.index), dtype=float)
+    years_arr = np.asarray(years, dtype=int)
+    factors = np.ones(len(years_arr), dtype=float)
     mask_linear = (years_arr >= int(ref_year)) & (years_arr <= int(tar_year))
     if mask_linear.any():
         n = int(mask_linear.sum())
         factors[mask_linear] = np.linspace(1.0, float(tar_fraction), n)
     factors[years_arr > int(tar_year)] = float(tar_fraction)
+    return factors
 
-    return series * factors
+
+def lifetime_schedule(start_year: int, lifetimes: list[int] | np.ndarray, years: list[int] | np.ndarray) -> np.ndarray:
+    """Replacement schedule of components with the given service lives.
+
+    A component is (re-)built in `start_year` and again every `lifetime` years after that. For example,
+    with `start_year=2020`, `lifetimes=[2, 3]` and `years=[2020, ..., 2026]`:
+        ```
+        [[1, 0, 1, 0, 1, 0, 1],
+         [1, 0, 0, 1, 0, 0, 1]]
+        ```
+
+    :param start_year: the construction year.
+    :param lifetimes: the service life of each component in years, minimum 1.
+    :param years: the years of the timeline.
+    :return: a (components × years) array, 1.0 in the years each component is (re-)built and 0.0 otherwise.
+    """
+    lifetimes_arr = np.asarray(lifetimes, dtype=int).reshape(-1, 1)
+    if (lifetimes_arr < 1).any():
+        raise ValueError("Lifetime must be at least 1 year.")
+    offset = np.asarray(years, dtype=int).reshape(1, -1) - int(start_year)
+    return ((offset >= 0) & (offset % lifetimes_arr == 0)).astype(float)
 
 
 def apply_feedstock_policies_inplace(
@@ -299,35 +338,30 @@ def apply_feedstock_policies_inplace(
         matching_fs = [
             fs for fs in available_feedstocks if str(fs).strip().upper() == fs_key_upper
         ]
-        if not matching_fs:
-            matching_fs = []
-        for fs in matching_fs:
-            for d in demand_types:
-                col = f"{d}_{fs}_kgCO2e"
-                if col in operational_multi_years.columns:
-                    operational_multi_years[col] = discount_over_year_indexed(
-                        operational_multi_years[col],
-                        ref_year=ref,
-                        tar_year=tgt,
-                        tar_fraction=frac,
-                    )
+        cols = [
+            f"{d}_{fs}_kgCO2e"
+            for fs in matching_fs
+            for d in demand_types
+            if f"{d}_{fs}_kgCO2e" in operational_multi_years.columns
+        ]
 
         # PV offset/export emissions are always tied to GRID electricity intensity.
         # if the feedstock being discounted is GRID, apply to PV columns too.
         # Columns look like: PV_{pv_code}_GRID_offset_kgCO2e or PV_{pv_code}_GRID_export_kgCO2e
         if fs_key_upper == "GRID":
-            for col in operational_multi_years.columns:
-                if (
-                    isinstance(col, str)
-                    and col.startswith("PV_")
-                    and col.endswith("_kgCO2e")
-                ):
-                    operational_multi_years[col] = discount_over_year_indexed(
-                        operational_multi_years[col],
-                        ref_year=ref,
-                        tar_year=tgt,
-                        tar_fraction=frac,
-                    )
+            cols += [
+                col
+                for col in operational_multi_years.columns
+                if isinstance(col, str) and col.startswith("PV_") and col.endswith("_kgCO2e")
+            ]
+        if not cols:
+            continue
+        factors = discount_factors(
+            years_from_index(operational_multi_years.index), ref_year=ref, tar_year=tgt, tar_fraction=frac
+        )
+        operational_multi_years[cols] = (
+            operational_multi_years[cols].to_numpy(dtype=float) * factors[:, np.newaxis]
+        )
 
 
 class BaseYearlyEmissionTimeline:
@@ -347,11 +381,15 @@ class BaseYearlyEmissionTimeline:
         name: str,
         locator: InputLocator,
         timeline: pd.DataFrame | None = None,
+        envelope_lookup: EnvelopeLookup | None = None,
     ):
         self.name = str(name)
         self.locator = locator
-        self.envelope_lookup: EnvelopeLookup = EnvelopeLookup.from_locator(self.locator)
-        self.feedstock_db: Feedstocks = Feedstocks.from_locator(self.locator)
+        # the envelope database can be shared between the timelines of many buildings (read-only)
+        self.envelope_lookup: EnvelopeLookup = (
+            envelope_lookup if envelope_lookup is not None else EnvelopeLookup.from_locator(self.locator)
+        )
+        self.feedstock_db: Feedstocks = get_catalog(self.locator).feedstocks_database()
         self.timeline = timeline if isinstance(timeline, pd.DataFrame) else pd.DataFrame()
 
     def get_available_feedstocks(self) -> list[str]:
@@ -531,6 +569,7 @@ class BuildingYearlyEmissionTimeline(BaseYearlyEmissionTimeline):
         building_name: str,
         locator: InputLocator,
         end_year: int,
+        envelope_lookup: EnvelopeLookup | None = None,
     ):
         """Initialize the BuildingEmissionTimeline object.
 
@@ -543,8 +582,11 @@ class BuildingYearlyEmissionTimeline(BaseYearlyEmissionTimeline):
         :type locator: InputLocator
         :param end_year: The last year that should exist in the building timeline.
         :type end_year: int
+        :param envelope_lookup: the envelope database to share between the timelines of several buildings,
+            read from the scenario if not given.
+        :type envelope_lookup: EnvelopeLookup | None
         """
-        super().__init__(name=building_name, locator=locator)
+        super().__init__(name=building_name, locator=locator, envelope_lookup=envelope_lookup)
 
         self._is_demolished = False
         self.geometry = building_properties.geometry[self.name]
@@ -595,35 +637,56 @@ class BuildingYearlyEmissionTimeline(BaseYearlyEmissionTimeline):
         key: str,
         note_detail: str | None = None,
     ):
-        self._log_emission_with_lifetime(
-            emission=production_per_area * area, lifetime=lifetime, col=f"production_{key}_kgCO2e"
-        )
-        self._log_emission_with_lifetime(
-            emission=-biogenic_per_area * area,
-            lifetime=lifetime,
-            col=f"biogenic_{key}_kgCO2e",
-        )
-        self._log_emission_with_lifetime(
-            emission=demolition_per_area * area,
-            lifetime=lifetime,
-            col=f"demolition_{key}_kgCO2e",
-        )
-        self.log(
-            emission=0.0,  # when building is first built, no demolition emission
-            year=self.typology["year"],
-            col=f"demolition_{key}_kgCO2e",
-            additive=False,
+        self._log_component_emissions(
+            keys=[key],
+            areas=[area],
+            production_per_area=[production_per_area],
+            biogenic_per_area=[biogenic_per_area],
+            demolition_per_area=[demolition_per_area],
+            lifetimes=[lifetime],
+            note_details=[note_detail],
         )
 
-        # Notes: avoid listing details in the construction year (use the generic 'Constructed' message).
+    def _log_component_emissions(
+        self,
+        *,
+        keys: list[str],
+        areas: list[float],
+        production_per_area: list[float],
+        biogenic_per_area: list[float],
+        demolition_per_area: list[float],
+        lifetimes: list[int],
+        note_details: list[str | None],
+    ) -> None:
+        """Log the production, biogenic and demolition emissions of several components at once.
+
+        Each component is (re-)built in the construction year and every `lifetime` years after that
+        (see :func:`lifetime_schedule`); no demolition emission is logged in the construction year.
+        The emissions are added to the values already in the timeline.
+        """
         start_year = int(self.typology["year"])
-        max_year = max(years_from_index(self.timeline.index))
-        if lifetime > 0 and max_year >= start_year + lifetime:
-            renovation_years = list(range(start_year + int(lifetime), int(max_year) + 1, int(lifetime)))
-            if renovation_years:
-                detail = f" ({note_detail})" if note_detail else ""
-                for y in renovation_years:
-                    self._append_note(year=int(y), message=f"Service life reached: {key}{detail}")
+        years = np.array(years_from_index(self.timeline.index), dtype=int)
+        schedule = lifetime_schedule(start_year, lifetimes, years)
+        areas_arr = np.asarray(areas, dtype=float)
+
+        for emission_type, per_area in (
+            ("production", np.asarray(production_per_area, dtype=float)),
+            ("biogenic", -np.asarray(biogenic_per_area, dtype=float)),
+            ("demolition", np.asarray(demolition_per_area, dtype=float)),
+        ):
+            cols = [f"{emission_type}_{key}_kgCO2e" for key in keys]
+            values = self.timeline[cols].to_numpy(dtype=float) + (schedule * (per_area * areas_arr)[:, np.newaxis]).T
+            if emission_type == "demolition":
+                # when building is first built, no demolition emission
+                values[years == start_year, :] = 0.0
+            self.timeline[cols] = values
+
+        # Notes: avoid listing details in the construction year (use the generic 'Constructed' message).
+        max_year = int(years.max())
+        for key, lifetime, note_detail in zip(keys, lifetimes, note_details):
+            detail = f" ({note_detail})" if note_detail else ""
+            for y in range(start_year + int(lifetime), max_year + 1, int(lifetime)):
+                self._append_note(year=int(y), message=f"Service life reached: {key}{detail}")
 
     def fill_embodied_emissions(self) -> None:
         """
@@ -632,7 +695,16 @@ class BuildingYearlyEmissionTimeline(BaseYearlyEmissionTimeline):
         and whenever any component needs to be renovated.
         """
         self.check_demolished()
-        
+
+        components: dict[str, list] = {
+            "keys": [],
+            "areas": [],
+            "production_per_area": [],
+            "biogenic_per_area": [],
+            "demolition_per_area": [],
+            "lifetimes": [],
+            "note_details": [],
+        }
         for key, value in _MAPPING_DICT.items():
             area: float = self.surface_area[f"A{key}"]
             code_for_note: str | None = None
@@ -677,7 +749,18 @@ class BuildingYearlyEmissionTimeline(BaseYearlyEmissionTimeline):
                 production = float(ghg_production_any)
                 biogenic = float(biogenic_any)
                 demolition = float(ghg_recycling_any)
-            self.log_emissions(area, production, biogenic, demolition, lifetime, key, note_detail=code_for_note)
+            for field, item in (
+                ("keys", key),
+                ("areas", area),
+                ("production_per_area", production),
+                ("biogenic_per_area", biogenic),
+                ("demolition_per_area", demolition),
+                ("lifetimes", lifetime),
+                ("note_details", code_for_note),
+            ):
+                components[field].append(item)
+        # all components are scheduled in one go, instead of one timeline lookup per component and emission type
+        self._log_component_emissions(**components)
 
     def fill_pv_embodied_emissions(self, pv_codes: list[str]) -> None:
         """Initialize the PV system in the building emission timeline.
@@ -687,7 +770,7 @@ class BuildingYearlyEmissionTimeline(BaseYearlyEmissionTimeline):
         Note: PV file existence is already checked in total_yearly() before calling this method.
         """
         self.check_demolished()
-        pv_db = pd.read_csv(self.locator.get_db4_components_conversion_conversion_technology_csv("PHOTOVOLTAIC_PANELS"), index_col='code')
+        pv_db = get_catalog(self.locator).indexed_table("PHOTOVOLTAIC_PANELS")
 
         for pv_code in pv_codes:
             if pv_code not in pv_db.index:
@@ -762,10 +845,7 @@ class BuildingYearlyEmissionTimeline(BaseYearlyEmissionTimeline):
                 pv_facades_by_code.setdefault(pv_code, []).append(facade)
 
         if pv_facades_by_code:
-            pv_db = pd.read_csv(
-                self.locator.get_db4_components_conversion_conversion_technology_csv('PHOTOVOLTAIC_PANELS'),
-                index_col='code',
-            )
+            pv_db = get_catalog(self.locator).indexed_table('PHOTOVOLTAIC_PANELS')
             for pv_code, facades in pv_facades_by_code.items():
                 if pv_code not in pv_db.index:
                     continue
@@ -808,33 +888,12 @@ class BuildingYearlyEmissionTimeline(BaseYearlyEmissionTimeline):
 
         Returns a Series aligned to the timeline index with the discount applied.
         """
-        if tar_year <= ref_year:
-            raise ValueError("Target year must be greater than reference year.")
-        if tar_fraction < 0:
-            raise ValueError("Target fraction must be non-negative.")
-
         # Ensure alignment to the timeline index
         idx = self.timeline.index
         series = base.reindex(idx).astype(float)
-
-        # Convert 'Y_YYYY' index to integer years
-        years: list[int] = []
-        for label in idx:
-            s = str(label)
-            if s.startswith("Y_"):
-                s = s[2:]
-                years.append(int(s))
-
-        years_arr = np.array(years, dtype=int)
-        factors = np.ones(len(idx), dtype=float)
-        # Linear segment (inclusive)
-        mask_linear = (years_arr >= int(ref_year)) & (years_arr <= int(tar_year))
-        if mask_linear.any():
-            n = int(mask_linear.sum())
-            factors[mask_linear] = np.linspace(1.0, float(tar_fraction), n)
-        # After target
-        factors[years_arr > int(tar_year)] = float(tar_fraction)
-
+        factors = discount_factors(
+            years_from_index(idx), ref_year=ref_year, tar_year=tar_year, tar_fraction=tar_fraction
+        )
         return series * factors
 
     # ---- helpers for operational emissions -----------------------------------------
@@ -979,6 +1038,13 @@ class BuildingYearlyEmissionTimeline(BaseYearlyEmissionTimeline):
             Must have the same column naming convention ({demand_type}_{feedstock}_kgCO2e).
         """
         self.check_demolished()
+        # read the hourly results once for both passes below
+        if operational_df is not None:
+            operational_timeseries = operational_df.drop(columns=['date', 'name'], errors='ignore')
+        else:
+            _, operational_timeseries = self._read_operational_timeseries()
+            operational_timeseries = operational_timeseries.drop(columns=['name'], errors='ignore')
+
         feedstocks = self.get_available_feedstocks()
         self.fill_operational_emissions_for_building(
             locator=self.locator,
@@ -987,15 +1053,10 @@ class BuildingYearlyEmissionTimeline(BaseYearlyEmissionTimeline):
             feedstock_policies=feedstock_policies,
             apply_decarbonisation=apply_decarbonisation,
             include_pv_offset=include_pv_offset,
-            operational_df=operational_df,
+            operational_df=operational_timeseries,
         )
         demand_types = list(_tech_name_mapping.keys())  # ['Qhs_sys', 'Qww_sys', 'Qcs_sys', 'E_sys']
-        feedstocks = list(self.feedstock_db._library.keys()) + ["NONE"]
 
-        if operational_df is not None:
-            operational_timeseries = operational_df.drop(columns=['date', 'name'], errors='ignore')
-        else:
-            _, operational_timeseries = self._read_operational_timeseries()
         yearly_sum = operational_timeseries.sum(axis=0)
         operational_multiyrs = self._tile_yearly(yearly_sum)
         self._apply_feedstock_policies(operational_multiyrs, feedstock_policies, feedstocks, demand_types)
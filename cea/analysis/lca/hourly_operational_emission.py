@@ -8,8 +8,8 @@ import numpy as np
 import pandas as pd
 
 from cea.constants import HOURS_IN_YEAR
-from cea.datamanagement.database.components import Feedstocks
 from cea.demand.building_properties import BuildingProperties
+from cea.technologies.component_catalog import get_catalog
 from cea.utilities import epwreader
 
 __author__      = "Yiqiao Wang, Zhongming Shi"
@@ -60,7 +60,7 @@ class OperationalHourlyTimeline:
         self._is_emission_calculated = False
         self.locator = locator
         self.bpr = bpr
-        self.feedstock_db = Feedstocks.from_locator(locator)
+        self.feedstock_db = get_catalog(locator).feedstocks_database()
         # Track which per-tech PV allocation columns were added per PV code for traceability
         self._pv_allocation: dict[str, pd.DataFrame] = {}
         self.emission_intensity_timeline = self.expand_feedstock_emissions()
@@ -375,7 +375,6 @@ class OperationalHourlyTimeline:
 
 if __name__ == "__main__":
     from cea.config import Configuration
-    from cea.datamanagement.database.components import Feedstocks
     from cea.demand.building_properties import BuildingProperties
     from cea.inputlocator import InputLocator
     from cea.utilities import epwreader
@@ -8,6 +8,7 @@ import configparser
 
 # Module-level constants
 CEA_CONFIG: str
+CONFIG_STATE_VERSION: int
 DEFAULT_CONFIG: str
 
 class Configuration:
@@ -55,6 +56,7 @@ class Configuration:
     result_summary: ResultSummarySection
     result_analytics: ResultAnalyticsSection
     test: TestSection
+    benchmark: BenchmarkSection
     trace_inputlocator: TraceInputlocatorSection
     thermal_network: ThermalNetworkSection
     thermal_network_simplified: ThermalNetworkSimplifiedSection
@@ -192,6 +194,8 @@ class Configuration:
     @overload
     def __getattr__(self, item: Literal["test"]) -> TestSection: ...
     @overload
+    def __getattr__(self, item: Literal["benchmark"]) -> BenchmarkSection: ...
+    @overload
     def __getattr__(self, item: Literal["trace_inputlocator"]) -> TraceInputlocatorSection: ...
     @overload
     def __getattr__(self, item: Literal["thermal_network"]) -> ThermalNetworkSection: ...
@@ -492,6 +496,8 @@ class RadiationSection(Section):
     surrounding_geometry: float
     consider_floors: bool
     neglect_adjacent_buildings: bool
+    geometry_cache: bool
+    terrain_vertical_tolerance: float
     albedo: float
     rad_ab: int
     rad_ad: int
@@ -524,6 +530,10 @@ class RadiationSection(Section):
     @overload
     def __getattr__(self, item: Literal["neglect_adjacent_buildings"]) -> bool: ...
     @overload
+    def __getattr__(self, item: Literal["geometry_cache"]) -> bool: ...
+    @overload
+    def __getattr__(self, item: Literal["terrain_vertical_tolerance"]) -> float: ...
+    @overload
     def __getattr__(self, item: Literal["albedo"]) -> float: ...
     @overload
     def __getattr__(self, item: Literal["rad_ab"]) -> int: ...
@@ -585,6 +595,7 @@ class DemandSection(Section):
     use_dynamic_infiltration_calculation: bool
     overheating_warning: bool
     retain_technical_results: bool
+    profile: bool
 
     @overload
     def __getattr__(self, item: Literal["buildings"]) -> list[str]: ...
@@ -594,6 +605,8 @@ class DemandSection(Section):
     def __getattr__(self, item: Literal["overheating_warning"]) -> bool: ...
     @overload
     def __getattr__(self, item: Literal["retain_technical_results"]) -> bool: ...
+    @overload
+    def __getattr__(self, item: Literal["profile"]) -> bool: ...
     def __getattr__(self, item: str) -> Any: ...
 
 class FinalEnergySection(Section):
@@ -848,6 +861,7 @@ class PathwaySimulationsSection(Section):
     existing_pathway_name: str
     skip_already_simulated_states: bool
     skip_custom_states: bool
+    reuse_unchanged_outputs: bool
 
     @overload
     def __getattr__(self, item: Literal["existing_pathway_name"]) -> str: ...
@@ -855,6 +869,8 @@ class PathwaySimulationsSection(Section):
     def __getattr__(self, item: Literal["skip_already_simulated_states"]) -> bool: ...
     @overload
     def __getattr__(self, item: Literal["skip_custom_states"]) -> bool: ...
+    @overload
+    def __getattr__(self, item: Literal["reuse_unchanged_outputs"]) -> bool: ...
     def __getattr__(self, item: str) -> Any: ...
 
 class PathwayStateEditSection(Section):
@@ -1012,26 +1028,37 @@ class ShapefileToolsSection(Section):
 class SensitivityAnalysisToolsSection(Section):
     """Typed section for sensitivity-analysis-tools configuration"""
     create_scenario_directory: bool
+    method: Optional[str]
     n: int
     having_variable_1: bool
     variable_1_lower_bound: float | None
     variable_1_upper_bound: float | None
+    variable_1_input: Any
     having_variable_2: bool
     variable_2_lower_bound: float | None
     variable_2_upper_bound: float | None
+    variable_2_input: Any
     having_variable_3: bool
     variable_3_lower_bound: float | None
     variable_3_upper_bound: float | None
+    variable_3_input: Any
     having_variable_4: bool
     variable_4_lower_bound: float | None
     variable_4_upper_bound: float | None
+    variable_4_input: Any
     having_variable_5: bool
     variable_5_lower_bound: float | None
     variable_5_upper_bound: float | None
+    variable_5_input: Any
+    commands: List[str]
+    target_outputs: List[str]
+    keep_sample_scenarios: bool
 
     @overload
     def __getattr__(self, item: Literal["create_scenario_directory"]) -> bool: ...
     @overload
+    def __getattr__(self, item: Literal["method"]) -> Optional[str]: ...
+    @overload
     def __getattr__(self, item: Literal["n"]) -> int: ...
     @overload
     def __getattr__(self, item: Literal["having_variable_1"]) -> bool: ...
@@ -1040,29 +1067,45 @@ class SensitivityAnalysisToolsSection(Section):
     @overload
     def __getattr__(self, item: Literal["variable_1_upper_bound"]) -> float | None: ...
     @overload
+    def __getattr__(self, item: Literal["variable_1_input"]) -> Any: ...
+    @overload
     def __getattr__(self, item: Literal["having_variable_2"]) -> bool: ...
     @overload
     def __getattr__(self, item: Literal["variable_2_lower_bound"]) -> float | None: ...
     @overload
     def __getattr__(self, item: Literal["variable_2_upper_bound"]) -> float | None: ...
     @overload
+    def __getattr__(self, item: Literal["variable_2_input"]) -> Any: ...
+    @overload
     def __getattr__(self, item: Literal["having_variable_3"]) -> bool: ...
     @overload
     def __getattr__(self, item: Literal["variable_3_lower_bound"]) -> float | None: ...
     @overload
     def __getattr__(self, item: Literal["variable_3_upper_bound"]) -> float | None: ...
     @overload
+    def __getattr__(self, item: Literal["variable_3_input"]) -> Any: ...
+    @overload
     def __getattr__(self, item: Literal["having_variable_4"]) -> bool: ...
     @overload
     def __getattr__(self, item: Literal["variable_4_lower_bound"]) -> float | None: ...
     @overload
     def __getattr__(self, item: Literal["variable_4_upper_bound"]) -> float | None: ...
     @overload
+    def __getattr__(self, item: Literal["variable_4_input"]) -> Any: ...
+    @overload
     def __getattr__(self, item: Literal["having_variable_5"]) -> bool: ...
     @overload
     def __getattr__(self, item: Literal["variable_5_lower_bound"]) -> float | None: ...
     @overload
     def __getattr__(self, item: Literal["variable_5_upper_bound"]) -> float | None: ...
+    @overload
+    def __getattr__(self, item: Literal["variable_5_input"]) -> Any: ...
+    @overload
+    def __getattr__(self, item: Literal["commands"]) -> List[str]: ...
+    @overload
+    def __getattr__(self, item: Literal["target_outputs"]) -> List[str]: ...
+    @overload
+    def __getattr__(self, item: Literal["keep_sample_scenarios"]) -> bool: ...
     def __getattr__(self, item: str) -> Any: ...
 
 class FormatHelperSection(Section):
@@ -1101,6 +1144,7 @@ class BatchProcessWorkflowSection(Section):
     system_costs: bool
     optimisation: bool
     results_summary_and_analytics: bool
+    parallel_steps: bool
 
     @overload
     def __getattr__(self, item: Literal["scenarios_to_simulate"]) -> list[str]: ...
@@ -1148,6 +1192,8 @@ class BatchProcessWorkflowSection(Section):
     def __getattr__(self, item: Literal["optimisation"]) -> bool: ...
     @overload
     def __getattr__(self, item: Literal["results_summary_and_analytics"]) -> bool: ...
+    @overload
+    def __getattr__(self, item: Literal["parallel_steps"]) -> bool: ...
     def __getattr__(self, item: str) -> Any: ...
 
 class ResultSummarySection(Section):
@@ -1215,6 +1261,29 @@ class TestSection(Section):
 
     def __getattr__(self, item: str) -> Any: ...
 
+class BenchmarkSection(Section):
+    """Typed section for benchmark configuration"""
+    folder: str
+    workflow: str | None
+    save_baseline: bool
+    time_threshold: float
+    memory_threshold: float
+    io_threshold: float
+
+    @overload
+    def __getattr__(self, item: Literal["folder"]) -> str: ...
+    @overload
+    def __getattr__(self, item: Literal["workflow"]) -> str | None: ...
+    @overload
+    def __getattr__(self, item: Literal["save_baseline"]) -> bool: ...
+    @overload
+    def __getattr__(self, item: Literal["time_threshold"]) -> float: ...
+    @overload
+    def __getattr__(self, item: Literal["memory_threshold"]) -> float: ...
+    @overload
+    def __getattr__(self, item: Literal["io_threshold"]) -> float: ...
+    def __getattr__(self, item: str) -> Any: ...
+
 class TraceInputlocatorSection(Section):
     """Typed section for trace-inputlocator configuration"""
     scripts: list[str]
@@ -1275,6 +1344,7 @@ class ThermalNetworkDetailedSection(Section):
     start_t: int
     stop_t: int
     use_representative_week_per_month: bool
+    representative_hours: int
     minimum_mass_flow_iteration_limit: int
     minimum_edge_mass_flow: float
     diameter_iteration_limit: int
@@ -1290,6 +1360,8 @@ class ThermalNetworkDetailedSection(Section):
     @overload
     def __getattr__(self, item: Literal["use_representative_week_per_month"]) -> bool: ...
     @overload
+    def __getattr__(self, item: Literal["representative_hours"]) -> int: ...
+    @overload
     def __getattr__(self, item: Literal["minimum_mass_flow_iteration_limit"]) -> int: ...
     @overload
     def __getattr__(self, item: Literal["minimum_edge_mass_flow"]) -> float: ...
@@ -1699,6 +1771,7 @@ class NetworkLayoutSection(Section):
     auto_modify_network: bool
     consider_only_buildings_with_demand: bool
     algorithm: Optional[str]
+    steiner_backend: Optional[str]
     connection_candidates: int
     snap_tolerance: float | None
 
@@ -1737,6 +1810,8 @@ class NetworkLayoutSection(Section):
     @overload
     def __getattr__(self, item: Literal["algorithm"]) -> Optional[str]: ...
     @overload
+    def __getattr__(self, item: Literal["steiner_backend"]) -> Optional[str]: ...
+    @overload
     def __getattr__(self, item: Literal["connection_candidates"]) -> int: ...
     @overload
     def __getattr__(self, item: Literal["snap_tolerance"]) -> float | None: ...
@@ -1768,6 +1843,7 @@ class WorkflowSection(Section):
     resume: bool
     resume_file: str | None
     trace_input: bool
+    parallel_steps: bool
 
     @overload
     def __getattr__(self, item: Literal["workflow"]) -> str: ...
@@ -1777,6 +1853,8 @@ class WorkflowSection(Section):
     def __getattr__(self, item: Literal["resume_file"]) -> str | None: ...
     @overload
     def __getattr__(self, item: Literal["trace_input"]) -> bool: ...
+    @overload
+    def __getattr__(self, item: Literal["parallel_steps"]) -> bool: ...
     def __getattr__(self, item: str) -> Any: ...
 
 class RenameBuildingSection(Section):
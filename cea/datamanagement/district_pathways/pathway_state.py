@@ -35,6 +35,7 @@ from cea.datamanagement.district_pathways.pathway_status import (
     record_simulated_state,
 )
 from cea.inputlocator import InputLocator
+from cea.utilities.file_clone import clone_tree
 from cea.utilities.fingerprint import hash_payload
 from cea.utilities.standardize_coordinates import shapefile_to_WSG_and_UTM
 
@@ -936,10 +937,9 @@ def create_state_in_time_scenario(
     )
     input_folder_path = main_locator.get_input_folder()
     state_locator = InputLocator(state_scenario_folder)
-    # Copy all files from the input folder to the pathway-state folder.
-    shutil.copytree(
-        input_folder_path, state_locator.get_input_folder(), dirs_exist_ok=True
-    )  # make sure existing files are overwritten
+    # Copy all files from the input folder to the pathway-state folder (overwriting existing files). The copies
+    # share their data with the main scenario where the file system supports copy-on-write clones.
+    clone_tree(input_folder_path, state_locator.get_input_folder())
     if update_yaml:
         add_year_in_pathway_yaml(config, year_of_state, pathway_name=pathway_name)
     return None
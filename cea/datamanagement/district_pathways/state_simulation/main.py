@@ -4,7 +4,8 @@ This module keeps the high-level orchestration for pathway-state simulations in
 
 - validate that the baked `state_{year}` folders match the pathway log
 - run each state in two passes
-  - first the base workflow through demand
+  - first the base workflow through demand, reusing the radiation, occupancy and demand
+    results of buildings that did not change since the previous state
   - then the post-demand tail with optional network steps and emissions
 - record the final workflow back into the pathway log
 - build the pathway emissions timeline after all state years finish
@@ -30,7 +31,7 @@ from cea.datamanagement.district_pathways.pathway_state import (
     DistrictEvolutionPathway,
     DistrictStateYear,
 )
-from cea.datamanagement.district_pathways.state_simulation import workflow_assembly
+from cea.datamanagement.district_pathways.state_simulation import output_reuse, workflow_assembly
 from cea.datamanagement.district_pathways.state_simulation.workflow_assembly import (
     determine_network_phase_mode,
 )
@@ -141,6 +142,9 @@ def simulate_all_states(config: Configuration, pathway_name: str) -> None:
     skip_custom = bool(
         getattr(config.pathway_simulations, "skip_custom_states", False)
     )
+    reuse_unchanged_outputs = bool(
+        getattr(config.pathway_simulations, "reuse_unchanged_outputs", True)
+    )
     skipped_years: list[int] = []
     years_to_simulate: list[int] = list(state_years)
     if skip_already_simulated or skip_custom:
@@ -229,7 +233,19 @@ def simulate_all_states(config: Configuration, pathway_name: str) -> None:
             modifications={},
             main_locator=pathway.main_locator,
         )
-        state.simulate(config, workflow=base_workflow, mark_simulated=False)
+        # Buildings that did not change since the previous state (skipped or simulated
+        # earlier in this run) copy their radiation, occupancy and demand results from it.
+        previous_years = [y for y in state_years if int(y) < int(year)]
+        previous_locator = None
+        if reuse_unchanged_outputs and previous_years:
+            previous_locator = InputLocator(
+                main_locator.get_state_in_time_scenario_folder(
+                    pathway_name=pathway_name, year_of_state=max(previous_years)
+                )
+            )
+        output_reuse.simulate_base_workflow(
+            state, config, base_workflow, previous_locator
+        )
 
         print(
             f"\n--- Simulating state {year}: post-demand workflow ---",
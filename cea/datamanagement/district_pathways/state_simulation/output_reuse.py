@@ -0,0 +1,411 @@
+"""Reuse of per-building simulation outputs between consecutive pathway states.
+
+Most buildings do not change from one state year to the next, so re-running radiation, occupancy and demand for
+every building of every state makes a 30-year pathway cost 30 full simulations. Instead, each building's outputs are
+keyed on a fingerprint of the inputs they were simulated with:
+
+- radiation: the whole scene (zone, surroundings, trees, terrain, envelope and the database rows it references),
+  since every building shades and reflects onto its neighbours.
+- occupancy: the building's own zone and building-properties rows, its schedule, the database rows they reference
+  (transitively, e.g. supply assembly -> component -> feedstock) and the weather.
+- demand: the occupancy fingerprint plus the building's radiation and occupancy results.
+
+The fingerprints of a simulated state are stored in its outputs (see
+``InputLocator.get_building_output_fingerprints_file``). When the next state is simulated, buildings whose
+fingerprint is unchanged copy their outputs from the previous state and the script only runs for the others.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import geopandas as gpd
+import pandas as pd
+import shapely
+
+from cea.config import Configuration
+from cea.inputlocator import InputLocator
+from cea.utilities.file_clone import clone_file
+from cea.utilities.fingerprint import hash_files, hash_folder, hash_payload
+
+# bump whenever the fingerprints change, so that outputs simulated with older fingerprints are not reused
+OUTPUT_FINGERPRINT_VERSION = 1
+
+# columns that identify the rows of a database table other tables refer to
+DATABASE_KEY_COLUMNS = ("code", "const_type", "use_type")
+
+
+@dataclass(frozen=True)
+class ReusableScript:
+    """Per-building outputs of a workflow script that can be copied from a previous state."""
+    section: str
+    building_files: Callable[[InputLocator, str], list[str]]
+    shared_files: Callable[[InputLocator], list[str]]
+
+
+def _radiation_building_files(locator: InputLocator, building: str) -> list[str]:
+    return [
+        locator.get_radiation_building(building),
+        locator.get_radiation_building_sensors(building),
+        locator.get_radiation_metadata(building),
+    ]
+
+
+REUSABLE_SCRIPTS: dict[str, ReusableScript] = {
+    "radiation": ReusableScript(
+        section="radiation",
+        building_files=_radiation_building_files,
+        shared_files=lambda locator: [locator.get_radiation_materials()],
+    ),
+    "radiation-crax": ReusableScript(
+        section="radiation-crax",
+        building_files=_radiation_building_files,
+        shared_files=lambda locator: [locator.get_radiation_materials()],
+    ),
+    "occupancy": ReusableScript(
+        section="occupancy",
+        building_files=lambda locator, building: [locator.get_occupancy_model_file(building)],
+        shared_files=lambda locator: [],
+    ),
+    "demand": ReusableScript(
+        section="demand",
+        building_files=lambda locator, building: [locator.get_demand_results_file(building)],
+        # the totals are rebuilt from the per-building results (see `merge_total_demand`)
+        shared_files=lambda locator: [],
+    ),
+}
+
+
+@dataclass
+class _DatabaseTable:
+    rel_path: str
+    stem: str
+    key: str | None
+    data: pd.DataFrame
+
+
+class StateInputs:
+    """The inputs of one state scenario, loaded once to fingerprint all of its buildings."""
+
+    def __init__(self, locator: InputLocator):
+        self.locator = locator
+        zone = gpd.read_file(locator.get_zone_geometry())
+        self.building_names: list[str] = sorted(zone["name"].astype(str))
+        self._zone_rows = {
+            str(row["name"]): _zone_row_payload(row) for _, row in zone.iterrows()
+        }
+
+        self._property_tables: dict[str, pd.DataFrame] = {}
+        properties_folder = locator.get_building_properties_folder()
+        if os.path.isdir(properties_folder):
+            for file_name in sorted(os.listdir(properties_folder)):
+                if not file_name.endswith(".csv"):
+                    continue
+                table = pd.read_csv(os.path.join(properties_folder, file_name), dtype=str, keep_default_na=False)
+                if "name" in table.columns:
+                    self._property_tables[file_name] = table.set_index("name")
+
+        self._database_tables, self._database_shared_hash = _load_database(locator.get_db4_folder())
+        self._database_cache: dict[frozenset[str], str] = {}
+        self._building_cache: dict[str, str] = {}
+        self.weather_hash = hash_files([locator.get_weather_file()], root=locator.scenario)
+
+    def _property_rows(self, building: str) -> dict[str, dict[str, str]]:
+        return {
+            file_name: table.loc[building].to_dict() if building in table.index else {}
+            for file_name, table in self._property_tables.items()
+        }
+
+    def database_fingerprint(self, values: frozenset[str]) -> str:
+        """Fingerprint of the database rows (and library files) referenced by `values`, transitively."""
+        if values not in self._database_cache:
+            referenced = set(values)
+            while True:
+                payload: dict[str, Any] = {}
+                found: set[str] = set()
+                for table in self._database_tables:
+                    if table.key is not None:
+                        rows = table.data[table.data[table.key].isin(referenced)]
+                        if len(rows):
+                            payload[table.rel_path] = rows.to_csv(index=False)
+                            found.update(rows.to_numpy().ravel())
+                    elif table.stem in referenced:
+                        payload[table.rel_path] = table.data.to_csv(index=False)
+                if found <= referenced:
+                    break
+                referenced |= found
+            self._database_cache[values] = hash_payload(payload)
+        return self._database_cache[values]
+
+    def building_fingerprint(self, building: str) -> str:
+        """Fingerprint of the inputs of a single building (independent of the other buildings of the state)."""
+        if building not in self._building_cache:
+            self._building_cache[building] = self._calc_building_fingerprint(building)
+        return self._building_cache[building]
+
+    def _calc_building_fingerprint(self, building: str) -> str:
+        zone_row = self._zone_rows[building]
+        property_rows = self._property_rows(building)
+        values = {str(v) for v in zone_row.values()}
+        for row in property_rows.values():
+            values.update(str(v) for v in row.values())
+        return hash_payload({
+            "version": OUTPUT_FINGERPRINT_VERSION,
+            "zone": zone_row,
+            "properties": property_rows,
+            "schedules": hash_files([
+                self.locator.get_building_weekly_schedules(building),
+                self.locator.get_building_weekly_schedules_monthly_multiplier_csv(),
+            ], root=self.locator.scenario),
+            "database": self.database_fingerprint(frozenset(values)),
+            "database_shared": self._database_shared_hash,
+            "weather": self.weather_hash,
+        })
+
+    def scene_fingerprint(self) -> str:
+        """Fingerprint of the inputs of the radiation scene, shared by all buildings of the state."""
+        envelope = pd.read_csv(self.locator.get_building_architecture(), dtype=str, keep_default_na=False)
+        return hash_payload({
+            "version": OUTPUT_FINGERPRINT_VERSION,
+            "geometry": _hash_optional_folder(self.locator.get_building_geometry_folder()),
+            "trees": _hash_optional_folder(self.locator.get_tree_geometry_folder()),
+            "terrain": _hash_optional_folder(self.locator.get_terrain_folder()),
+            "envelope": envelope.to_csv(index=False),
+            "database": self.database_fingerprint(frozenset(envelope.to_numpy().ravel())),
+            "database_shared": self._database_shared_hash,
+            "weather": self.weather_hash,
+        })
+
+
+def _zone_row_payload(row: pd.Series) -> dict[str, str]:
+    payload = {str(k): str(v) for k, v in row.items() if k != "geometry"}
+    payload["geometry"] = shapely.to_wkb(row["geometry"], hex=True) if row["geometry"] is not None else ""
+    return payload
+
+
+def _hash_optional_folder(folder: str) -> str | None:
+    return hash_folder(folder) if os.path.isdir(folder) else None
+
+
+def _load_database(database_folder: str) -> tuple[list[_DatabaseTable], str]:
+    """Read the database tables of a scenario.
+
+    Tables with a key column and library files referenced by name (e.g. the schedule and feedstock libraries) only
+    contribute the rows a building refers to. Everything else is part of a shared fingerprint for all buildings.
+    """
+    tables: list[_DatabaseTable] = []
+    other_files: list[str] = []
+    for root, dirs, files in os.walk(database_folder):
+        dirs.sort()
+        for file_name in sorted(files):
+            path = os.path.join(root, file_name)
+            if not file_name.endswith(".csv"):
+                other_files.append(path)
+                continue
+            data = pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8-sig")
+            key = next((column for column in DATABASE_KEY_COLUMNS if column in data.columns), None)
+            rel_path = os.path.relpath(path, database_folder).replace("\\", "/")
+            tables.append(_DatabaseTable(rel_path, os.path.splitext(file_name)[0], key, data))
+
+    all_values: set[str] = set()
+    for table in tables:
+        all_values.update(table.data.to_numpy().ravel())
+    referenced_tables = [table for table in tables if table.key is not None or table.stem in all_values]
+    shared_tables = [table for table in tables if table.key is None and table.stem not in all_values]
+    shared_hash = hash_payload({
+        "tables": {table.rel_path: table.data.to_csv(index=False) for table in shared_tables},
+        "files": hash_files(other_files, root=database_folder),
+    })
+    return referenced_tables, shared_hash
+
+
+def _section_payload(config: Configuration, section: str) -> dict[str, str]:
+    parameters = config.sections[section].parameters
+    return {name: parameter.get_raw() for name, parameter in parameters.items() if name != "buildings"}
+
+
+def calc_script_fingerprints(
+    script: str,
+    inputs: StateInputs,
+    config: Configuration,
+) -> dict[str, str]:
+    """Fingerprint of the inputs of each building's outputs of `script`.
+
+    Demand fingerprints include the radiation and occupancy results of the building, so they must be calculated
+    after those scripts have run (or their outputs have been reused).
+    """
+    section = _section_payload(config, REUSABLE_SCRIPTS[script].section)
+    if script in ("radiation", "radiation-crax"):
+        scene = inputs.scene_fingerprint()
+        return {
+            building: hash_payload({"script": script, "scene": scene, "config": section})
+            for building in inputs.building_names
+        }
+
+    fingerprints = {}
+    for building in inputs.building_names:
+        payload: dict[str, Any] = {
+            "script": script,
+            "building": inputs.building_fingerprint(building),
+            "config": section,
+        }
+        if script == "demand":
+            payload["results"] = hash_files([
+                inputs.locator.get_radiation_building(building),
+                inputs.locator.get_occupancy_model_file(building),
+            ], root=inputs.locator.scenario)
+        fingerprints[building] = hash_payload(payload)
+    return fingerprints
+
+
+def read_output_fingerprints(locator: InputLocator) -> dict[str, dict[str, str]]:
+    """Fingerprints of the outputs of a scenario by script, or an empty dict if there is no (current) record."""
+    path = locator.get_building_output_fingerprints_file()
+    if not os.path.isfile(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if record.get("version") != OUTPUT_FINGERPRINT_VERSION:
+        return {}
+    return record.get("scripts", {})
+
+
+def write_output_fingerprints(locator: InputLocator, fingerprints: dict[str, dict[str, str]]) -> None:
+    path = locator.get_building_output_fingerprints_file()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": OUTPUT_FINGERPRINT_VERSION, "scripts": fingerprints}, f, indent=2, sort_keys=True)
+
+
+def find_reusable_buildings(
+    script: str,
+    fingerprints: dict[str, str],
+    previous_fingerprints: dict[str, str],
+    previous_locator: InputLocator,
+) -> list[str]:
+    """Buildings whose outputs of `script` in the previous state were simulated with identical inputs."""
+    building_files = REUSABLE_SCRIPTS[script].building_files
+    return [
+        building for building, fingerprint in fingerprints.items()
+        if previous_fingerprints.get(building) == fingerprint
+        and all(os.path.isfile(path) for path in building_files(previous_locator, building))
+    ]
+
+
+def restore_building_outputs(
+    script: str,
+    previous_locator: InputLocator,
+    locator: InputLocator,
+    buildings: list[str],
+    *,
+    include_shared: bool = False,
+) -> None:
+    """Copy the outputs of `script` for `buildings` from the previous state."""
+    reusable = REUSABLE_SCRIPTS[script]
+    pairs = [
+        pair for building in buildings
+        for pair in zip(reusable.building_files(previous_locator, building),
+                        reusable.building_files(locator, building))
+    ]
+    if include_shared:
+        pairs += list(zip(reusable.shared_files(previous_locator), reusable.shared_files(locator)))
+    for source, target in pairs:
+        if os.path.isfile(source):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            clone_file(source, target)
+
+
+def merge_total_demand(
+    previous_locator: InputLocator,
+    locator: InputLocator,
+    reused: list[str],
+    building_names: list[str],
+) -> None:
+    """Rebuild the demand totals of a state from the results of the simulated and the reused buildings."""
+    from cea.demand.demand_writers import YearlyDemandWriter
+
+    totals = []
+    total_demand_file = locator.get_total_demand("csv")
+    if os.path.isfile(total_demand_file):
+        totals.append(pd.read_csv(total_demand_file))
+    previous_totals = pd.read_csv(previous_locator.get_total_demand("csv"))
+    totals.append(previous_totals[previous_totals["name"].astype(str).isin(reused)])
+    total_demand = pd.concat(totals, ignore_index=True).drop_duplicates(subset="name", keep="first")
+    order = {building: i for i, building in enumerate(building_names)}
+    total_demand = total_demand.sort_values("name", key=lambda names: names.astype(str).map(order))
+
+    locator.ensure_parent_folder_exists(total_demand_file)
+    total_demand.to_csv(total_demand_file, index=False, float_format="%.3f", na_rep="nan")
+    YearlyDemandWriter.write_aggregate_hourly(locator, building_names)
+
+
+def simulate_base_workflow(
+    state: Any,
+    config: Configuration,
+    workflow: list[dict[str, Any]],
+    previous_locator: InputLocator | None,
+) -> dict[str, list[str]]:
+    """Run the base workflow of a state, reusing unchanged building outputs of the previous state.
+
+    Args:
+        state: the ``DistrictStateYear`` to simulate.
+        config: the configuration of the main scenario.
+        workflow: the base workflow (see ``workflow_assembly.build_base_workflow``).
+        previous_locator: locator of the previous simulated state, or None to simulate every building.
+
+    Returns:
+        The reused buildings by script.
+    """
+    locator = InputLocator(state.state_folder())
+    previous_fingerprints = read_output_fingerprints(previous_locator) if previous_locator is not None else {}
+    inputs = StateInputs(locator)
+    fingerprints: dict[str, dict[str, str]] = {}
+    reused_by_script: dict[str, list[str]] = {}
+
+    config_steps: list[dict[str, Any]] = []
+    for step in workflow:
+        if "config" in step:
+            config_steps.append(step)
+            continue
+        script = step.get("script")
+        if script not in REUSABLE_SCRIPTS:
+            state.simulate(config, workflow=config_steps + [step], mark_simulated=False)
+            continue
+
+        fingerprints[script] = calc_script_fingerprints(script, inputs, config)
+        reused: list[str] = []
+        if previous_locator is not None and script in previous_fingerprints:
+            reused = find_reusable_buildings(
+                script, fingerprints[script], previous_fingerprints[script], previous_locator
+            )
+        reused_set = set(reused)
+        to_simulate = [b for b in inputs.building_names if b not in reused_set]
+        reused_by_script[script] = reused
+
+        if not to_simulate:
+            print(f"State {state.year}: reusing the {script} results of all {len(reused)} buildings "
+                  f"from the previous state.", flush=True)
+        elif reused:
+            print(f"State {state.year}: reusing the {script} results of {len(reused)} unchanged buildings, "
+                  f"simulating {len(to_simulate)} buildings.", flush=True)
+            partial_step = dict(step)
+            partial_step["parameters"] = {**step.get("parameters", {}), "buildings": to_simulate}
+            state.simulate(config, workflow=config_steps + [partial_step], mark_simulated=False)
+        else:
+            state.simulate(config, workflow=config_steps + [step], mark_simulated=False)
+
+        if reused:
+            # scripts clear their output folder when they run, so the reused outputs are copied in afterwards
+            assert previous_locator is not None
+            restore_building_outputs(script, previous_locator, locator, reused, include_shared=not to_simulate)
+            if script == "demand":
+                merge_total_demand(previous_locator, locator, reused, inputs.building_names)
+
+    write_output_fingerprints(locator, fingerprints)
+    return reused_by_script
@@ -10,7 +10,7 @@ import cea.config
 import cea.inputlocator
 import cea.utilities.parallel
 from cea import MissingInputDataException
-from cea.demand import thermal_loads
+from cea.demand import demand_profiler, thermal_loads
 from cea.demand.building_properties import BuildingProperties
 from cea.utilities import epwreader
 from cea.utilities.date import get_date_range_hours_from_year
@@ -39,6 +39,9 @@ def demand_calculation(locator, config):
       - ``Total_demand.csv``, csv file of yearly demand data per building.
 
 
+    With ``demand:profile`` set, the time spent in each phase of the calculation is written to
+    ``demand_profile.json`` (see :py:mod:`cea.demand.demand_profiler`).
+
     :param locator: An InputLocator to locate input files
     :type locator: cea.inputlocator.InputLocator
 
@@ -52,6 +55,9 @@ def demand_calculation(locator, config):
     migrate_void_deck_data(locator)
     # INITIALIZE TIMER
     t0 = time.perf_counter()
+    profile = config.demand.profile
+    run_profile = demand_profiler.make_profile('demand', profile)
+    start = run_profile.clock()
 
     # LOCAL VARIABLES
     building_names = config.demand.buildings
@@ -65,6 +71,7 @@ def demand_calculation(locator, config):
     year = weather_data['year'][0]
     # create date range for the calculation year
     date_range = get_date_range_hours_from_year(year)
+    start = run_profile.lap('weather', start)
 
     # SPECIFY NUMBER OF BUILDINGS TO SIMULATE
     print('Running demand calculation for the following buildings=%s' % building_names)
@@ -77,13 +84,15 @@ def demand_calculation(locator, config):
     # CALCULATE OBJECT WITH PROPERTIES OF ALL BUILDINGS
     building_properties = BuildingProperties(locator, weather_data, building_names)
     building_properties.check_buildings()
+    start = run_profile.lap('building_properties', start)
 
     # DEMAND CALCULATION
     n = len(building_names)
+    processes = config.get_number_of_processes()
     calc_thermal_loads = cea.utilities.parallel.vectorize(thermal_loads.calc_thermal_loads,
-                                                          config.get_number_of_processes(), on_complete=print_progress)
+                                                          processes, on_complete=print_progress)
 
-    calc_thermal_loads(
+    building_profiles = calc_thermal_loads(
         building_names,
         [building_properties[b] for b in building_names],
         repeat(weather_data, n),
@@ -91,11 +100,21 @@ def demand_calculation(locator, config):
         repeat(locator, n),
         repeat(use_dynamic_infiltration, n),
         repeat(config, n),
-        repeat(debug, n))
+        repeat(debug, n),
+        repeat(profile, n))
+    start = run_profile.lap('buildings', start)
 
     # WRITE TOTAL YEARLY VALUES
     demand_writers.YearlyDemandWriter.write_aggregate_buildings(locator, building_names)
     demand_writers.YearlyDemandWriter.write_aggregate_hourly(locator, building_names)
+    run_profile.lap('aggregation', start)
+
+    if profile:
+        report = demand_profiler.build_report(run_profile, building_profiles, processes)
+        demand_profiler.print_report(report)
+        report_path = demand_profiler.get_profile_report_path(locator)
+        demand_profiler.write_report(report, report_path)
+        print('Demand profile written to %s' % report_path)
     time_elapsed = time.perf_counter() - t0
     print('done - time elapsed: %d.2 seconds' % time_elapsed)
 
@@ -0,0 +1,169 @@
+"""
+Optional profiling of the demand calculation.
+
+With ``demand:profile`` set, :py:func:`cea.demand.thermal_loads.calc_thermal_loads` times the phases of the calculation
+of a building (schedules, ventilation, RC model, HVAC systems, writing the results) and returns them as a
+:py:class:`DemandProfile`. The profiles are returned from the worker processes by ``cea.utilities.parallel.vectorize``
+and merged with the phases timed in the main process (reading the weather, loading the building properties and
+aggregating the results) into one report per run, ``outputs/data/demand/demand_profile.json``.
+
+Without it, the phases are "timed" with ``NULL_PROFILE``, whose methods do nothing, so the instrumentation costs a few
+method calls per simulated hour.
+
+The phases are timed with laps, so that all the time of a building is attributed to exactly one phase::
+
+    start = profile.clock()
+    ...
+    start = profile.lap('schedules', start)
+    ...
+    start = profile.lap('rc_model', start)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from cea.inputlocator import InputLocator
+
+__author__ = "Daren Thomas"
+__copyright__ = "Copyright 2026, Architecture and Building Systems - ETH Zurich"
+__credits__ = ["Daren Thomas"]
+__license__ = "MIT"
+__version__ = "0.1"
+__maintainer__ = "Daren Thomas"
+__email__ = "cea@arch.ethz.ch"
+__status__ = "Production"
+
+REPORT_VERSION = 1
+
+
+class DemandProfile:
+    """The time spent in each phase and the counters of a building (or of the main process)"""
+
+    enabled = True
+
+    def __init__(self, name: str):
+        self.name = name
+        self.timings: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+
+    @staticmethod
+    def clock() -> float:
+        return time.perf_counter()
+
+    def lap(self, phase: str, start: float) -> float:
+        """Add the time since ``start`` to ``phase`` and return the current clock, the start of the next phase"""
+        now = time.perf_counter()
+        self.timings[phase] = self.timings.get(phase, 0.0) + now - start
+        return now
+
+    def count(self, counter: str, n: int = 1) -> None:
+        self.counters[counter] = self.counters.get(counter, 0) + n
+
+    @property
+    def total(self) -> float:
+        return sum(self.timings.values())
+
+
+class NullProfile:
+    """Has the interface of :py:class:`DemandProfile`, but measures nothing"""
+
+    enabled = False
+    name = None
+    timings: Dict[str, float] = {}
+    counters: Dict[str, int] = {}
+    total = 0.0
+
+    @staticmethod
+    def clock() -> float:
+        return 0.0
+
+    @staticmethod
+    def lap(phase: str, start: float) -> float:
+        return 0.0
+
+    @staticmethod
+    def count(counter: str, n: int = 1) -> None:
+        pass
+
+
+NULL_PROFILE = NullProfile()
+
+
+def make_profile(name: str, enabled: bool) -> DemandProfile | NullProfile:
+    return DemandProfile(name) if enabled else NULL_PROFILE
+
+
+def get_profile_report_path(locator: InputLocator) -> str:
+    """scenario/outputs/data/demand/demand_profile.json"""
+    return os.path.join(locator.get_demand_results_folder(), 'demand_profile.json')
+
+
+def build_report(run_profile: DemandProfile, building_profiles: List[DemandProfile], processes: int) -> dict:
+    """
+    Aggregate the profiles of the buildings (returned from the worker processes) and of the main process.
+
+    :param run_profile: the phases of the main process, including ``buildings``, the time to calculate all buildings
+    :param building_profiles: the profile of each building, as returned by ``calc_thermal_loads``
+    :param processes: the number of processes the buildings were calculated with
+    :rtype: dict
+    """
+    building_profiles = [profile for profile in building_profiles if profile is not None]
+    worker_time = sum(profile.total for profile in building_profiles)
+
+    phases = {}
+    counters = {}
+    for profile in building_profiles:
+        for phase, seconds in profile.timings.items():
+            stats = phases.setdefault(phase, {'total_s': 0.0, 'max_s': 0.0, 'slowest_building': None})
+            stats['total_s'] += seconds
+            if seconds >= stats['max_s']:
+                stats['max_s'] = seconds
+                stats['slowest_building'] = profile.name
+        for counter, n in profile.counters.items():
+            counters[counter] = counters.get(counter, 0) + n
+    for stats in phases.values():
+        stats['mean_s'] = stats['total_s'] / len(building_profiles)
+        stats['share'] = stats['total_s'] / worker_time if worker_time else 0.0
+
+    buildings_wall_time = run_profile.timings.get('buildings', 0.0)
+    return {
+        'version': REPORT_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'processes': processes,
+        'buildings': len(building_profiles),
+        'wall_time_s': run_profile.total,
+        'main_process': dict(run_profile.timings),
+        # the time spent calculating buildings, summed over all worker processes
+        'worker_time_s': worker_time,
+        'parallel_efficiency': (worker_time / (processes * buildings_wall_time)
+                                if processes and buildings_wall_time else None),
+        'building_phases': phases,
+        'counters': counters,
+        'per_building': {profile.name: {'phases': profile.timings, 'counters': profile.counters}
+                         for profile in building_profiles},
+    }
+
+
+def write_report(report: dict, path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+def print_report(report: dict) -> None:
+    print(f"Demand profile: {report['buildings']} buildings in {report['wall_time_s']:.2f} s "
+          f"using {report['processes']} process(es)")
+    for phase, seconds in report['main_process'].items():
+        print(f"  {phase:<24}{seconds:>10.2f} s")
+    print(f"Building phases (summed over the worker processes, {report['worker_time_s']:.2f} s):")
+    for phase, stats in sorted(report['building_phases'].items(), key=lambda item: -item[1]['total_s']):
+        print(f"  {phase:<24}{stats['total_s']:>10.2f} s {stats['share']:>6.1%}  "
+              f"mean {stats['mean_s']:.3f} s, slowest {stats['slowest_building']} ({stats['max_s']:.3f} s)")
+    for counter, n in report['counters'].items():
+        print(f"  {counter:<24}{n:>10}")
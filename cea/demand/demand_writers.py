@@ -18,6 +18,7 @@ from cea.demand.time_series_data import (ElectricalLoads, HeatingLoads,
 # NOTE: FuelSource removed - moved to primary-energy module
 
 from cea.utilities.reporting import TSD_KEYS_ENERGY_BALANCE_DASHBOARD, TSD_KEYS_SOLAR
+from cea.utilities.result_store import DEMAND, ResultStore
 
 if TYPE_CHECKING:
     from cea.demand.building_properties.building_properties_row import BuildingPropertiesRow
@@ -245,15 +246,20 @@ class YearlyDemandWriter:
 
     @staticmethod
     def write_aggregate_hourly(locator, building_names):
-        """read in the building files and append them to the Total_demand_hourly.csv file."""
+        """read in the building files and append them to the Total_demand_hourly.csv file (and the demand dataset of
+        the scenario's result store, see :py:mod:`cea.utilities.result_store`)."""
         aggregated_hourly_results_df = pd.DataFrame()
 
-        for i, building in enumerate(building_names):
-            hourly_results_per_building = pd.read_csv(locator.get_demand_results_file(building)).set_index('date')
-            if i == 0:
-                aggregated_hourly_results_df = hourly_results_per_building
-            else:
-                aggregated_hourly_results_df += hourly_results_per_building
+        with ResultStore(locator).writer(DEMAND) as store:
+            for i, building in enumerate(building_names):
+                demand_file = locator.get_demand_results_file(building)
+                hourly_results_per_building = pd.read_csv(demand_file)
+                store.write(building, hourly_results_per_building, source=demand_file)
+                hourly_results_per_building = hourly_results_per_building.set_index('date')
+                if i == 0:
+                    aggregated_hourly_results_df = hourly_results_per_building
+                else:
+                    aggregated_hourly_results_df += hourly_results_per_building
 
         aggregated_hourly_results_df = aggregated_hourly_results_df.drop(columns=['x_int'])
 
@@ -13,8 +13,9 @@ from cea.demand import latent_loads
 from cea.demand import sensible_loads, electrical_loads, hotwater_loads, refrigeration_loads, datacenter_loads
 from cea.demand import ventilation_air_flows_detailed, control_heating_cooling_systems
 from cea.demand.building_properties.building_solar import get_thermal_resistance_surface
+from cea.demand.demand_profiler import NULL_PROFILE, DemandProfile, NullProfile, make_profile
 from cea.demand.latent_loads import convert_rh_to_moisture_content
-from cea.demand.time_series_data import TimeSeriesData, Weather
+from cea.demand.time_series_data import TimeSeriesData, Weather, get_process_buffer
 from cea.utilities import reporting
 from typing import TYPE_CHECKING, Tuple
 
@@ -32,7 +33,8 @@ def calc_thermal_loads(building_name: str,
                        use_dynamic_infiltration_calculation: bool,
                        config: Configuration,
                        debug: bool,
-                       ):
+                       profile: bool = False,
+                       ) -> DemandProfile | None:
     """
     Calculate thermal loads of a single building with mechanical or natural ventilation.
     Calculation procedure follows the methodology of ISO 13790
@@ -85,11 +87,16 @@ def calc_thermal_loads(building_name: str,
     :type config: cea.configuration.Configuration
     :param debug: Enable debugging-specific behaviors.
     :type debug: bool
+    :param profile: True to time the phases of the calculation (see :py:mod:`cea.demand.demand_profiler`).
+    :type profile: bool
 
-    :returns: This function does not return anything
-    :rtype: NoneType
+    :returns: the time spent in each phase if ``profile`` is set, otherwise nothing
+    :rtype: DemandProfile | None
 
     """
+    building_profile = make_profile(building_name, profile)
+    start = building_profile.clock()
+
     tsd = initialize_timestep_data(weather_data)
     schedules, tsd = initialize_schedules(bpr, tsd, locator)
 
@@ -120,6 +127,8 @@ def calc_thermal_loads(building_name: str,
         tsd.cooling_system_mass_flows.mcpcdata_sys = tsd.cooling_system_temperatures.Tcdata_sys_re = tsd.cooling_system_temperatures.Tcdata_sys_sup = np.zeros(HOURS_IN_YEAR)
         tsd.electrical_loads.Edata = np.zeros(HOURS_IN_YEAR)
 
+    start = building_profile.lap('schedules', start)
+
     # CALCULATE SPACE CONDITIONING DEMANDS
     if np.isclose(bpr.rc_model.Af, 0.0):  # if building does not have conditioned area
         tsd.rc_model_temperatures.T_int = tsd.weather.T_ext
@@ -127,6 +136,7 @@ def calc_thermal_loads(building_name: str,
         # NOTE: E_cs, E_hs fields removed - primary energy fields moved to primary-energy module
         tsd.electrical_loads.Eaux_cs = tsd.electrical_loads.Eaux_hs = tsd.electrical_loads.Ehs_lat_aux = np.zeros(HOURS_IN_YEAR)
         print(f"building {bpr.name} does not have an air-conditioned area")
+        building_profile.count('buildings_without_conditioned_area')
     else:
         # get hourly thermal resistances of external surfaces
         tsd.thermal_resistance.RSE_wall, \
@@ -137,8 +147,11 @@ def calc_thermal_loads(building_name: str,
         tsd = latent_loads.calc_Qgain_lat(tsd, schedules['X_gh'].to_numpy())
         tsd = calc_set_points(bpr, date_range, tsd, building_name, config, locator,
                               schedules)  # calculate the setpoints for every hour
+        start = building_profile.lap('rc_model', start)
         tsd = calc_Qhs_Qcs(bpr, tsd,
-                           use_dynamic_infiltration_calculation, config)  # end-use demand latent and sensible + ventilation
+                           use_dynamic_infiltration_calculation, config,
+                           building_profile)  # end-use demand latent and sensible + ventilation
+        start = building_profile.clock()
         tsd = sensible_loads.calc_Qhs_Qcs_loss(bpr, tsd)  # losses
         tsd = sensible_loads.calc_Qhs_sys_Qcs_sys(tsd)  # system (incl. losses)
         tsd = sensible_loads.calc_temperatures_emission_systems(bpr, tsd)  # calculate temperatures
@@ -173,10 +186,14 @@ def calc_thermal_loads(building_name: str,
     tsd = electrical_loads.calc_E_sys(tsd)  # system (incl. losses)
     # NOTE: calc_Ef() call removed - primary energy calculation moved to primary-energy module
 
+    start = building_profile.lap('hvac_systems', start)
+
     # WRITE SOLAR RESULTS
     write_results(bpr, building_name, date_range, locator, tsd, debug, config)
+    building_profile.lap('write_results', start)
 
-    return
+    if building_profile.enabled:
+        return building_profile
 
 
 def calc_QH_sys_QC_sys(tsd: TimeSeriesData) -> TimeSeriesData:
@@ -213,22 +230,33 @@ def calc_set_points(bpr: BuildingPropertiesRow, date, tsd: TimeSeriesData, build
 def calc_Qhs_Qcs(bpr: BuildingPropertiesRow,
                  tsd: TimeSeriesData,
                  use_dynamic_infiltration_calculation: bool,
-                 config: Configuration):
+                 config: Configuration,
+                 profile: DemandProfile | NullProfile = NULL_PROFILE):
+    # the hourly steps alternate between ventilation and the RC model (including the control of the HVAC systems)
+    start = profile.clock()
+
     # get ventilation flows
     ventilation_air_flows_simple.calc_m_ve_required(tsd)
     ventilation_air_flows_simple.calc_m_ve_leakage_simple(bpr, tsd)
 
+    if use_dynamic_infiltration_calculation:
+        # the air paths of the building do not change, set up the mass balance once
+        natural_ventilation = ventilation_air_flows_detailed.NaturalVentilationSolver(
+            ventilation_air_flows_detailed.get_properties_natural_ventilation(bpr))
+
+    start = profile.lap('ventilation', start)
+
     # end-use demand calculation
     for t in get_hours(bpr):
 
         # heat flows in [W]
         tsd = sensible_loads.calc_Qgain_sen(t, tsd, bpr)
+        start = profile.lap('rc_model', start)
 
         if use_dynamic_infiltration_calculation:
             # OVERWRITE STATIC INFILTRATION WITH DYNAMIC INFILTRATION RATE
-            dict_props_nat_vent = ventilation_air_flows_detailed.get_properties_natural_ventilation(bpr)
-            qm_sum_in, qm_sum_out = ventilation_air_flows_detailed.calc_air_flows(
-                tsd.rc_model_temperatures.T_int[t - 1], tsd.weather.u_wind[t], tsd.weather.T_ext[t], dict_props_nat_vent)
+            qm_sum_in, qm_sum_out = natural_ventilation.calc_air_flows(
+                tsd.rc_model_temperatures.T_int[t - 1], tsd.weather.u_wind[t], tsd.weather.T_ext[t])
             # INFILTRATION IS FORCED NOT TO REACH ZERO IN ORDER TO AVOID THE RC MODEL TO FAIL
             tsd.ventilation_mass_flows.m_ve_inf[t] = max(qm_sum_in / 3600, 1 / 3600)
 
@@ -239,11 +267,14 @@ def calc_Qhs_Qcs(bpr: BuildingPropertiesRow,
         # ventilation air temperature and humidity
         ventilation_air_flows_simple.calc_theta_ve_mech(bpr, tsd, t)
         latent_loads.calc_moisture_content_airflows(tsd, t)
+        start = profile.lap('ventilation', start)
 
         # heating / cooling demand of building
         hourly_procedure_heating_cooling_system_load.calc_heating_cooling_loads(bpr, tsd, t, config)
+        start = profile.lap('rc_model', start)
 
         # END OF FOR LOOP
+    profile.count('hours_simulated', HOURS_IN_YEAR + HOURS_PRE_CONDITIONING)
     return tsd
 
 
@@ -278,6 +309,8 @@ def initialize_schedules(bpr: BuildingPropertiesRow,
 def initialize_timestep_data(weather_data: pd.DataFrame) -> TimeSeriesData:
     """
     initializes the time step data with the weather data and the minimum set of variables needed for computation.
+    The hourly series are stored in the buffer of the process (see ``cea.demand.time_series_data.TimeSeriesBuffer``),
+    which is reused for each building, so the returned data is only valid until the next call.
 
     :param weather_data: data from the .epw weather file. Each row represents an hour of the year. The columns are:
         ``drybulb_C``, ``relhum_percent``, and ``windspd_ms``
@@ -295,7 +328,7 @@ def initialize_timestep_data(weather_data: pd.DataFrame) -> TimeSeriesData:
         T_sky=weather_data.skytemp_C.values,
         u_wind=weather_data.windspd_ms.values
     )
-    tsd = TimeSeriesData(weather)
+    tsd = TimeSeriesData.from_buffer(weather, get_process_buffer())
 
     return tsd
 
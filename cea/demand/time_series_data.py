@@ -1,8 +1,12 @@
 """
 This module defines the `TimeSeriesData` dataclass, which is used to store the time series data for the demand
 calculations.
+
+The hourly series of a building can be stored in a :py:class:`TimeSeriesBuffer`, a contiguous block with one row per
+series, which is allocated once per process and reused for each building (see :py:meth:`TimeSeriesData.from_buffer`).
 """
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Tuple
 from enum import StrEnum
 import numpy as np
 import numpy.typing as npt
@@ -51,6 +55,23 @@ def empty_char_array():
     return np.full(HOURS_IN_YEAR, AHUStatus.UNKNOWN, dtype='U20')
 
 
+class BufferedSeries:
+    """
+    Base class of the groups of hourly (float) series of :py:class:`TimeSeriesData`.
+
+    A group bound to a :py:class:`TimeSeriesBuffer` holds views of the rows of the buffer: assigning a series copies the
+    values into its row (``tsd.heating_loads.Qhs = ...`` is ``tsd.heating_loads.Qhs[:] = ...``) instead of replacing
+    the array, so the series stay in the buffer. Unbound groups behave like plain dataclasses.
+    """
+
+    def __setattr__(self, name, value):
+        series = self.__dict__.get(name)
+        if series is not None and self.__dict__.get('_bound', False):
+            series[...] = value
+        else:
+            object.__setattr__(self, name, value)
+
+
 @dataclass
 class Weather:
     """
@@ -74,7 +95,7 @@ class Weather:
 
 
 @dataclass
-class Occupancy:
+class Occupancy(BufferedSeries):
     """
     Data related to building occupancy.
     """
@@ -93,7 +114,7 @@ class Occupancy:
 
 
 @dataclass
-class ElectricalLoads:
+class ElectricalLoads(BufferedSeries):
     """
     Data related to electrical loads.
     """
@@ -148,7 +169,7 @@ class ElectricalLoads:
 
 
 @dataclass
-class HeatingLoads:
+class HeatingLoads(BufferedSeries):
     """
     Data related to heating loads.
     """
@@ -214,7 +235,7 @@ class HeatingLoads:
 
 
 @dataclass
-class CoolingLoads:
+class CoolingLoads(BufferedSeries):
     """
     Data related to cooling loads.
     """
@@ -286,7 +307,7 @@ class CoolingLoads:
 
 
 @dataclass
-class HeatingSystemTemperatures:
+class HeatingSystemTemperatures(BufferedSeries):
     """
     Data related to heating system temperatures.
     """
@@ -338,7 +359,7 @@ class HeatingSystemTemperatures:
 
 
 @dataclass
-class HeatingSystemMassFlows:
+class HeatingSystemMassFlows(BufferedSeries):
     """
     Data related to heating system mass flows.
     """
@@ -372,7 +393,7 @@ class HeatingSystemMassFlows:
 
 
 @dataclass
-class CoolingSystemTemperatures:
+class CoolingSystemTemperatures(BufferedSeries):
     """
     Data related to cooling system temperatures.
     """
@@ -427,7 +448,7 @@ class CoolingSystemTemperatures:
 
 
 @dataclass
-class CoolingSystemMassFlows:
+class CoolingSystemMassFlows(BufferedSeries):
     """
     Data related to cooling system mass flows.
     """
@@ -458,7 +479,7 @@ class CoolingSystemMassFlows:
 
 
 @dataclass
-class RCModelTemperatures:
+class RCModelTemperatures(BufferedSeries):
     """
     Data related to the RC model temperatures.
     """
@@ -486,7 +507,7 @@ class RCModelTemperatures:
 
 
 @dataclass
-class Moisture:
+class Moisture(BufferedSeries):
     """
     Data related to moisture.
     """
@@ -514,7 +535,7 @@ class Moisture:
 
 
 @dataclass
-class VentilationMassFlows:
+class VentilationMassFlows(BufferedSeries):
     """
     Data related to ventilation mass flows.
     """
@@ -536,7 +557,7 @@ class VentilationMassFlows:
 
 
 @dataclass
-class EnergyBalanceDashboard:
+class EnergyBalanceDashboard(BufferedSeries):
     """
     Data related to the energy balance dashboard.
     """
@@ -579,7 +600,7 @@ class EnergyBalanceDashboard:
 
 
 @dataclass
-class Solar:
+class Solar(BufferedSeries):
     """
     Data related to solar radiation.
     """
@@ -595,7 +616,7 @@ class Solar:
 
 
 @dataclass
-class ThermalResistance:
+class ThermalResistance(BufferedSeries):
     """
     Data related to thermal resistance.
     """
@@ -617,7 +638,7 @@ class ThermalResistance:
 
 
 @dataclass
-class Water:
+class Water(BufferedSeries):
     """
     Data related to water consumption.
     """
@@ -672,6 +693,14 @@ class TimeSeriesData:
     # TODO: Check if SystemStatus is still needed - comprehensive analysis shows all fields are write-only/unused
     system_status: SystemStatus = field(default_factory=SystemStatus)
 
+    @classmethod
+    def from_buffer(cls, weather: Weather, buffer: 'TimeSeriesBuffer') -> 'TimeSeriesData':
+        """
+        Create the time series data of a building with its hourly series stored in ``buffer`` instead of allocating
+        them. This resets the series of the previous ``TimeSeriesData`` of the same buffer.
+        """
+        return cls(weather, **buffer.bind_groups())
+
 
     def get_load_value(self, load_type: str):
         """
@@ -788,4 +817,63 @@ class TimeSeriesData:
             if hasattr(obj, solar_irradiation_type):
                 return getattr(obj, solar_irradiation_type)
 
-        raise ValueError(f"Moisture type '{solar_irradiation_type}' not found in any occupancy-related properties.")
\ No newline at end of file
+        raise ValueError(f"Moisture type '{solar_irradiation_type}' not found in any occupancy-related properties.")
+
+
+class TimeSeriesBuffer:
+    """
+    Preallocated storage for the hourly series of :py:class:`TimeSeriesData`: a contiguous float64 block with one row
+    per series of the groups deriving from :py:class:`BufferedSeries` (the weather and the system status are not
+    stored in it).
+
+    Each call to :py:meth:`TimeSeriesData.from_buffer` resets the buffer to NaN and binds new groups to its rows, so the
+    memory is allocated once and only one ``TimeSeriesData`` of a buffer may be in use at a time.
+    """
+
+    def __init__(self):
+        self.layout: List[Tuple[str, type, List[str]]] = [
+            (group.name, group.type, [series.name for series in fields(group.type)])
+            for group in fields(TimeSeriesData)
+            if isinstance(group.type, type) and issubclass(group.type, BufferedSeries)]
+        self.rows: Dict[Tuple[str, str], int] = {}
+        for group_name, _, series_names in self.layout:
+            for series_name in series_names:
+                self.rows[group_name, series_name] = len(self.rows)
+        self.data = np.full((len(self.rows), HOURS_IN_YEAR), np.nan)
+        self._float32 = None
+
+    def bind_groups(self) -> Dict[str, BufferedSeries]:
+        """Reset the buffer to NaN and return a new instance of each group, bound to its rows"""
+        self.data.fill(np.nan)
+        groups = {}
+        for group_name, group_type, series_names in self.layout:
+            group = group_type.__new__(group_type)
+            group.__dict__.update({series_name: self.data[self.rows[group_name, series_name]]
+                                   for series_name in series_names})
+            group.__dict__['_bound'] = True
+            groups[group_name] = group
+        return groups
+
+    def row(self, group_name: str, series_name: str) -> npt.NDArray[np.float64]:
+        return self.data[self.rows[group_name, series_name]]
+
+    def as_float32(self) -> npt.NDArray[np.float32]:
+        """
+        A single precision copy of the buffer (same rows), e.g. for compiled kernels or compact intermediate files.
+        The copy is written to a block allocated on the first call, so it is overwritten by the next call.
+        """
+        if self._float32 is None:
+            self._float32 = np.empty(self.data.shape, dtype=np.float32)
+        np.copyto(self._float32, self.data, casting='same_kind')
+        return self._float32
+
+
+_process_buffer: TimeSeriesBuffer | None = None
+
+
+def get_process_buffer() -> TimeSeriesBuffer:
+    """The buffer of the current process, reused for each building calculated in it"""
+    global _process_buffer
+    if _process_buffer is None:
+        _process_buffer = TimeSeriesBuffer()
+    return _process_buffer
@@ -18,7 +18,7 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
-from scipy.optimize import minimize, OptimizeResult
+from scipy.optimize import brentq
 
 from cea.constants import KELVIN_CONVERSION
 from cea.demand import constants
@@ -61,7 +61,7 @@ def get_building_geometry_ventilation(gdf_building_geometry):
 
 def calc_air_flows(temp_zone, u_wind, temp_ext, dict_props_nat_vent):
     """
-    Minimization of variable air flows as a function of zone gauge
+    Air flows at the zone pressure that balances the air flow mass balance
 
     :param temp_zone: zone indoor air temperature (°C)
     :param u_wind: wind velocity (m/s)
@@ -71,37 +71,77 @@ def calc_air_flows(temp_zone, u_wind, temp_ext, dict_props_nat_vent):
     qm_sum_in : total air mass flow rates into zone (kg/h)
     qm_sum_out : total air mass flow rates out of zone (kg/h)
     """
+    return NaturalVentilationSolver(dict_props_nat_vent).calc_air_flows(temp_zone, u_wind, temp_ext)
 
-    # Different solver options to try:
-    # --------------------------------
-    # solver_options_nelder_mead ={'disp': False, 'maxiter': 100, 'maxfev': None, 'xtol': 0.1, 'ftol': 0.1}
-    # solver_options_cg ={'disp': False, 'gtol': 1e-05, 'eps': 1.4901161193847656e-08, 'return_all': False,
-    #                     'maxiter': None, 'norm': -np.inf}
-    # solver_options_powell = {'disp': True, 'maxiter': None, 'direc': None, 'maxfev': None,
-    #            'xtol': 0.0001, 'ftol': 0.0001}
-    # solver_options_tnc = {'disp': True, 'minfev': 0, 'scale': None, 'rescale': -1, 'offset': None, 'gtol': -1,
-    #                       'eps': 1e-08, 'eta': -1, 'maxiter': None, 'maxCGit': -1, 'mesg_num': None,
-    #                       'ftol': -1, 'xtol': -1, 'stepmx': 0, 'accuracy': 0}
-    solver_options_cobyla = {'iprint': 1, 'disp': False, 'maxiter': 100, 'rhobeg': 1.0, 'tol': 0.001}
-
-    # solve air flow mass balance via iteration
-    p_zone_ref = 1  # (Pa) zone pressure, THE UNKNOWN VALUE
-    res = minimize(calc_air_flow_mass_balance, p_zone_ref,
-                   args=(temp_zone, u_wind, temp_ext, dict_props_nat_vent, 'minimize',),
-                   method='COBYLA',
-                   options=solver_options_cobyla)
-    # print(res)
-    # get zone pressure of air flow mass balance
-    if not isinstance(res, OptimizeResult):
-        raise ValueError("Failed to find a solution for the air flow mass balance.")
-
-    p_zone = res.x
-
-    # calculate air flows at zone pressure
-    qm_sum_in, qm_sum_out = calc_air_flow_mass_balance(p_zone, temp_zone, u_wind,
-                                                       temp_ext, dict_props_nat_vent, 'calculate')
-
-    return qm_sum_in, qm_sum_out
+
+class NaturalVentilationSolver(object):
+    """
+    Solves the air flow mass balance (6.4.3.9 in [1]) of a zone, hour by hour.
+
+    The pressure difference across each air path (leakages and ventilation openings) is ``a_path - p_zone_ref``,
+    where ``a_path`` depends on the hour's temperatures and wind only (see :py:func:`calc_delta_p_path`). The mass
+    balance is therefore a strictly decreasing function of the zone reference pressure with its root between the
+    smallest and the largest ``a_path``. The root is found with Brent's method in that bracket, narrowed with the
+    zone pressure of the previous hour (warm start).
+
+    The air path properties are set up once per building (``get_properties_natural_ventilation``), instead of
+    every hour.
+    """
+
+    # (Pa) tolerance of the zone reference pressure (the flows are steep around paths without pressure difference)
+    XTOL = 1e-10
+
+    def __init__(self, dict_props_nat_vent):
+        self.coeff_path = np.concatenate([dict_props_nat_vent['coeff_vent_path'],
+                                          dict_props_nat_vent['coeff_lea_path']])
+        self.n_path = np.concatenate([np.full(len(dict_props_nat_vent['coeff_vent_path']), constants.N_VENT),
+                                      np.full(len(dict_props_nat_vent['coeff_lea_path']), constants.N_LEA)])
+        self.height_path = np.concatenate([dict_props_nat_vent['height_vent_path'],
+                                           dict_props_nat_vent['height_lea_path']])
+        self.coeff_wind_pressure_path = np.concatenate([dict_props_nat_vent['coeff_wind_pressure_path_vent'],
+                                                        dict_props_nat_vent['coeff_wind_pressure_path_lea']])
+        self.p_zone_ref = None  # zone reference pressure of the previous hour (Pa)
+
+    def calc_air_flows(self, temp_zone, u_wind, temp_ext):
+        """
+        :param temp_zone: zone indoor air temperature (°C)
+        :param u_wind: meteorological wind velocity (m/s)
+        :param temp_ext: exterior air temperature (°C)
+
+        :returns: - qm_sum_in : total air mass flow rates into zone (kg/h)
+                  - qm_sum_out : total air mass flow rates out of zone (kg/h)
+        """
+        # pressure difference across the paths is a_path - p_zone_ref, see Eq. (3) - (5) in [1]
+        a_path = calc_delta_p_path(0.0, self.height_path, temp_zone, self.coeff_wind_pressure_path,
+                                   calc_u_wind_site(u_wind), temp_ext)
+        rho_air_ext = calc_rho_air(temp_ext)
+        rho_air_zone = calc_rho_air(temp_zone)
+
+        def qm_path(p_zone_ref):
+            delta_p_path = a_path - p_zone_ref
+            # Eq. (60) and (64) in [1], converted to mass flows with Eq. (67) and (68) in [1]
+            qv_path = self.coeff_path * np.sign(delta_p_path) * np.abs(delta_p_path) ** self.n_path
+            return qv_path * np.where(qv_path > 0, rho_air_ext, rho_air_zone)
+
+        def qm_balance(p_zone_ref):
+            # Eq. (69) in [1]
+            return qm_path(p_zone_ref).sum()
+
+        lower, upper = a_path.min(), a_path.max()
+        if self.p_zone_ref is not None and lower < self.p_zone_ref < upper:
+            if qm_balance(self.p_zone_ref) > 0:
+                lower = self.p_zone_ref
+            else:
+                upper = self.p_zone_ref
+        if upper - lower > self.XTOL and qm_balance(lower) > 0 > qm_balance(upper):
+            p_zone_ref = brentq(qm_balance, lower, upper, xtol=self.XTOL)
+        else:
+            # all paths at the same pressure (or no flow through any path)
+            p_zone_ref = lower if abs(qm_balance(lower)) <= abs(qm_balance(upper)) else upper
+        self.p_zone_ref = p_zone_ref
+
+        qm = qm_path(p_zone_ref)
+        return qm[qm > 0].sum(), qm[qm < 0].sum()
 
 
 def get_properties_natural_ventilation(bpr: BuildingPropertiesRow):
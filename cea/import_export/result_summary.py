@@ -4,6 +4,11 @@ Read and summarise CEA results over all scenarios in a project.
 """
 import itertools
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 import pandas as pd
 import numpy as np
 import cea.config
@@ -12,6 +17,7 @@ from datetime import datetime, UTC
 import cea.inputlocator
 import geopandas as gpd
 from cea.analysis.lca.emission_timeline import _MAPPING_DICT
+from cea.utilities import result_store
 
 from cea.demand.building_properties.useful_areas import calc_useful_areas
 
@@ -72,6 +78,9 @@ dict_plot_metrics_cea_feature = {
 # TODO: Remove this from global state
 EMISSION_CONTEXT = None
 
+# Summary tables written while plotting, by path (see collect_plot_frames)
+_PLOT_FRAMES: ContextVar[dict | None] = ContextVar('plot_frames', default=None)
+
 BASE_NORMALISATION_NAME_MAPPING = {
     "grid_electricity_consumption[kWh]": "EUI_grid_electricity[kWh/m2]",
     "enduse_electricity_demand[kWh]": "EUI_enduse_electricity[kWh/m2]",
@@ -84,6 +93,65 @@ BASE_NORMALISATION_NAME_MAPPING = {
 }
 
 
+@contextmanager
+def collect_plot_frames():
+    """
+    Keep the summary tables written by ``write_summary_csv`` in memory instead of writing them to disk, so the plots
+    read them back with ``read_summary_csv`` without a round trip through CSV files. Only the tables written within
+    the context (in the current thread or task) can be read.
+    """
+    token = _PLOT_FRAMES.set({})
+    try:
+        yield
+    finally:
+        _PLOT_FRAMES.reset(token)
+
+
+def _as_read_from_csv(df: pd.DataFrame, float_format: str | None) -> pd.DataFrame:
+    """A copy of ``df`` as ``pd.read_csv`` would return it after writing it with ``float_format``."""
+    df = df.reset_index(drop=True)
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            # the format to_csv uses: no time if all the dates are at midnight
+            with_time = (series.dropna() != series.dropna().dt.normalize()).any()
+            series = series.dt.strftime('%Y-%m-%d %H:%M:%S' if with_time else '%Y-%m-%d')
+        elif pd.api.types.is_float_dtype(series) and float_format is not None:
+            series = series.round(int(float_format.strip('%f.')))
+        elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            series = series.mask(series == '')
+        columns[str(col)] = series
+    return pd.DataFrame(columns)
+
+
+def write_summary_csv(df: pd.DataFrame, path: str, float_format: str | None = None) -> None:
+    """Write a summary table to ``path``, or keep it in memory within ``collect_plot_frames``."""
+    frames = _PLOT_FRAMES.get()
+    if frames is None:
+        df.to_csv(path, index=False, float_format=float_format)
+    else:
+        frames[os.path.normpath(path)] = _as_read_from_csv(df, float_format)
+
+
+def read_summary_csv(path: str) -> pd.DataFrame:
+    """Read a summary table written by ``write_summary_csv``."""
+    frames = _PLOT_FRAMES.get()
+    if frames is None:
+        return pd.read_csv(path)
+    try:
+        return frames[os.path.normpath(path)].copy()
+    except KeyError:
+        raise FileNotFoundError(f"Summary table was not written: {path}") from None
+
+
+def summary_csv_exists(path: str) -> bool:
+    frames = _PLOT_FRAMES.get()
+    if frames is None:
+        return os.path.exists(path)
+    return os.path.normpath(path) in frames
+
+
 def build_emission_context(locator: cea.inputlocator.InputLocator) -> dict:
     """Build emission-related column lists and normalisation mappings from the locator."""
 
@@ -834,17 +902,52 @@ def add_period_columns(df, date_column='date'):
     if df[date_column].isna().any():
         raise ValueError(f"The column '{date_column}' contains invalid or NaT values.")
 
-    # Add period_month column using month names
-    df['period_month'] = df[date_column].dt.month.apply(lambda x: month_names[x - 1])
+    # Add period_month and period_season columns (ordered categories) from the month number of each row
+    month_index = df[date_column].dt.month.to_numpy() - 1
+    df['period_month'] = pd.Categorical.from_codes(month_index, categories=month_names, ordered=True)
+    df['period_season'] = pd.Categorical.from_codes(_SEASON_CODE_OF_MONTH[month_index], categories=season_names,
+                                                     ordered=True)
 
-    # Add period_season column using season_mapping
-    df['period_season'] = df[date_column].dt.month.map(season_mapping)
+    return df
 
-    # Ensure the order of categories is maintained for month and season
-    df['period_month'] = pd.Categorical(df['period_month'], categories=month_names, ordered=True)
-    df['period_season'] = pd.Categorical(df['period_season'], categories=season_names, ordered=True)
 
-    return df
+# index in season_names of the season of each month (January first)
+_SEASON_CODE_OF_MONTH = np.array([season_names.index(season_mapping[month]) for month in range(1, 13)])
+
+# calendars of the hourly result files, keyed by (number of rows, first date, last date) of their date column
+_calendar_cache = {}
+_calendar_cache_lock = threading.Lock()
+_MAX_CACHED_CALENDARS = 8
+
+
+def get_hourly_calendar(raw_dates):
+    """
+    Returns the calendar (parsed 'date', 'period_month' and 'period_season') of the date column of an hourly result
+    file.
+
+    The hourly results of a scenario all share the same date column, so the calendar is parsed and labelled once and
+    reused for every file whose (raw) date column is identical, instead of re-parsing the dates of each file.
+
+    Parameters:
+    - raw_dates (pd.Series): The date column as read from the .csv file.
+
+    Returns:
+    - pd.DataFrame: Calendar with one row per row of raw_dates and the columns ['date', 'period_month', 'period_season'].
+    """
+    raw_dates = raw_dates.to_numpy(dtype=object)
+    key = (len(raw_dates), raw_dates[0], raw_dates[-1]) if len(raw_dates) else (0, None, None)
+
+    with _calendar_cache_lock:
+        cached = _calendar_cache.get(key)
+    if cached is not None and np.array_equal(cached[0], raw_dates):
+        return cached[1]
+
+    calendar = add_period_columns(pd.DataFrame({'date': raw_dates}))
+    with _calendar_cache_lock:
+        if len(_calendar_cache) >= _MAX_CACHED_CALENDARS:
+            _calendar_cache.clear()
+        _calendar_cache[key] = (raw_dates, calendar)
+    return calendar
 
 
 def check_list_nesting(input_list):
@@ -884,88 +987,188 @@ def load_cea_results_from_csv_files(hour_start, hour_end, list_paths, list_cea_c
     Iterates over a list of file paths, loads DataFrames from existing .csv files,
     and returns a list of these DataFrames.
 
+    The files are read in parallel (thread pool); only the needed columns and, for hourly results, the needed hours
+    are read (see ``load_cea_results_from_csv_file``).
+
     Parameters:
-    - file_paths (list of str): List of file paths to .csv files.
+    - hour_start (int): First hour of the period (for timeline data: first year).
+    - hour_end (int): Last hour (exclusive) of the period (for timeline data: last year, inclusive).
+    - list_paths (list of str): List of file paths to .csv files.
+    - list_cea_column_names (list of str): Columns to load.
 
     Returns:
-    - list of pd.DataFrame: A list of DataFrames for files that exist.
+    - list of pd.DataFrame: A list of DataFrames for files that exist, in the order of list_paths.
     """
+    def load(path):
+        return load_cea_results_from_csv_file(hour_start, hour_end, path, list_cea_column_names)
+
+    with ThreadPoolExecutor() as executor:
+        results = list(executor.map(load, list_paths))
+
     list_dataframes = []
-    date_columns = {'Date', 'DATE', 'date'}
-    for path in list_paths:
-        if os.path.exists(path):
-            try:
-                df = pd.read_csv(path)  # Load the CSV file into a DataFrame
-
-                # Rename heat_rejection_kW to heat_rejection_kWh for consistency with energy units
-                if 'heat_rejection_kW' in df.columns:
-                    df = df.rename(columns={'heat_rejection_kW': 'heat_rejection_kWh'})
-
-                # Validation: Check if this is timeline data (has 'period' column) when we expect operational data
-                # Timeline files are in .../emissions/timeline/ and operational files are in .../emissions/operational/
-                is_operational_path = '/emissions/operational/' in path or '_operational_hourly.csv' in path
-                is_timeline_path = '/emissions/timeline/' in path or '_timeline.csv' in path
-                has_period_column = 'period' in df.columns
-                has_date_column = bool(date_columns.intersection(df.columns))
-
-                # Validate data structure matches file path
-                if is_operational_path and has_period_column and not has_date_column:
-                    raise ValueError(
-                        f"Data structure mismatch: File '{path}' is an operational file but has 'period' column "
-                        f"instead of 'date' column. This suggests timeline data was incorrectly loaded. "
-                        f"Available columns: {df.columns.tolist()}"
-                    )
-                if is_timeline_path and has_date_column and not has_period_column:
-                    raise ValueError(
-                        f"Data structure mismatch: File '{path}' is a timeline file but has 'date' column "
-                        f"instead of 'period' column. This suggests operational data was incorrectly loaded. "
-                        f"Available columns: {df.columns.tolist()}"
-                    )
+    for df, message in results:
+        if message:
+            print(message)
+        if df is not None:
+            list_dataframes.append(df)  # Add the DataFrame to the list
 
-                if date_columns.intersection(df.columns):
-                    df = get_standardized_date_column(df)   # Change where ['DATE'] or ['Date'] to ['date']
-
-                    # Label months and seasons
-                    df = add_period_columns(df)
-
-                    # Slice the useful columns
-                    selected_columns = ['date'] + list_cea_column_names + ['period_month'] + ['period_season']
-                    available_columns = [col for col in selected_columns if col in df.columns]   # check what's available
-                    df = df[available_columns]
-
-                    df['date'] = pd.to_datetime(df['date'], errors='coerce')
-                    df = slice_hourly_results_for_custom_time_period(hour_start, hour_end, df)   # Slice the custom period of time
-                    list_dataframes.append(df)  # Add the DataFrame to the list
-                elif 'period' in df.columns:
-                    # Timeline data (lifecycle emissions) - has 'period' column with years
-                    selected_columns = ['period'] + ['name'] + list_cea_column_names
-                    available_columns = [col for col in selected_columns if col in df.columns]   # check what's available
-                    df = df[available_columns]
-
-                    # Filter by year range (similar to how hourly data is filtered by hours)
-                    # For timeline data, hour_start/hour_end represent years, not hours
-                    # Extract year from period column (format: 'Y_2024' -> 2024)
-                    df['_year'] = df['period'].astype(str).str.replace('Y_', '', regex=False)
-                    df['_year'] = pd.to_numeric(df['_year'], errors='coerce')
-
-                    # Filter rows by year range
-                    df = df[(df['_year'] >= hour_start) & (df['_year'] <= hour_end)]
-                    df = df.drop(columns=['_year'])
-
-                    list_dataframes.append(df)
-                else:
-                    # Slice the useful columns
-                    selected_columns = ['name'] + list_cea_column_names
-                    available_columns = [col for col in selected_columns if col in df.columns]   # check what's available
-                    df = df[available_columns]
-                    list_dataframes.append(df)  # Add the DataFrame to the list
+    return list_dataframes
 
-            except Exception as e:
-                print(f"Error loading {path}: {e}")
+
+def load_cea_results_from_csv_file(hour_start, hour_end, path, list_cea_column_names):
+    """
+    Loads the useful columns of a CEA result .csv file.
+
+    The header is read first to find the type of the file (hourly results with a date column, timeline data with a
+    'period' column, or annual results), then only the needed columns are read. For hourly results, only the rows of
+    the period [hour_start, hour_end) are read (the whole year if the period wraps around the end of the year) and
+    the month and season labels are joined from the shared calendar (see ``get_hourly_calendar``).
+
+    Returns:
+    - tuple: (pd.DataFrame or None, message to print or None)
+    """
+    if not os.path.exists(path):
+        return None, f"File not found: {path}"
+
+    date_columns = {'Date', 'DATE', 'date'}
+    try:
+        # Rename heat_rejection_kW to heat_rejection_kWh for consistency with energy units
+        renames = {'heat_rejection_kW': 'heat_rejection_kWh'}
+        file_columns = pd.read_csv(path, nrows=0).columns.tolist()
+        columns = [renames.get(col, col) for col in file_columns]
+
+        # Validation: Check if this is timeline data (has 'period' column) when we expect operational data
+        # Timeline files are in .../emissions/timeline/ and operational files are in .../emissions/operational/
+        is_operational_path = '/emissions/operational/' in path or '_operational_hourly.csv' in path
+        is_timeline_path = '/emissions/timeline/' in path or '_timeline.csv' in path
+        has_period_column = 'period' in columns
+        has_date_column = bool(date_columns.intersection(columns))
+
+        # Validate data structure matches file path
+        if is_operational_path and has_period_column and not has_date_column:
+            raise ValueError(
+                f"Data structure mismatch: File '{path}' is an operational file but has 'period' column "
+                f"instead of 'date' column. This suggests timeline data was incorrectly loaded. "
+                f"Available columns: {columns}"
+            )
+        if is_timeline_path and has_date_column and not has_period_column:
+            raise ValueError(
+                f"Data structure mismatch: File '{path}' is a timeline file but has 'date' column "
+                f"instead of 'period' column. This suggests operational data was incorrectly loaded. "
+                f"Available columns: {columns}"
+            )
+
+        if has_date_column:
+            # Change where ['DATE'] or ['Date'] to ['date']
+            date_column = next(col for col in ['DATE', 'date', 'Date'] if col in columns)
+            renames[date_column] = 'date'
+            useful_columns = {date_column}.union(list_cea_column_names)
+            usecols = [col for col in file_columns if renames.get(col, col) in useful_columns or col == date_column]
+
+            if hour_start <= hour_end:
+                # Read the custom period of time only (hour_end is exclusive)
+                df = pd.read_csv(path, usecols=usecols, skiprows=range(1, hour_start + 1),
+                                 nrows=hour_end - hour_start)
+            else:
+                df = pd.read_csv(path, usecols=usecols)
+            df = df.rename(columns=renames)
+            return label_and_slice_hourly_results(hour_start, hour_end, df, list_cea_column_names), None
+        elif has_period_column:
+            # Timeline data (lifecycle emissions) - has 'period' column with years
+            selected_columns = ['period'] + ['name'] + list_cea_column_names
+            df = pd.read_csv(path, usecols=lambda col: renames.get(col, col) in selected_columns).rename(columns=renames)
+            return slice_timeline_results(hour_start, hour_end, df, list_cea_column_names), None
         else:
-            print(f"File not found: {path}")
+            # Slice the useful columns
+            selected_columns = ['name'] + list_cea_column_names
+            df = pd.read_csv(path, usecols=lambda col: renames.get(col, col) in selected_columns).rename(columns=renames)
+            available_columns = [col for col in selected_columns if col in df.columns]   # check what's available
+            return df[available_columns], None
 
-    return list_dataframes
+    except Exception as e:
+        return None, f"Error loading {path}: {e}"
+
+
+def label_and_slice_hourly_results(hour_start, hour_end, df, list_cea_column_names):
+    """
+    Labels the months and seasons of hourly results (read for the period [hour_start, hour_end), or the whole year if
+    the period wraps around the end of the year) and keeps the useful columns of the period.
+    """
+    # Label months and seasons from the shared calendar
+    calendar = get_hourly_calendar(df['date'])
+    df = pd.concat([calendar[['date']], df.drop(columns=['date']),
+                    calendar[['period_month', 'period_season']]], axis=1)
+
+    # Slice the useful columns
+    selected_columns = ['date'] + list_cea_column_names + ['period_month'] + ['period_season']
+    available_columns = [col for col in selected_columns if col in df.columns]   # check what's available
+    df = df[available_columns]
+
+    if hour_start <= hour_end:
+        return slice_hourly_results_for_custom_time_period(0, len(df), df)   # Drop empty rows
+    else:
+        return slice_hourly_results_for_custom_time_period(hour_start, hour_end, df)   # Slice the custom period of time
+
+
+def slice_timeline_results(year_start, year_end, df, list_cea_column_names):
+    """
+    Keeps the useful columns of the years [year_start, year_end] of timeline data (lifecycle emissions).
+    """
+    selected_columns = ['period'] + ['name'] + list_cea_column_names
+    available_columns = [col for col in selected_columns if col in df.columns]   # check what's available
+    df = df[available_columns]
+
+    # Filter by year range (similar to how hourly data is filtered by hours)
+    # Extract year from period column (format: 'Y_2024' -> 2024)
+    year = pd.to_numeric(df['period'].astype(str).str.replace('Y_', '', regex=False), errors='coerce')
+
+    # Filter rows by year range
+    return df[(year >= year_start) & (year <= year_end)]
+
+
+# CEA Features whose per-building results are also kept in the scenario's result store
+RESULT_STORE_DATASETS = {
+    'demand': result_store.DEMAND,
+    'operational_emissions': result_store.OPERATIONAL_EMISSIONS,
+    'lifecycle_emissions': result_store.LIFECYCLE_EMISSIONS,
+}
+
+
+def load_cea_results_from_store(locator, cea_feature, hour_start, hour_end, list_buildings, list_paths,
+                                list_cea_column_names):
+    """
+    Loads the useful results of the buildings from the scenario's result store in one read, instead of one .csv file
+    per building. Returns the same DataFrames as ``load_cea_results_from_csv_files``.
+
+    Returns:
+    - list of pd.DataFrame, or None if the store does not hold the current results of all buildings (read the .csv
+      files instead).
+    """
+    dataset = RESULT_STORE_DATASETS.get(cea_feature)
+    if dataset is None or len(list_paths) != len(list_buildings):
+        return None
+    store = result_store.ResultStore(locator)
+    if not store.is_current(dataset, dict(zip(list_buildings, list_paths))):
+        return None
+
+    date_columns = ['date', 'DATE', 'Date']
+    hourly = cea_feature != 'lifecycle_emissions'
+    columns = (date_columns if hourly else ['period']) + list_cea_column_names
+    hours = (hour_start, hour_end) if hourly and hour_start <= hour_end else None
+    df_all = store.query(dataset, columns, buildings=list_buildings, hours=hours)
+
+    dataframes = {}
+    for building, df in df_all.groupby(result_store.NAME_COLUMN, sort=False):
+        df = df.reset_index(drop=True)
+        if hourly:
+            date_column = next(col for col in date_columns if col in df.columns)
+            df = df.drop(columns=[result_store.NAME_COLUMN, result_store.HOUR_COLUMN], errors='ignore')
+            df = df.rename(columns={date_column: 'date'})
+            dataframes[building] = label_and_slice_hourly_results(hour_start, hour_end, df, list_cea_column_names)
+        else:
+            dataframes[building] = slice_timeline_results(hour_start, hour_end, df, list_cea_column_names)
+    # in the order of the buildings, like the .csv files
+    return [dataframes[building] for building in list_buildings if building in dataframes]
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -1177,7 +1380,11 @@ def exec_read_and_slice(hour_start, hour_end, locator, list_metrics, list_buildi
     # check if list_paths is nested, for example, for PV, the lists can be nested as there are different types of PV
     if not check_list_nesting(list_paths):
         # get the useful CEA results for the user-selected metrics and hours
-        list_useful_cea_results = load_cea_results_from_csv_files(hour_start, hour_end, list_paths, list_cea_column_names)
+        list_useful_cea_results = load_cea_results_from_store(locator, cea_feature, hour_start, hour_end,
+                                                              list_buildings, list_paths, list_cea_column_names)
+        if list_useful_cea_results is None:
+            list_useful_cea_results = load_cea_results_from_csv_files(hour_start, hour_end, list_paths,
+                                                                      list_cea_column_names)
         list_list_useful_cea_results.append(list_useful_cea_results)
     else:
         for sublist_paths in list_paths:
@@ -1350,7 +1557,7 @@ def exec_aggregate_building_lifecycle_emissions(locator, hour_start, hour_end, s
             _appendix = appendix if not plot else appendix.replace("_", "-")
             path = locator.get_export_results_summary_cea_feature_buildings_file(summary_folder, cea_feature=_cea_feature, appendix=_appendix)
             os.makedirs(os.path.dirname(path), exist_ok=True)
-            aggregated_df.to_csv(path, index=False, float_format='%.2f')
+            write_summary_csv(aggregated_df, path, float_format='%.2f')
 
 
 
@@ -1840,7 +2047,7 @@ def results_writer_time_period(locator, hour_start, hour_end, summary_folder, li
             os.makedirs(os.path.dirname(path_csv), exist_ok=True)
 
             # Write the CSV
-            df.to_csv(path_csv, index=False, float_format="%.2f")
+            write_summary_csv(df, path_csv, float_format="%.2f")
 
             # Break early for specific single-day conditions
             if len(df) == 1 and time_period in ('daily', 'monthly'):
@@ -1926,13 +2133,13 @@ def results_writer_time_period_building(locator, hour_start, hour_end, summary_f
         if appendix == 'lifecycle_emissions':
             df_timeline = aggregate_or_combine_dataframes(bool_use_acronym, list_df)
             if df_timeline is not None:
-                df_timeline.to_csv(path_csv, index=False, float_format="%.4f")
+                write_summary_csv(df_timeline, path_csv, float_format="%.4f")
 
         else:
             # Write to .csv files
             for df in list_df:
                 if not df.empty:
-                    df.to_csv(path_csv, index=False, float_format="%.4f")
+                    write_summary_csv(df, path_csv, float_format="%.4f")
 
 
 # Filter by criteria for buildings
@@ -2595,11 +2802,11 @@ def calc_ubem_analytics_normalised(locator, hour_start, hour_end, cea_feature, s
             summary_folder, cea_feature, appendix, time_period, hour_start, hour_end
         )
 
-        if not os.path.exists(df_time_path):
+        if not summary_csv_exists(df_time_path):
             print(f"File not found: {df_time_path}.")
             break
         else:
-            df_time_resolution = pd.read_csv(df_time_path)
+            df_time_resolution = read_summary_csv(df_time_path)
 
         if bool_use_acronym:
             df_time_resolution.columns = map_metrics_and_cea_columns(
@@ -2624,8 +2831,8 @@ def calc_ubem_analytics_normalised(locator, hour_start, hour_end, cea_feature, s
                 df_buildings_path = locator.get_export_results_summary_cea_feature_time_resolution_buildings_file(
                     summary_folder, cea_feature, appendix, time_period, hour_start, hour_end
                 )
-                if os.path.exists(df_buildings_path):
-                    df_buildings = pd.read_csv(df_buildings_path)
+                if summary_csv_exists(df_buildings_path):
+                    df_buildings = read_summary_csv(df_buildings_path)
 
                     if bool_use_acronym:
                         df_buildings.columns = map_metrics_and_cea_columns(df_buildings.columns, direction="columns_to_metrics")
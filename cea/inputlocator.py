@@ -1716,6 +1716,20 @@ class InputLocator(object):
         """scenario/outputs/data/solar-radiation"""
         return os.path.join(self.scenario, 'outputs', 'data', 'solar-radiation')
 
+    def get_building_geometry_cache_folder(self):
+        """Returns the folder of the cached 3D building geometry of the radiation scripts. It is kept outside of the
+        solar radiation folder, which is cleared at the start of every radiation run.
+
+        `scenario/outputs/cache/building-geometry`"""
+        return os.path.join(self.scenario, 'outputs', 'cache', 'building-geometry')
+
+    def get_building_output_fingerprints_file(self):
+        """Returns the JSON record of the input fingerprints each building's radiation, occupancy and demand outputs
+        were simulated with. Pathway simulations compare it between consecutive states to reuse unchanged outputs.
+
+        `scenario/outputs/cache/building-output-fingerprints.json`"""
+        return os.path.join(self.scenario, 'outputs', 'cache', 'building-output-fingerprints.json')
+
     def get_radiation_building(self, building):
         """scenario/outputs/data/solar-radiation/${building}_radiation.csv"""
         return os.path.join(self.get_solar_radiation_folder(), '%s_radiation.csv' % building)
@@ -1816,6 +1830,17 @@ class InputLocator(object):
         """scenario/outputs/data/demand/{building}.csv"""
         return os.path.join(self.get_demand_results_folder(), '%(building)s.%(format)s' % locals())
 
+    # RESULT STORE
+    def get_result_store_folder(self):
+        """scenario/outputs/data/result-store"""
+        return os.path.join(self.scenario, 'outputs', 'data', 'result-store')
+
+    def get_result_store_dataset(self, dataset: str):
+        """scenario/outputs/data/result-store/{dataset}.parquet
+
+        The per-building results of a script in one columnar file (see :py:mod:`cea.utilities.result_store`)."""
+        return os.path.join(self.get_result_store_folder(), f'{dataset}.parquet')
+
     # EMISSIONS
     def get_lca_emissions_results_folder(self):
         """scenario/outputs/data/emissions"""
@@ -4,11 +4,12 @@ API endpoints for scenario download management.
 import os
 import asyncio
 from typing import List, Optional
+from urllib.parse import quote
 
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 from sqlmodel import select
-from starlette.responses import FileResponse
+from starlette.responses import StreamingResponse
 from starlette.background import BackgroundTask
 
 from cea.interfaces.dashboard.api.utils import CEAProject, CEAProjectID
@@ -25,6 +26,7 @@ from cea.interfaces.dashboard.server.downloads import (
     cleanup_download,
     mark_download_downloaded,
     prepare_download_background,
+    stream_download_archive,
     DownloadStartedEvent,
     OutputFileType
 )
@@ -355,7 +357,7 @@ async def download_file(
     token: Optional[str] = None  # From query parameter (pre-signed URL)
 ):
     """
-    Download the prepared zip file.
+    Download the prepared files as a zip archive, compressed while it is streamed.
     Supports two authentication methods:
     1. Session-based (cookies) via the CEAUserID dependency
     2. Token-based (pre-signed URL) via the token query parameter
@@ -370,7 +372,7 @@ async def download_file(
         token: JWT token from pre-signed URL (optional)
 
     Returns:
-        File response with zip file
+        Streaming response with the zip archive
 
     Raises:
         HTTPException 401: If no authentication provided
@@ -500,14 +502,23 @@ async def download_file(
 
     logger.info(f"Sending download {download_id} to user {authenticated_user_id}")
 
-    return FileResponse(
-        path=file_path,
+    # The size of the archive is not known before it is compressed, so no Content-Length
+    return StreamingResponse(
+        stream_download_archive(file_path),
         media_type="application/zip",
-        filename=filename,
+        headers={"Content-Disposition": content_disposition(filename)},
         background=BackgroundTask(cleanup_after_download, download_id)
     )
 
 
+def content_disposition(filename: str) -> str:
+    """Attachment header for ``filename``, as set by FileResponse (RFC 5987 encoding for non-ASCII names)."""
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
 async def cleanup_after_download(download_id: str):
     """
     Cleanup function that runs after file is fully streamed.
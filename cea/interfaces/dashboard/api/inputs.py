@@ -8,7 +8,7 @@ import traceback
 import warnings
 from collections import defaultdict
 from contextlib import redirect_stdout
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import zipfile
 
 from fastapi.responses import StreamingResponse
@@ -22,6 +22,12 @@ from pydantic import BaseModel, Field
 import cea.config
 import cea.inputlocator
 from cea.datamanagement.district_pathways.pathway_timeline import PathwayChildScenario
+from cea.interfaces.dashboard.lib.geometry_cache import (
+    file_fingerprint,
+    geometry_cache,
+    property_cache,
+    simplify_tolerance,
+)
 from cea.interfaces.dashboard.lib.logs import getCEAServerLogger
 import cea.schemas
 from cea.databases import CEADatabase, CEADatabaseException
@@ -103,7 +109,11 @@ async def get_building_props_db(db: str):
 
 
 @router.get('/geojson/{kind}')
-async def get_input_geojson(scenario: CEAScenario, kind: str):
+async def get_input_geojson(scenario: CEAScenario, kind: str, zoom: Optional[float] = None):
+    """
+    GeoJSON of an input geometry. With ``zoom`` (the zoom level of the map), the geometry is simplified to what is
+    visible at that zoom level - use the full geometry (no ``zoom``) for editing.
+    """
     locator = cea.inputlocator.InputLocator(scenario)
 
     if kind not in GEOJSON_KEYS:
@@ -120,16 +130,31 @@ async def get_input_geojson(scenario: CEAScenario, kind: str):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f'Invalid database for geojson: {location}',
             )
-        return df_to_json(location, root=scenario)[0]
+        return (await run_in_threadpool(df_to_json, location, scenario, zoom))[0]
     elif kind in NETWORK_KEYS:
         return get_network(scenario, kind)[0]
     elif kind == 'streets':
-        return df_to_json(locator.get_street_network(), root=scenario)[0]
+        return (await run_in_threadpool(df_to_json, locator.get_street_network(), scenario, zoom))[0]
 
 
 @router.get('/building-properties')
-async def get_building_props(scenario: CEAScenario):
-    return get_building_properties(scenario)
+async def get_building_props(scenario: CEAScenario, known: Optional[str] = None):
+    """
+    The building property tables and their column definitions.
+
+    ``known`` lists the fingerprints of tables the client already has (``db:fingerprint,...``, as returned in
+    ``fingerprints``). Unchanged tables are then left out of ``tables`` and listed in ``unchanged``.
+    """
+    known_fingerprints = {}
+    if known:
+        try:
+            known_fingerprints = dict(item.split(':', 1) for item in known.split(','))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail='Invalid known fingerprints, expected db:fingerprint,...',
+            )
+    return await run_in_threadpool(get_building_properties, scenario, known_fingerprints)
 
 
 @router.get('/all-inputs')
@@ -276,13 +301,43 @@ def _build_choices_cache(locator):
             path = getattr(locator, lookup_path_method)()
             key = (lookup_path_method, column['choice']['lookup']['column'])
             if key not in cache:
-                cache[key] = (path, get_choices(column['choice'], path))
+                choice = column['choice']
+                cache[key] = (path, property_cache.get((path, json.dumps(choice, sort_keys=True)),
+                                                       file_fingerprint(path),
+                                                       lambda: get_choices(choice, path)))
     return cache
 
 
-def get_building_properties(scenario: str):
+def _read_property_table(file_path: str, file_type: str, db_columns: Dict[str, Any]) -> Dict[str, Any]:
+    """Read a building property table, indexed by building name"""
+    if file_type == 'shp':
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        table_df = geopandas.read_file(file_path)
+        table_df = pd.DataFrame(table_df.drop(columns='geometry'))
+        if 'reference' in db_columns and 'reference' not in table_df.columns:
+            table_df['reference'] = None
+        return json.loads(table_df.set_index('name').to_json(orient='index'))
+    else:
+        table_df = pd.read_csv(file_path)
+        if 'reference' in db_columns and 'reference' not in table_df.columns:
+            table_df['reference'] = None
+        return table_df.set_index("name").to_dict(orient='index')
+
+
+def get_building_properties(scenario: str, known_fingerprints: Optional[Dict[str, str]] = None):
+    """
+    Read the building property tables (cached until their files change) and their column definitions.
+
+    :param scenario: path to the scenario
+    :param known_fingerprints: fingerprints of the tables the client already has, these tables are listed in
+        ``unchanged`` instead of being sent again if they did not change.
+    """
     locator = cea.inputlocator.InputLocator(scenario)
-    store = {'tables': {}, 'columns': {}}
+    store = {'tables': {}, 'columns': {}, 'fingerprints': {}}
+    if known_fingerprints:
+        store['unchanged'] = []
 
     choices_cache = _build_choices_cache(locator)
 
@@ -292,24 +347,18 @@ def get_building_properties(scenario: str):
         file_type = db_info['file_type']
         db_columns = db_info['columns']
 
+        if file_type == 'shp' and 'geometry' in db_columns:
+            del db_columns['geometry']
+
         # Get building property data from file
         try:
-            if file_type == 'shp':
-                if not os.path.exists(file_path):
-                    raise FileNotFoundError(f"File not found: {file_path}")
-
-                table_df = geopandas.read_file(file_path)
-                table_df = pd.DataFrame(table_df.drop(columns='geometry'))
-                if 'geometry' in db_columns:
-                    del db_columns['geometry']
-                if 'reference' in db_columns and 'reference' not in table_df.columns:
-                    table_df['reference'] = None
-                store['tables'][db] = json.loads(table_df.set_index('name').to_json(orient='index'))
+            fingerprint = file_fingerprint(file_path)
+            store['fingerprints'][db] = fingerprint
+            if known_fingerprints and known_fingerprints.get(db) == fingerprint:
+                store['unchanged'].append(db)
             else:
-                table_df = pd.read_csv(file_path)
-                if 'reference' in db_columns and 'reference' not in table_df.columns:
-                    table_df['reference'] = None
-                store['tables'][db] = table_df.set_index("name").to_dict(orient='index')
+                store['tables'][db] = property_cache.get(
+                    file_path, fingerprint, lambda: _read_property_table(file_path, file_type, db_columns))
         except (IOError, DriverError, ValueError, FileNotFoundError) as e:
             logger.warning(f"Error reading {db} from {file_path}: {e}")
             store['tables'][db] = None
@@ -373,13 +422,15 @@ def get_network(scenario: str, network_type):
         edges = locator.get_network_layout_edges_shapefile(network_type, network_name)
         nodes = locator.get_network_layout_nodes_shapefile(network_type, network_name)
 
-        network_json, crs = df_to_json(edges, root=scenario)
-        if network_json is None:
+        edges_json, crs = df_to_json(edges, root=scenario)
+        if edges_json is None:
             return None, [], None
 
+        # the geojsons are cached, build a new one
         nodes_json, _ = df_to_json(nodes, root=scenario)
-        network_json['features'].extend(nodes_json['features'])
-        network_json['properties'] = {'connected_buildings': connected_buildings}
+        network_json = {**edges_json,
+                        'features': edges_json['features'] + nodes_json['features'],
+                        'properties': {'connected_buildings': connected_buildings}}
         return network_json, connected_buildings, crs
     except IOError as e:
         logger.warning(f"Error reading network layout: {e}")
@@ -389,30 +440,25 @@ def get_network(scenario: str, network_type):
         return None, [], None
 
 
-def df_to_json(file_location, root=None):
-    from cea.utilities.standardize_coordinates import get_lat_lon_projected_shapefile, get_projected_coordinate_system
-
+def df_to_json(file_location, root=None, zoom=None):
+    """
+    Read a shapefile as GeoJSON (in latitude / longitude) and the projected coordinate system of its location.
+    The result is cached until the shapefile changes - don't modify it.
+
+    :param file_location: path to the shapefile
+    :param root: the folder the file must be in (see ``secure_path``)
+    :param zoom: the zoom level of the map the geometry is shown at, the geometry is simplified to what is visible
+        at that zoom level. None for the full geometry (e.g. to edit it).
+    :return: (geojson, crs), (None, None) if the file can't be read
+    """
     try:
         file_location = secure_path(file_location, root=root)
         if not os.path.exists(file_location):
             raise FileNotFoundError(f"File not found: {file_location}")
 
-        table_df = geopandas.GeoDataFrame.from_file(file_location)
-        # Save coordinate system
-        if table_df.empty:
-            # Set crs to generic projection if empty
-            crs = table_df.crs.to_proj4()
-        else:
-            lat, lon = get_lat_lon_projected_shapefile(table_df)
-            crs = get_projected_coordinate_system(lat, lon)
-
-        if "name" in table_df.columns:
-            table_df['name'] = table_df['name'].astype('str')
-
-        # make sure that the geojson is coded in latitude / longitude
-        out = table_df.to_crs(get_geographic_coordinate_system())
-        out = json.loads(out.to_json())
-        return out, crs
+        tolerance = simplify_tolerance(zoom)
+        return geometry_cache.get((file_location, tolerance), file_fingerprint(file_location),
+                                  lambda: _read_geojson(file_location, tolerance))
     except (IOError, DriverError, FileNotFoundError) as e:
         print(e)
         return None, None
@@ -421,6 +467,29 @@ def df_to_json(file_location, root=None):
         return None, None
 
 
+def _read_geojson(file_location, tolerance=None):
+    from cea.utilities.standardize_coordinates import get_lat_lon_projected_shapefile, get_projected_coordinate_system
+
+    table_df = geopandas.GeoDataFrame.from_file(file_location)
+    # Save coordinate system
+    if table_df.empty:
+        # Set crs to generic projection if empty
+        crs = table_df.crs.to_proj4()
+    else:
+        lat, lon = get_lat_lon_projected_shapefile(table_df)
+        crs = get_projected_coordinate_system(lat, lon)
+
+    if "name" in table_df.columns:
+        table_df['name'] = table_df['name'].astype('str')
+
+    # make sure that the geojson is coded in latitude / longitude
+    out = table_df.to_crs(get_geographic_coordinate_system())
+    if tolerance is not None and not out.empty:
+        out['geometry'] = out.geometry.simplify(tolerance, preserve_topology=True)
+    out = json.loads(out.to_json())
+    return out, crs
+
+
 @router.get('/building-schedule/{building}')
 async def get_building_schedule(scenario: CEAScenario, building: str):
     locator = cea.inputlocator.InputLocator(scenario)
@@ -0,0 +1,86 @@
+"""
+In-process cache of the geometry and property tables served by the inputs API.
+
+Opening a scenario in the map reads, reprojects and serialises the zone,
+surroundings, trees and streets shapefiles and reads all building property
+tables - on every request. The results are kept here, keyed by the file they
+were read from and validated against the fingerprint of that file (see
+:func:`cea.utilities.fingerprint.hash_files`), so a file edited by a script or
+the input editor is read again on the next request.
+
+Cached values are shared between requests - treat them as read-only.
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional
+
+from cea.utilities.fingerprint import hash_files
+
+# the files of a shapefile that make up its content
+SHAPEFILE_EXTENSIONS = ('.shp', '.shx', '.dbf', '.prj', '.cpg')
+
+# pixels of a web-map tile, used to derive the simplification tolerance of a zoom level
+TILE_SIZE = 256
+
+
+def source_files(file_location: str) -> List[str]:
+    """The files a dataset is read from (all the files of a shapefile)"""
+    root, ext = os.path.splitext(file_location)
+    if ext.lower() == '.shp':
+        return [root + extension for extension in SHAPEFILE_EXTENSIONS]
+    return [file_location]
+
+
+def file_fingerprint(file_location: str) -> str:
+    """Fingerprint of the contents of a dataset (changes when any of its files is changed, added or removed)"""
+    return hash_files(source_files(file_location))
+
+
+def simplify_tolerance(zoom: Optional[float]) -> Optional[float]:
+    """
+    Tolerance (in degrees) to simplify geometry shown at a web-map zoom level: half a pixel at the equator, so the
+    simplification is not visible. None (no simplification) if ``zoom`` is None.
+    """
+    if zoom is None:
+        return None
+    return 360.0 / (TILE_SIZE * 2 ** zoom) / 2
+
+
+class FingerprintCache:
+    """A bounded, thread-safe LRU cache whose entries are only valid for the fingerprint they were computed for."""
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, fingerprint: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return the value cached for ``key`` if it was computed for ``fingerprint``, otherwise compute and cache it.
+        Exceptions raised by ``compute`` are passed on and nothing is cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = (fingerprint, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# (file_location, simplify tolerance) -> (geojson, crs)
+geometry_cache = FingerprintCache()
+# file_location -> property table, (file_location, choice properties) -> choices
+property_cache = FingerprintCache(max_entries=256)
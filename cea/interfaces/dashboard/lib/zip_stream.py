@@ -0,0 +1,181 @@
+"""
+Streaming ZIP archives for scenario downloads.
+
+``stream_zip`` yields the bytes of a ZIP archive while it is being built, so
+the first bytes reach the client as soon as the first file is compressed -
+the archive is never written to disk as a whole.
+
+- Files are compressed in a thread pool (``zlib`` releases the GIL), a
+  bounded number of files ahead of the one being sent. Compressed data is
+  spooled to memory (or a temporary file for large files), so peak disk use
+  depends on the largest files in flight, not on the size of the scenario.
+- Already-compressed files (e.g. the zstd Feather files of the radiation
+  results) are stored without recompression.
+- The sizes and CRC of each entry are known before its local header is
+  written, so no data descriptors are needed. ZIP64 records are added when
+  an entry or the archive exceeds the 4 GiB limits of the classic format.
+"""
+import os
+import struct
+import tempfile
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Optional, Sequence, Tuple, Union
+
+# files that are already compressed, storing them is as small and much faster
+STORED_EXTENSIONS = {".feather", ".parquet", ".zip", ".gz", ".zst"}
+
+CHUNK_SIZE = 1024 * 1024
+# compressed files larger than this are spooled to a temporary file instead of memory
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+COMPRESS_LEVEL = 6
+
+# sizes, offsets and counts from these limits on are stored in ZIP64 records
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP64_COUNT_LIMIT = 0xFFFF
+_SENTINEL = 0xFFFFFFFF
+_COUNT_SENTINEL = 0xFFFF
+
+_METHOD_STORED = 0
+_METHOD_DEFLATED = 8
+_FLAG_UTF8 = 0x0800
+_VERSION_DEFAULT = 20
+_VERSION_ZIP64 = 45
+_VERSION_MADE_BY = (3 << 8) | _VERSION_ZIP64  # unix, so that the file permissions are kept
+
+
+class _CompressedEntry(NamedTuple):
+    archive_name: str
+    method: int
+    crc: int
+    compressed_size: int
+    uncompressed_size: int
+    dos_time: int
+    dos_date: int
+    external_attr: int
+    data: BinaryIO
+
+
+def _dos_date_time(mtime: float) -> Tuple[int, int]:
+    year, month, day, hour, minute, second = time.localtime(mtime)[:6]
+    year = min(max(year, 1980), 2107)
+    return (hour << 11) | (minute << 5) | (second // 2), ((year - 1980) << 9) | (month << 5) | day
+
+
+def _compress_file(file_path: Path, archive_name: str) -> _CompressedEntry:
+    """Compress (or store) a file into a spooled buffer, computing the CRC on the way."""
+    stat = os.stat(file_path)
+    method = _METHOD_STORED if file_path.suffix.lower() in STORED_EXTENSIONS else _METHOD_DEFLATED
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -15) if method == _METHOD_DEFLATED else None
+
+    data = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    crc = 0
+    uncompressed_size = 0
+    try:
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                crc = zlib.crc32(chunk, crc)
+                uncompressed_size += len(chunk)
+                data.write(compressor.compress(chunk) if compressor else chunk)
+        if compressor:
+            data.write(compressor.flush())
+        compressed_size = data.tell()
+        data.seek(0)
+    except BaseException:
+        data.close()
+        raise
+
+    dos_time, dos_date = _dos_date_time(stat.st_mtime)
+    return _CompressedEntry(archive_name.replace(os.sep, "/"), method, crc, compressed_size, uncompressed_size,
+                            dos_time, dos_date, (stat.st_mode & 0xFFFF) << 16, data)
+
+
+def _field(value: int, limit: Optional[int] = None, sentinel: int = _SENTINEL) -> int:
+    """The value of a classic size/offset field, the sentinel if the value is stored in a ZIP64 record"""
+    return value if value < (ZIP64_LIMIT if limit is None else limit) else sentinel
+
+
+def _local_header(entry: _CompressedEntry, name: bytes) -> bytes:
+    zip64 = entry.compressed_size >= ZIP64_LIMIT or entry.uncompressed_size >= ZIP64_LIMIT
+    extra = struct.pack("<HHQQ", 0x0001, 16, entry.uncompressed_size, entry.compressed_size) if zip64 else b""
+    return struct.pack(
+        "<IHHHHHIIIHH", 0x04034B50, _VERSION_ZIP64 if zip64 else _VERSION_DEFAULT, _FLAG_UTF8, entry.method,
+        entry.dos_time, entry.dos_date, entry.crc,
+        _SENTINEL if zip64 else entry.compressed_size,
+        _SENTINEL if zip64 else entry.uncompressed_size,
+        len(name), len(extra)) + name + extra
+
+
+def _central_directory_header(entry: _CompressedEntry, name: bytes, offset: int) -> bytes:
+    # the ZIP64 extra field only holds the values that do not fit their classic field, in this order
+    zip64_values = [value for value in (entry.uncompressed_size, entry.compressed_size, offset)
+                    if value >= ZIP64_LIMIT]
+    extra = struct.pack(f"<HH{len(zip64_values)}Q", 0x0001, 8 * len(zip64_values),
+                        *zip64_values) if zip64_values else b""
+    return struct.pack(
+        "<IHHHHHHIIIHHHHHII", 0x02014B50, _VERSION_MADE_BY,
+        _VERSION_ZIP64 if zip64_values else _VERSION_DEFAULT, _FLAG_UTF8, entry.method,
+        entry.dos_time, entry.dos_date, entry.crc,
+        _field(entry.compressed_size), _field(entry.uncompressed_size),
+        len(name), len(extra), 0, 0, 0, entry.external_attr, _field(offset)) + name + extra
+
+
+def _end_of_central_directory(count: int, cd_offset: int, cd_size: int) -> bytes:
+    records = b""
+    if count >= ZIP64_COUNT_LIMIT or cd_offset >= ZIP64_LIMIT or cd_size >= ZIP64_LIMIT:
+        zip64_offset = cd_offset + cd_size
+        records += struct.pack("<IQHHIIQQQQ", 0x06064B50, 44, _VERSION_MADE_BY, _VERSION_ZIP64, 0, 0,
+                               count, count, cd_size, cd_offset)
+        records += struct.pack("<IIQI", 0x07064B50, 0, zip64_offset, 1)
+    count_field = _field(count, ZIP64_COUNT_LIMIT, _COUNT_SENTINEL)
+    return records + struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, count_field, count_field,
+                                 _field(cd_size), _field(cd_offset), 0)
+
+
+def stream_zip(files: Iterable[Tuple[Union[str, os.PathLike], str]], workers: Optional[int] = None,
+               chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield a ZIP archive of ``files`` chunk by chunk.
+
+    :param files: (file_path, archive_name) of each file, in the order they appear in the archive.
+    :param workers: number of files compressed in parallel (defaults to the number of CPUs, at most 8).
+    :param chunk_size: maximum size of the chunks of file data that are yielded.
+    """
+    files: Sequence[Tuple[Union[str, os.PathLike], str]] = list(files)
+    workers = workers or min(8, os.cpu_count() or 1)
+    central_directory = []
+    offset = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # compress a few files ahead of the one being sent, but not the whole scenario
+        pending = [executor.submit(_compress_file, Path(path), name) for path, name in files[:2 * workers]]
+        next_file = len(pending)
+        try:
+            while pending:
+                entry = pending.pop(0).result()
+                if next_file < len(files):
+                    path, name = files[next_file]
+                    pending.append(executor.submit(_compress_file, Path(path), name))
+                    next_file += 1
+
+                with entry.data:
+                    name = entry.archive_name.encode("utf-8")
+                    header = _local_header(entry, name)
+                    central_directory.append(_central_directory_header(entry, name, offset))
+                    yield header
+                    for chunk in iter(lambda: entry.data.read(chunk_size), b""):
+                        yield chunk
+                    offset += len(header) + entry.compressed_size
+        finally:
+            # e.g. the client disconnected - don't compress the remaining files and release their buffers
+            for future in pending:
+                future.cancel()
+            for future in pending:
+                if not future.cancelled() and future.exception() is None:
+                    future.result().data.close()
+
+    cd_bytes = b"".join(central_directory)
+    yield cd_bytes
+    yield _end_of_central_directory(len(central_directory), offset, len(cd_bytes))
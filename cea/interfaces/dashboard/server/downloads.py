@@ -1,15 +1,20 @@
 """
 Download management for scenario downloads.
 Handles download lifecycle, cleanup, and user limits.
+
+Preparing a download only generates the requested summaries and records the files
+to send in a manifest. The ZIP archive is built while it is sent to the client (see
+``cea.interfaces.dashboard.lib.zip_stream``), so neither the time to the first byte
+nor the disk space used depend on the size of the scenario.
 """
 import os
 import asyncio
-import zipfile
+import json
 import shutil
 import tempfile
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from pydantic import BaseModel
 from sqlmodel import select
@@ -21,6 +26,7 @@ from cea.interfaces.dashboard.lib.database.models import Download, DownloadState
 from cea.interfaces.dashboard.lib.database.session import get_session_context
 from cea.interfaces.dashboard.lib.logs import logger
 from cea.interfaces.dashboard.lib.socketio import emit_with_retry
+from cea.interfaces.dashboard.lib.zip_stream import stream_zip
 
 from cea.interfaces.dashboard.api.contents import VALID_EXTENSIONS, OutputFileType
 
@@ -240,8 +246,8 @@ async def mark_download_ready(
     Args:
         session: Database session
         download_id: Download ID
-        file_path: Path to prepared zip file
-        file_size: Size of zip file in bytes
+        file_path: Path to the manifest of the files to download
+        file_size: Size of the files to download in bytes (before compression)
     """
     result = await session.execute(
         select(Download).where(Download.id == download_id)
@@ -255,7 +261,7 @@ async def mark_download_ready(
     download.state = DownloadState.READY
     download.file_path = file_path
     download.file_size = file_size
-    progress_msg = f"Download ready: {round(file_size / (1024 * 1024), 2)} MB"
+    progress_msg = f"Download ready: {round(file_size / (1024 * 1024), 2)} MB (before compression)"
     download.progress_message = progress_msg
 
     # Capture values before commit (avoid lazy loading issues)
@@ -438,9 +444,47 @@ def get_download_directory(download_id: str) -> Path:
     return DOWNLOAD_DIR_BASE / download_id
 
 
-def get_download_zip_path(download_id: str) -> Path:
-    """Get the zip file path for a download."""
-    return get_download_directory(download_id) / "scenario_download.zip"
+def get_download_manifest_path(download_id: str) -> Path:
+    """Get the path of the manifest listing the files of a download."""
+    return get_download_directory(download_id) / "manifest.json"
+
+
+def write_download_manifest(manifest_path: Path, files: list[tuple[Path, str]]) -> int:
+    """
+    Record the files of a download.
+
+    Args:
+        manifest_path: Path of the manifest
+        files: List of (file_path, archive_name) tuples
+
+    Returns:
+        Total size of the files in bytes
+    """
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_path, 'w') as f:
+        json.dump([[str(item_path), archive_name] for item_path, archive_name in files], f)
+    return sum(os.path.getsize(item_path) for item_path, _ in files)
+
+
+def stream_download_archive(manifest_path: str) -> Iterator[bytes]:
+    """
+    Yield the ZIP archive of the files in a download manifest, compressing them while they are sent.
+    Files that were removed since the download was prepared are left out.
+
+    Args:
+        manifest_path: Path of the manifest
+
+    Returns:
+        Iterator over the bytes of the archive
+    """
+    with open(manifest_path) as f:
+        files = [(item_path, archive_name) for item_path, archive_name in json.load(f)]
+
+    existing = [(item_path, archive_name) for item_path, archive_name in files if os.path.exists(item_path)]
+    if len(existing) < len(files):
+        logger.warning(f"{len(files) - len(existing)} files of {manifest_path} no longer exist, skipping")
+
+    yield from stream_zip(existing)
 
 
 # ============================================================================
@@ -563,7 +607,8 @@ def prepare_download_sync(
         loop.call_soon_threadsafe(progress_queue.put_nowait, msg)
 
     try:
-        # Progress breakdown: Summary (0-40%), Collect (40-45%), ZIP (45-100%)
+        # Progress breakdown: Summary (0-40%), Collect (40-100%)
+        # The archive itself is compressed while it is downloaded
 
         # Update progress: Starting
         put_progress({
@@ -609,42 +654,16 @@ def prepare_download_sync(
 
         logger.info(f"Found {len(files_to_zip)} files to zip for download {download_id}")
 
-        # Create ZIP file (45-100%)
-        put_progress({
-            'type': 'progress',
-            'message': f"Creating ZIP archive ({len(files_to_zip)} files)...",
-            'percent': 45
-        })
-
-        zip_path = get_download_zip_path(download_id)
-        zip_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for i, (item_path, archive_name) in enumerate(files_to_zip):
-                zip_file.write(item_path, arcname=archive_name)
-
-                # Update progress every 50 files (45-100%)
-                if (i + 1) % 50 == 0 or (i + 1) == len(files_to_zip):
-                    # Calculate progress: 45% + (55% * file_completion)
-                    file_progress = (i + 1) / len(files_to_zip)
-                    percent = int(45 + (55 * file_progress))
-
-                    put_progress({
-                        'type': 'progress',
-                        'message': f"Adding files to archive... ({i+1}/{len(files_to_zip)})",
-                        'percent': percent,
-                        'persist': False  # Don't write file counts to database
-                    })
-
-        # Get file size
-        file_size = os.path.getsize(zip_path)
+        manifest_path = get_download_manifest_path(download_id)
+        file_size = write_download_manifest(manifest_path, files_to_zip)
 
-        logger.info(f"Download {download_id} prepared successfully: {zip_path} ({file_size} bytes)")
+        logger.info(f"Download {download_id} prepared successfully: {manifest_path} "
+                    f"({len(files_to_zip)} files, {file_size} bytes)")
 
         # Mark download as ready
         put_progress({
             'type': 'ready',
-            'file_path': str(zip_path),
+            'file_path': str(manifest_path),
             'file_size': file_size
         })
 
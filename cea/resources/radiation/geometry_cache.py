@@ -0,0 +1,159 @@
+"""
+Content-addressed cache of the 3D building geometry of the radiation scripts.
+
+Generating the ``BuildingGeometry`` pickles (terrain intersection, windows, intersection of the surfaces with adjacent
+buildings) is the most expensive part of preparing a radiation run, and in design iterations most buildings do not
+change between runs. Each building is therefore keyed on a fingerprint of everything its geometry is generated from:
+
+- the solid of a building: simplified footprint, height, floors, void deck, simplification tolerance and the terrain
+  patch under the footprint (:py:func:`building_solid_fingerprint`).
+- the geometry of a zone building additionally depends on its window-to-wall ratios and on the solids of the adjacent
+  buildings its surfaces are intersected with (:py:func:`zone_building_fingerprint`).
+
+Cache entries are the files written by ``BuildingGeometry.save``, stored under their fingerprint, so a hit is a plain
+file copy into the geometry folder of the run. The fingerprints do not include the name of a building, so a renamed
+building (or one of several identical buildings) hits the entry of another name: ``update_geometry_cache`` resets the
+name of a restored geometry to the building it is restored for.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from typing import Iterable, List
+
+import shapely
+
+from cea.utilities.fingerprint import hash_arrays, hash_payload
+
+__author__ = "Jimeno A. Fonseca"
+__copyright__ = "Copyright 2017, Architecture and Building Systems - ETH Zurich"
+__credits__ = ["Jimeno A. Fonseca", "Kian Wee Chen"]
+__license__ = "MIT"
+__version__ = "0.1"
+__maintainer__ = "Daren Thomas"
+__email__ = "cea@arch.ethz.ch"
+__status__ = "Production"
+
+# bump whenever the geometry generation changes, to invalidate existing cache entries
+GEOMETRY_CACHE_VERSION = 1
+
+ZONE = 'zone'
+SURROUNDINGS = 'surroundings'
+
+
+def elevation_patch_fingerprint(elevation_map) -> str:
+    """fingerprint of the terrain patch (an `ElevationMap`) a building is burnt into."""
+    return hash_arrays(elevation_map.elevation_map, elevation_map.x_coords, elevation_map.y_coords,
+                       [elevation_map.x_size, elevation_map.y_size,
+                        float('nan') if elevation_map.nodata is None else elevation_map.nodata])
+
+
+def building_solid_fingerprint(geometry: shapely.Geometry,
+                               height_ag: float,
+                               floors_ag: int,
+                               void_deck: int,
+                               simplification: float,
+                               elevation_patch_hash: str,
+                               ) -> str:
+    """fingerprint of the inputs of a building solid (see `geometry_generator.calc_building_solids`).
+
+    :param geometry: simplified footprint of the building.
+    :type geometry: shapely.Polygon
+    :param height_ag: height above ground [m].
+    :type height_ag: float
+    :param floors_ag: number of floors above ground.
+    :type floors_ag: int
+    :param void_deck: number of void deck floors.
+    :type void_deck: int
+    :param simplification: simplification tolerance of the footprint.
+    :type simplification: float
+    :param elevation_patch_hash: fingerprint of the terrain under the footprint (see `elevation_patch_fingerprint`).
+    :type elevation_patch_hash: str
+    :return: a 64-character hex digest.
+    :rtype: str
+    """
+    return hash_payload({"version": GEOMETRY_CACHE_VERSION,
+                         "geometry": shapely.to_wkb(geometry, hex=True),
+                         "height_ag": float(height_ag),
+                         "floors_ag": int(floors_ag),
+                         "void_deck": int(void_deck),
+                         "simplification": float(simplification),
+                         "terrain": elevation_patch_hash})
+
+
+def zone_building_fingerprint(solid_fingerprint: str,
+                              wwr: Iterable[float],
+                              neglect_adjacent_buildings: bool,
+                              adjacent_solid_fingerprints: Iterable[str],
+                              ) -> str:
+    """fingerprint of the inputs of the geometry of a building in the zone (see
+    `geometry_generator.calc_building_geometry_zone`).
+
+    :param solid_fingerprint: fingerprint of the building's own solid.
+    :type solid_fingerprint: str
+    :param wwr: window-to-wall ratios (west, east, north, south).
+    :type wwr: list[float]
+    :param neglect_adjacent_buildings: True if no adjacency of other buildings is considered.
+    :type neglect_adjacent_buildings: bool
+    :param adjacent_solid_fingerprints: fingerprints of the solids the building's surfaces are intersected with.
+    :type adjacent_solid_fingerprints: list[str]
+    :return: a 64-character hex digest.
+    :rtype: str
+    """
+    return hash_payload({"version": GEOMETRY_CACHE_VERSION,
+                         "solid": solid_fingerprint,
+                         "wwr": [float(x) for x in wwr],
+                         "neglect_adjacent_buildings": bool(neglect_adjacent_buildings),
+                         "adjacent": sorted(adjacent_solid_fingerprints)})
+
+
+class BuildingGeometryCache(object):
+    """
+    A folder of `BuildingGeometry` pickles stored by fingerprint, in one sub-folder per kind of building
+    (`zone` or `surroundings`, like the geometry folder of a radiation run).
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def entry_path(self, kind: str, fingerprint: str) -> str:
+        return os.path.join(self.cache_dir, kind, fingerprint)
+
+    def contains(self, kind: str, fingerprint: str) -> bool:
+        return os.path.isfile(self.entry_path(kind, fingerprint))
+
+    def restore(self, kind: str, fingerprint: str, pickle_location: str) -> str:
+        """copy a cached geometry to `pickle_location` (where `BuildingGeometry.load` expects it)."""
+        os.makedirs(os.path.dirname(pickle_location), exist_ok=True)
+        shutil.copyfile(self.entry_path(kind, fingerprint), pickle_location)
+        return pickle_location
+
+    def store(self, kind: str, fingerprint: str, pickle_location: str) -> str:
+        """add the geometry saved at `pickle_location` (by `BuildingGeometry.save`) to the cache."""
+        entry_path = self.entry_path(kind, fingerprint)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        # write to a temporary file first, so that an interrupted run never leaves a truncated entry behind
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), prefix='.tmp-')
+        os.close(fd)
+        try:
+            shutil.copyfile(pickle_location, temp_path)
+            os.replace(temp_path, entry_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return entry_path
+
+    def evict_orphans(self, kind: str, fingerprints: Iterable[str]) -> List[str]:
+        """remove the cache entries of `kind` that are not in `fingerprints` and return their fingerprints."""
+        folder = os.path.join(self.cache_dir, kind)
+        if not os.path.isdir(folder):
+            return []
+        keep = set(fingerprints)
+        evicted = []
+        for file_name in os.listdir(folder):
+            if file_name not in keep:
+                os.remove(os.path.join(folder, file_name))
+                evicted.append(file_name)
+        return evicted
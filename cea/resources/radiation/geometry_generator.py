@@ -20,6 +20,7 @@ import py4design.py3dmodel.construct as construct
 import py4design.py3dmodel.fetch as fetch
 import py4design.py3dmodel.modify as modify
 import py4design.py3dmodel.utility as utility
+import shapely
 from OCC.Core.IntCurvesFace import IntCurvesFace_ShapeIntersector
 from OCC.Core.gp import gp_Pnt, gp_Lin, gp_Ax1, gp_Dir
 from osgeo import osr, gdal
@@ -30,11 +31,14 @@ import cea
 import cea.config
 import cea.inputlocator
 import cea.utilities.parallel
+from cea.resources.radiation.terrain import calc_detail_mask, select_terrain_points
+from cea.resources.radiation.geometry_cache import (ZONE, SURROUNDINGS, BuildingGeometryCache,
+                                                    building_solid_fingerprint, elevation_patch_fingerprint,
+                                                    zone_building_fingerprint)
 
 if TYPE_CHECKING:
     import geopandas as gpd
     from OCC.Core.TopoDS import TopoDS_Face, TopoDS_Solid
-    import shapely
 
 __author__ = "Jimeno A. Fonseca"
 __copyright__ = "Copyright 2017, Architecture and Building Systems - ETH Zurich"
@@ -61,6 +65,12 @@ SURFACE_DIRECTION_LABELS = {'windows_east',
                             'undersides_bottom',
                             }
 
+# two buildings are close (and checked for intersecting surfaces) if the south-west corners of their bounding boxes
+# are within this distance [m] on the xy-plane
+ADJACENCY_DISTANCE = 100
+# margin [m] added to ADJACENCY_DISTANCE when adjacent buildings are found on footprints instead of solids
+ADJACENCY_MARGIN = 1.0
+
 
 def identify_surfaces_type(occface_list: List[TopoDS_Face]) -> Tuple[List[TopoDS_Face], 
                                                                      List[TopoDS_Face], 
@@ -277,7 +287,8 @@ def building_2d_to_3d(zone_df: gpd.GeoDataFrame,
                       architecture_wwr_df: pd.DataFrame, 
                       elevation_map: ElevationMap, 
                       config: cea.config.Configuration, 
-                      geometry_pickle_dir: str
+                      geometry_pickle_dir: str,
+                      geometry_cache_dir: str | None = None,
                       ) -> Tuple[List[str], List[str]]:
     """reconstruct 3D building geometries with windows and store each building's 3D data into a file.
 
@@ -293,6 +304,10 @@ def building_2d_to_3d(zone_df: gpd.GeoDataFrame,
     :type config: cea.config.Configuration
     :param geometry_pickle_dir: directory for saving building's 3D data.
     :type geometry_pickle_dir: str
+    :param geometry_cache_dir: directory of the building geometry cache (see `geometry_cache.BuildingGeometryCache`).
+        Buildings whose inputs did not change since a previous run are copied from the cache instead of being
+        regenerated. If `None`, the geometry of every building is generated.
+    :type geometry_cache_dir: str, optional
     :return: names of analyzed buildings.
     :rtype: list[str]
     :return: names of surrounding buildings.
@@ -310,63 +325,202 @@ def building_2d_to_3d(zone_df: gpd.GeoDataFrame,
     surroundings_simplification = config.radiation.surrounding_geometry
     neglect_adjacent_buildings = config.radiation.neglect_adjacent_buildings
 
-    print('Calculating terrain intersection of building geometries')
     zone_buildings_df: pd.DataFrame = zone_df.set_index('name')
     # merge architecture wwr data into zone buildings dataframe with "name" column,
     # because we want to use void_deck when creating the building solid.
     zone_building_names = zone_buildings_df.index.values
-    zone_building_solid_list, zone_elevations = calc_building_solids(zone_buildings_df, zone_simplification,
-                                                                     elevation_map, num_processes)
+    n = len(zone_building_names)
 
     # Check if there are any buildings in surroundings_df before processing
     if not surroundings_df.empty:
         surroundings_buildings_df = surroundings_df.set_index('name')
         if 'void_deck' not in surroundings_buildings_df.columns:
             surroundings_buildings_df['void_deck'] = 0
-            
         surroundings_building_names = surroundings_buildings_df.index.values
-        surroundings_building_solid_list, _ = calc_building_solids(
-            surroundings_buildings_df, surroundings_simplification, elevation_map, num_processes)
+    else:
+        surroundings_buildings_df = None
+        surroundings_building_names = []
+
+    # the solids of all buildings are indexed zone buildings first, then surroundings
+    # (the order in which they are intersected with the surfaces of the zone buildings)
+    n_all = n + len(surroundings_building_names)
+    zone_todo = np.ones(n, dtype=bool)
+    surroundings_todo = np.ones(n_all - n, dtype=bool)
+    cache = None
+    if geometry_cache_dir is not None:
+        cache = BuildingGeometryCache(geometry_cache_dir)
+        zone_fingerprints, surroundings_fingerprints, footprint_neighbours = calc_building_fingerprints(
+            zone_buildings_df, surroundings_buildings_df, architecture_wwr_df, elevation_map,
+            zone_simplification, surroundings_simplification, neglect_adjacent_buildings)
+        zone_todo = np.array([not cache.contains(ZONE, fp) for fp in zone_fingerprints], dtype=bool)
+        surroundings_todo = np.array([not cache.contains(SURROUNDINGS, fp) for fp in surroundings_fingerprints],
+                                     dtype=bool)
+        print(f"Reusing cached geometry of {n - zone_todo.sum()} out of {n} buildings in the zone "
+              f"and {len(surroundings_todo) - surroundings_todo.sum()} out of {len(surroundings_todo)} "
+              f"surrounding buildings")
+
+    # solids are needed for the buildings to generate and for the buildings adjacent to them
+    solid_needed = np.concatenate([zone_todo, surroundings_todo])
+    if cache is not None and not neglect_adjacent_buildings:
+        for i in np.flatnonzero(zone_todo):
+            solid_needed[footprint_neighbours[i]] = True
+    solids = [None] * n_all
+    zone_elevations = [None] * n
+
+    print('Calculating terrain intersection of building geometries')
+    zone_needed = np.flatnonzero(solid_needed[:n])
+    if len(zone_needed) > 0:
+        zone_building_solid_list, elevations = calc_building_solids(zone_buildings_df.iloc[zone_needed],
+                                                                    zone_simplification, elevation_map,
+                                                                    num_processes)
+        for i, solid, elevation in zip(zone_needed, zone_building_solid_list, elevations):
+            solids[i] = solid
+            zone_elevations[i] = elevation
+
+    if surroundings_buildings_df is not None:
+        surroundings_needed = np.flatnonzero(solid_needed[n:])
+        if len(surroundings_needed) > 0:
+            surroundings_building_solid_list, _ = calc_building_solids(
+                surroundings_buildings_df.iloc[surroundings_needed], surroundings_simplification, elevation_map,
+                num_processes)
+            for j, solid in zip(surroundings_needed, surroundings_building_solid_list):
+                solids[n + j] = solid
         # calculate geometry for the surroundings
         print('Generating geometry for surrounding buildings')
-        geometry_3D_surroundings = [calc_building_geometry_surroundings(x, y, geometry_pickle_dir) for x, y in
-                                    zip(surroundings_building_names, surroundings_building_solid_list)]
-    else:
-        surroundings_building_solid_list = []
-        geometry_3D_surroundings = []
+        for j in np.flatnonzero(surroundings_todo):
+            calc_building_geometry_surroundings(surroundings_building_names[j], solids[n + j], geometry_pickle_dir)
 
     # calculate geometry for the zone of analysis
     print('Generating geometry for buildings in the zone of analysis')
-    n = len(zone_building_names)
-    calc_zone_geometry_multiprocessing = cea.utilities.parallel.vectorize(calc_building_geometry_zone,
-                                                                          num_processes,
-                                                                          on_complete=print_progress)
+    todo = np.flatnonzero(zone_todo)
+    if len(todo) > 0:
+        calc_zone_geometry_multiprocessing = cea.utilities.parallel.vectorize(calc_building_geometry_zone,
+                                                                              num_processes,
+                                                                              on_complete=print_progress)
+
+        # only ship the solids that are close to each building to its task (instead of every solid of the site)
+        if not neglect_adjacent_buildings:
+            available = np.flatnonzero(solid_needed)
+            available_solid_list = [solids[k] for k in available]
+            corners = calc_bounding_box_corners(available_solid_list)
+            close_buildings = find_close_buildings(corners[np.searchsorted(available, todo)], corners)
+            close_building_solid_list = [[available_solid_list[k] for k in indices] for indices in close_buildings]
+            print_adjacent_solids_report(close_buildings, available_solid_list, measure_bytes=config.debug)
+        else:
+            close_building_solid_list = repeat([], len(todo))
+        # TODO: maybe move calc_building_solid into this function and avoid using archiecture_wwr_df, because it's already merged into zone_buildings_df.
+        calc_zone_geometry_multiprocessing(zone_building_names[todo],
+                                           [solids[i] for i in todo],
+                                           close_building_solid_list,
+                                           [architecture_wwr_df.loc[[name]] for name in zone_building_names[todo]],
+                                           repeat(geometry_pickle_dir, len(todo)),
+                                           repeat(neglect_adjacent_buildings, len(todo)),
+                                           [zone_elevations[i] for i in todo])
+
+    if cache is not None:
+        update_geometry_cache(cache, geometry_pickle_dir, ZONE, zone_building_names, zone_fingerprints, zone_todo)
+        update_geometry_cache(cache, geometry_pickle_dir, SURROUNDINGS, surroundings_building_names,
+                              surroundings_fingerprints, surroundings_todo)
+
+    geometry_3D_zone = list(zone_building_names)
+    geometry_3D_surroundings = list(surroundings_building_names)
+    return geometry_3D_zone, geometry_3D_surroundings
 
-    if not neglect_adjacent_buildings:
-        all_building_solid_list = np.append(zone_building_solid_list, surroundings_building_solid_list)
+
+def calc_building_fingerprints(zone_buildings_df: pd.DataFrame,
+                               surroundings_buildings_df: pd.DataFrame | None,
+                               architecture_wwr_df: pd.DataFrame,
+                               elevation_map: ElevationMap,
+                               zone_simplification: float,
+                               surroundings_simplification: float,
+                               neglect_adjacent_buildings: bool,
+                               ) -> Tuple[List[str], List[str], List[np.ndarray]]:
+    """fingerprint the inputs of the 3D geometry of each building for the geometry cache.
+
+    The adjacent buildings of a zone building are found on the simplified footprints, before any solid is created,
+    with a margin on top of `ADJACENCY_DISTANCE`, so that they include every building
+    `calc_building_geometry_zone` may intersect its surfaces with.
+
+    :return: fingerprints of the zone buildings.
+    :rtype: list[str]
+    :return: fingerprints of the surrounding buildings.
+    :rtype: list[str]
+    :return: for each zone building, the indices of its adjacent buildings (zone buildings first, then surroundings).
+    :rtype: list[ndarray]
+    """
+    def solid_fingerprints(buildings_df, simplification):
+        geometries = buildings_df.geometry.simplify(simplification, preserve_topology=True)
+        fingerprints = [building_solid_fingerprint(geometry, height, floors, void_deck, simplification,
+                                                   elevation_patch_fingerprint(
+                                                       elevation_map.get_elevation_map_from_geometry(geometry)))
+                        for geometry, height, floors, void_deck in zip(geometries,
+                                                                       buildings_df['height_ag'],
+                                                                       buildings_df['floors_ag'],
+                                                                       buildings_df['void_deck'])]
+        return fingerprints, geometries.bounds[['minx', 'miny']].to_numpy(dtype=float)
+
+    zone_solid_fingerprints, corners = solid_fingerprints(zone_buildings_df, zone_simplification)
+    all_solid_fingerprints = list(zone_solid_fingerprints)
+    if surroundings_buildings_df is not None:
+        surroundings_fingerprints, surroundings_corners = solid_fingerprints(surroundings_buildings_df,
+                                                                             surroundings_simplification)
+        all_solid_fingerprints += surroundings_fingerprints
+        corners = np.concatenate([corners, surroundings_corners])
     else:
-        all_building_solid_list = []
-    # TODO: maybe move calc_building_solid into this function and avoid using archiecture_wwr_df, because it's already merged into zone_buildings_df.
-    geometry_3D_zone = calc_zone_geometry_multiprocessing(zone_building_names,
-                                                          zone_building_solid_list,
-                                                          repeat(all_building_solid_list, n),
-                                                          repeat(architecture_wwr_df, n),
-                                                          repeat(geometry_pickle_dir, n),
-                                                          repeat(neglect_adjacent_buildings, n),
-                                                          zone_elevations)
+        surroundings_fingerprints = []
 
-    return geometry_3D_zone, geometry_3D_surroundings
+    n = len(zone_solid_fingerprints)
+    if neglect_adjacent_buildings:
+        footprint_neighbours = [np.array([], dtype=int)] * n
+    else:
+        footprint_neighbours = find_close_buildings(corners[:n], corners, ADJACENCY_DISTANCE + ADJACENCY_MARGIN)
+
+    wwr_columns = ['wwr_west', 'wwr_east', 'wwr_north', 'wwr_south']
+    zone_fingerprints = [zone_building_fingerprint(zone_solid_fingerprints[i],
+                                                   architecture_wwr_df.loc[name, wwr_columns].astype(float),
+                                                   neglect_adjacent_buildings,
+                                                   [all_solid_fingerprints[k] for k in footprint_neighbours[i]])
+                         for i, name in enumerate(zone_buildings_df.index)]
+    return zone_fingerprints, surroundings_fingerprints, footprint_neighbours
+
+
+def update_geometry_cache(cache: BuildingGeometryCache,
+                          geometry_pickle_dir: str,
+                          kind: str,
+                          building_names: List[str],
+                          fingerprints: List[str],
+                          generated: np.ndarray):
+    """store the newly generated geometries in the cache, copy the cached ones into `geometry_pickle_dir`
+    and evict the cache entries that are not used by any building anymore.
+
+    Cache entries are keyed by content only, so a cached geometry may have been generated for a building of another
+    name (a renamed building, or one of several identical buildings). Its name is reset to the building it is
+    restored for, which the radiance surfaces and sensors are named after."""
+    for name, fingerprint, is_generated in zip(building_names, fingerprints, generated):
+        pickle_location = os.path.join(geometry_pickle_dir, kind, str(name))
+        if is_generated:
+            cache.store(kind, fingerprint, pickle_location)
+        else:
+            cache.restore(kind, fingerprint, pickle_location)
+            building_geometry = BuildingGeometry.load(pickle_location)
+            if building_geometry.name != name:
+                building_geometry.name = name
+                building_geometry.save(pickle_location)
+    evicted = cache.evict_orphans(kind, fingerprints)
+    if evicted:
+        print(f"Removed {len(evicted)} outdated {kind} geometries from the cache")
 
 
-def print_progress(i, n, _, __):
-    print("Generating geometry for building {i} completed out of {n}".format(i=i + 1, n=n))
+def print_progress(i, n, args, __):
+    print("Generating geometry for building {i} completed out of {n} ({adjacent} adjacent solids)".format(
+        i=i + 1, n=n, adjacent=len(args[2])))
 
 
 def print_terrain_intersection_progress(i, n, _, __):
     print("Creating geometry for building {i} completed out of {n}".format(i=i + 1, n=n))
 
 
-def are_buildings_close_to_eachother(x_1, y_1, solid2, dist=100):
+def are_buildings_close_to_eachother(x_1, y_1, solid2, dist=ADJACENCY_DISTANCE):
     box2 = calculate.get_bounding_box(solid2)
     x_2 = box2[0]
     y_2 = box2[1]
@@ -377,6 +531,71 @@ def are_buildings_close_to_eachother(x_1, y_1, solid2, dist=100):
         return False
 
 
+def calc_bounding_box_corners(building_solid_list: List[TopoDS_Solid]) -> np.ndarray:
+    """south-west corner (x, y) of the bounding box of each solid, as an (n x 2) array."""
+    corners = [calculate.get_bounding_box(solid)[:2] for solid in building_solid_list]
+    return np.array(corners, dtype=float).reshape(-1, 2)
+
+
+def find_close_buildings(query_corners: np.ndarray,
+                         corners: np.ndarray,
+                         dist: float = ADJACENCY_DISTANCE,
+                         ) -> List[np.ndarray]:
+    """
+    Bulk version of :py:func:`are_buildings_close_to_eachother`: for each building in `query_corners`, find the
+    buildings in `corners` whose bounding box south-west corner is within `dist` of its own.
+
+    The corners are indexed in an STRtree, so each building is only compared with its neighbours instead of every
+    building of the site.
+
+    :param query_corners: south-west bounding box corners (x, y) of the buildings to find neighbours for (n x 2).
+    :type query_corners: ndarray
+    :param corners: south-west bounding box corners (x, y) of all buildings (m x 2).
+    :type corners: ndarray
+    :param dist: distance [m] within which two buildings are considered close.
+    :type dist: float
+    :return: for each building in `query_corners`, the (ascending) indices into `corners` of the close buildings.
+    :rtype: list[ndarray]
+    """
+    if len(query_corners) == 0:
+        return []
+    tree = shapely.STRtree(shapely.points(corners))
+    query_index, tree_index = tree.query(shapely.points(query_corners), predicate='dwithin', distance=dist)
+    order = np.lexsort((tree_index, query_index))
+    query_index, tree_index = query_index[order], tree_index[order]
+    return np.split(tree_index, np.searchsorted(query_index, np.arange(1, len(query_corners))))
+
+
+def print_adjacent_solids_report(close_buildings: List[np.ndarray],
+                                 all_building_solid_list: List[TopoDS_Solid],
+                                 measure_bytes: bool = False):
+    """Print how many adjacent solids are sent to each building's task, compared to sending all solids of the site.
+
+    :param close_buildings: the indices of the adjacent solids of each building (see `find_close_buildings`).
+    :type close_buildings: list[ndarray]
+    :param all_building_solid_list: all solids of the site.
+    :type all_building_solid_list: list[TopoDS_Solid]
+    :param measure_bytes: also report the size of the pickled solids sent to each task. This pickles every solid of
+        the site once, so it is only done in debug mode.
+    :type measure_bytes: bool
+    """
+    counts = np.array([len(indices) for indices in close_buildings], dtype=np.int64)
+    if len(counts) == 0:
+        return
+    print("Adjacent solids shipped per building: {mean:.1f} on average, {max} at most "
+          "({total} in total instead of {unpruned} for all solids of the site)".format(
+              mean=counts.mean(), max=counts.max(), total=counts.sum(),
+              unpruned=len(all_building_solid_list) * len(counts)))
+    if measure_bytes:
+        solid_bytes = np.array([len(pickle.dumps(solid, protocol=pickle.HIGHEST_PROTOCOL))
+                                for solid in all_building_solid_list], dtype=np.int64)
+        task_bytes = np.array([solid_bytes[indices].sum() for indices in close_buildings], dtype=np.int64)
+        print("Adjacent solids shipped per building: {mean:.1f} kB on average, {max:.1f} kB at most "
+              "({total:.1f} MB in total instead of {unpruned:.1f} MB for all solids of the site)".format(
+                  mean=task_bytes.mean() / 1e3, max=task_bytes.max() / 1e3, total=task_bytes.sum() / 1e6,
+                  unpruned=solid_bytes.sum() * len(task_bytes) / 1e6))
+
+
 class BuildingGeometry(object):
     __slots__ = ["name", "terrain_elevation", "footprint",
                  "windows",    "orientation_windows",    "normals_windows",    "intersect_windows",
@@ -432,9 +651,11 @@ def calc_building_geometry_zone(name: str,
         a closed geometry representing the building external shells, 
         made from footprint + vertical external walls + roof (without windows).
     :type building_solid: OCCsolid
-    :param all_building_solid_list: a list of all_building_solid_list, or an empty list if `neglect_adjacent_buildings == True`.
+    :param all_building_solid_list: the solids of the buildings close to this building (see `find_close_buildings`),
+        or an empty list if `neglect_adjacent_buildings == True`.
     :type all_building_solid_list: list[OCCsolid]
-    :param architecture_wwr_df: a dataframe read from `locator.get_building_architecture` containing envelope info.
+    :param architecture_wwr_df: a dataframe read from `locator.get_building_architecture` containing envelope info
+        (at least the row of this building).
     :type architecture_wwr_df: DataFrame
     :param geometry_pickle_dir: folder path to save the created `BuildingGeometry` object.
     :type geometry_pickle_dir: str
@@ -782,27 +1003,75 @@ class ElevationMap(object):
 
         return ElevationMap(new_elevation_map, new_x_coords, new_y_coords, self.x_size, self.y_size, self.nodata)
 
-    def generate_tin(self, tolerance=1e-6):
+    def generate_tin(self, tolerance=1e-6, max_vertical_error=None, detail_geometries=None, detail_buffer_cells=3):
         """generates a 3D mesh from the elevation raster map.
 
         :param tolerance: The minimal surface area of each triangulated face. 
             Any faces smaller than the tolerance will be deleted. Defaults to `1e-6`.
         :type tolerance: float, optional
+        :param max_vertical_error: vertical tolerance [m] of the mesh. If given, only the raster cells needed to keep
+            every cell within this distance of the mesh are triangulated (see `terrain.select_terrain_points`), and
+            the mesh is built from the triangulation the tolerance was checked against.
+            Defaults to `None`, which triangulates every raster cell.
+        :type max_vertical_error: float, optional
+        :param detail_geometries: geometries (e.g. building footprints) around which every raster cell is kept.
+        :type detail_geometries: list[shapely.Geometry], optional
+        :param detail_buffer_cells: distance (in raster cells) around `detail_geometries` kept at full resolution.
+        :type detail_buffer_cells: int, optional
         :return: a list of OCCface triangles representing the 3D mesh of the terrain.
         :rtype: list[OCCface]
         """
         # Ignore no data values from raster
-        y_index, x_index = np.nonzero(self.elevation_map != self.nodata)
+        valid = self.elevation_map != self.nodata
+        selection = None
+        if max_vertical_error:
+            detail_mask = None
+            if detail_geometries is not None:
+                buffer_distance = detail_buffer_cells * max(abs(self.x_size), abs(self.y_size))
+                detail_mask = calc_detail_mask(self.x_coords, self.y_coords, detail_geometries, buffer_distance)
+            selection = select_terrain_points(self.elevation_map, self.x_coords, self.y_coords, valid,
+                                              max_vertical_error, detail_mask)
+            n_valid = int(np.count_nonzero(valid))
+            valid = selection.selected
+
+        y_index, x_index = np.nonzero(valid)
         _x_coords = self.x_coords[x_index]
         _y_coords = self.y_coords[y_index]
 
-        raster_points = ((x, y, z) for x, y, z in zip(_x_coords, _y_coords, self.elevation_map[y_index, x_index]))
-
-        tin_occface_list = construct.delaunay3d(raster_points, tolerance=tolerance)
+        _z_coords = self.elevation_map[y_index, x_index]
 
+        if selection is not None:
+            # the rows of `np.nonzero(selection.selected)` are the vertices of `selection.triangles`
+            vertices = np.column_stack([_x_coords, _y_coords, _z_coords]).astype(float)
+            tin_occface_list = triangles_to_occfaces(vertices, selection.triangles, tolerance)
+            print(f"Terrain mesh: {len(tin_occface_list)} triangles from {len(y_index)} of {n_valid} raster points "
+                  f"(max vertical error {selection.max_error:.3f} m, tolerance {max_vertical_error} m)")
+        else:
+            raster_points = ((x, y, z) for x, y, z in zip(_x_coords, _y_coords, _z_coords))
+            tin_occface_list = construct.delaunay3d(raster_points, tolerance=tolerance)
         return tin_occface_list
 
 
+def triangles_to_occfaces(vertices: np.ndarray, triangles: np.ndarray, tolerance: float) -> List[TopoDS_Face]:
+    """the triangles of a mesh as OCCfaces, like `construct.delaunay3d` but without triangulating the vertices again.
+
+    :param vertices: the (x, y, z) coordinates of the vertices of the mesh.
+    :type vertices: ndarray
+    :param triangles: the indices of the three vertices of each triangle.
+    :type triangles: ndarray
+    :param tolerance: the minimal area of a triangle, smaller triangles are dropped.
+    :type tolerance: float
+    :return: the triangles of the mesh.
+    :rtype: list[OCCface]
+    """
+    occface_list = []
+    for triangle in triangles:
+        occface = construct.make_polygon([list(vertices[k]) for k in triangle])
+        if calculate.face_area(occface) > tolerance:
+            occface_list.append(occface)
+    return occface_list
+
+
 def standardize_coordinate_systems(zone_df, surroundings_df, trees_df, terrain_raster):
     # Change all to projected cr (to meters)
     lat, lon = get_lat_lon_projected_shapefile(zone_df)
@@ -869,6 +1138,7 @@ def geometry_main(config: cea.config.Configuration,
                   terrain_raster: gdal.Dataset, 
                   architecture_wwr_df: pd.DataFrame, 
                   geometry_pickle_dir: str,
+                  geometry_cache_dir: str | None = None,
                   ) -> Tuple[List[TopoDS_Face], 
                              List[str], 
                              List[str], 
@@ -890,6 +1160,8 @@ def geometry_main(config: cea.config.Configuration,
     :type architecture_wwr_df: pd.DataFrame
     :param geometry_pickle_dir: directory where building 3D geometry data is stored.
     :type geometry_pickle_dir: str
+    :param geometry_cache_dir: directory of the building geometry cache, or `None` to regenerate every building.
+    :type geometry_cache_dir: str, optional
     :return: a list of OCCface triangles representing the 3D mesh of the terrain.
     :rtype: list[OCCface]
     :return: names of analyzed buildings within the scenario.
@@ -912,13 +1184,16 @@ def geometry_main(config: cea.config.Configuration,
     # Create a triangulated irregular network of terrain from raster
     print("Reading terrain geometry")
     elevation_map = ElevationMap.read_raster(terrain_raster)
-    terrain_tin = elevation_map.generate_tin()
+    terrain_tin = elevation_map.generate_tin(
+        max_vertical_error=config.radiation.terrain_vertical_tolerance,
+        detail_geometries=list(zone_df.geometry) + list(surroundings_df.geometry))
 
     # transform buildings 2D to 3D and add windows
     print("Creating 3D building surfaces")
     os.makedirs(geometry_pickle_dir, exist_ok=True)
     geometry_3D_zone, geometry_3D_surroundings = building_2d_to_3d(zone_df, surroundings_df, architecture_wwr_df,
-                                                                   elevation_map, config, geometry_pickle_dir)
+                                                                   elevation_map, config, geometry_pickle_dir,
+                                                                   geometry_cache_dir)
 
     tree_surfaces = []
     if len(trees_df.geometry) > 0:
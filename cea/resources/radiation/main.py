@@ -171,6 +171,8 @@ def main(config: cea.config.Configuration):
     building_surface_properties.to_csv(locator.get_radiation_materials())
 
     geometry_staging_location = os.path.join(locator.get_solar_radiation_folder(), "radiance_geometry_pickle")
+    geometry_cache_location = (locator.get_building_geometry_cache_folder() if config.radiation.geometry_cache
+                               else None)
 
     print("Creating 3D geometry and surfaces")
     print(f"Saving geometry pickle files in: {geometry_staging_location}")
@@ -187,7 +189,8 @@ def main(config: cea.config.Configuration):
                                                        trees_df,
                                                        terrain_raster,
                                                        architecture_wwr_df,
-                                                       geometry_staging_location)
+                                                       geometry_staging_location,
+                                                       geometry_cache_location)
 
     daysim_staging_location = os.path.join(locator.get_temporary_folder(), 'cea_radiation')
     cea_daysim = CEADaySim(daysim_staging_location, daysim_bin_path)
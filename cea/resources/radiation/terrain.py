@@ -0,0 +1,195 @@
+"""
+Error-bounded decimation of the terrain raster before it is triangulated for the radiation scene.
+
+Feeding every raster cell of a high resolution terrain model to the triangulation produces millions of triangles,
+most of them on flat ground far away from any building. Instead, the terrain points are selected by greedy insertion:
+starting from a coarse regular grid (plus every cell close to a building), the cell with the largest vertical error
+in each triangle of the current triangulation is added until no cell deviates more than the vertical tolerance from
+the triangulated surface. The size of the terrain mesh then scales with the complexity of the terrain instead of the
+size of the raster.
+
+The terrain mesh of the radiation scene is built from the triangles of that final triangulation (see
+``ElevationMap.generate_tin``), so the vertical tolerance holds for the mesh that is actually used.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, NamedTuple
+
+import numpy as np
+import shapely
+from scipy.spatial import Delaunay
+
+__author__ = "Jimeno A. Fonseca"
+__copyright__ = "Copyright 2017, Architecture and Building Systems - ETH Zurich"
+__credits__ = ["Jimeno A. Fonseca", "Kian Wee Chen"]
+__license__ = "MIT"
+__version__ = "0.1"
+__maintainer__ = "Daren Thomas"
+__email__ = "cea@arch.ethz.ch"
+__status__ = "Production"
+
+# spacing (in raster cells) of the regular grid the greedy insertion starts from
+INITIAL_GRID_STEP = 16
+
+# number of greedy insertion rounds before every remaining out-of-tolerance cell is added at once
+MAX_INSERTION_ROUNDS = 60
+
+# number of points whose error is evaluated at once (bounds the memory of the barycentric interpolation)
+EVALUATION_CHUNK_SIZE = 2 ** 21
+
+
+class TerrainSelection(NamedTuple):
+    # selected: boolean mask of the raster cells that are kept as terrain mesh vertices (same shape as the raster)
+    # max_error: largest vertical distance between a valid raster cell and the triangulated surface [m]
+    # triangles: the triangulation of the selected cells, as indices into the selected cells in row-major order
+    #   (the order of ``np.nonzero(selected)``), one row of three vertices per triangle
+    selected: np.ndarray
+    max_error: float
+    triangles: np.ndarray
+
+
+def calc_detail_mask(x_coords: np.ndarray,
+                     y_coords: np.ndarray,
+                     geometries: Iterable[shapely.Geometry],
+                     buffer_distance: float,
+                     ) -> np.ndarray:
+    """raster cells whose centre lies within `buffer_distance` of any of the geometries (e.g. building footprints).
+
+    :param x_coords: x coordinate of the centre of each raster column.
+    :type x_coords: ndarray
+    :param y_coords: y coordinate of the centre of each raster row.
+    :type y_coords: ndarray
+    :param geometries: geometries around which the terrain is kept at full resolution.
+    :type geometries: list[shapely.Geometry]
+    :param buffer_distance: distance [m] around the geometries.
+    :type buffer_distance: float
+    :return: boolean mask with the shape of the raster (rows x columns).
+    :rtype: ndarray
+    """
+    mask = np.zeros((len(y_coords), len(x_coords)), dtype=bool)
+    x_order = np.argsort(x_coords)
+    y_order = np.argsort(y_coords)
+    x_sorted = x_coords[x_order]
+    y_sorted = y_coords[y_order]
+    for geometry in geometries:
+        if geometry is None or geometry.is_empty:
+            continue
+        area = geometry.buffer(buffer_distance)
+        minx, miny, maxx, maxy = area.bounds
+        columns = x_order[np.searchsorted(x_sorted, minx, side='left'):np.searchsorted(x_sorted, maxx, side='right')]
+        rows = y_order[np.searchsorted(y_sorted, miny, side='left'):np.searchsorted(y_sorted, maxy, side='right')]
+        if len(columns) == 0 or len(rows) == 0:
+            continue
+        xx, yy = np.meshgrid(x_coords[columns], y_coords[rows])
+        inside = shapely.contains_xy(area, xx, yy)
+        mask[np.ix_(rows, columns)] |= inside
+    return mask
+
+
+def triangulate(points: np.ndarray) -> Delaunay | None:
+    """2D Delaunay triangulation of the points, or `None` if there are too few or they are degenerate."""
+    if len(points) < 3:
+        return None
+    try:
+        return Delaunay(points)
+    except Exception:
+        return None
+
+
+def calc_vertical_errors(triangulation: Delaunay, points: np.ndarray, z: np.ndarray, z_vertices: np.ndarray):
+    """vertical distance of each point to the triangulated surface and the triangle that contains it
+    (error is infinite and triangle -1 for points outside of the triangulation)."""
+    errors = np.full(len(points), np.inf)
+    simplices = np.full(len(points), -1, dtype=np.int64)
+    for start in range(0, len(points), EVALUATION_CHUNK_SIZE):
+        chunk = slice(start, start + EVALUATION_CHUNK_SIZE)
+        simplex = triangulation.find_simplex(points[chunk])
+        inside = simplex >= 0
+        transform = triangulation.transform[simplex[inside]]
+        barycentric = np.einsum('ijk,ik->ij', transform[:, :2, :], points[chunk][inside] - transform[:, 2, :])
+        weights = np.column_stack([barycentric, 1.0 - barycentric.sum(axis=1)])
+        surface = (weights * z_vertices[triangulation.simplices[simplex[inside]]]).sum(axis=1)
+        chunk_errors = errors[chunk]
+        chunk_errors[inside] = np.abs(z[chunk][inside] - surface)
+        errors[chunk] = chunk_errors
+        simplices[chunk] = simplex
+    return errors, simplices
+
+
+def select_terrain_points(elevation: np.ndarray,
+                          x_coords: np.ndarray,
+                          y_coords: np.ndarray,
+                          valid: np.ndarray,
+                          max_vertical_error: float,
+                          detail_mask: np.ndarray | None = None,
+                          initial_step: int = INITIAL_GRID_STEP,
+                          ) -> TerrainSelection:
+    """select the raster cells to triangulate so that no valid cell is further than `max_vertical_error` from the
+    triangulated surface, and return the triangulation this was checked against.
+
+    :param elevation: elevation of each raster cell (rows x columns).
+    :type elevation: ndarray
+    :param x_coords: x coordinate of the centre of each raster column.
+    :type x_coords: ndarray
+    :param y_coords: y coordinate of the centre of each raster row.
+    :type y_coords: ndarray
+    :param valid: boolean mask of the cells with data (rows x columns).
+    :type valid: ndarray
+    :param max_vertical_error: vertical tolerance [m].
+    :type max_vertical_error: float
+    :param detail_mask: boolean mask of the cells that are always kept (e.g. close to buildings).
+    :type detail_mask: ndarray, optional
+    :param initial_step: spacing (in cells) of the regular grid the insertion starts from.
+    :type initial_step: int
+    :rtype: TerrainSelection
+    """
+    n_rows, n_columns = elevation.shape
+    row_index, column_index = np.nonzero(valid)
+    points = np.column_stack([x_coords[column_index], y_coords[row_index]]).astype(float)
+    z = elevation[row_index, column_index].astype(float)
+
+    # start from a coarse regular grid (including the last row and column) and the cells close to buildings
+    on_grid_rows = (row_index % initial_step == 0) | (row_index == n_rows - 1)
+    on_grid_columns = (column_index % initial_step == 0) | (column_index == n_columns - 1)
+    keep = on_grid_rows & on_grid_columns
+    if detail_mask is not None:
+        keep |= detail_mask[row_index, column_index]
+
+    errors = np.zeros(len(points))
+    for insertion_round in range(MAX_INSERTION_ROUNDS + 1):
+        triangulation = triangulate(points[keep])
+        if triangulation is None:
+            # too few or degenerate (e.g. collinear) points: keep every cell
+            keep[:] = True
+            errors[:] = 0.0
+            triangulation = triangulate(points)
+            break
+        errors, simplices = calc_vertical_errors(triangulation, points, z, z[keep])
+        errors[keep] = 0.0
+        violating = np.flatnonzero(errors > max_vertical_error)
+        if len(violating) == 0:
+            break
+        if insertion_round == MAX_INSERTION_ROUNDS:
+            # the remaining cells are exact vertices of the final triangulation
+            keep[violating] = True
+            triangulation = triangulate(points[keep])
+            errors, _ = calc_vertical_errors(triangulation, points, z, z[keep])
+            errors[keep] = 0.0
+            break
+        # insert the worst cell of each triangle (and every cell outside of the triangulation)
+        outside = violating[simplices[violating] < 0]
+        inside = violating[simplices[violating] >= 0]
+        inside = inside[np.lexsort((-errors[inside], simplices[inside]))]
+        first = np.ones(len(inside), dtype=bool)
+        first[1:] = simplices[inside][1:] != simplices[inside][:-1]
+        keep[inside[first]] = True
+        keep[outside] = True
+
+    selected = np.zeros((n_rows, n_columns), dtype=bool)
+    selected[row_index[keep], column_index[keep]] = True
+    max_error = float(errors.max()) if len(errors) else 0.0
+    # the points of the triangulation are the kept cells in the order of `np.nonzero(valid)`, i.e. row-major
+    triangles = (np.zeros((0, 3), dtype=np.int64) if triangulation is None
+                 else triangulation.simplices.astype(np.int64))
+    return TerrainSelection(selected=selected, max_error=max_error, triangles=triangles)
@@ -383,6 +383,8 @@ def calulate_cea_sensor_data(locator, config):
     _config.radiation.zone_geometry = config.radiation_crax.zone_geometry
     _config.radiation.surrounding_geometry = config.radiation_crax.surrounding_geometry
     _config.radiation.neglect_adjacent_buildings = config.radiation_crax.neglect_adjacent_buildings
+    geometry_cache_location = (locator.get_building_geometry_cache_folder() if _config.radiation.geometry_cache
+                               else None)
 
     (geometry_terrain,
      zone_building_names,
@@ -393,7 +395,8 @@ def calulate_cea_sensor_data(locator, config):
                                                        trees_df,
                                                        terrain_raster,
                                                        architecture_wwr_df,
-                                                       geometry_staging_location)
+                                                       geometry_staging_location,
+                                                       geometry_cache_location)
 
     run_daysim_sensor_generate(zone_building_names, locator, config.radiation_crax, geometry_staging_location,
                                num_processes=config.get_number_of_processes())  # Call the provided CEA mesh generation method
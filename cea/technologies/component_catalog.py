@@ -0,0 +1,276 @@
+"""
+In-memory catalog of the scenario's ``COMPONENTS`` database.
+
+Final-energy, system-costs and emissions look up components by ``code``
+and carriers by name once per building, service and component. Reading
+the CSV behind every lookup made those scripts spend most of their time
+parsing the same handful of files over and over again.
+
+:func:`get_catalog` returns a process-wide, read-only
+:class:`ComponentCatalog` per scenario that:
+
+1. Loads every table under ``COMPONENTS/CONVERSION/`` once and indexes
+   its rows by ``code`` (keeping the piecewise cost-curve segments of a
+   code together, in file order).
+2. Loads ``FEEDSTOCKS/ENERGY_CARRIERS.csv`` and the
+   ``FEEDSTOCKS_LIBRARY/*.csv`` price and emission profiles on first use.
+3. Evaluates cost curves for whole arrays of capacities at once
+   (:func:`calc_cost_curves`).
+
+The catalog is rebuilt when any of those CSV files is added, removed or
+modified (by file size and mtime). To keep lookups cheap the files are
+checked at most every :data:`REVALIDATE_INTERVAL` seconds; call
+:func:`clear_catalog_cache` after editing the database from within the
+same process to pick up the changes immediately.
+
+The DataFrames served by the catalog are shared between callers - treat
+them as read-only (``.copy()`` before modifying).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+__author__ = "Zhongming Shi"
+__copyright__ = "Copyright 2026, UUEN PTE. LTD."
+__credits__ = ["Zhongming Shi"]
+__license__ = "MIT"
+__version__ = "0.1"
+__maintainer__ = "Reynold Mok"
+__email__ = "cea@arch.ethz.ch"
+__status__ = "Production"
+
+
+# seconds between two checks of the database files of a cached catalog
+REVALIDATE_INTERVAL = 1.0
+
+# number of scenarios to keep a catalog for (e.g. the dashboard switching between scenarios)
+_MAX_CATALOGS = 8
+
+_catalogs: OrderedDict[str, ComponentCatalog] = OrderedDict()
+_catalogs_lock = threading.Lock()
+
+
+def _folder_signature(folder: str) -> Optional[Tuple]:
+    """(name, size, mtime) of every CSV file in a folder, or None if the folder does not exist."""
+    try:
+        entries = list(os.scandir(folder))
+    except OSError:
+        return None
+    signature = []
+    for entry in entries:
+        if entry.name.lower().endswith('.csv') and entry.is_file():
+            stat = entry.stat()
+            signature.append((entry.name, stat.st_size, stat.st_mtime_ns))
+    return tuple(sorted(signature))
+
+
+class ComponentCatalog:
+    """Read-only, indexed view of the ``COMPONENTS`` tables of one scenario."""
+
+    def __init__(self, scenario: str):
+        # Late import — importing InputLocator at module load creates a
+        # circular path through ``cea.config`` in some entry points.
+        import cea.inputlocator
+        self.scenario = scenario
+        self.locator = cea.inputlocator.InputLocator(scenario=scenario)
+        self._folders = (
+            self.locator.get_db4_components_conversion_folder(),
+            self.locator.get_db4_components_feedstocks_folder(),
+            self.locator.get_db4_components_feedstocks_library_folder(),
+        )
+        self.signature = self._calc_signature()
+        self._checked = time.monotonic()
+
+        self.conversion_tables: Dict[str, pd.DataFrame] = {}
+        self._rows_by_code: Dict[str, Dict[str, pd.DataFrame]] = {}
+        self._load_conversion_tables()
+
+        self._energy_carriers: Optional[pd.DataFrame] = None
+        self._feedstocks: Dict[str, Optional[pd.DataFrame]] = {}
+        self._indexed_tables: Dict[str, pd.DataFrame] = {}
+        self._conversion_index: Optional[Dict[str, Tuple[str, Dict]]] = None
+        self._feedstocks_database = None
+
+    def _calc_signature(self) -> Tuple:
+        return tuple(_folder_signature(folder) for folder in self._folders)
+
+    def is_current(self) -> bool:
+        """True if the database files did not change since the catalog was loaded (checked at most every
+        :data:`REVALIDATE_INTERVAL` seconds)."""
+        now = time.monotonic()
+        if now - self._checked < REVALIDATE_INTERVAL:
+            return True
+        self._checked = now
+        return self._calc_signature() == self.signature
+
+    def _load_conversion_tables(self) -> None:
+        folder = self.locator.get_db4_components_conversion_folder()
+        if not folder or not os.path.isdir(folder):
+            return
+        for fname in sorted(os.listdir(folder)):
+            if not fname.lower().endswith('.csv'):
+                continue
+            try:
+                df = pd.read_csv(os.path.join(folder, fname))
+            except Exception:
+                continue
+            table_name = os.path.splitext(fname)[0]
+            self.conversion_tables[table_name] = df
+            if 'code' in df.columns:
+                self._rows_by_code[table_name] = {code: rows for code, rows in df.groupby('code', sort=False)}
+
+    def table(self, table_name: str) -> pd.DataFrame:
+        """A table under ``COMPONENTS/CONVERSION/`` (e.g. ``'PHOTOVOLTAIC_PANELS'``).
+
+        :raises FileNotFoundError: If the scenario database has no such table.
+        """
+        try:
+            return self.conversion_tables[table_name]
+        except KeyError:
+            raise FileNotFoundError(
+                self.locator.get_db4_components_conversion_conversion_technology_csv(table_name))
+
+    def indexed_table(self, table_name: str) -> pd.DataFrame:
+        """Same as :meth:`table`, indexed by ``code``."""
+        if table_name not in self._indexed_tables:
+            self._indexed_tables[table_name] = self.table(table_name).set_index('code')
+        return self._indexed_tables[table_name]
+
+    def conversion_index(self) -> Dict[str, Tuple[str, Dict]]:
+        """``{code: (table_name, row_dict)}`` of the first row of each code - see
+        :func:`cea.technologies.components.get_component_table`."""
+        if self._conversion_index is None:
+            index: Dict[str, Tuple[str, Dict]] = {}
+            for table_name, df in self.conversion_tables.items():
+                if 'code' not in df.columns:
+                    continue
+                for row in df.to_dict('records'):
+                    code = str(row['code']).strip()
+                    # First table wins (cap_min/cap_max segments for the same
+                    # code appear as multiple rows; the first row is a fine
+                    # proxy for the component's category-level attributes like
+                    # fuel_code and efficiency).
+                    if code and code not in index:
+                        index[code] = (table_name, row)
+            self._conversion_index = index
+        return self._conversion_index
+
+    def component_rows(self, table_name: str, component_code: str) -> pd.DataFrame:
+        """All rows (cost-curve segments) of a component in a table, in file order - empty if there are none."""
+        rows = self._rows_by_code.get(table_name, {}).get(component_code)
+        if rows is None:
+            return self.table(table_name).iloc[0:0]
+        return rows
+
+    @property
+    def energy_carriers(self) -> pd.DataFrame:
+        """``ENERGY_CARRIERS.csv`` with normalised ``feedstock_file``, ``type`` and ``code`` columns."""
+        if self._energy_carriers is None:
+            df = pd.read_csv(self.locator.get_database_components_feedstocks_energy_carriers())
+            df['feedstock_file'] = (
+                df['feedstock_file'].fillna('-').astype(str).str.strip().str.upper()
+            )
+            df['type'] = df['type'].fillna('').astype(str).str.strip().str.lower()
+            df['code'] = df['code'].astype(str).str.strip()
+            self._energy_carriers = df
+        return self._energy_carriers
+
+    def feedstock(self, carrier: str) -> Optional[pd.DataFrame]:
+        """The ``FEEDSTOCKS_LIBRARY/{carrier}.csv`` table, or None if the carrier has no feedstock file."""
+        if carrier not in self._feedstocks:
+            path = self.locator.get_db4_components_feedstocks_feedstocks_csv(carrier)
+            self._feedstocks[carrier] = pd.read_csv(path) if os.path.exists(path) else None
+        return self._feedstocks[carrier]
+
+
+    def feedstocks_database(self):
+        """The :class:`cea.datamanagement.database.components.Feedstocks` database (energy carriers and the hourly
+        profiles of every feedstock), as used by the emission calculations."""
+        if self._feedstocks_database is None:
+            from cea.datamanagement.database.components import Feedstocks
+            self._feedstocks_database = Feedstocks.from_locator(self.locator)
+        return self._feedstocks_database
+
+
+def get_catalog(locator) -> ComponentCatalog:
+    """The catalog of the scenario of `locator`, (re-)loading it if the database files changed."""
+    scenario = locator.scenario
+    with _catalogs_lock:
+        catalog = _catalogs.get(scenario)
+        if catalog is not None and catalog.is_current():
+            _catalogs.move_to_end(scenario)
+            return catalog
+        catalog = ComponentCatalog(scenario)
+        _catalogs[scenario] = catalog
+        _catalogs.move_to_end(scenario)
+        while len(_catalogs) > _MAX_CATALOGS:
+            _catalogs.popitem(last=False)
+        return catalog
+
+
+def clear_catalog_cache() -> None:
+    """Forget all cached catalogs, e.g. after editing a database from within the same process."""
+    with _catalogs_lock:
+        _catalogs.clear()
+
+
+def select_segments(rows: pd.DataFrame, quantities) -> np.ndarray:
+    """Position (in `rows`) of the cost-curve segment to use for each quantity: the first row with
+    ``cap_min <= quantity < cap_max``, or the last (highest-capacity) row if no segment covers the quantity."""
+    quantities = np.atleast_1d(np.asarray(quantities, dtype=float))
+    n = len(rows)
+    if n == 1 or 'cap_min' not in rows.columns or 'cap_max' not in rows.columns:
+        return np.zeros(len(quantities), dtype=int)
+    cap_min = rows['cap_min'].to_numpy(dtype=float)
+    cap_max = rows['cap_max'].to_numpy(dtype=float)
+    covers = (cap_min[None, :] <= quantities[:, None]) & (cap_max[None, :] > quantities[:, None])
+    return np.where(covers.any(axis=1), covers.argmax(axis=1), n - 1)
+
+
+def calc_cost_curves(rows: pd.DataFrame, quantities) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized cost curve ``InvC = a + b*Q^c + (d + e*Q)*ln(Q)`` for an array of quantities.
+
+    Same rules as :func:`cea.analysis.costs.main._calc_cost_curve`: the segment of each quantity is picked with
+    :func:`select_segments`, quantities below ``cap_min`` are costed at ``cap_min`` and quantities above
+    ``cap_max`` are split into equal units. Quantities <= 0 cost nothing.
+
+    :param rows: the cost-curve segments of one component (see :meth:`ComponentCatalog.component_rows`).
+    :param quantities: quantities in the component's native unit (W for thermal/PV/PVT, m² for SC).
+    :return: arrays ``(capex_total_USD, capex_a_USD, opex_fixed_a_USD)`` - NaN where the curve is undefined.
+    """
+    quantities = np.atleast_1d(np.asarray(quantities, dtype=float))
+    segment = select_segments(rows, quantities)
+
+    def column(name, default):
+        if name not in rows.columns:
+            return np.full(len(quantities), default, dtype=float)
+        return rows[name].to_numpy(dtype=float)[segment]
+
+    cap_min = column('cap_min', 1.0)
+    cap_max = column('cap_max', np.inf)
+    a, b, c, d, e = (column(name, np.nan) for name in ('a', 'b', 'c', 'd', 'e'))
+    IR = column('IR_%', np.nan) / 100.0
+    LT_yr = column('LT_yr', np.nan)
+    OM_frac = column('O&M_%', np.nan) / 100.0
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        Q = np.where(quantities < cap_min, cap_min, quantities)
+        n_units = np.where(Q <= cap_max, 1.0, np.ceil(Q / cap_max))
+        Q = Q / n_units
+        InvC = (a + b * Q ** c + (d + e * Q) * np.log(Q)) * n_units
+        capex_a = np.where(IR == 0, InvC / LT_yr, InvC * IR / (1 - (1 + IR) ** (-LT_yr)))
+        opex_fixed_a = InvC * OM_frac
+
+    inactive = quantities <= 0
+    return (np.where(inactive, 0.0, InvC),
+            np.where(inactive, 0.0, capex_a),
+            np.where(inactive, 0.0, opex_fixed_a))
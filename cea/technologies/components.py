@@ -13,9 +13,9 @@ didn't exist yet.
 This module removes the gate. It:
 
 1. Scans every ``*.csv`` file under
-   ``{scenario}/inputs/technology/components/CONVERSION/`` (falling back
-   to CEA's bundled DB) and builds a ``code → (table_name, row_dict)``
-   index.
+   ``{scenario}/inputs/technology/components/CONVERSION/`` (via the
+   scenario's :mod:`cea.technologies.component_catalog`) and builds a
+   ``code → (table_name, row_dict)`` index.
 2. Classifies each component purely from its *columns* — a scheme that
    stays correct as long as users follow CEA's existing schema
    conventions.
@@ -56,12 +56,12 @@ filename-delegation path or extend this module's classification.
 
 from __future__ import annotations
 
-import functools
-import os
 from typing import Dict, Optional, Tuple
 
 import pandas as pd
 
+from cea.technologies.component_catalog import get_catalog
+
 
 __author__ = "Zhongming Shi"
 __copyright__ = "Copyright 2026, UUEN PTE. LTD."
@@ -116,8 +116,7 @@ _COST_ONLY_TABLES: Dict[str, str] = {
 }
 
 
-@functools.lru_cache(maxsize=8)
-def _scan_conversion_tables(scenario: str) -> Dict[str, Tuple[str, Dict]]:
+def _scan_conversion_tables(locator) -> Dict[str, Tuple[str, Dict]]:
     """Scan every ``COMPONENTS/CONVERSION/*.csv`` and index rows by ``code``.
 
     Returns a dict ``{code: (table_name, row_dict)}``. ``table_name`` is
@@ -125,36 +124,10 @@ def _scan_conversion_tables(scenario: str) -> Dict[str, Tuple[str, Dict]]:
     multiple tables (shouldn't happen but is possible in an ill-formed
     DB), the first-scanned entry wins.
 
-    Cached per-scenario via ``lru_cache`` keyed on the scenario path.
+    Served from the scenario's :mod:`cea.technologies.component_catalog`,
+    so the tables are only read again when they change on disk.
     """
-    import cea.inputlocator
-    locator = cea.inputlocator.InputLocator(scenario=scenario)
-    folder = locator.get_db4_components_conversion_folder()
-    index: Dict[str, Tuple[str, Dict]] = {}
-    if not folder or not os.path.isdir(folder):
-        return index
-    for fname in sorted(os.listdir(folder)):
-        if not fname.lower().endswith('.csv'):
-            continue
-        path = os.path.join(folder, fname)
-        try:
-            df = pd.read_csv(path)
-        except Exception:
-            continue
-        if 'code' not in df.columns:
-            continue
-        table_name = os.path.splitext(fname)[0]
-        for _, row in df.iterrows():
-            code = str(row['code']).strip()
-            if not code:
-                continue
-            # First table wins (cap_min/cap_max segments for the same
-            # code appear as multiple rows; the first row is a fine
-            # proxy for the component's category-level attributes like
-            # fuel_code and efficiency).
-            if code not in index:
-                index[code] = (table_name, row.to_dict())
-    return index
+    return get_catalog(locator).conversion_index()
 
 
 def get_component_table(component_code: str, locator) -> Optional[str]:
@@ -163,7 +136,7 @@ def get_component_table(component_code: str, locator) -> Optional[str]:
     E.g. ``'BO1' → 'BOILERS'``, ``'OEHR1' → 'COGENERATION_PLANTS'``.
     Returns ``None`` if the code isn't in any scanned table.
     """
-    hit = _scan_conversion_tables(locator.scenario).get(component_code)
+    hit = _scan_conversion_tables(locator).get(component_code)
     return hit[0] if hit else None
 
 
@@ -209,7 +182,7 @@ def load_component_info(component_code: str, locator) -> Dict:
     :raises ValueError: If the code isn't in any conversion table, with
         an actionable message listing the tables that were scanned.
     """
-    index = _scan_conversion_tables(locator.scenario)
+    index = _scan_conversion_tables(locator)
     hit = index.get(component_code)
     if hit is None:
         raise ValueError(
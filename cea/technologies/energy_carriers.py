@@ -26,11 +26,12 @@ Python change needed.
 
 from __future__ import annotations
 
-import functools
 from typing import Set
 
 import pandas as pd
 
+from cea.technologies.component_catalog import get_catalog
+
 __author__ = "Zhongming Shi"
 __copyright__ = "Copyright 2026, UUEN PTE. LTD."
 __credits__ = ["Zhongming Shi"]
@@ -41,33 +42,10 @@ __email__ = "cea@arch.ethz.ch"
 __status__ = "Production"
 
 
-def _load_cached(scenario: str) -> pd.DataFrame:
-    """Cached read of the scenario's ``ENERGY_CARRIERS.csv``.
-
-    Scenarios keyed by path string so the cache doesn't retain InputLocator
-    instances (which are lightweight but can pickle-fail in workers).
-    """
-    return _load_cached_by_path(scenario)
-
-
-@functools.lru_cache(maxsize=8)
-def _load_cached_by_path(scenario: str) -> pd.DataFrame:
-    # Late import — importing InputLocator at module load creates a
-    # circular path through ``cea.config`` in some entry points.
-    import cea.inputlocator
-    locator = cea.inputlocator.InputLocator(scenario=scenario)
-    path = locator.get_database_components_feedstocks_energy_carriers()
-    df = pd.read_csv(path)
-    df['feedstock_file'] = (
-        df['feedstock_file'].fillna('-').astype(str).str.strip().str.upper()
-    )
-    df['type'] = df['type'].fillna('').astype(str).str.strip().str.lower()
-    df['code'] = df['code'].astype(str).str.strip()
-    return df
-
-
 def _df(locator) -> pd.DataFrame:
-    return _load_cached(locator.scenario)
+    """The scenario's ``ENERGY_CARRIERS.csv``, served from its
+    :mod:`cea.technologies.component_catalog` (re-read when it changes)."""
+    return get_catalog(locator).energy_carriers
 
 
 def carrier_from_fuel_code(locator, fuel_code: str) -> str:
@@ -28,10 +28,11 @@ Key guarantees:
 - No floating-point precision issues
 """
 
-from collections import defaultdict, Counter
+from collections import defaultdict
 
 import networkx as nx
 import numpy as np
+import shapely
 from geopandas import GeoDataFrame as gdf
 from shapely import Point, LineString
 from shapely.ops import substring, linemerge
@@ -250,7 +251,7 @@ def snap_endpoints_to_nearby_lines(network_gdf: gdf, snap_tolerance: float, spli
 
     Process:
     1. Find dangling endpoints (endpoints that appear only once in the network)
-    2. For each dangling endpoint, find nearby lines within snap_tolerance
+    2. For all dangling endpoints at once, find nearby lines within snap_tolerance (bulk spatial index query)
     3. Snap endpoint to nearest point on closest line
     4. Optionally split target lines at snap points to create explicit T-junctions
 
@@ -267,100 +268,75 @@ def snap_endpoints_to_nearby_lines(network_gdf: gdf, snap_tolerance: float, spli
 
     # Step 1: Find dangling endpoints (terminal points not connected)
     # Count how many times each endpoint appears across all lines
-    endpoint_counts = Counter()
-    for geom in network_gdf.geometry:
-        # Convert to plain (float, float) tuples to avoid inhomogeneous types
-        coords = [(float(c[0]), float(c[1])) for c in geom.coords]
-        start = coords[0]
-        end = coords[-1]
-        endpoint_counts[start] += 1
-        endpoint_counts[end] += 1
+    _network_gdf = network_gdf.copy()
+    _network_gdf.reset_index(inplace=True, drop=True)  # Ensure clean index for sindex
+    lines = _network_gdf.geometry.values
+    endpoints = np.concatenate([shapely.get_coordinates(shapely.get_point(lines, 0)),
+                                shapely.get_coordinates(shapely.get_point(lines, -1))])
+    _, endpoint_ids, endpoint_counts = np.unique(endpoints, axis=0, return_inverse=True, return_counts=True)
 
     # Dangling endpoints appear exactly once (not shared with other lines)
-    dangling_endpoints = {pt for pt, count in endpoint_counts.items() if count == 1}
-
-    if not dangling_endpoints:
+    # (line, end) pairs sorted by line, start (0) before end (1)
+    dangling_ends = np.flatnonzero(endpoint_counts[endpoint_ids.ravel()] == 1)
+    if len(dangling_ends) == 0:
         # No dangling endpoints, nothing to snap
         return network_gdf
-
-    # Step 2: Use GeoDataFrame's built-in spatial index for fast nearest-neighbor queries
-    _network_gdf = network_gdf.copy()
-    _network_gdf.reset_index(inplace=True, drop=True)  # Ensure clean index for sindex
-    sindex = _network_gdf.sindex
+    dangling_lines, dangling_sides = dangling_ends % len(lines), dangling_ends // len(lines)
+    order = np.lexsort((dangling_sides, dangling_lines))
+    dangling_lines, dangling_sides = dangling_lines[order], dangling_sides[order]
+    dangling_coords = endpoints[dangling_ends[order]]
+
+    # Step 2: Use GeoDataFrame's built-in spatial index to find the lines near all dangling endpoints at once
+    dangling_points = shapely.points(dangling_coords)
+    search_areas = shapely.buffer(dangling_points, snap_tolerance, quad_segs=16)  # same as Point.buffer
+    query_points, query_lines = _network_gdf.sindex.query(search_areas, predicate='intersects')
+    not_itself = query_lines != dangling_lines[query_points]  # Exclude the line itself (don't snap to itself)
+    query_points, query_lines = query_points[not_itself], query_lines[not_itself]
+    distances = shapely.distance(lines[query_lines], dangling_points[query_points])
+
+    # Nearest line of each dangling endpoint (ties broken by line order)
+    order = np.lexsort((query_lines, distances, query_points))
+    snapped_points, first = np.unique(query_points[order], return_index=True)
+    nearest_lines = query_lines[order][first]
+
+    # Step 3: Snap each dangling endpoint to the nearest point on its nearest line
+    nearest_geometries = lines[nearest_lines]
+    snapped = shapely.line_interpolate_point(nearest_geometries,
+                                             shapely.line_locate_point(nearest_geometries,
+                                                                       dangling_points[snapped_points]))
 
     # Track which lines need to be split and where
     lines_to_split = {}  # {line_idx: [snap_points]}
-
-    def _snap_point_to_nearby_lines(point_coords: tuple, idx_to_exclude) -> tuple[float, float]:
-        """
-        Inner helper: Snap a single point to the nearest nearby line within tolerance.
-
-        :param point_coords: Tuple of (x, y) coordinates to snap
-        :param idx_to_exclude: The index of the line geometry to exclude (don't snap to itself)
-        :return: Snapped coordinates (x, y) or original if no nearby line found
-        """
-        # Ensure point_coords is a plain tuple (not numpy array or other sequence)
-        point_coords = tuple(point_coords)
-        point = Point(point_coords)
-        # Query spatial index with buffered point to find candidates
-        nearby_indices = sindex.query(point.buffer(snap_tolerance), predicate='intersects')
-        nearby_indices = [id for id in nearby_indices if id != idx_to_exclude]  # Exclude the line itself
-
-        if not nearby_indices:
-            return point_coords  # No nearby lines to snap to
-
-        distance = _network_gdf.loc[nearby_indices].geometry.distance(point).sort_values()
-        nearest_index = distance.index[0]
-        nearest_line: LineString = _network_gdf.loc[nearest_index].geometry
-
-        # Snap to nearest point on line
-        snapped = nearest_line.interpolate(nearest_line.project(point))
+    new_endpoints = {}  # {(line_idx, side): (x, y)}
+    for dangling_index, nearest_index, snapped_point in zip(snapped_points, nearest_lines, snapped):
         # Build normalized coordinate tuple directly to avoid geometry-type ambiguity
         best_snap = (
-            round(float(snapped.x), SHAPEFILE_TOLERANCE),
-            round(float(snapped.y), SHAPEFILE_TOLERANCE)
+            round(float(snapped_point.x), SHAPEFILE_TOLERANCE),
+            round(float(snapped_point.y), SHAPEFILE_TOLERANCE)
         )
-        if lines_to_split.get(nearest_index) is None:
-            lines_to_split[nearest_index] = []
-        lines_to_split[nearest_index].append(Point(best_snap))
-
-        return best_snap
+        lines_to_split.setdefault(int(nearest_index), []).append(Point(best_snap))
+        new_endpoints[(int(dangling_lines[dangling_index]), int(dangling_sides[dangling_index]))] = best_snap
 
-    # Step 3: Process lines with dangling endpoints first
-    modified_geometries = {}  # {idx: geometry}
-
-    for idx, row in _network_gdf.iterrows():
-        line = row.geometry
+    # Rebuild the lines with dangling endpoints (endpoints without a nearby line are kept as they are)
+    modified_geometries = dict(enumerate(lines))  # {idx: geometry}
+    for idx in np.unique(dangling_lines):
+        idx = int(idx)
         # Use homogeneous (float, float) tuples for all vertices
-        coords = [(float(c[0]), float(c[1])) for c in line.coords]
-
-        start = coords[0]
-        end = coords[-1]
-
-        # Check if endpoints are dangling
-        start_is_dangling = start in dangling_endpoints
-        end_is_dangling = end in dangling_endpoints
-
-        # Snap dangling endpoints
-        if start_is_dangling or end_is_dangling:
-            new_start = _snap_point_to_nearby_lines(coords[0], idx) if start_is_dangling else coords[0]
-            new_end = _snap_point_to_nearby_lines(coords[-1], idx) if end_is_dangling else coords[-1]
-            # Ensure all middle coordinates are (float, float) tuples
-            new_coords = [new_start] + [(float(c[0]), float(c[1])) for c in coords[1:-1]] + [new_end]
-            modified_geometries[idx] = LineString(new_coords)
-        else:
-            modified_geometries[idx] = line
+        coords = [(float(c[0]), float(c[1])) for c in lines[idx].coords]
+        new_start = new_endpoints.get((idx, 0), coords[0])
+        new_end = new_endpoints.get((idx, 1), coords[-1])
+        modified_geometries[idx] = LineString([new_start] + coords[1:-1] + [new_end])
 
     # Just snap and not split
     final_geometries = []
     # Step 4a: If no splitting needed, return snapped geometries directly
     if not split_lines:
-        for idx, row in _network_gdf.iterrows():
+        for idx in range(len(lines)):
             final_geometries.append(modified_geometries[idx])
         return gdf(geometry=final_geometries, crs=network_gdf.crs)
 
     # Step 4b: Split lines that had endpoints snapped to them
-    for idx, row in _network_gdf.iterrows():
+    for idx in range(len(lines)):
         if idx in lines_to_split:
             # This line needs to be split at snap points
             line = modified_geometries[idx]
@@ -437,8 +413,10 @@ def near_analysis(building_centroids, street_network: gdf, k: int = 1):
     """
     Find k-nearest street edges for each building centroid.
 
-    Optimized implementation using vectorized operations and spatial indexing
-    for efficient k-nearest neighbor search.
+    All buildings are queried at once against an STRtree of the streets: the nearest street of each building gives a
+    first search radius, which is doubled for the buildings that have fewer than ``k`` streets within it. Only the
+    streets within the radius are candidates, so the cost grows with the number of buildings rather than with
+    buildings x streets. Ties are broken by street order, as with ``nsmallest``.
 
     :param building_centroids: GeoDataFrame of building centroids
     :param street_network: GeoDataFrame of street network edges
@@ -451,42 +429,71 @@ def near_analysis(building_centroids, street_network: gdf, k: int = 1):
     if len(street_network) == 0 or len(building_centroids) == 0:
         return gdf({"building_idx": [], "idx": []}, geometry=[], crs=street_network.crs)
 
-    results = []
     k_nearest_count = min(k, len(street_network))
+    candidate_buildings, candidate_streets, distances = _k_nearest_candidates(
+        building_centroids.geometry.values, street_network.geometry.values, k_nearest_count)
 
-    # Pre-compute all distances in a vectorized manner
-    # For each building, calculate distances to all streets (vectorized)
-    # Then select k smallest per building
-    for bldg_idx, bldg_row in building_centroids.iterrows():
-        bldg_geom = bldg_row.geometry
-
-        # Compute distances to all streets (vectorized)
-        distances = street_network.geometry.distance(bldg_geom)
-        if distances.isna().all():
-            continue
+    if len(candidate_buildings) == 0:
+        # No candidates found at all; return empty GDF with expected columns
+        return gdf({"building_idx": [], "idx": []}, geometry=[], crs=street_network.crs)
 
-        # Get k-nearest street indices
-        k_nearest_indices = distances.nsmallest(k_nearest_count).index.tolist()
+    # Project building points onto their street lines and interpolate the connection points
+    street_lines = street_network.geometry.values[candidate_streets]
+    building_points = building_centroids.geometry.values[candidate_buildings]
+    connection_points = shapely.line_interpolate_point(street_lines,
+                                                       shapely.line_locate_point(street_lines, building_points))
+    connection_points = [normalize_geometry(point, SHAPEFILE_TOLERANCE) for point in connection_points]
 
-        # Batch process the k-nearest streets for this building
-        for street_idx in k_nearest_indices:
-            street_line = street_network.loc[street_idx].geometry
-            # Project building point onto street line and interpolate
-            projected_distance = street_line.project(bldg_geom)
-            connection_point_raw = street_line.interpolate(projected_distance)
-            connection_point_normalized = normalize_geometry(connection_point_raw, SHAPEFILE_TOLERANCE)
+    return gdf({"building_idx": building_centroids.index.values[candidate_buildings],
+                "idx": street_network.index.values[candidate_streets]},
+               geometry=connection_points, crs=street_network.crs)
 
-            results.append({
-                "building_idx": bldg_idx,
-                "idx": street_idx,
-                "geometry": connection_point_normalized
-            })
 
-    if not results:
-        # No candidates found at all; return empty GDF with expected columns
-        return gdf({"building_idx": [], "idx": []}, geometry=[], crs=street_network.crs)
-
-    return gdf(results, crs=street_network.crs)
+def _k_nearest_candidates(points, lines, k):
+    """
+    Bulk k-nearest search of ``lines`` for each of ``points`` with an STRtree.
+
+    :param points: array of (point) geometries
+    :param lines: array of line geometries
+    :param int k: number of nearest lines per point (at most the number of lines)
+    :return: (point positions, line positions, distances), sorted by point, distance and line - k rows per point
+        (points with empty or missing geometries are skipped)
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+    """
+    k = min(k, int(np.sum(~(shapely.is_missing(lines) | shapely.is_empty(lines)))))
+    tree = shapely.STRtree(lines)
+    nearest_points, nearest_lines = tree.query_nearest(points, all_matches=False)
+    if len(nearest_points) == 0 or k == 0:
+        empty = np.array([], dtype=int)
+        return empty, empty, np.array([], dtype=float)
+
+    # Search radius of each point: the distance to its nearest line (enough for k = 1, expanded below for k > 1)
+    radius = np.full(len(points), np.nan)
+    radius[nearest_points] = shapely.distance(points[nearest_points], lines[nearest_lines])
+    pending = nearest_points
+    found_points, found_lines = [], []
+    while len(pending) > 0:
+        query_points, query_lines = tree.query(points[pending], predicate='dwithin', distance=radius[pending])
+        query_points = pending[query_points]
+        counts = np.bincount(query_points, minlength=len(points))[pending]
+        # all lines nearer than the k-th nearest line are within the radius once it holds k lines
+        done = counts >= k
+        done_mask = np.isin(query_points, pending[done])
+        found_points.append(query_points[done_mask])
+        found_lines.append(query_lines[done_mask])
+        pending = pending[~done]
+        radius[pending] = np.maximum(radius[pending] * 2, SNAP_TOLERANCE)
+
+    candidate_points = np.concatenate(found_points)
+    candidate_lines = np.concatenate(found_lines)
+    distances = shapely.distance(points[candidate_points], lines[candidate_lines])
+
+    # keep the k nearest lines of each point (ties broken by line order)
+    order = np.lexsort((candidate_lines, distances, candidate_points))
+    candidate_points, candidate_lines, distances = candidate_points[order], candidate_lines[order], distances[order]
+    first_of_point = np.searchsorted(candidate_points, candidate_points, side='left')
+    keep = np.arange(len(candidate_points)) - first_of_point < k
+    return candidate_points[keep], candidate_lines[keep], distances[keep]
 
 
 def create_terminals(building_centroids: gdf, street_network: gdf, connection_candidates: int = 1) -> gdf:
@@ -0,0 +1,279 @@
+"""
+Steiner tree backend for the network layout based on ``scipy.sparse.csgraph``.
+
+The potential network is compiled once into a compressed sparse row (CSR) matrix and the Steiner tree heuristics
+(Kou and Mehlhorn, as implemented in NetworkX) are evaluated with batched Dijkstra runs over that matrix instead of
+one Python-level shortest path search per terminal. The terminal rerouting queries of the layout post-processing
+(paths between two buildings along the streets, avoiding every other building) are answered from shortest path trees
+that are computed once per source building and reused.
+"""
+
+import networkx as nx
+import numpy as np
+import scipy.sparse
+from scipy.sparse.csgraph import dijkstra, minimum_spanning_tree
+
+__author__ = "Jimeno A. Fonseca"
+__copyright__ = "Copyright 2017, Architecture and Building Systems - ETH Zurich"
+__credits__ = ["Jimeno A. Fonseca"]
+__license__ = "MIT"
+__version__ = "0.1"
+__maintainer__ = "Daren Thomas"
+__email__ = "cea@arch.ethz.ch"
+__status__ = "Production"
+
+# number of terminals per batched Dijkstra run when computing the metric closure (bounds memory to CHUNK x nodes)
+METRIC_CLOSURE_CHUNK_SIZE = 256
+
+# weight used in place of zero-length edges when building minimum spanning trees (scipy drops explicit zeros)
+ZERO_WEIGHT = 1e-12
+
+
+class CSRGraph(object):
+    """
+    An undirected ``nx.Graph`` compiled into a symmetric CSR matrix.
+
+    :ivar nodes: node of each row / column of the matrix
+    :ivar index: row / column of each node
+    :ivar edge_u: first node (index) of each edge of the graph
+    :ivar edge_v: second node (index) of each edge of the graph
+    :ivar edge_weight: weight of each edge of the graph (1 if the edge has no weight, like NetworkX)
+    :ivar matrix: symmetric adjacency matrix of the graph
+    """
+
+    def __init__(self, graph, weight='weight'):
+        self.nodes = list(graph.nodes())
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        edges = [(self.index[u], self.index[v], data.get(weight, 1))
+                 for u, v, data in graph.edges(data=True) if u != v]
+        self.edge_u = np.array([e[0] for e in edges], dtype=np.int32)
+        self.edge_v = np.array([e[1] for e in edges], dtype=np.int32)
+        self.edge_weight = np.array([e[2] for e in edges], dtype=float)
+        self.matrix = self.symmetric_matrix(len(self.nodes), self.edge_u, self.edge_v, self.edge_weight)
+
+    @staticmethod
+    def symmetric_matrix(n_nodes, rows, cols, weights):
+        return scipy.sparse.csr_matrix((np.concatenate([weights, weights]),
+                                        (np.concatenate([rows, cols]), np.concatenate([cols, rows]))),
+                                       shape=(n_nodes, n_nodes))
+
+    def indices_of(self, nodes):
+        return np.array([self.index[node] for node in nodes], dtype=np.int32)
+
+
+def _minimum_spanning_edges(n_nodes, rows, cols, weights):
+    """Edges (rows, cols) of the minimum spanning forest of the undirected graph given as an edge list."""
+    weights = np.where(weights > 0, weights, ZERO_WEIGHT)
+    mst = minimum_spanning_tree(scipy.sparse.csr_matrix((weights, (rows, cols)), shape=(n_nodes, n_nodes))).tocoo()
+    return mst.row, mst.col
+
+
+def _path_to_source(predecessors, node):
+    """Nodes from ``node`` back to the source of a shortest path tree (both included)."""
+    path = [node]
+    while predecessors[path[-1]] >= 0:
+        path.append(predecessors[path[-1]])
+    return path
+
+
+def _unique_edges(edges):
+    return {(u, v) if u < v else (v, u) for u, v in edges}
+
+
+def _steiner_subgraph(graph, csr_graph, edges, terminals):
+    """
+    Final steps shared by Kou and Mehlhorn: the minimum spanning tree of the union of the expanded paths, with the
+    non-terminal leaves removed, returned as a subgraph of ``graph`` (edge data is kept).
+    """
+    edges = np.array(sorted(_unique_edges(edges)), dtype=np.int32).reshape(-1, 2)
+    if len(edges) == 0:
+        return graph.subgraph(terminals).copy()
+    adjacency = csr_graph.matrix
+    weights = np.asarray(adjacency[edges[:, 0], edges[:, 1]]).ravel()
+    rows, cols = _minimum_spanning_edges(len(csr_graph.nodes), edges[:, 0], edges[:, 1], weights)
+
+    # remove non-terminal leaves until every leaf is a terminal
+    tree = nx.Graph()
+    tree.add_edges_from(zip(rows.tolist(), cols.tolist()))
+    terminal_indices = set(csr_graph.indices_of(terminals).tolist())
+    leaves = [n for n in tree.nodes if tree.degree(n) == 1 and n not in terminal_indices]
+    while leaves:
+        leaf = leaves.pop()
+        neighbours = list(tree.neighbors(leaf))
+        tree.remove_node(leaf)
+        for neighbour in neighbours:
+            if tree.degree(neighbour) == 1 and neighbour not in terminal_indices:
+                leaves.append(neighbour)
+
+    nodes = csr_graph.nodes
+    return graph.edge_subgraph((nodes[u], nodes[v]) for u, v in tree.edges()).copy()
+
+
+def mehlhorn_steiner_tree(graph, terminals, weight='weight', csr_graph=None):
+    """
+    Mehlhorn's 2-approximation of the Steiner tree: a single multi-source Dijkstra run assigns every node to its
+    closest terminal, and the tree is built from the edges that connect the Voronoi regions of two terminals.
+
+    :param nx.Graph graph: undirected potential network
+    :param terminals: nodes that must be connected
+    :param str weight: name of the edge attribute holding the edge length
+    :param CSRGraph csr_graph: compiled ``graph`` (compiled on the fly if not given)
+    :rtype: nx.Graph
+    """
+    csr_graph = csr_graph or CSRGraph(graph, weight)
+    terminal_indices = csr_graph.indices_of(terminals)
+    distances, predecessors, sources = dijkstra(csr_graph.matrix, directed=False, indices=terminal_indices,
+                                                return_predecessors=True, min_only=True)
+
+    # edges between two Voronoi regions define the (shortest) candidate connections between their terminals
+    u, v, w = csr_graph.edge_u, csr_graph.edge_v, csr_graph.edge_weight
+    crossing = (sources[u] >= 0) & (sources[v] >= 0) & (sources[u] != sources[v])
+    u, v = u[crossing], v[crossing]
+    lengths = distances[u] + w[crossing] + distances[v]
+    source_u, source_v = sources[u], sources[v]
+    swap = source_u > source_v
+    u, v = np.where(swap, v, u), np.where(swap, u, v)
+    source_u, source_v = np.minimum(source_u, source_v), np.maximum(source_u, source_v)
+
+    # keep the shortest candidate of each pair of terminals
+    order = np.lexsort((lengths, source_v, source_u))
+    u, v, lengths, source_u, source_v = u[order], v[order], lengths[order], source_u[order], source_v[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = (source_u[1:] != source_u[:-1]) | (source_v[1:] != source_v[:-1])
+    u, v, lengths, source_u, source_v = u[first], v[first], lengths[first], source_u[first], source_v[first]
+
+    rows, cols = _minimum_spanning_edges(len(csr_graph.nodes), source_u, source_v, lengths)
+    selected = {(a, b) for a, b in zip(rows.tolist(), cols.tolist())}
+    edges = []
+    for a, b, x, y in zip(source_u.tolist(), source_v.tolist(), u.tolist(), v.tolist()):
+        if (a, b) in selected or (b, a) in selected:
+            path = _path_to_source(predecessors, x)[::-1] + _path_to_source(predecessors, y)
+            edges.extend(zip(path[:-1], path[1:]))
+    return _steiner_subgraph(graph, csr_graph, edges, terminals)
+
+
+def kou_steiner_tree(graph, terminals, weight='weight', csr_graph=None, chunk_size=METRIC_CLOSURE_CHUNK_SIZE):
+    """
+    Kou's 2-approximation of the Steiner tree: the minimum spanning tree of the metric closure of the terminals,
+    expanded back into shortest paths of the network. The metric closure is computed with batched Dijkstra runs of
+    ``chunk_size`` terminals, and the shortest paths are only reconstructed for the edges of its spanning tree.
+
+    :param nx.Graph graph: undirected potential network
+    :param terminals: nodes that must be connected
+    :param str weight: name of the edge attribute holding the edge length
+    :param CSRGraph csr_graph: compiled ``graph`` (compiled on the fly if not given)
+    :param int chunk_size: number of terminals per Dijkstra run
+    :rtype: nx.Graph
+    """
+    csr_graph = csr_graph or CSRGraph(graph, weight)
+    terminal_indices = csr_graph.indices_of(terminals)
+    n_terminals = len(terminal_indices)
+
+    metric_closure = np.empty((n_terminals, n_terminals))
+    for start in range(0, n_terminals, chunk_size):
+        distances = dijkstra(csr_graph.matrix, directed=False, indices=terminal_indices[start:start + chunk_size])
+        metric_closure[start:start + chunk_size] = distances[:, terminal_indices]
+    if np.isinf(metric_closure).any():
+        raise nx.NetworkXError('The terminals of the Steiner tree are not connected')
+
+    metric_closure[metric_closure <= 0] = ZERO_WEIGHT
+    np.fill_diagonal(metric_closure, 0)
+    mst = minimum_spanning_tree(metric_closure).tocoo()
+    mst_rows, mst_cols = mst.row, mst.col
+
+    # expand each edge of the spanning tree into its shortest path, one Dijkstra run per distinct source terminal
+    targets_of_source = {}
+    for a, b in zip(mst_rows.tolist(), mst_cols.tolist()):
+        targets_of_source.setdefault(a, []).append(b)
+    sources = sorted(targets_of_source)
+    edges = []
+    for start in range(0, len(sources), chunk_size):
+        chunk = sources[start:start + chunk_size]
+        _, predecessors = dijkstra(csr_graph.matrix, directed=False, indices=terminal_indices[chunk],
+                                   return_predecessors=True)
+        for row, source in enumerate(chunk):
+            for target in targets_of_source[source]:
+                path = _path_to_source(predecessors[row], terminal_indices[target])
+                edges.extend(zip(path[:-1], path[1:]))
+    return _steiner_subgraph(graph, csr_graph, edges, terminals)
+
+
+def steiner_tree(graph, terminals, weight='weight', method='kou'):
+    """
+    Drop-in replacement of ``networkx.algorithms.approximation.steinertree.steiner_tree`` for the Kou and Mehlhorn
+    methods.
+
+    :param nx.Graph graph: undirected potential network
+    :param terminals: nodes that must be connected
+    :param str weight: name of the edge attribute holding the edge length
+    :param str method: 'kou' or 'mehlhorn'
+    :rtype: nx.Graph
+    """
+    if method == 'kou':
+        return kou_steiner_tree(graph, terminals, weight)
+    elif method == 'mehlhorn':
+        return mehlhorn_steiner_tree(graph, terminals, weight)
+    raise ValueError('Unknown Steiner tree method: {method}'.format(method=method))
+
+
+class TerminalStreetPaths(object):
+    """
+    Shortest paths between two nodes (usually terminals) that only pass through non-terminal (street) nodes.
+
+    The graph is compiled into a directed CSR matrix in which terminals only have incoming edges from the streets, so
+    that no shortest path can pass through a terminal. Each terminal gets an extra "departure" node with outgoing
+    edges to its street neighbours. A single Dijkstra run from the departure node of a terminal gives the shortest
+    paths to every other terminal; the resulting shortest path tree is cached and reused for every query from that
+    terminal.
+    """
+
+    def __init__(self, graph, terminals, weight='weight'):
+        self.nodes = list(graph.nodes())
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        self.departure = {terminal: len(self.nodes) + i
+                          for i, terminal in enumerate(t for t in terminals if t in self.index)}
+        self.predecessors = {}
+
+        rows, cols, weights = [], [], []
+        for u, v, data in graph.edges(data=True):
+            if u == v or (u in self.departure and v in self.departure):
+                continue
+            w = data.get(weight, 1)
+            if u in self.departure or v in self.departure:
+                terminal, street = (u, v) if u in self.departure else (v, u)
+                rows.extend([self.index[street], self.departure[terminal]])
+                cols.extend([self.index[terminal], self.index[street]])
+            else:
+                rows.extend([self.index[u], self.index[v]])
+                cols.extend([self.index[v], self.index[u]])
+            weights.extend([w, w])
+        n_nodes = len(self.nodes) + len(self.departure)
+        self.matrix = scipy.sparse.csr_matrix((np.array(weights, dtype=float),
+                                               (np.array(rows, dtype=np.int32), np.array(cols, dtype=np.int32))),
+                                              shape=(n_nodes, n_nodes))
+
+    def shortest_path(self, source, target):
+        """
+        Shortest path from ``source`` to ``target`` along the streets.
+
+        :return: nodes of the path, from ``source`` to ``target``
+        :raises nx.NetworkXNoPath: if the nodes are not connected through the streets
+        """
+        for node in (source, target):
+            if node not in self.index:
+                raise nx.NodeNotFound('Node {node} is not in the graph'.format(node=node))
+        if source == target:
+            return [source]
+        if source not in self.predecessors:
+            # street nodes have no departure node: their own edges never lead through a terminal
+            departure = self.departure.get(source, self.index[source])
+            _, predecessors = dijkstra(self.matrix, directed=True, indices=departure, return_predecessors=True)
+            self.predecessors[source] = predecessors
+        predecessors = self.predecessors[source]
+
+        target_index = self.index[target]
+        if predecessors[target_index] < 0:
+            raise nx.NetworkXNoPath('No street path between {source} and {target}'.format(source=source,
+                                                                                       target=target))
+        path = _path_to_source(predecessors, target_index)[::-1]
+        return [source] + [self.nodes[i] for i in path[1:]]
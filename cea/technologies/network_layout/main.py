@@ -1468,6 +1468,7 @@ def auto_layout_network(config, network_layout, locator: cea.inputlocator.InputL
     connection_candidates = config.network_layout.connection_candidates
     snap_tolerance = config.network_layout.snap_tolerance if config.network_layout.snap_tolerance else SNAP_TOLERANCE
     steiner_algorithm = network_layout.algorithm
+    steiner_backend = config.network_layout.steiner_backend
 
     # Validate include_services is not empty
     if not list_include_services:
@@ -1778,7 +1779,8 @@ def auto_layout_network(config, network_layout, locator: cea.inputlocator.InputL
             plant_building_names=None,  # Skip plant creation (caller will add plants manually)
             disconnected_building_names=disconnected_building_names,
             method=steiner_algorithm,
-            connection_candidates=connection_candidates
+            connection_candidates=connection_candidates,
+            backend=steiner_backend
         )
 
         # Read generated nodes and edges
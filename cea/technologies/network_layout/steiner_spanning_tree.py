@@ -13,6 +13,7 @@ from shapely import LineString, Point
 from cea.constants import SHAPEFILE_TOLERANCE
 from cea.technologies.constants import TYPE_MAT_DEFAULT, PIPE_DIAMETER_DEFAULT
 
+from cea.technologies.network_layout import csgraph_steiner
 from cea.technologies.network_layout.graph_utils import gdf_to_nx, normalize_coords
 from cea.technologies.network_layout.plant_node_operations import add_plant_close_to_anchor, get_next_node_name
 from cea.datamanagement.graph_helper import GraphCorrector
@@ -60,6 +61,28 @@ class SteinerAlgorithm(StrEnum):
         return self.value
 
 
+class SteinerBackend(StrEnum):
+    """
+    Enum for the graph backends that can be used to calculate the Steiner tree and the terminal reroutes.
+    """
+
+    NetworkX = 'networkx'
+    """
+    NetworkX: reference implementation (``networkx.algorithms.approximation.steinertree.steiner_tree``), with one
+    ``nx.shortest_path`` search on a copy of the street graph per rerouted building edge.
+    """
+
+    CSGraph = 'csgraph'
+    """
+    scipy.sparse.csgraph: the potential network is compiled into a sparse matrix and the Steiner tree is computed with
+    batched Dijkstra runs. Building reroutes are answered from cached shortest path trees (one per source building).
+    Much faster on large networks; ties between equally long paths may be broken differently than with NetworkX.
+    """
+
+    def __str__(self):
+        return self.value
+
+
 def calc_steiner_spanning_tree(crs_projected,
                                building_centroids_df: gdf,
                                potential_network_graph: nx.Graph,
@@ -73,7 +96,8 @@ def calc_steiner_spanning_tree(crs_projected,
                                type_mat_default=TYPE_MAT_DEFAULT,
                                pipe_diameter_default=PIPE_DIAMETER_DEFAULT,
                                method: str = SteinerAlgorithm.Kou,
-                               connection_candidates: int = 3):
+                               connection_candidates: int = 3,
+                               backend: str = SteinerBackend.NetworkX):
     """
     Calculate the minimum spanning tree of the network. Note that this function can't be run in parallel in it's
     present form.
@@ -92,9 +116,11 @@ def calc_steiner_spanning_tree(crs_projected,
     :param int connection_candidates: Number of nearest street connection points to consider per building.
         Default is 3 (balanced quality/speed). Values of 1 (fastest greedy) to 5 (best quality) are supported.
         Only works with Kou algorithm - Mehlhorn will use greedy nearest regardless.
+    :param backend: The graph backend used for the Steiner tree and the building reroutes. Default is NetworkX.
     :return: ``(mst_edges, mst_nodes)``
     """
     steiner_algorithm = SteinerAlgorithm(method)
+    steiner_backend = SteinerBackend(backend)
 
     # Validate connection_candidates with Mehlhorn algorithm
     if connection_candidates > 1 and steiner_algorithm == SteinerAlgorithm.Mehlhorn:
@@ -149,7 +175,11 @@ def calc_steiner_spanning_tree(crs_projected,
         try:
             # Note: steiner_tree() already returns a tree (both Kou and Mehlhorn algorithms)
             # No need for additional MST computation
-            mst_non_directed = steiner_tree(G, terminal_nodes_coordinates, method=steiner_algorithm)
+            if steiner_backend == SteinerBackend.CSGraph:
+                mst_non_directed = csgraph_steiner.steiner_tree(G, terminal_nodes_coordinates,
+                                                                method=str(steiner_algorithm))
+            else:
+                mst_non_directed = steiner_tree(G, terminal_nodes_coordinates, method=steiner_algorithm)
         except Exception as e:
             raise ValueError('There was an error while creating the Steiner tree despite graph corrections. '
                             'This is an unexpected error. Please report this issue with your streets.shp file.') from e
@@ -173,36 +203,44 @@ def calc_steiner_spanning_tree(crs_projected,
 
         terminals_set = set(tuple(t) for t in terminals)
 
-        # Pre-create a graph with all terminals removed for efficient shortest path queries
-        # This avoids copying the full graph for every reroute operation (major performance optimization)
-        G_no_terminals = full_graph.copy()
-        for t in terminals_set:
-            if G_no_terminals.has_node(t):
-                G_no_terminals.remove_node(t)
+        if steiner_backend == SteinerBackend.CSGraph:
+            # Shortest path trees are computed once per source terminal and reused for every reroute
+            street_paths = csgraph_steiner.TerminalStreetPaths(full_graph, terminals_set)
+
+            def _street_path(source, target):
+                return street_paths.shortest_path(source, target)
+        else:
+            # Pre-create a graph with all terminals removed for efficient shortest path queries
+            # This avoids copying the full graph for every reroute operation (major performance optimization)
+            G_no_terminals = full_graph.copy()
+            for t in terminals_set:
+                if G_no_terminals.has_node(t):
+                    G_no_terminals.remove_node(t)
+
+            def _street_path(source, target):
+                # Compute shortest path between source and target in the street network (no terminals)
+                # Add back only the source and target terminals for this query
+                G2 = G_no_terminals.copy()
+                for term in [source, target]:
+                    # Add the terminal node itself first
+                    if not G2.has_node(term):
+                        # Copy node attributes from full_graph
+                        if full_graph.has_node(term):
+                            G2.add_node(term, **full_graph.nodes[term])
+                        else:
+                            G2.add_node(term)
+                    # Then add edges to street nodes
+                    for neighbor in full_graph.neighbors(term):
+                        if neighbor not in terminals_set:  # Only connect to street nodes
+                            edge_data = full_graph.get_edge_data(term, neighbor, default={})
+                            G2.add_edge(term, neighbor, **edge_data)
+                return nx.shortest_path(G2, source=source, target=target, weight='weight')
 
         # 2) Remove direct building-to-building edges, replace with street path
         b2b_edges = [(u, v) for u, v in sg.edges() if u in terminals_set and v in terminals_set]
         for u, v in b2b_edges:
-            # Compute shortest path between u and v in the street network (no terminals)
-            # Add back only the source and target terminals for this query
-            G2 = G_no_terminals.copy()
-            # Re-add u and v terminals with their edges to streets
-            for term in [u, v]:
-                # Add the terminal node itself first
-                if not G2.has_node(term):
-                    # Copy node attributes from full_graph
-                    if full_graph.has_node(term):
-                        G2.add_node(term, **full_graph.nodes[term])
-                    else:
-                        G2.add_node(term)
-                # Then add edges to street nodes
-                for neighbor in full_graph.neighbors(term):
-                    if neighbor not in terminals_set:  # Only connect to street nodes
-                        edge_data = full_graph.get_edge_data(term, neighbor, default={})
-                        G2.add_edge(term, neighbor, **edge_data)
-            
             try:
-                path = nx.shortest_path(G2, source=u, target=v, weight='weight')
+                path = _street_path(u, v)
             except nx.NetworkXNoPath:
                 # If no alternate path, keep edge but warn (shouldn't happen with proper streets)
                 print(f"  WARNING: No street path found to replace building-to-building edge {u}–{v}")
@@ -235,26 +273,10 @@ def calc_steiner_spanning_tree(crs_projected,
                     break
 
                 # Reroute each extra neighbour to 'keep' via streets without passing through building terminals
-                # Build a query graph with only n and keep terminals added back (all other terminals excluded)
+                # (only n and keep terminals are part of the query, all other terminals are excluded)
                 for n in to_reroute:
-                    G2 = G_no_terminals.copy()
-                    # Re-add n and keep terminals with their edges to streets
-                    for term in [n, keep]:
-                        # Add the terminal node itself first
-                        if not G2.has_node(term):
-                            # Copy node attributes from full_graph
-                            if full_graph.has_node(term):
-                                G2.add_node(term, **full_graph.nodes[term])
-                            else:
-                                G2.add_node(term)
-                        # Then add edges to street nodes
-                        for neighbor in full_graph.neighbors(term):
-                            if neighbor not in terminals_set:  # Only connect to street nodes
-                                edge_data = full_graph.get_edge_data(term, neighbor, default={})
-                                G2.add_edge(term, neighbor, **edge_data)
-                    
                     try:
-                        path = nx.shortest_path(G2, source=n, target=keep, weight='weight')
+                        path = _street_path(n, keep)
                         # Add reroute path
                         _add_path_edges(path)
                         # Only remove the direct edge if rerouting succeeded
@@ -38,7 +38,8 @@ def main(config: cea.config.Configuration):
                 self.network_type = network_type_override
                 for attr in ['network_names', 'file_type',
                              'load_max_edge_flowrate_from_previous_run', 'start_t', 'stop_t',
-                             'use_representative_week_per_month', 'minimum_mass_flow_iteration_limit',
+                             'use_representative_week_per_month', 'representative_hours',
+                             'minimum_mass_flow_iteration_limit',
                              'minimum_edge_mass_flow', 'diameter_iteration_limit',
                              'substation_cooling_systems', 'substation_heating_systems',
                              'network_temperature_dh', 'network_temperature_dc',
@@ -3,6 +3,7 @@ Hydraulic - thermal network
 """
 
 import collections
+import hashlib
 import math
 import os
 import random
@@ -18,6 +19,9 @@ import re
 
 import cea.technologies.substation as substation
 import cea.technologies.thermal_network.detailed.substation as substation_matrix
+from cea.technologies.thermal_network.detailed.sparse_solver import solve_edge_flows, solve_node_pressures
+from cea.technologies.thermal_network.detailed.representative_hours import select_representative_hours, \
+    print_representative_hours_report
 from cea.optimization.preprocessing.preprocessing_main import get_building_names_with_load
 from cea.technologies.thermal_network.physics import (
     calc_temperature_out_per_pipe,
@@ -65,7 +69,7 @@ class ThermalNetwork(object):
                                   and, if it is a consumer or plant, the name of the corresponding building (2 x n)
     :ivar DataFrame edge_df:
     """
-    loops_cache = {}  # {edge_nodes_df.to_string(): find_loops(edge_nodes_df)
+    loops_cache = {}  # {sha1(edge_nodes_df.values): find_loops(edge_nodes_df)
 
     def __init__(self, locator, network_name, thermal_network_section=None):
         self.locator = locator
@@ -79,6 +83,7 @@ class ThermalNetwork(object):
         self.start_t = 0
         self.stop_t = 8760
         self.use_representative_week_per_month = True
+        self.representative_hours = 0  # number of load-clustered hours to simulate, 0 to simulate all hours
         self.minimum_mass_flow_iteration_limit = 30
         self.minimum_edge_mass_flow = 0.1
         self.diameter_iteration_limit = 10
@@ -106,6 +111,8 @@ class ThermalNetwork(object):
         self.t_target_supply_C = None  # to be filled from buildings_demands properties
         self.t_target_supply_df = None  # target supply temperature of each node, to be filled from all_nodes_df
         self.itemised_dh_services = None  # to be filled from plant node type in get_thermal_network_from_csv
+        self.timestep_mapping = None  # simulated timestep of each hour of the year, set by prepare_inputs_of_representative_hours
+        self.simulated_hours = None  # hour of the year of each simulated timestep, set by prepare_inputs_of_representative_hours
 
         self.edge_mass_flow_df = None
         self.node_mass_flow_df = None
@@ -136,7 +143,8 @@ class ThermalNetwork(object):
     def copy_config_section(self, thermal_network_section):
         thermal_network_section_fields = ["network_type", "network_names", "file_type",
                                           "load_max_edge_flowrate_from_previous_run", "start_t", "stop_t",
-                                          "use_representative_week_per_month", "minimum_mass_flow_iteration_limit",
+                                          "use_representative_week_per_month", "representative_hours",
+                                          "minimum_mass_flow_iteration_limit",
                                           "minimum_edge_mass_flow", "diameter_iteration_limit",
                                           "substation_cooling_systems", "substation_heating_systems",
                                           "network_temperature_dh", "network_temperature_dc",
@@ -537,6 +545,10 @@ class ThermalNetwork(object):
         self.edge_df = edge_df
         self.building_names = building_names
 
+    def uses_reduced_timesteps(self):
+        """True if only a subset of the hours of the year is simulated (representative weeks or hours)."""
+        return self.use_representative_week_per_month or self.timestep_mapping is not None
+
     def find_loops(self, edge_node_df=None):
         """
         This function converts the input matrix into a networkx type graph and identifies all fundamental loops
@@ -558,7 +570,7 @@ class ThermalNetwork(object):
             edge_node_df = self.edge_node_df
 
         # check to see if we've already computed the loops
-        edge_node_str = edge_node_df.to_string()
+        edge_node_str = hashlib.sha1(np.ascontiguousarray(edge_node_df.values, dtype=float).tobytes()).hexdigest()
         if edge_node_str in ThermalNetwork.loops_cache:
             return ThermalNetwork.loops_cache[edge_node_str]
 
@@ -777,6 +789,10 @@ def thermal_network_main(locator, thermal_network, processes=1):
         thermal_network.start_t = 0
         thermal_network.stop_t = 2016  # 24 hours x 7 days x 12 months
         prepare_inputs_of_representative_weeks(thermal_network)
+    elif thermal_network.representative_hours > 0:
+        # we run only the load-clustered representative hours, the other hours take the results of their cluster
+        thermal_network.start_t = 0
+        thermal_network.stop_t = prepare_inputs_of_representative_hours(thermal_network)
 
     print('Calculating edge mass flows for pipe sizing')
     if thermal_network.load_max_edge_flowrate_from_previous_run:
@@ -787,16 +803,11 @@ def thermal_network_main(locator, thermal_network, processes=1):
         thermal_network.edge_mass_flow_df = calc_max_edge_flowrate(thermal_network, processes=processes)
 
         # save results to file
-        if thermal_network.use_representative_week_per_month:
+        if thermal_network.uses_reduced_timesteps():
             # need to repeat lines to make sure our outputs have 8760 timesteps. Otherwise plots
             # and network optimization will fail as they expect 8760 timesteps.
-            edge_mass_flow_for_csv = pd.DataFrame(thermal_network.edge_mass_flow_df)
-            # we need to extrapolate 8760 datapoints from 2016 points from our representative weeks.
-            # To do this, the initial dataset is repeated 4 times, the remaining values are filled with the average values of all above.
-            edge_mass_flow_for_csv = pd.concat([edge_mass_flow_for_csv] * 4, ignore_index=True)
-            while len(edge_mass_flow_for_csv.index) < HOURS_IN_YEAR:
-                edge_mass_flow_for_csv = pd.concat(
-                    [edge_mass_flow_for_csv, edge_mass_flow_for_csv.mean().to_frame().T], ignore_index=True)
+            edge_mass_flow_for_csv = extrapolate_datapoints_for_representative_weeks(
+                thermal_network.edge_mass_flow_df, thermal_network.timestep_mapping)
             edge_mass_flow_for_csv.to_csv(
                 thermal_network.locator.get_nominal_edge_mass_flow_csv_file(thermal_network.network_type,
                                                                             thermal_network.network_name), index=False)
@@ -981,54 +992,82 @@ def output_hex_specs_at_nodes(substation_HEX_Q, thermal_network):
 
 
 def prepare_inputs_of_representative_weeks(thermal_network):
-    hours_list = chain(range(0, 168), range(744, 912), range(1416, 1584), range(2160, 2328), range(2880, 3048),
-                       range(3624, 3792), range(4344, 4512), range(5088, 5256), range(5832, 6000), range(6522, 6690),
-                       range(7296, 7464), range(8016, 8184))
-    # cut out relevant parts of all dataframes
-    thermal_network.T_ground_K = [value for index, value in enumerate(thermal_network.T_ground_K) if
-                                  index in hours_list]
+    hours_list = list(chain(range(0, 168), range(744, 912), range(1416, 1584), range(2160, 2328), range(2880, 3048),
+                            range(3624, 3792), range(4344, 4512), range(5088, 5256), range(5832, 6000),
+                            range(6522, 6690), range(7296, 7464), range(8016, 8184)))
+    cut_out_timesteps(thermal_network, hours_list)
+    return np.nan
+
+
+def prepare_inputs_of_representative_hours(thermal_network):
+    """
+    Select the load-clustered representative hours of the year (see
+    :py:mod:`cea.technologies.thermal_network.detailed.representative_hours`) and cut the hourly inputs of the network
+    down to those hours. The mapping from each hour of the year to its representative hour is stored in
+    ``thermal_network.timestep_mapping`` to reconstruct the annual results.
+
+    :param ThermalNetwork thermal_network: object containing all the data of the thermal network
+    :return: number of representative hours to simulate
+    :rtype: int
+    """
+    selected = select_representative_hours(thermal_network.buildings_demands, thermal_network.network_type,
+                                           thermal_network.representative_hours, thermal_network.T_ground_K)
+    print_representative_hours_report(selected)
+    thermal_network.timestep_mapping = selected.timestep_mapping
+    thermal_network.simulated_hours = list(selected.hours)
+    cut_out_timesteps(thermal_network, selected.hours)
+    return len(selected.hours)
+
+
+def cut_out_timesteps(thermal_network, hours_list):
+    """Cut out the relevant hours of all hourly inputs of the thermal network and re-index them from 0."""
+    hours_list = list(hours_list)
+    nhours = len(hours_list)
+    thermal_network.T_ground_K = [thermal_network.T_ground_K[hour] for hour in hours_list]
     for building in thermal_network.buildings_demands.keys():
         thermal_network.buildings_demands[building] = thermal_network.buildings_demands[building].iloc[hours_list]
-        thermal_network.buildings_demands[building].index = range(0, 2016)
+        thermal_network.buildings_demands[building].index = range(0, nhours)
     thermal_network.t_target_supply_C = thermal_network.t_target_supply_C.iloc[hours_list]
-    thermal_network.t_target_supply_C.index = range(0, 2016)
+    thermal_network.t_target_supply_C.index = range(0, nhours)
     thermal_network.t_target_supply_df = thermal_network.t_target_supply_df.iloc[hours_list]
-    thermal_network.t_target_supply_df.index = range(0, 2016)
-    return np.nan
+    thermal_network.t_target_supply_df.index = range(0, nhours)
 
 
 def save_all_results_to_csv(csv_outputs, thermal_network):
-    if thermal_network.use_representative_week_per_month:
-        # we need to extrapolate 8760 data points from 2016 points from our representative weeks.
-        # To do this, the initial dataset is repeated 4 times, the remaining values are filled with the average values of all above.
-        edge_mass_flows_for_csv = extrapolate_datapoints_for_representative_weeks(csv_outputs['edge_mass_flows'])
-        node_mass_flows_for_csv = extrapolate_datapoints_for_representative_weeks(csv_outputs['node_mass_flows'])
+    if thermal_network.uses_reduced_timesteps():
+        # we need to extrapolate 8760 data points from the simulated timesteps (representative weeks or hours).
+        edge_mass_flows_for_csv = extrapolate_datapoints_for_representative_weeks(
+            csv_outputs['edge_mass_flows'], thermal_network.timestep_mapping)
+        node_mass_flows_for_csv = extrapolate_datapoints_for_representative_weeks(
+            csv_outputs['node_mass_flows'], thermal_network.timestep_mapping)
         velocities_in_supply_edges_mpers_for_csv = extrapolate_datapoints_for_representative_weeks(
-            csv_outputs['velocities_in_supply_edges_mpers'])
-        T_supply_nodes_for_csv = extrapolate_datapoints_for_representative_weeks(csv_outputs['T_supply_nodes'])
-        T_return_nodes_for_csv = extrapolate_datapoints_for_representative_weeks(csv_outputs['T_return_nodes'])
+            csv_outputs['velocities_in_supply_edges_mpers'], thermal_network.timestep_mapping)
+        T_supply_nodes_for_csv = extrapolate_datapoints_for_representative_weeks(
+            csv_outputs['T_supply_nodes'], thermal_network.timestep_mapping)
+        T_return_nodes_for_csv = extrapolate_datapoints_for_representative_weeks(
+            csv_outputs['T_return_nodes'], thermal_network.timestep_mapping)
         temperatures_at_plants_K_for_csv = extrapolate_datapoints_for_representative_weeks(
-            csv_outputs['temperatures_at_plant_K'])
+            csv_outputs['temperatures_at_plant_K'], thermal_network.timestep_mapping)
         q_loss_supply_edges_kW_for_csv = extrapolate_datapoints_for_representative_weeks(
-            csv_outputs['q_loss_supply_edges_kW'])
+            csv_outputs['q_loss_supply_edges_kW'], thermal_network.timestep_mapping)
         linear_thermal_loss_supply_edges_Wperm_for_csv = extrapolate_datapoints_for_representative_weeks(
-            csv_outputs['linear_thermal_loss_supply_edges_Wperm'])
+            csv_outputs['linear_thermal_loss_supply_edges_Wperm'], thermal_network.timestep_mapping)
         thermal_losses_system_kW_for_csv = extrapolate_datapoints_for_representative_weeks(
-            csv_outputs['thermal_losses_system_kW'])
+            csv_outputs['thermal_losses_system_kW'], thermal_network.timestep_mapping)
         plant_heat_requirement_for_csv = extrapolate_datapoints_for_representative_weeks(
-            csv_outputs['plant_heat_requirement'])
+            csv_outputs['plant_heat_requirement'], thermal_network.timestep_mapping)
         pressure_at_supply_nodes_Pa_for_csv = extrapolate_datapoints_for_representative_weeks(
-            csv_outputs['pressure_at_supply_nodes_Pa'])
+            csv_outputs['pressure_at_supply_nodes_Pa'], thermal_network.timestep_mapping)
         pressure_loss_system_kW_for_csv = extrapolate_datapoints_for_representative_weeks(
-            csv_outputs['pressure_loss_system_kW'])
+            csv_outputs['pressure_loss_system_kW'], thermal_network.timestep_mapping)
         pressure_loss_system_Pa_for_csv = extrapolate_datapoints_for_representative_weeks(
-            csv_outputs['pressure_loss_system_Pa'])
+            csv_outputs['pressure_loss_system_Pa'], thermal_network.timestep_mapping)
         pressure_loss_substations_kW_for_csv = extrapolate_datapoints_for_representative_weeks(
-            csv_outputs['pressure_loss_substations_kW'])
+            csv_outputs['pressure_loss_substations_kW'], thermal_network.timestep_mapping)
         linear_pressure_loss_supply_Paperm_for_csv = extrapolate_datapoints_for_representative_weeks(
-            csv_outputs['linear_pressure_loss_supply_Paperm'])
+            csv_outputs['linear_pressure_loss_supply_Paperm'], thermal_network.timestep_mapping)
         pressure_loss_supply_edge_for_csv = extrapolate_datapoints_for_representative_weeks(
-            csv_outputs['pressure_loss_supply_edge_kW'])
+            csv_outputs['pressure_loss_supply_edge_kW'], thermal_network.timestep_mapping)
 
         # Output values
         # Edge Mass Flows
@@ -1303,8 +1342,17 @@ def save_all_results_to_csv(csv_outputs, thermal_network):
                 thermal_network.network_type, thermal_network.network_name), index=False, float_format='%.3f')
 
 
-def extrapolate_datapoints_for_representative_weeks(representative_week_data):
+def extrapolate_datapoints_for_representative_weeks(representative_week_data, timestep_mapping=None):
+    """
+    Extrapolate 8760 datapoints from the simulated timesteps.
+
+    For representative hours (``timestep_mapping`` given), each hour of the year takes the values of the representative
+    hour of its cluster. For representative weeks, the initial dataset is repeated 4 times and the remaining values
+    are filled with the average values of all above.
+    """
     representative_week_df = pd.DataFrame(representative_week_data)
+    if timestep_mapping is not None:
+        return representative_week_df.iloc[timestep_mapping].reset_index(drop=True)
     representative_week_df = pd.concat([representative_week_df] * 4, ignore_index=True)
     while len(representative_week_df.index) < HOURS_IN_YEAR:
         representative_week_df = pd.concat(
@@ -1410,6 +1458,8 @@ def calc_mass_flow_edges(edge_node_df, mass_flow_substation_df, all_nodes_df, pi
     """
     edge_node_df = edge_node_df.copy()
     loops, graph = find_loops(edge_node_df)  # identifies all linear independent loops
+    plant_index = np.where(all_nodes_df['type'].str.contains('PLANT', na=False))[0][0]  # find index of the first plant node
+    node_flows = np.nan_to_num(np.asarray(mass_flow_substation_df, dtype=float)).ravel()
     if loops:
         # print('Fundamental loops in the network:', loops)  # returns nodes that define loop, useful for visiual
         # verification in testing phase,
@@ -1418,11 +1468,12 @@ def calc_mass_flow_edges(edge_node_df, mass_flow_substation_df, all_nodes_df, pi
 
         # if loops exist:
         # 1. calculate initial guess solution of matrix A
-        # delete first plant on an edge of matrix and solution space b as these are redundant
-        A = edge_node_df.drop(edge_node_df.index[0], axis=0)  # solution matrix A without loop equations (kirchhoff 2)
-        b_init = np.nan_to_num(mass_flow_substation_df.drop(mass_flow_substation_df.columns[0], axis=1).transpose())
-        # solution vector b of node demands
-        mass_flow_edge = np.linalg.lstsq(A, b_init, rcond=-1)[0].transpose()[0]  # solve system
+        # delete first node of the matrix and solution space b as these are redundant
+        mass_flow_edge = solve_edge_flows(edge_node_df.values, node_flows, 0)
+
+        # signed loop-edge matrix (loops x edges): +1 if the edge is traversed in its flow direction (clockwise)
+        loop_edge_matrix = calc_loop_edge_matrix(loops, graph, edge_node_df.values)
+        loop_edge_matrix_abs = abs(loop_edge_matrix)
 
         # setup iterations for implicit matrix solver
         tolerance = 0.01  # tolerance for mass flow convergence
@@ -1439,50 +1490,16 @@ def calc_mass_flow_edges(edge_node_df, mass_flow_substation_df, all_nodes_df, pi
                                                   PressureLossMode.DIRECT) * np.sign(m_old)  # calculate pressure losses
             delta_m_den = abs(calc_pressure_loss_pipe(pipe_diameter_m, pipe_length_m, m_old, T_edge_K,
                                                       PressureLossMode.GRADIENT))  # calculate derivatives of pressure losses
-            delta_m_num = delta_m_num.transpose()
-
-            sum_delta_m_num = np.zeros((1, len(loops)))[0]
-            sum_delta_m_den = np.zeros((1, len(loops)))[0]
-
-            for i in range(len(loops)):
-                # calculate the mass flow correction for each loop
-                # iterate over loops
-                # save the edge number connecting the nodes of the loops into the variable index
-                for j in range(len(loops[i])):
-                    if j == len(loops[i]) - 1:
-                        value = loops[i][0]
-                    else:
-                        value = loops[i][j + 1]
-                    index = graph.get_edge_data(loops[i][j], value)
-                    # check if nodes  defined in clockwise loop, to keep sign convention for Hardy Cross Method
-                    if not (edge_node_df.iloc[loops[i][j]][index['edge_number']] == 1) & \
-                           (edge_node_df.iloc[value][index['edge_number']] == -1):
-                        clockwise = -1
-                    else:
-                        clockwise = 1
-                    sum_delta_m_num[i] = sum_delta_m_num[i] + delta_m_num[index["edge_number"]] * clockwise
-                    sum_delta_m_den[i] = sum_delta_m_den[i] + delta_m_den[index["edge_number"]]
-                # calculate flow correction for each loop
-                if np.isclose(sum_delta_m_den[i], 0):
-                    delta_m = 0
-                else:
-                    delta_m = -sum_delta_m_num[i] / sum_delta_m_den[i]
 
-                # apply mass flow correction to all edges of each loop
-                for j in range(len(loops[i])):
-                    if j == len(loops[i]) - 1:
-                        value = loops[i][0]
-                    else:
-                        value = loops[i][j + 1]
-                    index = graph.get_edge_data(loops[i][j], value)
-                    # check if nodes  defined in clockwise loop
-                    if not (edge_node_df.iloc[loops[i][j]][index['edge_number']] == 1) & \
-                           (edge_node_df.iloc[value][index['edge_number']] == -1):
-                        clockwise = -1
-                    else:
-                        clockwise = 1
-                    # apply loop correction
-                    mass_flow_edge[index["edge_number"]] = mass_flow_edge[index["edge_number"]] + delta_m * clockwise
+            # calculate the mass flow correction for each loop
+            sum_delta_m_num = loop_edge_matrix @ np.ravel(delta_m_num)
+            sum_delta_m_den = loop_edge_matrix_abs @ np.ravel(delta_m_den)
+            delta_m = np.zeros(len(loops))
+            non_zero = ~np.isclose(sum_delta_m_den, 0)
+            delta_m[non_zero] = -sum_delta_m_num[non_zero] / sum_delta_m_den[non_zero]
+
+            # apply mass flow correction to all edges of each loop
+            mass_flow_edge = mass_flow_edge + loop_edge_matrix.T @ delta_m
             iterations = iterations + 1
 
             # adapt tolerance to reduce total amount of iterations
@@ -1500,18 +1517,11 @@ def calc_mass_flow_edges(edge_node_df, mass_flow_substation_df, all_nodes_df, pi
 
     else:  # no loops
         # remove one equation (at plant node) to build a well-determined matrix, A.
-        plant_index = np.where(all_nodes_df['type'].str.contains('PLANT', na=False))[0][0]  # find index of the first plant node
-        A = edge_node_df.drop(edge_node_df.index[plant_index])
-        b = np.nan_to_num(mass_flow_substation_df.T)
-        b = np.delete(b, plant_index)
-        mass_flow_edge = np.linalg.solve(A.values, b)
+        mass_flow_edge = solve_edge_flows(edge_node_df.values, node_flows, plant_index)
 
     # verify calculated solution
-    plant_index = np.where(all_nodes_df['type'].str.contains('PLANT', na=False))[0][0]  # find index of the first plant node
-    A = edge_node_df.drop(edge_node_df.index[plant_index])
-    b_verification = A.dot(mass_flow_edge)
-    b_original = np.nan_to_num(mass_flow_substation_df.T)
-    b_original = np.delete(b_original, plant_index)
+    b_verification = np.delete(edge_node_df.values.dot(mass_flow_edge), plant_index)
+    b_original = np.delete(node_flows, plant_index)
     if max(abs(b_original - b_verification)) > 0.01:
         print('Error in the defined mass flows, deviation of ', max(abs(b_original - b_verification)),
               ' from node demands.')
@@ -1524,6 +1534,32 @@ def calc_mass_flow_edges(edge_node_df, mass_flow_substation_df, all_nodes_df, pi
     return mass_flow_edge
 
 
+def calc_loop_edge_matrix(loops, graph, edge_node_matrix):
+    """
+    Build the signed loop-edge matrix used for the loop corrections (Hardy Cross) in :py:func:`calc_mass_flow_edges`.
+
+    :param loops: list of fundamental loops, each a list of nodes as returned by ``ThermalNetwork.find_loops``
+    :param graph: networkx graph of the network with an ``edge_number`` attribute on each edge
+    :param ndarray edge_node_matrix: edge-node matrix of the network (n x e)
+
+    :return loop_edge_matrix: matrix (loops x e) with +1 if the edge is part of the loop and defined in clockwise
+                              direction, -1 if it is part of the loop in counter-clockwise direction, else 0
+    :rtype loop_edge_matrix: ndarray
+    """
+    loop_edge_matrix = np.zeros((len(loops), edge_node_matrix.shape[1]))
+    for i, loop in enumerate(loops):
+        for j, node in enumerate(loop):
+            next_node = loop[(j + 1) % len(loop)]
+            edge_number = graph.get_edge_data(node, next_node)['edge_number']
+            # check if nodes defined in clockwise loop, to keep sign convention for Hardy Cross Method
+            if (edge_node_matrix[node, edge_number] == 1) and (edge_node_matrix[next_node, edge_number] == -1):
+                clockwise = 1
+            else:
+                clockwise = -1
+            loop_edge_matrix[i, edge_number] += clockwise
+    return loop_edge_matrix
+
+
 def calc_assign_diameter(max_flow, pipe_catalog):
     if max_flow < pipe_catalog['mdot_min_kgs'].min():
         return 'DN20'  # the smallest pipe
@@ -1687,10 +1723,8 @@ def calc_pressure_nodes(t_supply_node__k, t_return_node__k, thermal_network, t):
     # A12 * H + F(Q) = -A10 * H0 = 0
     # edge_node_transpose * pressure_nodes = - (pressure_loss_pipe) (Ax = b)
     # ToDo: does not apply for looped networks
-    edge_node_transpose = np.transpose(edge_node_df.values)
     pressure_nodes_supply__pa = np.round(
-        np.transpose(
-            np.linalg.lstsq(edge_node_transpose, np.transpose(pressure_loss_pipe_supply__pa) * (-1), rcond=-1)[0]),
+        solve_node_pressures(edge_node_df.values, np.ravel(pressure_loss_pipe_supply__pa))[np.newaxis, :],
         decimals=5)
     # pressure_nodes_return__pa = np.round(
     #     np.transpose(
@@ -1887,18 +1921,19 @@ def calc_max_edge_flowrate(thermal_network, processes=1):
     """
 
     # create empty DataFrames to store results
-    if thermal_network.use_representative_week_per_month:
+    if thermal_network.uses_reduced_timesteps():
+        nhours = thermal_network.stop_t  # 2016 timesteps for representative weeks
         thermal_network.edge_mass_flow_df = pd.DataFrame(
-            data=np.zeros((2016, len(thermal_network.edge_node_df.columns.values))),
-            columns=thermal_network.edge_node_df.columns.values)  # stores values for 2016 timesteps
+            data=np.zeros((nhours, len(thermal_network.edge_node_df.columns.values))),
+            columns=thermal_network.edge_node_df.columns.values)  # stores values for simulated timesteps
 
         thermal_network.node_mass_flow_df = pd.DataFrame(
-            data=np.zeros((2016, len(thermal_network.edge_node_df.index))),
-            columns=thermal_network.edge_node_df.index.values)  # stores values for 2016 timestep
+            data=np.zeros((nhours, len(thermal_network.edge_node_df.index))),
+            columns=thermal_network.edge_node_df.index.values)  # stores values for simulated timesteps
 
         thermal_network.thermal_demand = pd.DataFrame(
-            data=np.zeros((2016, len(thermal_network.building_names))),
-            columns=thermal_network.building_names.values)  # stores values for 8760 timesteps
+            data=np.zeros((nhours, len(thermal_network.building_names))),
+            columns=thermal_network.building_names.values)  # stores values for simulated timesteps
 
     else:
         thermal_network.edge_mass_flow_df = pd.DataFrame(
@@ -1989,13 +2024,13 @@ def calc_max_edge_flowrate(thermal_network, processes=1):
         iterations += 1
 
     # output csv files with node mass flows
-    if thermal_network.use_representative_week_per_month:
-        # we need to extrapolate 8760 datapoints from 2016 points from our representative weeks.
-        # To do this, the initial dataset is repeated 4 times, the remaining values are filled with the average values of all above.
+    if thermal_network.uses_reduced_timesteps():
+        # we need to extrapolate 8760 datapoints from the simulated timesteps (representative weeks or hours).
 
         # Nominal node mass flow
         # Replace NaN with 0 (zero flow when network idle)
-        node_mass_flow_for_csv = extrapolate_datapoints_for_representative_weeks(thermal_network.node_mass_flow_df)
+        node_mass_flow_for_csv = extrapolate_datapoints_for_representative_weeks(thermal_network.node_mass_flow_df,
+                                                                                 thermal_network.timestep_mapping)
         node_mass_flow_for_csv = node_mass_flow_for_csv.fillna(0)
         node_mass_flow_for_csv.to_csv(
             thermal_network.locator.get_nominal_node_mass_flow_csv_file(thermal_network.network_type,
@@ -2003,7 +2038,8 @@ def calc_max_edge_flowrate(thermal_network, processes=1):
             index=False)
 
         # output csv files with aggregated demand
-        thermal_demand_for_csv = extrapolate_datapoints_for_representative_weeks(thermal_network.thermal_demand)
+        thermal_demand_for_csv = extrapolate_datapoints_for_representative_weeks(thermal_network.thermal_demand,
+                                                                                 thermal_network.timestep_mapping)
         thermal_demand_for_csv.to_csv(
             thermal_network.locator.get_thermal_demand_csv_file(thermal_network.network_type,
                                                                 thermal_network.network_name),
@@ -2035,7 +2071,7 @@ def load_max_edge_flowrate_from_previous_run(thermal_network):
     del edge_mass_flow_df['Unnamed: 0']
     # max_edge_mass_flow_df = pd.DataFrame(data=[(edge_mass_flow_df.abs()).max(axis=0)],
     #                                     columns=thermal_network.edge_node_df.columns)
-    return edge_mass_flow_df
+    return cut_out_timesteps_of_previous_run(thermal_network, edge_mass_flow_df)
 
 
 def load_node_flowrate_from_previous_run(thermal_network):
@@ -2045,7 +2081,20 @@ def load_node_flowrate_from_previous_run(thermal_network):
                                                                     thermal_network.network_name))
     # max_edge_mass_flow_df = pd.DataFrame(data=[(edge_mass_flow_df.abs()).max(axis=0)],
     #                                     columns=thermal_network.edge_node_df.columns)
-    return node_mass_flow_df
+    return cut_out_timesteps_of_previous_run(thermal_network, node_mass_flow_df)
+
+
+def cut_out_timesteps_of_previous_run(thermal_network, hourly_results_df):
+    """
+    Cut the annual (8760 hours) results of a previous run down to the hours simulated in this run, the same way as
+    the inputs in :py:func:`cut_out_timesteps`, so that timestep ``t`` reads the results of its representative hour.
+
+    With representative weeks, the annual results repeat the simulated timesteps from the start of the year (see
+    :py:func:`extrapolate_datapoints_for_representative_weeks`), so their first rows are already in timestep order.
+    """
+    if thermal_network.simulated_hours is None:
+        return hourly_results_df
+    return hourly_results_df.iloc[thermal_network.simulated_hours].reset_index(drop=True)
 
 
 def read_in_diameters_from_shapefile(thermal_network):
@@ -2273,8 +2322,8 @@ def initial_diameter_guess(thermal_network):
 
     # Identify time steps of highest 50 demands
     if thermal_network.network_type == 'DH':
-        if thermal_network.use_representative_week_per_month:
-            heating_sum = np.zeros(2016)
+        if thermal_network.uses_reduced_timesteps():
+            heating_sum = np.zeros(thermal_network.stop_t)
         else:
             heating_sum = np.zeros(HOURS_IN_YEAR)
         for building in thermal_network.buildings_demands.keys():
@@ -2286,8 +2335,8 @@ def initial_diameter_guess(thermal_network):
                         'Qhs_sys_' + system + '_kWh']
         timesteps_top_demand = np.argsort(heating_sum)[-50:]  # identifies 50 time steps with largest demand
     else:
-        if thermal_network.use_representative_week_per_month:
-            cooling_sum = np.zeros(2016)
+        if thermal_network.uses_reduced_timesteps():
+            cooling_sum = np.zeros(thermal_network.stop_t)
         else:
             cooling_sum = np.zeros(HOURS_IN_YEAR)
         for building in thermal_network.buildings_demands.keys():  # sum up cooling demands of all buildings to create (1xt) array
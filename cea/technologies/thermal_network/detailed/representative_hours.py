@@ -0,0 +1,179 @@
+"""
+Load-clustered representative hours for the detailed thermal network.
+
+Instead of simulating every hour of the year, the hours are clustered (k-medoids) on the hourly substation loads and
+target supply temperatures of all buildings connected to the network. The network is only simulated at the medoid of
+each cluster; every other hour takes the results of the medoid of its cluster. The peak hour is always kept as its own
+representative so that the network is sized and checked at its design condition.
+"""
+
+import collections
+
+import numpy as np
+
+from cea.constants import HOURS_IN_YEAR
+
+__author__ = "Daren Thomas"
+__copyright__ = "Copyright 2016, Architecture and Building Systems - ETH Zurich"
+__credits__ = ["Martin Mosteiro Romero", "Shanshan Hsieh", "Lennart Rogenhofer", "Daren Thomas"]
+__license__ = "MIT"
+__version__ = "0.1"
+__maintainer__ = "Daren Thomas"
+__email__ = "thomas@arch.ethz.ch"
+__status__ = "Production"
+
+# number of principal components the load profiles are projected on before clustering
+MAX_FEATURES = 32
+
+# hours: representative hours of the year (ascending)
+# weights: number of hours of the year represented by each representative hour (sums to 8760)
+# timestep_mapping: index into `hours` of the representative of each hour of the year (8760 x 1)
+# annual_load_error: relative error of the reconstructed annual substation load [-]
+# max_load_deviation_kW: largest difference between the reconstructed and actual hourly substation load [kW]
+RepresentativeHours = collections.namedtuple('RepresentativeHours',
+                                             ['hours', 'weights', 'timestep_mapping', 'annual_load_error',
+                                              'max_load_deviation_kW'])
+
+
+def calc_substation_load_profiles(buildings_demands, network_type, t_ground_k=None):
+    """
+    Assemble the hourly feature vectors used to cluster the hours of the year: the substation load and target supply
+    temperature of each building (and the ground temperature, if given), each scaled to the range [0, 1].
+
+    :param dict buildings_demands: demand of each building as returned by
+                                   :py:func:`cea.technologies.thermal_network.detailed.substation.determine_building_supply_temperatures`
+    :param str network_type: 'DH' or 'DC'
+    :param t_ground_k: ground temperature at each hour of the year (t x 1)
+
+    :return features: scaled feature vector of each hour (t x f)
+    :return total_load_kW: total substation load of the network at each hour (t x 1)
+    :rtype features: ndarray
+    :rtype total_load_kW: ndarray
+    """
+    load_column = 'Q_substation_heating' if network_type == 'DH' else 'Q_substation_cooling'
+    temperature_column = 'T_sup_target_' + network_type
+
+    columns = []
+    for demand_df in buildings_demands.values():
+        columns.append(np.abs(np.nan_to_num(np.asarray(demand_df[load_column], dtype=float))))
+        columns.append(np.nan_to_num(np.asarray(demand_df[temperature_column], dtype=float)))
+    if t_ground_k is not None:
+        columns.append(np.asarray(t_ground_k, dtype=float))
+
+    features = np.column_stack(columns)
+    total_load_kW = features[:, 0:2 * len(buildings_demands):2].sum(axis=1)
+
+    value_range = features.max(axis=0) - features.min(axis=0)
+    value_range[value_range == 0] = 1.0
+    features = (features - features.min(axis=0)) / value_range
+    return features, total_load_kW
+
+
+def reduce_features(features, max_features=MAX_FEATURES):
+    """Project the feature vectors on their first ``max_features`` principal components (distances are preserved up
+    to the discarded variance)."""
+    if features.shape[1] <= max_features:
+        return features
+    centered = features - features.mean(axis=0)
+    u, s, _ = np.linalg.svd(centered, full_matrices=False)
+    return u[:, :max_features] * s[:max_features]
+
+
+def calc_distances(points_a, points_b):
+    """Euclidean distance matrix between two sets of points (a x f) and (b x f)."""
+    squared = (np.sum(points_a ** 2, axis=1)[:, np.newaxis] + np.sum(points_b ** 2, axis=1)[np.newaxis, :]
+               - 2 * points_a @ points_b.T)
+    return np.sqrt(np.maximum(squared, 0.0))
+
+
+def k_medoids(features, n_clusters, pinned=(), max_iterations=50, seed=0):
+    """
+    Cluster the rows of ``features`` with the alternating (Voronoi iteration) k-medoids algorithm, initialized with
+    k-medoids++.
+
+    :param ndarray features: feature vector of each point (t x f)
+    :param int n_clusters: number of clusters
+    :param pinned: indexes of points that are always kept as medoids
+    :param int max_iterations: maximum number of assignment / update iterations
+    :param int seed: seed of the random initialization
+
+    :return medoids: index of the medoid of each cluster (k x 1)
+    :return labels: cluster of each point (t x 1)
+    :rtype medoids: ndarray
+    :rtype labels: ndarray
+    """
+    rng = np.random.default_rng(seed)
+    n_points = features.shape[0]
+    n_clusters = min(n_clusters, n_points)
+    pinned = list(dict.fromkeys(pinned))[:n_clusters]
+
+    # k-medoids++ initialization
+    medoids = list(pinned) if pinned else [int(rng.integers(n_points))]
+    closest = calc_distances(features, features[medoids]).min(axis=1)
+    while len(medoids) < n_clusters:
+        if closest.sum() == 0:
+            candidates = np.setdiff1d(np.arange(n_points), medoids)
+            new_medoid = int(rng.choice(candidates))
+        else:
+            new_medoid = int(rng.choice(n_points, p=closest ** 2 / np.sum(closest ** 2)))
+        medoids.append(new_medoid)
+        closest = np.minimum(closest, calc_distances(features, features[[new_medoid]])[:, 0])
+    medoids = np.array(medoids)
+
+    labels = None
+    for _ in range(max_iterations):
+        labels = calc_distances(features, features[medoids]).argmin(axis=1)
+        labels[medoids] = np.arange(n_clusters)
+        new_medoids = medoids.copy()
+        for cluster in range(len(pinned), n_clusters):
+            members = np.where(labels == cluster)[0]
+            cost = calc_distances(features[members], features[members]).sum(axis=1)
+            new_medoids[cluster] = members[cost.argmin()]
+        if np.array_equal(new_medoids, medoids):
+            break
+        medoids = new_medoids
+
+    labels = calc_distances(features, features[medoids]).argmin(axis=1)
+    labels[medoids] = np.arange(n_clusters)
+    return medoids, labels
+
+
+def select_representative_hours(buildings_demands, network_type, n_hours, t_ground_k=None, seed=0):
+    """
+    Select ``n_hours`` representative hours of the year for the detailed thermal network simulation.
+
+    :param dict buildings_demands: demand of each building (8760 rows each)
+    :param str network_type: 'DH' or 'DC'
+    :param int n_hours: number of representative hours
+    :param t_ground_k: ground temperature at each hour of the year (8760 x 1)
+    :param int seed: seed of the clustering
+
+    :rtype: RepresentativeHours
+    """
+    features, total_load_kW = calc_substation_load_profiles(buildings_demands, network_type, t_ground_k)
+    features = reduce_features(features)
+    peak_hour = int(np.argmax(total_load_kW))
+    medoids, labels = k_medoids(features, n_hours, pinned=[peak_hour], seed=seed)
+
+    order = np.argsort(medoids)
+    hours = medoids[order]
+    timestep_mapping = np.argsort(order)[labels]
+    weights = np.bincount(timestep_mapping, minlength=len(hours))
+
+    reconstructed_load_kW = total_load_kW[hours][timestep_mapping]
+    annual_load_kWh = total_load_kW.sum()
+    annual_load_error = (abs(reconstructed_load_kW.sum() - annual_load_kWh) / annual_load_kWh
+                         if annual_load_kWh > 0 else 0.0)
+    max_load_deviation_kW = float(np.abs(reconstructed_load_kW - total_load_kW).max())
+
+    return RepresentativeHours(hours=hours, weights=weights, timestep_mapping=timestep_mapping,
+                               annual_load_error=annual_load_error, max_load_deviation_kW=max_load_deviation_kW)
+
+
+def print_representative_hours_report(representative_hours):
+    print('Simulating {n} representative hours instead of {hours_in_year} hours of the year'.format(
+        n=len(representative_hours.hours), hours_in_year=HOURS_IN_YEAR))
+    print('  - annual substation load reconstruction error: {error:.2%}'.format(
+        error=representative_hours.annual_load_error))
+    print('  - maximum hourly substation load deviation: {deviation:.1f} kW'.format(
+        deviation=representative_hours.max_load_deviation_kW))
@@ -0,0 +1,266 @@
+"""
+Sparse incidence-matrix solvers for the detailed thermal network.
+
+The hydraulic equations of the detailed thermal network are built on the edge-node incidence matrix (n x e), which only
+has two non-zero entries per edge. Solving them with dense ``np.linalg`` routines costs O(n³) per timestep, even
+though the topology of the network does not change between timesteps or diameter iterations.
+
+This module compiles the incidence matrix into ``scipy.sparse`` format and factorizes it once per topology. Flow
+reversals only flip the sign of a column of the incidence matrix (A' = A·D, with D a diagonal matrix of ±1), so they are
+handled by a sign vector instead of a new factorization:
+
+- tree networks: A' x = b  ->  x = D · A⁻¹ b
+- looped networks (minimum-norm solution, as ``np.linalg.lstsq``): x = A'ᵀ (A' A'ᵀ)⁻¹ b, where A' A'ᵀ = A Aᵀ
+- node pressures (least squares of A'ᵀ p = -Δp): L p = -A' Δp, with L = A Aᵀ the (singular) graph Laplacian
+"""
+
+import hashlib
+import time
+import tracemalloc
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import splu
+
+__author__ = "Daren Thomas"
+__copyright__ = "Copyright 2016, Architecture and Building Systems - ETH Zurich"
+__credits__ = ["Martin Mosteiro Romero", "Shanshan Hsieh", "Lennart Rogenhofer", "Daren Thomas"]
+__license__ = "MIT"
+__version__ = "0.1"
+__maintainer__ = "Daren Thomas"
+__email__ = "thomas@arch.ethz.ch"
+__status__ = "Production"
+
+
+class IncidenceMatrixSolver(object):
+    """
+    Factorizations of an edge-node incidence matrix, reusable across timesteps, flow reversals and diameter iterations.
+
+    Use :py:meth:`for_edge_node_matrix` to get the (cached) solver for a given edge-node matrix. Factorizations are
+    computed lazily the first time they are needed.
+
+    :ivar ndarray source_nodes: index of the node each edge leaves in the reference orientation (e x 1)
+    :ivar ndarray target_nodes: index of the node each edge points to in the reference orientation (e x 1)
+    :ivar csc_matrix incidence: sparse incidence matrix in the reference orientation (n x e)
+    :ivar bool is_connected: True if all nodes belong to one connected network
+    """
+    topology_cache = {}  # {topology_key: IncidenceMatrixSolver}
+
+    def __init__(self, source_nodes, target_nodes, number_of_nodes):
+        self.source_nodes = source_nodes
+        self.target_nodes = target_nodes
+        self.number_of_nodes = number_of_nodes
+        self.number_of_edges = len(source_nodes)
+
+        edges = np.arange(self.number_of_edges)
+        self.incidence = sp.csc_matrix(
+            (np.concatenate([np.ones(self.number_of_edges), -np.ones(self.number_of_edges)]),
+             (np.concatenate([target_nodes, source_nodes]), np.concatenate([edges, edges]))),
+            shape=(number_of_nodes, self.number_of_edges))
+
+        adjacency = sp.csr_matrix((np.ones(self.number_of_edges), (source_nodes, target_nodes)),
+                                  shape=(number_of_nodes, number_of_nodes))
+        n_components, _ = connected_components(adjacency, directed=False)
+        self.is_connected = n_components == 1
+
+        self._reduced_lu = {}  # {removed_node: splu(A without row removed_node)}
+        self._reduced_laplacian_lu = {}  # {removed_node: splu(L without row and column removed_node)}
+
+    @staticmethod
+    def topology_of(edge_node_matrix):
+        """
+        Extract the reference orientation of an edge-node matrix and the orientation of each edge relative to it.
+
+        :param ndarray edge_node_matrix: edge-node matrix with a +1 (edge points to node) and -1 (edge leaves node)
+                                         entry for each edge (n x e)
+        :return: (source_nodes, target_nodes, orientation) where orientation is +1 for edges that follow the reference
+                 orientation (lower node index -> higher node index) and -1 for reversed edges
+        """
+        pointing_to = edge_node_matrix.argmax(axis=0)
+        leaving = edge_node_matrix.argmin(axis=0)
+        source_nodes = np.minimum(pointing_to, leaving)
+        target_nodes = np.maximum(pointing_to, leaving)
+        orientation = np.where(pointing_to == target_nodes, 1.0, -1.0)
+        return source_nodes, target_nodes, orientation
+
+    @classmethod
+    def for_edge_node_matrix(cls, edge_node_matrix):
+        """
+        Return the solver for the topology of ``edge_node_matrix`` together with the orientation of its edges.
+
+        :param edge_node_matrix: edge-node matrix (n x e)
+        :type edge_node_matrix: ndarray or DataFrame
+        :return: (solver, orientation)
+        :rtype: (IncidenceMatrixSolver, ndarray)
+        """
+        edge_node_matrix = np.asarray(edge_node_matrix, dtype=float)
+        source_nodes, target_nodes, orientation = cls.topology_of(edge_node_matrix)
+        number_of_nodes = edge_node_matrix.shape[0]
+        topology_key = hashlib.sha1(np.concatenate([[number_of_nodes], source_nodes, target_nodes])
+                                    .astype(np.int64).tobytes()).hexdigest()
+        if topology_key not in cls.topology_cache:
+            cls.topology_cache[topology_key] = cls(source_nodes, target_nodes, number_of_nodes)
+        return cls.topology_cache[topology_key], orientation
+
+    def _keep_rows(self, removed_node):
+        return np.delete(np.arange(self.number_of_nodes), removed_node)
+
+    def _get_reduced_lu(self, removed_node):
+        if removed_node not in self._reduced_lu:
+            reduced = self.incidence[self._keep_rows(removed_node), :]
+            self._reduced_lu[removed_node] = splu(sp.csc_matrix(reduced))
+        return self._reduced_lu[removed_node]
+
+    def _get_reduced_laplacian_lu(self, removed_node):
+        if removed_node not in self._reduced_laplacian_lu:
+            reduced = self.incidence[self._keep_rows(removed_node), :]
+            self._reduced_laplacian_lu[removed_node] = splu(sp.csc_matrix(reduced @ reduced.T))
+        return self._reduced_laplacian_lu[removed_node]
+
+    def solve_edge_flows(self, orientation, node_flows, removed_node):
+        """
+        Solve the mass balance A x = b for the edge mass flows, after removing the (redundant) equation of one node.
+
+        For tree networks the reduced system is square and the exact solution is returned. For looped networks the
+        minimum-norm solution is returned, which is the initial guess ``np.linalg.lstsq`` would produce.
+
+        :param ndarray orientation: orientation of each edge relative to the reference orientation (e x 1)
+        :param ndarray node_flows: mass flow at each node, including the removed node (n x 1)
+        :param int removed_node: index of the node whose equation is dropped (usually a plant)
+        :return: mass flow in each edge (e x 1)
+        :rtype: ndarray
+        """
+        b = np.delete(np.asarray(node_flows, dtype=float), removed_node)
+        if self.number_of_edges == self.number_of_nodes - 1:
+            return orientation * self._get_reduced_lu(removed_node).solve(b)
+        reduced = self.incidence[self._keep_rows(removed_node), :]
+        y = self._get_reduced_laplacian_lu(removed_node).solve(b)
+        return orientation * (reduced.T @ y)
+
+    def solve_node_pressures(self, orientation, edge_pressure_loss):
+        """
+        Least squares solution of A'ᵀ p = -Δp for the pressure at each node (minimum norm, i.e. zero mean pressure),
+        which is the solution ``np.linalg.lstsq(A'ᵀ, -Δp)`` returns for a connected network.
+
+        :param ndarray orientation: orientation of each edge relative to the reference orientation (e x 1)
+        :param ndarray edge_pressure_loss: pressure loss through each edge (e x 1)
+        :return: pressure at each node (n x 1)
+        :rtype: ndarray
+        """
+        rhs = -(self.incidence @ (orientation * np.asarray(edge_pressure_loss, dtype=float)))
+        pressure = np.zeros(self.number_of_nodes)
+        pressure[1:] = self._get_reduced_laplacian_lu(0).solve(rhs[1:])
+        return pressure - pressure.mean()
+
+
+def solve_edge_flows(edge_node_matrix, node_flows, removed_node):
+    """
+    Solve the node mass balance of a thermal network for the edge mass flows, reusing the factorization of the network
+    topology where possible. Falls back to the dense solution for networks that are not connected.
+
+    :param edge_node_matrix: edge-node matrix of the network (n x e)
+    :param ndarray node_flows: mass flow at each node (n x 1)
+    :param int removed_node: index of the node whose (redundant) equation is dropped
+    :return: mass flow in each edge (e x 1)
+    :rtype: ndarray
+    """
+    solver, orientation = IncidenceMatrixSolver.for_edge_node_matrix(edge_node_matrix)
+    if solver.is_connected:
+        return solver.solve_edge_flows(orientation, node_flows, removed_node)
+    return dense_solve_edge_flows(edge_node_matrix, node_flows, removed_node)
+
+
+def solve_node_pressures(edge_node_matrix, edge_pressure_loss):
+    """
+    Solve for the pressure at each node given the pressure loss through each edge, reusing the factorization of the
+    network topology where possible. Falls back to the dense solution for networks that are not connected.
+
+    :param edge_node_matrix: edge-node matrix of the network (n x e)
+    :param ndarray edge_pressure_loss: pressure loss through each edge (e x 1)
+    :return: pressure at each node (n x 1)
+    :rtype: ndarray
+    """
+    solver, orientation = IncidenceMatrixSolver.for_edge_node_matrix(edge_node_matrix)
+    if solver.is_connected:
+        return solver.solve_node_pressures(orientation, edge_pressure_loss)
+    return dense_solve_node_pressures(edge_node_matrix, edge_pressure_loss)
+
+
+def dense_solve_edge_flows(edge_node_matrix, node_flows, removed_node):
+    """Dense reference implementation of :py:func:`solve_edge_flows`."""
+    A = np.delete(np.asarray(edge_node_matrix, dtype=float), removed_node, axis=0)
+    b = np.delete(np.asarray(node_flows, dtype=float), removed_node)
+    if A.shape[0] == A.shape[1]:
+        return np.linalg.solve(A, b)
+    return np.linalg.lstsq(A, b, rcond=-1)[0]
+
+
+def dense_solve_node_pressures(edge_node_matrix, edge_pressure_loss):
+    """Dense reference implementation of :py:func:`solve_node_pressures`."""
+    edge_node_transpose = np.transpose(np.asarray(edge_node_matrix, dtype=float))
+    return np.linalg.lstsq(edge_node_transpose, -np.asarray(edge_pressure_loss, dtype=float), rcond=-1)[0]
+
+
+def create_random_network(number_of_nodes, number_of_loops=0, seed=0):
+    """
+    Create the edge-node matrix of a random connected network (a random spanning tree plus ``number_of_loops``
+    additional edges) with a plant at node 0, together with node mass flows that balance at the plant.
+
+    :return: (edge_node_matrix, node_flows)
+    """
+    rng = np.random.default_rng(seed)
+    parents = [rng.integers(0, node) for node in range(1, number_of_nodes)]
+    edges = list(zip(parents, range(1, number_of_nodes)))
+    existing = set(edges)
+    while len(edges) < number_of_nodes - 1 + number_of_loops:
+        u, v = sorted(rng.choice(number_of_nodes, size=2, replace=False))
+        if (u, v) not in existing:
+            existing.add((u, v))
+            edges.append((u, v))
+
+    edge_node_matrix = np.zeros((number_of_nodes, len(edges)))
+    for e, (u, v) in enumerate(edges):
+        edge_node_matrix[u, e] = -1
+        edge_node_matrix[v, e] = 1
+    node_flows = np.concatenate([[0.0], rng.uniform(0.1, 5.0, number_of_nodes - 1)])
+    node_flows[0] = -node_flows[1:].sum()
+    return edge_node_matrix, node_flows
+
+
+def benchmark(number_of_nodes=2000, number_of_loops=0, timesteps=24):
+    """
+    Compare speed and peak memory of the sparse and dense solvers on a random network, solving the edge flows and node
+    pressures of ``timesteps`` timesteps with random flow reversals.
+
+    :return: {'dense': (seconds, peak_bytes), 'sparse': (seconds, peak_bytes)}
+    """
+    edge_node_matrix, node_flows = create_random_network(number_of_nodes, number_of_loops)
+    rng = np.random.default_rng(1)
+    reversals = [np.where(rng.random(edge_node_matrix.shape[1]) < 0.05, -1.0, 1.0) for _ in range(timesteps)]
+
+    results = {}
+    for name, solve_flows, solve_pressures in [('dense', dense_solve_edge_flows, dense_solve_node_pressures),
+                                               ('sparse', solve_edge_flows, solve_node_pressures)]:
+        IncidenceMatrixSolver.topology_cache.clear()
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        for reversal in reversals:
+            matrix_t = edge_node_matrix * reversal
+            edge_flows = solve_flows(matrix_t, node_flows, 0)
+            solve_pressures(matrix_t, edge_flows * np.abs(edge_flows))
+        results[name] = (time.perf_counter() - t0, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return results
+
+
+def main():
+    for number_of_nodes, number_of_loops in [(200, 0), (200, 10), (2000, 0), (2000, 50)]:
+        results = benchmark(number_of_nodes, number_of_loops)
+        print('nodes={number_of_nodes}, loops={number_of_loops}: '.format(**locals()) + ', '.join(
+            '{name} {seconds:.3f} s / {peak:.1f} MB'.format(name=name, seconds=seconds, peak=peak / 1e6)
+            for name, (seconds, peak) in results.items()))
+
+
+if __name__ == '__main__':
+    main()
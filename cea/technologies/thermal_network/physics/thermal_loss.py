@@ -1,3 +1,5 @@
+import numpy as np
+
 from cea.constants import HEAT_CAPACITY_OF_WATER_JPERKGK
 
 
@@ -26,19 +28,21 @@ def calc_temperature_out_per_pipe(t_in, m, k, t_ground):
 
     Parameters
     ----------
-    t_in : float
+    t_in : float or ndarray
         Inlet temperature [K]
-    m : float
+    m : float or ndarray
         Mass flow rate [kg/s]
-    k : float
+    k : float or ndarray
         Aggregated thermal loss coefficient [kW/K]
         (calculated using calc_aggregated_heat_conduction_coefficient)
-    t_ground : float
+    t_ground : float or ndarray
         Ground temperature [K]
 
+    Array arguments are broadcast against each other.
+
     Returns
     -------
-    float
+    float or ndarray
         Outlet temperature [K]
 
     Raises
@@ -72,7 +76,11 @@ def calc_temperature_out_per_pipe(t_in, m, k, t_ground):
     denominator = -m * cp_kW_per_kgK - k / 2
 
     # Check for division by zero
-    if abs(denominator) < 1e-10:
+    near_zero = np.abs(denominator) < 1e-10
+    if np.any(near_zero):
+        if np.ndim(near_zero) > 0:
+            # report the first offending element when called with arrays
+            m, k, denominator = (np.broadcast_to(value, near_zero.shape)[near_zero][0] for value in (m, k, denominator))
         raise ValueError(
             f"Invalid thermal network configuration - denominator near zero in temperature calculation!\n"
             f"Mass flow rate (m): {m:.6f} kg/s\n"
@@ -0,0 +1,161 @@
+"""
+Persistent EPANET (wntr) model of a thermal network for the simplified thermal network model.
+
+The simplified model runs EPANET several times on the same network (pipe sizing, pressure drops, final utilization)
+and the multi-phase workflow simulates the same phase networks again with optimised pipe diameters. Instead of
+rebuilding the ``WaterNetworkModel`` every time, the model is built once per topology and the diameters, demand
+patterns and reservoir head pattern are patched in place between simulations.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import wntr
+
+__author__ = "Jimeno A. Fonseca"
+__copyright__ = "Copyright 2019, Architecture and Building Systems - ETH Zurich"
+__credits__ = ["Jimeno A. Fonseca"]
+__license__ = "MIT"
+__version__ = "0.1"
+__maintainer__ = "Daren Thomas"
+__email__ = "cea@arch.ethz.ch"
+__status__ = "Production"
+
+RESERVOIR_PATTERN = 'reservoir'
+
+
+class EpanetNetworkModel(object):
+    """
+    A ``wntr.network.WaterNetworkModel`` of a thermal network that is kept alive across simulations.
+
+    Use :py:meth:`for_network` to get the model of a network: models are cached by topology (nodes, pipes and
+    hydraulic options), so repeated simulations of the same network only patch the values that change.
+
+    :ivar wn: the underlying water network model
+    :ivar plant_node: name of the plant node (modelled as a reservoir)
+    :ivar consumer_nodes: names of the consumer nodes
+    :ivar building_nodes_pairs: building connected to each consumer node
+    """
+    model_cache = OrderedDict()  # {topology_key: EpanetNetworkModel}
+    max_cached_models = 16
+
+    def __init__(self, node_df, edge_df, design_head_m, roughness, fraction_equivalent_length):
+        self.design_head_m = design_head_m
+        self.wn = wntr.network.WaterNetworkModel()
+        self.consumer_nodes = []
+        self.building_nodes_pairs = {}
+        self.plant_node = None
+
+        # demand patterns are added with a flat profile and patched in set_demands
+        for building in node_df.loc[node_df['type'] == 'CONSUMER', 'building'].unique():
+            self.wn.add_pattern(building, [0.0])
+
+        # add nodes
+        for node_name, node in node_df.iterrows():
+            if node['type'] == 'CONSUMER':
+                self.consumer_nodes.append(node_name)
+                self.building_nodes_pairs[node_name] = node['building']
+                self.wn.add_junction(node_name,
+                                     base_demand=0.0,
+                                     demand_pattern=node['building'],
+                                     elevation=design_head_m,
+                                     coordinates=node['coordinates'])
+            elif 'PLANT' in str(node['type']):
+                self.plant_node = node_name
+                self.wn.add_reservoir(node_name,
+                                      base_head=self.plant_base_head_m,
+                                      coordinates=node['coordinates'])
+            else:
+                self.wn.add_junction(node_name,
+                                     elevation=0,
+                                     coordinates=node['coordinates'])
+
+        # add pipes
+        for edge_name, edge in edge_df.iterrows():
+            self.wn.add_pipe(edge_name, edge['start node'], edge['end node'],
+                             length=edge['length_m'] * (1 + fraction_equivalent_length),
+                             roughness=roughness,
+                             minor_loss=0.0,
+                             initial_status='OPEN')
+        self.initial_diameters_m = {name: pipe.diameter for name, pipe in self.wn.pipes()}
+
+        # add options
+        self.wn.options.time.duration = 8759 * 3600  # this indicates epanet to do one year simulation
+        self.wn.options.time.hydraulic_timestep = 60 * 60
+        self.wn.options.time.pattern_timestep = 60 * 60
+        self.wn.options.hydraulic.accuracy = 0.01
+        self.wn.options.hydraulic.trials = 100
+
+    @property
+    def plant_base_head_m(self):
+        return int(self.design_head_m * 1.2)
+
+    @staticmethod
+    def topology_key(node_df, edge_df, design_head_m, roughness, fraction_equivalent_length):
+        nodes = [(name, str(node['type']), str(node['building']), tuple(node['coordinates']))
+                 for name, node in node_df.iterrows()]
+        edges = [(name, edge['start node'], edge['end node'], float(edge['length_m']))
+                 for name, edge in edge_df.iterrows()]
+        description = repr((nodes, edges, design_head_m, roughness, fraction_equivalent_length))
+        return hashlib.sha1(description.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def for_network(cls, node_df, edge_df, design_head_m, roughness, fraction_equivalent_length):
+        """
+        Return the (cached) model of a network, reset to its initial pipe diameters and plant head.
+
+        :param node_df: nodes of the network as returned by ``extract_network_from_shapefile``
+        :param edge_df: edges of the network as returned by ``extract_network_from_shapefile``
+        :param float design_head_m: design head of the thermal transfer units (substations) [m]
+        :param float roughness: Hazen-Williams friction coefficient of the pipes
+        :param float fraction_equivalent_length: fraction of pipe length added to account for accessories
+        :rtype: EpanetNetworkModel
+        """
+        key = cls.topology_key(node_df, edge_df, design_head_m, roughness, fraction_equivalent_length)
+        if key in cls.model_cache:
+            cls.model_cache.move_to_end(key)
+        else:
+            cls.model_cache[key] = cls(node_df, edge_df, design_head_m, roughness, fraction_equivalent_length)
+            while len(cls.model_cache) > cls.max_cached_models:
+                cls.model_cache.popitem(last=False)
+        model = cls.model_cache[key]
+        model.reset()
+        return model
+
+    def reset(self):
+        """Restore the pipe diameters and plant head the model was built with."""
+        self.set_diameters(self.initial_diameters_m)
+        reservoir = self.wn.get_node(self.plant_node)
+        reservoir.head_timeseries.base_value = self.plant_base_head_m
+        reservoir.head_timeseries._pattern = None
+
+    def set_demands(self, building_base_demand_m3s, building_patterns):
+        """
+        Set the base demand and hourly demand pattern of each consumer node.
+
+        :param dict building_base_demand_m3s: base (peak) volume flow of each building [m3/s]
+        :param dict building_patterns: hourly demand multipliers of each building (relative to the base demand)
+        """
+        for building, pattern in building_patterns.items():
+            self.wn.get_pattern(building).multipliers = pattern
+        for node_name, building in self.building_nodes_pairs.items():
+            self.wn.get_node(node_name).demand_timeseries_list[0].base_value = building_base_demand_m3s[building]
+
+    def set_diameters(self, diameter_int_m):
+        """Set the internal diameter of each pipe [m] (any mapping of pipe name to diameter)."""
+        for pipe_name, diameter_m in diameter_int_m.items():
+            self.wn.get_link(pipe_name).diameter = diameter_m
+
+    def set_plant_head_pattern(self, base_head_m, pattern_head):
+        """Apply an hourly head pattern to the plant (reservoir) node."""
+        if RESERVOIR_PATTERN in self.wn.pattern_name_list:
+            self.wn.get_pattern(RESERVOIR_PATTERN).multipliers = pattern_head
+        else:
+            self.wn.add_pattern(RESERVOIR_PATTERN, pattern_head)
+        reservoir = self.wn.get_node(self.plant_node)
+        reservoir.head_timeseries.base_value = int(base_head_m)
+        reservoir.head_timeseries._pattern = RESERVOIR_PATTERN
+
+    def run(self):
+        """Run an EPANET simulation of the model in the current working directory."""
+        return wntr.sim.EpanetSimulator(self.wn).run_sim()
@@ -17,6 +17,7 @@ from cea.optimization.preprocessing.preprocessing_main import get_building_names
 from cea.technologies.thermal_network.common.geometry import extract_network_from_shapefile, load_network_shapefiles
 from cea.technologies.thermal_network.common.utils import add_date_to_dataframe, calculate_ground_temperature
 from cea.technologies.thermal_network.physics import calc_temperature_out_per_pipe
+from cea.technologies.thermal_network.simplified.epanet_model import EpanetNetworkModel
 from cea.technologies.network_layout.plant_node_operations import PlantServices
 
 
@@ -384,6 +385,10 @@ def calc_linear_thermal_loss_coefficient(diameter_ext_m, diameter_int_m, diamete
     return K_WperKm
 
 def calc_thermal_loss_per_pipe(T_in_K, m_kgpers, T_ground_K, k_kWperK):
+    """
+    Thermal loss of a pipe [kWh]. All arguments may be arrays that broadcast against each other, e.g. (hours x 1)
+    temperatures, (hours x pipes) mass flows and (pipes) loss coefficients to calculate all pipes at once.
+    """
     T_out_K = calc_temperature_out_per_pipe(T_in_K, m_kgpers, k_kWperK, T_ground_K)
     DT = T_in_K - T_out_K
     Q_loss_kWh = DT * m_kgpers * HEAT_CAPACITY_OF_WATER_JPERKGK / 1000
@@ -812,11 +817,9 @@ def thermal_network_simplified(locator: cea.inputlocator.InputLocator, config: c
     #   are transformed in a way that they can be properly interpreted by epanet.
     import cea.utilities
     with cea.utilities.pushd(locator.get_output_thermal_network_type_folder(network_type, network_name)):
-        # Create a water network model
-        wn = wntr.network.WaterNetworkModel()
-
         # add loads
         building_base_demand_m3s = {}
+        building_patterns = {}
         building_nodes = node_df[node_df["type"] == "CONSUMER"]
         for node in building_nodes.iterrows():
             building = node[1]['building']
@@ -828,12 +831,12 @@ def thermal_network_simplified(locator: cea.inputlocator.InputLocator, config: c
                     "Setting base demand to 0."
                 )
                 building_base_demand_m3s[building] = 0
-                wn.add_pattern(building, [0]*len(volume_flow_m3pers_building))
+                building_patterns[building] = [0]*len(volume_flow_m3pers_building)
                 continue
 
             building_base_demand_m3s[building] = volume_flow_m3pers_building[building].max()
             pattern_demand = (volume_flow_m3pers_building[building].values / building_base_demand_m3s[building]).tolist()
-            wn.add_pattern(building, pattern_demand)
+            building_patterns[building] = pattern_demand
         
         # check that there is one plant node
         plant_nodes = node_df[node_df['type'].str.contains('PLANT', na=False)]
@@ -847,60 +850,20 @@ def thermal_network_simplified(locator: cea.inputlocator.InputLocator, config: c
         consumer_nodes = node_df[node_df['type'] == 'CONSUMER'].index.tolist()
         validate_network_topology_for_wntr(edge_df, node_df, consumer_nodes, plant_nodes, network_type)
 
-        # add nodes
-        consumer_nodes = []
-        building_nodes_pairs = {}
-        building_nodes_pairs_inversed = {}
-        for node in node_df.iterrows():
-            if node[1]["type"] == "CONSUMER":
-                demand_pattern = node[1]['building']
-                base_demand_m3s = building_base_demand_m3s[demand_pattern]
-                consumer_nodes.append(node[0])
-                building_nodes_pairs[node[0]] = demand_pattern
-                building_nodes_pairs_inversed[demand_pattern] = node[0]
-                wn.add_junction(node[0],
-                                base_demand=base_demand_m3s,
-                                demand_pattern=demand_pattern,
-                                elevation=thermal_transfer_unit_design_head_m,
-                                coordinates=node[1]["coordinates"])
-            elif 'PLANT' in str(node[1]["type"]):
-                base_head = int(thermal_transfer_unit_design_head_m*1.2)
-                start_node = node[0]
-                name_node_plant = start_node
-                wn.add_reservoir(start_node,
-                                 base_head=base_head,
-                                 coordinates=node[1]["coordinates"])
-            else:
-                wn.add_junction(node[0],
-                                elevation=0,
-                                coordinates=node[1]["coordinates"])
-
-        # add pipes (edge endpoints already validated in validate_network_topology_for_wntr)
-        for edge in edge_df.iterrows():
-            length_m = edge[1]["length_m"]
-            edge_name = edge[0]
-            start_node = edge[1]["start node"]
-            end_node = edge[1]["end node"]
-            
-            wn.add_pipe(edge_name, start_node, end_node,
-                        length=length_m * (1 + fraction_equivalent_length),
-                        roughness=coefficient_friction_hazen_williams,
-                        minor_loss=0.0,
-                        initial_status='OPEN')
-
-        # add options
-        wn.options.time.duration = 8759 * 3600   # this indicates epanet to do one year simulation
-        wn.options.time.hydraulic_timestep = 60 * 60
-        wn.options.time.pattern_timestep = 60 * 60
-        wn.options.hydraulic.accuracy = 0.01
-        wn.options.hydraulic.trials = 100
+        # Get the water network model of this network (built once per topology and reused across the
+        # simulations below, as well as across re-simulations of the same network) and apply the demands
+        epanet_model = EpanetNetworkModel.for_network(node_df, edge_df, thermal_transfer_unit_design_head_m,
+                                                      coefficient_friction_hazen_williams, fraction_equivalent_length)
+        epanet_model.set_demands(building_base_demand_m3s, building_patterns)
+        consumer_nodes = epanet_model.consumer_nodes
+        building_nodes_pairs = epanet_model.building_nodes_pairs
+        building_nodes_pairs_inversed = {building: node for node, building in building_nodes_pairs.items()}
 
         if set_diameter:
             # 1st ITERATION GET MASS FLOWS AND CALCULATE DIAMETER
             print("Starting 1st iteration to calculate pipe diameters...")
             try:
-                sim = wntr.sim.EpanetSimulator(wn)
-                results = sim.run_sim()
+                results = epanet_model.run()
             except Exception as e:
                 error_msg = str(e)
 
@@ -996,13 +959,9 @@ def thermal_network_simplified(locator: cea.inputlocator.InputLocator, config: c
         print("Starting 2nd iteration to calculate pressure drops...")
 
         # modify diameter and run simulations
-        for edge in edge_df.iterrows():
-            edge_name = edge[0]
-            pipe = wn.get_link(edge_name)
-            pipe.diameter = diameter_int_m[edge_name]
+        epanet_model.set_diameters(diameter_int_m[edge_df.index])
         try:
-            sim = wntr.sim.EpanetSimulator(wn)
-            results = sim.run_sim()
+            results = epanet_model.run()
         except Exception as e:
             error_msg = str(e)
             raise ValueError(
@@ -1038,14 +997,10 @@ def thermal_network_simplified(locator: cea.inputlocator.InputLocator, config: c
         # apply this pattern to the reservoir and get results
         base_head = reservoir_head_loss_m.max()
         pattern_head_m = (reservoir_head_loss_m.values / base_head).tolist()
-        wn.add_pattern('reservoir', pattern_head_m)
-        reservoir = wn.get_node(name_node_plant)
-        reservoir.head_timeseries.base_value = int(base_head)
-        reservoir.head_timeseries._pattern = 'reservoir'
-        
+        epanet_model.set_plant_head_pattern(base_head, pattern_head_m)
+
         try:
-            sim = wntr.sim.EpanetSimulator(wn)
-            results = sim.run_sim()
+            results = epanet_model.run()
         except Exception as e:
             error_msg = str(e)
             raise ValueError(
@@ -1154,36 +1109,23 @@ def thermal_network_simplified(locator: cea.inputlocator.InputLocator, config: c
     average_temperature_supply_K = T_active.mean(axis=1, skipna=True).fillna(0)
 
 
-    thermal_losses_supply_kWh = link_headloss_df.copy()
-    thermal_losses_supply_kWh.reset_index(inplace=True, drop=True)
-    thermal_losses_supply_Wperm = thermal_losses_supply_kWh.copy()
-    for pipe in pipe_names:
-        length_m = edge_df.loc[pipe]['length_m']
-        massflow_kgs = massflow_supply_kgs[pipe]
-        k_WperKm_pipe = thermal_coeffcient_WperKm[pipe]
-        k_kWperK = k_WperKm_pipe * length_m / 1000
-        thermal_losses_supply_kWh[pipe] = np.vectorize(calc_thermal_loss_per_pipe)(average_temperature_supply_K.values,
-                                                                     massflow_kgs.values,
-                                                                     temperature_of_the_ground_K,
-                                                                     k_kWperK,
-                                                                     )
-
-        thermal_losses_supply_Wperm[pipe] = (thermal_losses_supply_kWh[pipe] / length_m) * 1000
+    # all pipes and hours at once: (hours x pipes) mass flows, (pipes) loss coefficients, (hours) temperatures
+    link_names = link_headloss_df.columns
+    length_m = edge_df.loc[link_names, 'length_m'].values
+    k_kWperK = thermal_coeffcient_WperKm[link_names].values * length_m / 1000
+    massflow_kgs = massflow_supply_kgs[link_names].values
+    thermal_losses_supply_kWh = pd.DataFrame(
+        calc_thermal_loss_per_pipe(average_temperature_supply_K.values[:, np.newaxis], massflow_kgs,
+                                   np.asarray(temperature_of_the_ground_K)[:, np.newaxis], k_kWperK),
+        columns=link_names)
+    thermal_losses_supply_Wperm = (thermal_losses_supply_kWh / length_m) * 1000
 
     # return pipes
     average_temperature_return_K = T_re_K_building.mean(axis=1)
-    thermal_losses_return_kWh = link_headloss_df.copy()
-    thermal_losses_return_kWh.reset_index(inplace=True, drop=True)
-    for pipe in pipe_names:
-        length_m = edge_df.loc[pipe]['length_m']
-        massflow_kgs = massflow_supply_kgs[pipe]
-        k_WperKm_pipe = thermal_coeffcient_WperKm[pipe]
-        k_kWperK = k_WperKm_pipe * length_m / 1000
-        thermal_losses_return_kWh[pipe] = np.vectorize(calc_thermal_loss_per_pipe)(average_temperature_return_K.values,
-                                                                     massflow_kgs.values,
-                                                                     temperature_of_the_ground_K,
-                                                                     k_kWperK,
-                                                                     )
+    thermal_losses_return_kWh = pd.DataFrame(
+        calc_thermal_loss_per_pipe(average_temperature_return_K.values[:, np.newaxis], massflow_kgs,
+                                   np.asarray(temperature_of_the_ground_K)[:, np.newaxis], k_kWperK),
+        columns=link_names)
     # WRITE TO DISK
     locator.ensure_parent_folder_exists(locator.get_thermal_network_folder())
 
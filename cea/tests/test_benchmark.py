@@ -0,0 +1,51 @@
+"""
+Test the measurements and the regression check of the performance benchmark
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from cea.utilities.benchmark import ProcessTreeMonitor, compare_to_baseline, phase_name
+
+MB = 1024 * 1024
+
+
+def test_process_tree_monitor(tmp_path):
+    # a process that starts a sub-process allocating 200 MB and writing 20 MB
+    child = (f"import time; x = bytearray({200 * MB}); open({str(tmp_path / 'out.bin')!r}, 'wb').write(bytes({20 * MB}));"
+             "time.sleep(1)")
+    process = subprocess.Popen([sys.executable, '-c', f"import subprocess, sys; subprocess.run([sys.executable, '-c', {child!r}])"])
+    monitor = ProcessTreeMonitor(process.pid)
+    while process.poll() is None:
+        monitor.sample()
+        try:
+            process.wait(0.05)
+        except subprocess.TimeoutExpired:
+            pass
+
+    assert monitor.peak_rss > 200 * MB
+    read, write = monitor.io_volume()
+    if monitor.io_supported:
+        assert write >= 20 * MB
+
+
+def test_compare_to_baseline():
+    baseline = {'demand': {'wall_time_s': 100.0, 'peak_rss_mb': 1000.0, 'read_mb': 500.0, 'write_mb': None},
+                'occupancy': {'wall_time_s': 0.5, 'peak_rss_mb': 200.0, 'read_mb': 1.0, 'write_mb': 1.0}}
+    results = {'demand': {'wall_time_s': 130.0, 'peak_rss_mb': 1100.0, 'read_mb': 100.0, 'write_mb': 100.0},
+               # much slower relative to the baseline, but by less than the absolute tolerance
+               'occupancy': {'wall_time_s': 0.9, 'peak_rss_mb': 200.0, 'read_mb': 1.0, 'write_mb': 1.0},
+               'radiation': {'wall_time_s': 60.0, 'peak_rss_mb': 300.0, 'read_mb': 1.0, 'write_mb': 1.0}}
+    thresholds = {'wall_time_s': 0.25, 'peak_rss_mb': 0.25, 'read_mb': 0.25, 'write_mb': 0.25}
+
+    assert compare_to_baseline(results, baseline, thresholds) == [('demand', 'wall_time_s', 100.0, 130.0)]
+    assert compare_to_baseline(results, baseline, dict(thresholds, wall_time_s=0.5)) == []
+
+
+@pytest.mark.parametrize('step, name', [({'script': 'demand'}, 'demand'),
+                                        ({'benchmark': 'dashboard-inputs'}, 'dashboard-inputs'),
+                                        ({'config': '.'}, None)])
+def test_phase_name(step, name):
+    assert phase_name(step) == name
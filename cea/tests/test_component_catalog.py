@@ -0,0 +1,56 @@
+"""
+Tests for the in-memory catalog of the COMPONENTS database
+"""
+
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import cea.inputlocator
+import cea.technologies.component_catalog as component_catalog
+from cea.analysis.costs.main import _calc_component_cost, _mean_feedstock_price
+from cea.technologies.component_catalog import calc_cost_curves, clear_catalog_cache, get_catalog
+from cea.technologies.components import get_component_table
+
+DATABASE = os.path.join(os.path.dirname(cea.inputlocator.__file__), 'databases', 'CH', 'COMPONENTS')
+
+
+@pytest.fixture
+def locator(tmp_path):
+    locator = cea.inputlocator.InputLocator(str(tmp_path))
+    shutil.copytree(DATABASE, locator.get_db4_components_folder())
+    clear_catalog_cache()
+    yield locator
+    clear_catalog_cache()
+
+
+def test_catalog_is_shared(locator):
+    assert get_catalog(locator) is get_catalog(cea.inputlocator.InputLocator(locator.scenario))
+    assert get_component_table('BO1', locator) == 'BOILERS'
+
+
+def test_vectorized_cost_curves_match_scalar(locator):
+    capacities_kW = np.array([0.0, 0.5, 10.0, 89.9, 90.0, 500.0, 730.0, 5000.0])
+    rows = get_catalog(locator).component_rows('BOILERS', 'BO1')
+    assert len(rows) > 1
+
+    vectorized = calc_cost_curves(rows, capacities_kW * 1000.0)
+    for i, capacity_kW in enumerate(capacities_kW):
+        expected = _calc_component_cost('BO1', capacity_kW, locator)
+        assert [cost[i] for cost in vectorized] == pytest.approx(expected)
+
+
+def test_catalog_reloads_changed_files(locator, monkeypatch):
+    monkeypatch.setattr(component_catalog, 'REVALIDATE_INTERVAL', 0.0)
+    before = _mean_feedstock_price('NATURALGAS', locator)
+
+    path = locator.get_db4_components_feedstocks_feedstocks_csv('NATURALGAS')
+    feedstock = pd.read_csv(path)
+    feedstock['Opex_var_buy_USD2015kWh'] *= 2
+    feedstock.to_csv(path, index=False)
+    os.utime(path, ns=(0, 0))  # make sure the change is noticed on coarse file system timestamps
+
+    assert _mean_feedstock_price('NATURALGAS', locator) == pytest.approx(2 * before)
@@ -3,6 +3,7 @@
 
 
 
+import io
 import unittest
 import pickle
 import os
@@ -44,6 +45,28 @@ class TestConfiguration(unittest.TestCase):
         config = pickle.loads(pickle.dumps(config))
         self.assertEqual(config.multiprocessing, True)
 
+    def test_pickled_state_only_has_changed_values(self):
+        config = cea.config.Configuration(cea.config.DEFAULT_CONFIG)
+        config.general.parameters['multiprocessing'].set(False)
+        state = config.__getstate__()
+        self.assertEqual(state['version'], cea.config.CONFIG_STATE_VERSION)
+        self.assertEqual(state['user_config'].split(), ['[general]', 'multiprocessing', '=', 'false'])
+
+        unpickled = pickle.loads(pickle.dumps(config))
+        for section in config.user_config.sections():
+            self.assertEqual(config.user_config.items(section, raw=True),
+                             unpickled.user_config.items(section, raw=True))
+
+    def test_unpickling_full_user_config(self):
+        """the state pickled by earlier versions is the complete user_config"""
+        config = cea.config.Configuration()
+        config.scenario = os.path.dirname(__file__)
+        buffer = io.StringIO()
+        config.user_config.write(buffer)
+        unpickled = cea.config.Configuration.__new__(cea.config.Configuration)
+        unpickled.__setstate__(buffer.getvalue())
+        self.assertEqual(unpickled.scenario, os.path.dirname(__file__))
+
     def test_applying_parameters(self):
         config = cea.config.Configuration()
         scenario = os.path.normpath(os.path.join(tempfile.gettempdir().replace('\\', '/'), 'baseline'))
@@ -0,0 +1,71 @@
+"""
+Tests for the streamed ZIP archives of scenario downloads
+"""
+import io
+import os
+import zipfile
+
+import pytest
+
+from cea.interfaces.dashboard.lib import zip_stream
+from cea.interfaces.dashboard.server.downloads import stream_download_archive, write_download_manifest
+
+
+@pytest.fixture
+def scenario_files(tmp_path):
+    (tmp_path / "outputs").mkdir()
+    files = {
+        "outputs/B1001.csv": "date,GRID_kWh\n" + "2005-01-01 00:00:00,1.5\n" * 10000,
+        "outputs/sensors.feather": os.urandom(100000),
+        "outputs/empty.txt": "",
+        "outputs/Zürich.csv": "x\n1\n",
+    }
+    paths = []
+    for name, content in files.items():
+        path = tmp_path / name
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content, encoding="utf-8")
+        paths.append((path, f"scenario/{name}"))
+    return paths
+
+
+def read_archive(chunks):
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    assert archive.testzip() is None
+    return archive
+
+
+def test_stream_zip(scenario_files):
+    archive = read_archive(zip_stream.stream_zip(scenario_files, workers=2, chunk_size=1000))
+
+    assert archive.namelist() == [name for _, name in scenario_files]
+    for path, name in scenario_files:
+        assert archive.read(name) == path.read_bytes()
+
+    info = {i.filename: i for i in archive.infolist()}
+    assert info["scenario/outputs/B1001.csv"].compress_type == zipfile.ZIP_DEFLATED
+    assert info["scenario/outputs/B1001.csv"].compress_size < info["scenario/outputs/B1001.csv"].file_size
+    # already compressed, stored as is
+    assert info["scenario/outputs/sensors.feather"].compress_type == zipfile.ZIP_STORED
+
+
+def test_stream_zip64(scenario_files, monkeypatch):
+    """Sizes, offsets and counts beyond the limits of the classic format are stored in ZIP64 records"""
+    monkeypatch.setattr(zip_stream, "ZIP64_LIMIT", 10)
+    monkeypatch.setattr(zip_stream, "ZIP64_COUNT_LIMIT", 2)
+    archive = read_archive(zip_stream.stream_zip(scenario_files))
+    for path, name in scenario_files:
+        assert archive.read(name) == path.read_bytes()
+
+
+def test_stream_download_archive(scenario_files, tmp_path):
+    manifest_path = tmp_path / "download" / "manifest.json"
+    total_size = write_download_manifest(manifest_path, scenario_files)
+    assert total_size == sum(os.path.getsize(path) for path, _ in scenario_files)
+
+    # files removed after preparing the download are left out
+    os.remove(scenario_files[0][0])
+    archive = read_archive(stream_download_archive(str(manifest_path)))
+    assert archive.namelist() == [name for _, name in scenario_files[1:]]
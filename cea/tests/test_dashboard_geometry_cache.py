@@ -0,0 +1,97 @@
+"""
+Tests for the cached (and simplified) geometry and property tables of the dashboard inputs API
+"""
+import os
+import shutil
+
+import geopandas
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import Polygon
+
+from cea.interfaces.dashboard.api.inputs import df_to_json, get_building_properties
+from cea.interfaces.dashboard.lib.geometry_cache import FingerprintCache, simplify_tolerance
+import cea.inputlocator
+
+
+def write_zone(path, height=10.0):
+    # buildings with 200 vertices each, in Zurich (UTM 32N)
+    angles = np.linspace(0, 2 * np.pi, 200, endpoint=False)
+    buildings = [Polygon(zip(465000 + 100 * i + 20 * np.cos(angles), 5247000 + 20 * np.sin(angles)))
+                 for i in range(3)]
+    geopandas.GeoDataFrame({'name': ['B1', 'B2', 'B3'], 'height_ag': height, 'floors_ag': 3},
+                           geometry=buildings, crs='EPSG:32632').to_file(path)
+
+
+def count_coordinates(geojson):
+    return sum(len(feature['geometry']['coordinates'][0]) for feature in geojson['features'])
+
+
+def test_fingerprint_cache():
+    cache = FingerprintCache(max_entries=2)
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return value
+
+    assert cache.get('a', 'v1', lambda: compute(1)) == 1
+    assert cache.get('a', 'v1', lambda: compute(2)) == 1
+    assert cache.get('a', 'v2', lambda: compute(3)) == 3
+    cache.get('b', 'v1', lambda: compute(4))
+    cache.get('c', 'v1', lambda: compute(5))
+    assert cache.get('a', 'v2', lambda: compute(6)) == 6  # evicted
+    assert calls == [1, 3, 4, 5, 6]
+
+    with pytest.raises(ValueError):
+        cache.get('d', 'v1', lambda: compute(int('x')))
+    assert cache.get('d', 'v1', lambda: compute(7)) == 7
+
+
+def test_df_to_json_cached_until_changed(tmp_path):
+    path = str(tmp_path / 'zone.shp')
+    write_zone(path)
+
+    geojson, crs = df_to_json(path, root=str(tmp_path))
+    assert [f['properties']['name'] for f in geojson['features']] == ['B1', 'B2', 'B3']
+    assert df_to_json(path, root=str(tmp_path))[0] is geojson
+
+    write_zone(path, height=20.0)
+    changed, _ = df_to_json(path, root=str(tmp_path))
+    assert changed is not geojson
+    assert changed['features'][0]['properties']['height_ag'] == 20.0
+
+
+def test_df_to_json_simplified(tmp_path):
+    path = str(tmp_path / 'zone.shp')
+    write_zone(path)
+
+    full, _ = df_to_json(path, root=str(tmp_path))
+    overview, _ = df_to_json(path, root=str(tmp_path), zoom=12)
+    detail, _ = df_to_json(path, root=str(tmp_path), zoom=22)
+    assert count_coordinates(overview) < count_coordinates(detail) <= count_coordinates(full)
+    assert all(feature['geometry']['type'] == 'Polygon' for feature in overview['features'])
+    assert simplify_tolerance(None) is None
+    assert simplify_tolerance(13) == pytest.approx(simplify_tolerance(12) / 2)
+
+
+def test_building_properties_unchanged_tables(tmp_path):
+    locator = cea.inputlocator.InputLocator(str(tmp_path))
+    shutil.copytree(os.path.join(os.path.dirname(cea.inputlocator.__file__), 'databases', 'CH'),
+                    locator.get_db4_folder())
+    os.makedirs(locator.get_building_geometry_folder())
+    os.makedirs(locator.get_building_properties_folder())
+    write_zone(locator.get_zone_geometry())
+    pd.DataFrame({'name': ['B1', 'B2', 'B3'], 'const_type': 'STANDARD1'}).to_csv(
+        locator.get_building_architecture(), index=False)
+
+    store = get_building_properties(str(tmp_path))
+    assert set(store['tables']['zone']) == {'B1', 'B2', 'B3'}
+    assert 'unchanged' not in store
+
+    pd.DataFrame({'name': ['B1', 'B2', 'B3'], 'const_type': 'STANDARD2'}).to_csv(
+        locator.get_building_architecture(), index=False)
+    diff = get_building_properties(str(tmp_path), store['fingerprints'])
+    assert 'zone' in diff['unchanged'] and 'zone' not in diff['tables']
+    assert diff['tables']['envelope']['B1']['const_type'] == 'STANDARD2'
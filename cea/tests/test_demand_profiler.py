@@ -0,0 +1,56 @@
+"""
+Test the aggregation of the phase timings of the demand calculation
+"""
+
+import json
+import pickle
+
+from cea.demand.demand_profiler import NULL_PROFILE, DemandProfile, build_report, make_profile, write_report
+
+
+def building_profile(name, timings, hours=8760):
+    profile = DemandProfile(name)
+    profile.timings.update(timings)
+    profile.count('hours_simulated', hours)
+    return profile
+
+
+def test_laps_attribute_all_time():
+    profile = make_profile('B1001', True)
+    start = profile.clock()
+    for _ in range(3):
+        start = profile.lap('ventilation', start)
+        start = profile.lap('rc_model', start)
+    assert set(profile.timings) == {'ventilation', 'rc_model'}
+    assert profile.total == profile.timings['ventilation'] + profile.timings['rc_model']
+
+    # profiles are returned from the worker processes
+    assert pickle.loads(pickle.dumps(profile)).timings == profile.timings
+
+    assert make_profile('B1001', False) is NULL_PROFILE
+    assert NULL_PROFILE.lap('rc_model', NULL_PROFILE.clock()) == 0.0
+    NULL_PROFILE.count('hours_simulated')
+    assert NULL_PROFILE.timings == {} and NULL_PROFILE.counters == {}
+
+
+def test_build_report(tmp_path):
+    run_profile = DemandProfile('demand')
+    run_profile.timings.update({'weather': 0.5, 'building_properties': 1.5, 'buildings': 4.0, 'aggregation': 1.0})
+    building_profiles = [building_profile('B1001', {'schedules': 1.0, 'rc_model': 3.0}),
+                         building_profile('B1002', {'schedules': 0.5, 'rc_model': 1.5, 'write_results': 2.0})]
+
+    report = build_report(run_profile, building_profiles, processes=2)
+
+    assert report['buildings'] == 2
+    assert report['wall_time_s'] == 7.0
+    assert report['worker_time_s'] == 8.0
+    assert report['parallel_efficiency'] == 1.0
+    assert report['building_phases']['rc_model'] == {'total_s': 4.5, 'max_s': 3.0, 'slowest_building': 'B1001',
+                                                     'mean_s': 2.25, 'share': 4.5 / 8.0}
+    assert report['building_phases']['write_results']['slowest_building'] == 'B1002'
+    assert report['counters'] == {'hours_simulated': 2 * 8760}
+    assert report['per_building']['B1002']['phases']['write_results'] == 2.0
+
+    path = tmp_path / 'demand' / 'demand_profile.json'
+    write_report(report, str(path))
+    assert json.loads(path.read_text()) == report
@@ -0,0 +1,84 @@
+"""
+Tests for the array-based scheduling of the yearly emission timelines
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cea.analysis.lca.emission_time_dependent import building_chunks, sum_by_building
+from cea.analysis.lca.emission_timeline import (
+    BuildingYearlyEmissionTimeline,
+    discount_factors,
+    discount_over_year_indexed,
+    lifetime_schedule,
+)
+
+
+def make_timeline(start_year, end_year, keys):
+    """A timeline without building properties, enough to log component emissions"""
+    timeline = object.__new__(BuildingYearlyEmissionTimeline)
+    timeline.name = "B1001"
+    timeline.typology = {"year": start_year}
+    cols = [f"{t}_{key}_kgCO2e" for t in BuildingYearlyEmissionTimeline._EMISSION_TYPES for key in keys]
+    timeline.timeline = BuildingYearlyEmissionTimeline.empty_timeline_df(
+        start_year=start_year, end_year=end_year, columns=cols)
+    timeline.timeline["Note"] = ""
+    return timeline
+
+
+def test_lifetime_schedule():
+    schedule = lifetime_schedule(2020, [2, 3], range(2020, 2027))
+    assert schedule.tolist() == [[1, 0, 1, 0, 1, 0, 1],
+                                 [1, 0, 0, 1, 0, 0, 1]]
+    with pytest.raises(ValueError):
+        lifetime_schedule(2020, [0], range(2020, 2027))
+
+
+def test_log_component_emissions():
+    timeline = make_timeline(2000, 2010, ["wall_ag", "roof"])
+    timeline.log_emissions(10.0, 2.0, 0.5, 1.0, 4, "wall_ag", note_detail="WALL_1")
+    timeline.log_emissions(5.0, 1.0, 0.0, 3.0, 20, "roof")
+    df = timeline.timeline
+
+    built = ["Y_2000", "Y_2004", "Y_2008"]
+    assert df.loc[built, "production_wall_ag_kgCO2e"].tolist() == [20.0] * 3
+    assert df.loc[built, "biogenic_wall_ag_kgCO2e"].tolist() == [-5.0] * 3
+    # no demolition when the building is first built
+    assert df.loc[built, "demolition_wall_ag_kgCO2e"].tolist() == [0.0, 10.0, 10.0]
+    assert df["production_wall_ag_kgCO2e"].sum() == 60.0
+    assert df["production_roof_kgCO2e"].sum() == 5.0
+    assert df["demolition_roof_kgCO2e"].sum() == 0.0
+    assert df.at["Y_2004", "Note"] == "Service life reached: wall_ag (WALL_1)"
+    assert df.at["Y_2001", "Note"] == ""
+
+
+def test_discount_factors():
+    years = pd.Index([f"Y_{y}" for y in range(2020, 2031)])
+    factors = discount_factors(range(2020, 2031), ref_year=2022, tar_year=2026, tar_fraction=0.2)
+    assert factors[:3].tolist() == [1.0, 1.0, 1.0]
+    assert factors[2:7] == pytest.approx(np.linspace(1.0, 0.2, 5))
+    assert factors[7:].tolist() == [0.2] * 4
+
+    discounted = discount_over_year_indexed(pd.Series(10.0, index=years), ref_year=2022, tar_year=2026,
+                                            tar_fraction=0.2)
+    assert discounted.to_numpy() == pytest.approx(10.0 * factors)
+    with pytest.raises(ValueError):
+        discount_factors(range(2020, 2031), ref_year=2026, tar_year=2022, tar_fraction=0.2)
+
+
+def test_building_chunks():
+    buildings = [f"B{i}" for i in range(10)]
+    chunks = building_chunks(buildings, 3)
+    assert [b for chunk in chunks for b in chunk] == buildings
+    assert [len(chunk) for chunk in chunks] == [4, 3, 3]
+    assert building_chunks(buildings[:2], 8) == [["B0"], ["B1"]]
+
+
+def test_sum_by_building():
+    df_1 = pd.DataFrame({"name": "B1", "a_kgCO2e": [1.0, 3.0], "b_kgCO2e": [2.0, 0.0], "Note": ["", "x"]})
+    df_2 = pd.DataFrame({"name": "B2", "a_kgCO2e": [5.0, 7.0], "b_kgCO2e": [6.0, 8.0], "Note": ["", ""]})
+    summed = sum_by_building([("B1", df_1), ("B2", df_2)])
+    assert summed.index.name == "name"
+    assert summed.to_dict(orient="index") == {"B1": {"a_kgCO2e": 4.0, "b_kgCO2e": 2.0},
+                                               "B2": {"a_kgCO2e": 12.0, "b_kgCO2e": 14.0}}
@@ -0,0 +1,83 @@
+"""
+Tests for the EPW reader and its binary weather cache
+"""
+
+import math
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cea.utilities import epwreader
+from cea.utilities.epwreader import (calc_file_checksum, calc_horirsky, calc_skytemp, calc_wetbulb, epw_reader,
+                                     get_weather_cache_path, parse_epw)
+from cea.constants import BOLTZMANN, KELVIN_CONVERSION
+
+WEATHER_FILE = os.path.join(os.path.dirname(__file__), '..', 'databases', 'weather', 'Zuerich-SMA_2015.epw')
+
+
+def wetbulb_scalar(Tdrybulb, RH):
+    """The scalar formula of calc_wetbulb"""
+    return Tdrybulb * math.atan(0.151977 * ((RH + 8.313659) ** 0.5)) + math.atan(Tdrybulb + RH) - math.atan(
+        RH - 1.676331) + (0.00391838 * (RH ** (3 / 2))) * math.atan(0.023101 * RH) - 4.686035
+
+
+@pytest.fixture
+def weather_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(epwreader, 'WEATHER_CACHE_FOLDER', str(tmp_path / 'cache'))
+    os.makedirs(tmp_path / 'inputs' / 'weather')
+    path = str(tmp_path / 'inputs' / 'weather' / 'weather.epw')
+    shutil.copy(WEATHER_FILE, path)
+    return path
+
+
+def test_calc_wetbulb_arrays():
+    drybulb = np.array([-10.0, 0.0, 15.5, 32.0])
+    relhum = np.array([90.0, 50.0, 75.0, 20.0])
+    expected = [wetbulb_scalar(t, rh) for t, rh in zip(drybulb, relhum)]
+    assert calc_wetbulb(drybulb, relhum) == pytest.approx(expected)
+    assert calc_wetbulb(15.5, 75.0) == pytest.approx(expected[2])
+
+
+def test_calc_skytemp_arrays():
+    hor_ir = np.array([300.0, 9999.0, 350.0])
+    drybulb = np.array([10.0, 5.0, 20.0])
+    dewpoint = np.array([5.0, 0.0, 12.0])
+    sky_cover = np.array([2.0, 6.0, 99.0])  # the missing sky cover is not needed, the radiation is known
+
+    sky_temp = calc_skytemp(hor_ir, drybulb, dewpoint, sky_cover)
+    expected_ir = [300.0, calc_horirsky(5.0, 0.0, 6.0), 350.0]
+    assert sky_temp == pytest.approx([(ir / BOLTZMANN) ** 0.25 - KELVIN_CONVERSION for ir in expected_ir])
+    assert calc_skytemp(9999.0, 5.0, 0.0, 6.0) == pytest.approx(sky_temp[1])
+
+    with pytest.raises(ValueError):
+        calc_skytemp(hor_ir, drybulb, dewpoint, np.array([2.0, 99.0, 2.0]))
+    with pytest.raises(ValueError):
+        calc_skytemp(np.array([-1.0]), drybulb[:1], dewpoint[:1], sky_cover[:1])
+
+
+def test_weather_cache(weather_path):
+    parsed = parse_epw(weather_path)
+    epw_data = epw_reader(weather_path)
+    cache_path = get_weather_cache_path(calc_file_checksum(weather_path))
+    assert os.path.exists(cache_path)
+    # the cache is not part of the inputs of the scenario
+    assert os.path.dirname(cache_path) == epwreader.WEATHER_CACHE_FOLDER
+    assert os.listdir(os.path.dirname(weather_path)) == ['weather.epw']
+    pd.testing.assert_frame_equal(epw_data, parsed)
+
+    # read from the cache
+    pd.testing.assert_frame_equal(epw_reader(weather_path), parsed)
+
+    # a changed weather file is parsed again
+    with open(weather_path) as f:
+        lines = f.readlines()
+    fields = lines[8].split(',')
+    fields[6] = '30.0'  # dry bulb temperature of the first hour
+    lines[8] = ','.join(fields)
+    with open(weather_path, 'w') as f:
+        f.writelines(lines)
+    assert epw_reader(weather_path)['drybulb_C'].iloc[0] == 30.0
+    assert epw_reader(weather_path)['drybulb_C'].iloc[0] == 30.0
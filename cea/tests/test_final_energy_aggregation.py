@@ -0,0 +1,78 @@
+"""
+Unit tests for the streaming aggregation of building and plant final energy into the compilation files.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cea.analysis.final_energy.calculation import (
+    FinalEnergyAggregator,
+    create_hourly_timeseries_aggregation,
+    summarise_building_final_energy,
+)
+from cea.constants import HOURS_IN_YEAR
+
+
+def _building_df(rng, carrier_columns):
+    df = pd.DataFrame({'date': pd.date_range('2020-01-01', periods=HOURS_IN_YEAR, freq='h').astype(str)})
+    for col in ['Qhs_sys_kWh', 'Qww_sys_kWh', 'Qcs_sys_kWh', 'E_sys_kWh'] + carrier_columns:
+        df[col] = rng.random(HOURS_IN_YEAR)
+    df['scale'] = 'BUILDING'
+    df['case'] = 1
+    df['case_description'] = 'Standalone (all services)'
+    return df
+
+
+@pytest.fixture
+def building_dfs():
+    rng = np.random.default_rng(0)
+    return {
+        'B1000': _building_df(rng, ['Qhs_sys_NATURALGAS_kWh', 'E_sys_GRID_kWh', 'PV_roofs_top_kWh']),
+        'B1001': _building_df(rng, ['Qcs_sys_GRID_kWh', 'E_sys_GRID_kWh', 'Qww_sys_SOLAR_kWh',
+                                    'Qww_sys_SOLAR_dumped_kWh', 'SC_FP_radiation_roofs_top_kWh']),
+        'B1002': _building_df(rng, ['Qhs_sys_DH_kWh', 'E_sys_GRID_kWh']),
+    }
+
+
+@pytest.fixture
+def plant_dfs():
+    rng = np.random.default_rng(1)
+    return {'DH_NODE5': pd.DataFrame({'thermal_load_kWh': rng.random(HOURS_IN_YEAR),
+                                      'plant_primary_DH_OIL_kWh': rng.random(HOURS_IN_YEAR),
+                                      'plant_pumping_DH_GRID_kWh': rng.random(HOURS_IN_YEAR)})}
+
+
+class TestFinalEnergyAggregator:
+    def test_hourly_totals_by_carrier(self, building_dfs, plant_dfs):
+        aggregated = create_hourly_timeseries_aggregation(building_dfs, plant_dfs)
+        assert list(aggregated.columns) == ['date', 'Qhs_sys_kWh', 'Qww_sys_kWh', 'Qcs_sys_kWh', 'E_sys_kWh',
+                                            'NATURALGAS_kWh', 'GRID_kWh', 'PV_kWh', 'SOLAR_kWh', 'DH_kWh',
+                                            'OIL_kWh', 'TOTAL_kWh']
+        expected_grid = (sum(df['E_sys_GRID_kWh'] for df in building_dfs.values())
+                         + building_dfs['B1001']['Qcs_sys_GRID_kWh'])
+        np.testing.assert_allclose(aggregated['GRID_kWh'], expected_grid)
+        np.testing.assert_allclose(aggregated['OIL_kWh'], plant_dfs['DH_NODE5']['plant_primary_DH_OIL_kWh'])
+        # dumped solar heat and raw irradiation are not delivered carriers
+        np.testing.assert_allclose(aggregated['SOLAR_kWh'], building_dfs['B1001']['Qww_sys_SOLAR_kWh'])
+
+    def test_result_does_not_depend_on_arrival_order(self, building_dfs, plant_dfs):
+        expected = create_hourly_timeseries_aggregation(building_dfs, plant_dfs)
+
+        aggregator = FinalEnergyAggregator()
+        names = list(building_dfs)
+        for position in [2, 0, 1]:
+            aggregator.add_building(summarise_building_final_energy(names[position], building_dfs[names[position]]),
+                                    position)
+        for plant_key, df in plant_dfs.items():
+            aggregator.add_plant(plant_key, df)
+
+        pd.testing.assert_frame_equal(aggregator.timeseries_df(), expected)
+        assert aggregator.number_of_buildings == 3
+        assert aggregator.total_demand_MWh == pytest.approx(
+            sum(df[['Qhs_sys_kWh', 'Qww_sys_kWh', 'Qcs_sys_kWh', 'E_sys_kWh']].sum().sum()
+                for df in building_dfs.values()) / 1000.0)
+
+    def test_empty_aggregation_raises(self):
+        with pytest.raises(ValueError):
+            FinalEnergyAggregator().timeseries_df()
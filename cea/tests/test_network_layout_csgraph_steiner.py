@@ -0,0 +1,97 @@
+"""
+Unit tests for the scipy.sparse.csgraph Steiner tree backend of the network layout.
+
+The csgraph backend must produce valid Steiner trees of the same length as the NetworkX reference, and its street
+reroutes must be shortest paths that never pass through another building.
+"""
+
+import random
+
+import networkx as nx
+import pytest
+from networkx.algorithms.approximation.steinertree import steiner_tree as nx_steiner_tree
+
+from cea.technologies.network_layout.csgraph_steiner import TerminalStreetPaths, steiner_tree
+
+
+def create_street_network(size, n_buildings, seed):
+    rng = random.Random(seed)
+    graph = nx.grid_2d_graph(size, size)
+    graph = nx.relabel_nodes(graph, {node: (node[0] * 10.0, node[1] * 10.0) for node in graph})
+    for u, v in graph.edges:
+        graph.edges[u, v]['weight'] = rng.uniform(5, 15)
+    streets = list(graph.nodes)
+    buildings = []
+    for _ in range(n_buildings):
+        building = (rng.uniform(0, size * 10.0), rng.uniform(0, size * 10.0) + 0.5)
+        for street in rng.sample(streets, rng.randint(1, 3)):
+            graph.add_edge(building, street, weight=rng.uniform(1, 20))
+        buildings.append(building)
+    # a few direct building-to-building connections, which the reroutes must avoid
+    for _ in range(n_buildings // 5):
+        a, b = rng.sample(buildings, 2)
+        graph.add_edge(a, b, weight=rng.uniform(1, 5))
+    return graph, buildings
+
+
+def path_length(graph, path):
+    return sum(graph.edges[u, v]['weight'] for u, v in zip(path[:-1], path[1:]))
+
+
+@pytest.fixture(params=[0, 1, 2])
+def network(request):
+    return create_street_network(12, 25, request.param)
+
+
+@pytest.mark.parametrize("method", ["kou", "mehlhorn"])
+def test_steiner_tree_matches_networkx(network, method):
+    graph, buildings = network
+    tree = steiner_tree(graph, buildings, method=method)
+    reference = nx_steiner_tree(graph, buildings, method=method)
+
+    assert nx.is_tree(tree)
+    assert set(buildings) <= set(tree.nodes)
+    assert all(node in buildings for node in tree if tree.degree(node) == 1)
+    assert tree.size(weight='weight') == pytest.approx(reference.size(weight='weight'))
+    # edge data of the potential network is kept
+    for u, v, data in tree.edges(data=True):
+        assert data == graph.edges[u, v]
+
+
+def test_single_terminal():
+    graph, buildings = create_street_network(4, 1, 0)
+    tree = steiner_tree(graph, buildings, method='kou')
+    assert list(tree.nodes) == buildings
+
+
+def test_street_paths_avoid_other_buildings(network):
+    graph, buildings = network
+    building_set = set(buildings)
+    street_paths = TerminalStreetPaths(graph, building_set)
+    streets = graph.subgraph(n for n in graph if n not in building_set)
+
+    rng = random.Random(0)
+    for _ in range(20):
+        source, target = rng.sample(buildings, 2)
+        query_graph = nx.Graph(streets)
+        for building in (source, target):
+            query_graph.add_node(building)
+            for neighbour in graph.neighbors(building):
+                if neighbour not in building_set:
+                    query_graph.add_edge(building, neighbour, **graph.edges[building, neighbour])
+        expected = nx.shortest_path(query_graph, source, target, weight='weight')
+
+        path = street_paths.shortest_path(source, target)
+        assert path[0] == source and path[-1] == target
+        assert not set(path[1:-1]) & building_set
+        assert path_length(graph, path) == pytest.approx(path_length(graph, expected))
+
+
+def test_street_paths_no_path():
+    graph = nx.Graph()
+    graph.add_edge('A', 'B', weight=1.0)
+    graph.add_edge('A', 's1', weight=1.0)
+    graph.add_edge('B', 's2', weight=1.0)
+    street_paths = TerminalStreetPaths(graph, {'A', 'B'})
+    with pytest.raises(nx.NetworkXNoPath):
+        street_paths.shortest_path('A', 'B')
@@ -0,0 +1,69 @@
+"""
+Unit tests for the bulk spatial-index searches of the network layout connectivity potential.
+"""
+
+import numpy as np
+import pytest
+from geopandas import GeoDataFrame
+from shapely.geometry import Point, LineString
+
+from cea.technologies.network_layout.connectivity_potential import near_analysis, snap_endpoints_to_nearby_lines
+
+
+@pytest.fixture
+def streets():
+    rng = np.random.default_rng(0)
+    lines = []
+    for x, y in rng.uniform(0, 1000, (200, 2)):
+        lines.append(LineString([(x, y), (x + rng.uniform(-50, 50), y + rng.uniform(-50, 50)),
+                                 (x + rng.uniform(-50, 50), y + rng.uniform(-50, 50))]))
+    network = GeoDataFrame(geometry=lines, crs="EPSG:2056")
+    network.index = network.index * 2 + 1  # non-trivial index labels
+    return network
+
+
+@pytest.fixture
+def buildings():
+    rng = np.random.default_rng(1)
+    return GeoDataFrame(geometry=[Point(xy) for xy in rng.uniform(0, 1000, (300, 2))], crs="EPSG:2056")
+
+
+class TestNearAnalysis:
+    @pytest.mark.parametrize("k", [1, 3])
+    def test_matches_brute_force(self, buildings, streets, k):
+        result = near_analysis(buildings, streets, k=k)
+        assert len(result) == k * len(buildings)
+        for building_idx, candidates in result.groupby("building_idx", sort=False):
+            distances = streets.geometry.distance(buildings.geometry[building_idx])
+            assert candidates["idx"].tolist() == distances.nsmallest(k).index.tolist()
+
+    def test_connection_points_lie_on_streets(self, buildings, streets):
+        result = near_analysis(buildings, streets, k=2)
+        distances = [streets.geometry[idx].distance(point) for idx, point in zip(result["idx"], result.geometry)]
+        assert max(distances) < 1e-5
+
+    def test_k_larger_than_street_count(self, buildings):
+        streets = GeoDataFrame(geometry=[LineString([(0, 0), (10, 0)]), LineString([(0, 5), (10, 5)])],
+                               crs="EPSG:2056")
+        result = near_analysis(buildings.iloc[:5], streets, k=4)
+        assert len(result) == 10
+
+    def test_empty_inputs(self, streets):
+        empty = GeoDataFrame(geometry=[], crs="EPSG:2056")
+        assert len(near_analysis(empty, streets)) == 0
+
+
+class TestSnapEndpoints:
+    def test_near_miss_endpoint_is_snapped_and_split(self):
+        network = GeoDataFrame(geometry=[LineString([(0, 0), (10, 0)]),
+                                         LineString([(5, 0.3), (5, 10)])], crs="EPSG:2056")
+        snapped = snap_endpoints_to_nearby_lines(network, snap_tolerance=0.5, split_lines=True)
+        assert len(snapped) == 3
+        assert Point(5, 0).equals(Point(snapped.geometry[2].coords[0]))
+        assert {tuple(line.coords[-1]) for line in snapped.geometry} >= {(5.0, 0.0)}
+
+    def test_endpoint_beyond_tolerance_is_kept(self):
+        network = GeoDataFrame(geometry=[LineString([(0, 0), (10, 0)]),
+                                         LineString([(5, 2), (5, 10)])], crs="EPSG:2056")
+        snapped = snap_endpoints_to_nearby_lines(network, snap_tolerance=0.5)
+        assert list(snapped.geometry[1].coords) == [(5.0, 2.0), (5.0, 10.0)]
@@ -0,0 +1,149 @@
+"""
+Unit tests for the reuse of unchanged building outputs between consecutive pathway states.
+"""
+
+from __future__ import annotations
+
+import os
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+from shapely.geometry import box
+
+import cea.config
+from cea.datamanagement.district_pathways.state_simulation.output_reuse import (
+    REUSABLE_SCRIPTS,
+    StateInputs,
+    calc_script_fingerprints,
+    read_output_fingerprints,
+    simulate_base_workflow,
+)
+from cea.inputlocator import InputLocator
+from cea.utilities.file_clone import clone_file
+
+BUILDINGS = ["B1000", "B1001", "B1002"]
+WORKFLOW = [{"config": "."}, {"script": "radiation"}, {"script": "occupancy"}, {"script": "demand"}]
+
+
+def write_state(folder, wall_types=("WALL_1", "WALL_1", "WALL_1"), wall_u=("0.3", "0.5"), weather="weather"):
+    locator = InputLocator(str(folder))
+    os.makedirs(locator.get_building_geometry_folder())
+    gpd.GeoDataFrame({"name": BUILDINGS, "floors_ag": [3, 4, 5]},
+                     geometry=[box(i * 20, 0, i * 20 + 10, 10) for i in range(3)],
+                     crs="EPSG:2056").to_file(locator.get_zone_geometry())
+    os.makedirs(locator.get_building_properties_folder())
+    pd.DataFrame({"name": BUILDINGS, "type_wall": list(wall_types), "wwr": ["0.3"] * 3}).to_csv(
+        locator.get_building_architecture(), index=False)
+    pd.DataFrame({"name": BUILDINGS, "type_hs": ["HVAC_1"] * 3}).to_csv(
+        locator.get_building_air_conditioning(), index=False)
+    walls = os.path.join(locator.get_db4_folder(), "ASSEMBLIES", "ENVELOPE", "ENVELOPE_WALL.csv")
+    os.makedirs(os.path.dirname(walls))
+    pd.DataFrame({"code": ["WALL_1", "WALL_2"], "U_wall": list(wall_u)}).to_csv(walls, index=False)
+    os.makedirs(os.path.dirname(locator.get_weather_file()), exist_ok=True)
+    with open(locator.get_weather_file(), "w") as f:
+        f.write(weather)
+    return locator
+
+
+class FakeState(object):
+    """Stands in for `DistrictStateYear`: "simulates" by writing one output file per building and script."""
+
+    def __init__(self, folder, year):
+        self.folder = str(folder)
+        self.year = year
+        self.simulated = {}
+
+    def state_folder(self):
+        return self.folder
+
+    def simulate(self, config, workflow, mark_simulated=True):
+        locator = InputLocator(self.folder)
+        step = workflow[-1]
+        script = step["script"]
+        buildings = step.get("parameters", {}).get("buildings", BUILDINGS)
+        self.simulated[script] = list(buildings)
+        for building in buildings:
+            for path in REUSABLE_SCRIPTS[script].building_files(locator, building):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                if script == "demand":
+                    pd.DataFrame({"date": ["2005-01-01 00:00"], "x_int": [0], "QH_sys_kWh": [self.year]}).to_csv(
+                        path, index=False)
+                else:
+                    with open(path, "w") as f:
+                        f.write(f"{script} {building} {self.year}")
+        if script == "demand":
+            pd.DataFrame({"name": buildings, "QH_sys_MWhyr": [self.year] * len(buildings)}).to_csv(
+                locator.get_total_demand("csv"), index=False)
+
+
+@pytest.fixture
+def config():
+    return cea.config.Configuration(cea.config.DEFAULT_CONFIG)
+
+
+def test_clone_file_is_independent_of_source(tmp_path):
+    source = tmp_path / "source.csv"
+    source.write_text("original")
+    target = clone_file(str(source), str(tmp_path / "target.csv"))
+    with open(target, "w") as f:
+        f.write("changed")
+    assert source.read_text() == "original"
+
+
+class TestFingerprints:
+    def test_only_changed_buildings_change(self, tmp_path, config):
+        reference = calc_script_fingerprints("occupancy", StateInputs(write_state(tmp_path / "a")), config)
+        changed = calc_script_fingerprints(
+            "occupancy", StateInputs(write_state(tmp_path / "b", wall_types=("WALL_1", "WALL_2", "WALL_1"))), config)
+        assert [reference[b] == changed[b] for b in BUILDINGS] == [True, False, True]
+
+    def test_referenced_database_rows(self, tmp_path, config):
+        reference = calc_script_fingerprints("occupancy", StateInputs(write_state(tmp_path / "a")), config)
+        # WALL_2 is not used by any building
+        unused = calc_script_fingerprints("occupancy", StateInputs(write_state(tmp_path / "b", wall_u=("0.3", "0.9"))),
+                                          config)
+        used = calc_script_fingerprints("occupancy", StateInputs(write_state(tmp_path / "c", wall_u=("0.2", "0.5"))),
+                                        config)
+        assert unused == reference
+        assert all(used[b] != reference[b] for b in BUILDINGS)
+
+    def test_weather_changes_everything(self, tmp_path, config):
+        reference = calc_script_fingerprints("radiation", StateInputs(write_state(tmp_path / "a")), config)
+        changed = calc_script_fingerprints("radiation", StateInputs(write_state(tmp_path / "b", weather="other")),
+                                           config)
+        assert all(changed[b] != reference[b] for b in BUILDINGS)
+
+
+def test_simulate_base_workflow_reuses_unchanged_buildings(tmp_path, config):
+    previous_locator = write_state(tmp_path / "state_2030")
+    previous = FakeState(tmp_path / "state_2030", 2030)
+    assert simulate_base_workflow(previous, config, WORKFLOW, None) == {"radiation": [], "occupancy": [],
+                                                                        "demand": []}
+    assert set(read_output_fingerprints(previous_locator)) == {"radiation", "occupancy", "demand"}
+
+    # B1001 is retrofitted: it gets a new wall, which also changes the radiation scene
+    locator = write_state(tmp_path / "state_2040", wall_types=("WALL_1", "WALL_2", "WALL_1"))
+    state = FakeState(tmp_path / "state_2040", 2040)
+    reused = simulate_base_workflow(state, config, WORKFLOW, previous_locator)
+
+    assert reused["radiation"] == []
+    assert state.simulated["radiation"] == BUILDINGS
+    # the radiation results were simulated again, so demand cannot be reused
+    assert reused["occupancy"] == ["B1000", "B1002"]
+    assert state.simulated["occupancy"] == ["B1001"]
+    assert reused["demand"] == []
+
+    with open(locator.get_occupancy_model_file("B1000")) as f:
+        assert f.read() == "occupancy B1000 2030"
+
+    # an identical state reuses everything, including the demand totals
+    state = FakeState(tmp_path / "state_2050", 2050)
+    write_state(tmp_path / "state_2050", wall_types=("WALL_1", "WALL_2", "WALL_1"))
+    reused = simulate_base_workflow(state, config, WORKFLOW, locator)
+    assert state.simulated == {}
+    assert reused == {script: BUILDINGS for script in ("radiation", "occupancy", "demand")}
+    total_demand = pd.read_csv(InputLocator(state.folder).get_total_demand("csv"))
+    assert total_demand["name"].tolist() == BUILDINGS
+    assert total_demand["QH_sys_MWhyr"].tolist() == [2040] * 3
+    assert os.path.isfile(InputLocator(state.folder).get_total_demand_hourly("csv"))
@@ -0,0 +1,62 @@
+"""
+Test the in-memory summary tables of the plots and the downsampling of hourly plots
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cea.import_export.result_summary import (collect_plot_frames, read_summary_csv, summary_csv_exists,
+                                              write_summary_csv)
+from cea.visualisation.c_plotter import downsample_min_max, is_time_series
+
+
+def summary_table():
+    return pd.DataFrame({
+        'date': pd.date_range('2005-01-01', periods=48, freq='h'),
+        'period': [f'H_{i}' for i in range(48)],
+        'name': ['B1001'] * 47 + [''],
+        'grid_electricity_consumption[kWh]': np.linspace(0, 1, 48) / 3,
+        'count': np.arange(48),
+    }, index=np.arange(100, 148))
+
+
+def test_summary_table_in_memory_matches_csv(tmp_path):
+    path = str(tmp_path / 'summary.csv')
+    df = summary_table()
+
+    with collect_plot_frames():
+        write_summary_csv(df, path, float_format='%.3f')
+        assert summary_csv_exists(path)
+        in_memory = read_summary_csv(path)
+    assert not (tmp_path / 'summary.csv').exists()
+
+    write_summary_csv(df, path, float_format='%.3f')
+    pd.testing.assert_frame_equal(in_memory, pd.read_csv(path))
+
+    with collect_plot_frames():
+        assert not summary_csv_exists(path)
+        with pytest.raises(FileNotFoundError):
+            read_summary_csv(path)
+
+
+def test_downsample_keeps_peaks():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'X': [f'H_{i}' for i in range(8760)],
+        'heating': rng.uniform(0, 10, 8760),
+        'cooling': -rng.uniform(0, 10, 8760),
+    })
+    df.loc[4000, 'heating'] = 100.0
+    df.loc[6000, 'cooling'] = -100.0
+    assert is_time_series(df['X'])
+
+    for stacked in (False, True):
+        sampled = downsample_min_max(df, ['heating', 'cooling'], 1000, stacked=stacked)
+        assert len(sampled) <= 1002
+        assert sampled['X'].iloc[0] == 'H_0' and sampled['X'].iloc[-1] == 'H_8759'
+        assert sampled.index.is_monotonic_increasing
+        assert {4000, 6000} <= set(sampled.index)
+
+    assert downsample_min_max(df, ['heating'], 10000) is df
+    assert not is_time_series(pd.Series(['B1001', 'B1002']))
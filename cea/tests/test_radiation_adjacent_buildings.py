@@ -0,0 +1,56 @@
+"""
+Test that the STRtree selection of adjacent buildings matches the brute-force bounding box check
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from cea.resources.radiation import geometry_generator
+from cea.resources.radiation.geometry_generator import (ADJACENCY_DISTANCE, are_buildings_close_to_eachother,
+                                                        calc_bounding_box_corners, find_close_buildings,
+                                                        print_adjacent_solids_report)
+
+
+@pytest.fixture
+def boxes(monkeypatch):
+    """Bounding boxes (xmin, ymin, zmin, xmax, ymax, zmax) standing in for the solids of a small site"""
+    rng = np.random.default_rng(0)
+    corners = rng.uniform(0, 500, (60, 2))
+    # buildings exactly at and just beyond the adjacency distance of the first one
+    corners[1] = corners[0] + [ADJACENCY_DISTANCE, 0]
+    corners[2] = corners[0] + [0, ADJACENCY_DISTANCE + 1e-6]
+    sizes = rng.uniform(5, 40, (60, 2))
+    boxes = [(x, y, 0.0, x + dx, y + dy, 20.0) for (x, y), (dx, dy) in zip(corners, sizes)]
+    monkeypatch.setattr(geometry_generator.calculate, 'get_bounding_box', lambda solid: solid)
+    return boxes
+
+
+def test_find_close_buildings_matches_brute_force(boxes):
+    corners = calc_bounding_box_corners(boxes)
+    query = [0, 5, 17, 59]
+
+    close_buildings = find_close_buildings(corners[query], corners)
+
+    assert len(close_buildings) == len(query)
+    for i, indices in zip(query, close_buildings):
+        x, y = boxes[i][:2]
+        expected = [k for k, other in enumerate(boxes) if are_buildings_close_to_eachother(x, y, other)]
+        assert indices.tolist() == expected
+    assert 1 in close_buildings[0] and 2 not in close_buildings[0]
+    assert find_close_buildings(corners[[]], corners) == []
+
+
+def test_adjacent_solids_report(boxes, capsys):
+    corners = calc_bounding_box_corners(boxes)
+    close_buildings = find_close_buildings(corners[:3], corners)
+
+    print_adjacent_solids_report(close_buildings, boxes)
+    assert len(capsys.readouterr().out.splitlines()) == 1
+
+    print_adjacent_solids_report(close_buildings, boxes, measure_bytes=True)
+    counts_line, bytes_line = capsys.readouterr().out.splitlines()
+    box_bytes = len(pickle.dumps(boxes[0], protocol=pickle.HIGHEST_PROTOCOL))
+    assert f"{sum(len(indices) for indices in close_buildings)} in total instead of {3 * len(boxes)}" in counts_line
+    assert f"instead of {3 * len(boxes) * box_bytes / 1e6:.1f} MB" in bytes_line
@@ -0,0 +1,104 @@
+"""
+Unit tests for the content-addressed cache of the 3D building geometry of the radiation scripts.
+"""
+
+import os
+
+import numpy as np
+import pytest
+from shapely.geometry import box
+
+from cea.resources.radiation.geometry_cache import (ZONE, BuildingGeometryCache, building_solid_fingerprint,
+                                                    elevation_patch_fingerprint, zone_building_fingerprint)
+
+
+class ElevationPatch(object):
+    def __init__(self, elevation):
+        self.elevation_map = np.full((3, 3), elevation, dtype=float)
+        self.x_coords = np.arange(3.0)
+        self.y_coords = np.arange(3.0)
+        self.x_size = 1.0
+        self.y_size = -1.0
+        self.nodata = None
+
+
+def solid_fingerprint(geometry=box(0, 0, 10, 10), height_ag=10.0, floors_ag=3, void_deck=0, simplification=2.0,
+                      elevation=400.0):
+    return building_solid_fingerprint(geometry, height_ag, floors_ag, void_deck, simplification,
+                                      elevation_patch_fingerprint(ElevationPatch(elevation)))
+
+
+class TestFingerprints:
+    def test_solid_fingerprint_is_stable(self):
+        assert solid_fingerprint() == solid_fingerprint()
+
+    @pytest.mark.parametrize("change", [dict(geometry=box(0, 0, 10, 11)), dict(height_ag=12.0), dict(floors_ag=4),
+                                        dict(void_deck=1), dict(simplification=5.0), dict(elevation=401.0)])
+    def test_solid_fingerprint_changes_with_inputs(self, change):
+        assert solid_fingerprint(**change) != solid_fingerprint()
+
+    def test_zone_fingerprint_depends_on_adjacent_solids(self):
+        own, adjacent = solid_fingerprint(), solid_fingerprint(geometry=box(20, 0, 30, 10))
+        reference = zone_building_fingerprint(own, [0.3] * 4, False, [own, adjacent])
+        assert zone_building_fingerprint(own, [0.3] * 4, False, [adjacent, own]) == reference
+        assert zone_building_fingerprint(own, [0.3] * 4, False, [own]) != reference
+        assert zone_building_fingerprint(own, [0.3, 0.3, 0.4, 0.3], False, [own, adjacent]) != reference
+
+
+class TestBuildingGeometryCache:
+    def test_store_restore_and_evict(self, tmp_path):
+        cache = BuildingGeometryCache(str(tmp_path / "cache"))
+        pickle_location = tmp_path / "run" / ZONE / "B1000"
+        pickle_location.parent.mkdir(parents=True)
+        pickle_location.write_bytes(b"geometry of B1000")
+
+        assert not cache.contains(ZONE, "abc")
+        cache.store(ZONE, "abc", str(pickle_location))
+        assert cache.contains(ZONE, "abc")
+
+        restored = tmp_path / "next-run" / ZONE / "B1000"
+        cache.restore(ZONE, "abc", str(restored))
+        assert restored.read_bytes() == b"geometry of B1000"
+
+        cache.store(ZONE, "def", str(pickle_location))
+        assert cache.evict_orphans(ZONE, ["def"]) == ["abc"]
+        assert os.listdir(tmp_path / "cache" / ZONE) == ["def"]
+
+
+class TestUpdateGeometryCache:
+    @pytest.fixture
+    def geometry_generator(self):
+        # imported here, so that the tests of the cache itself do not need the 3D geometry libraries
+        from cea.resources.radiation import geometry_generator
+        return geometry_generator
+
+    def generate(self, geometry_generator, run_dir, name):
+        geometry = geometry_generator.BuildingGeometry(name=name, terrain_elevation=400.0, windows=[[0, 0, 0]])
+        return geometry.save(os.path.join(run_dir, ZONE, name))
+
+    def test_renamed_building(self, geometry_generator, tmp_path):
+        cache = BuildingGeometryCache(str(tmp_path / "cache"))
+        self.generate(geometry_generator, str(tmp_path / "run"), "B1000")
+        geometry_generator.update_geometry_cache(cache, str(tmp_path / "run"), ZONE, ["B1000"], ["abc"],
+                                                 np.array([True]))
+
+        geometry_generator.update_geometry_cache(cache, str(tmp_path / "next-run"), ZONE, ["B2000"], ["abc"],
+                                                 np.array([False]))
+
+        restored = geometry_generator.BuildingGeometry.load(str(tmp_path / "next-run" / ZONE / "B2000"))
+        assert restored.name == "B2000"
+        assert restored.windows == [[0, 0, 0]]
+
+    def test_identical_buildings(self, geometry_generator, tmp_path):
+        cache = BuildingGeometryCache(str(tmp_path / "cache"))
+        for name in ["B1000", "B1001"]:
+            self.generate(geometry_generator, str(tmp_path / "run"), name)
+        geometry_generator.update_geometry_cache(cache, str(tmp_path / "run"), ZONE, ["B1000", "B1001"],
+                                                 ["abc", "abc"], np.array([True, True]))
+
+        geometry_generator.update_geometry_cache(cache, str(tmp_path / "next-run"), ZONE, ["B1000", "B1001"],
+                                                 ["abc", "abc"], np.array([False, False]))
+
+        for name in ["B1000", "B1001"]:
+            assert geometry_generator.BuildingGeometry.load(str(tmp_path / "next-run" / ZONE / name)).name == name
+        assert os.listdir(tmp_path / "cache" / ZONE) == ["abc"]
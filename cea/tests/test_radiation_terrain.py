@@ -0,0 +1,74 @@
+"""
+Unit tests for the error-bounded decimation of the terrain raster of the radiation scene.
+"""
+
+import numpy as np
+import pytest
+from matplotlib.tri import LinearTriInterpolator, Triangulation
+from shapely.geometry import box
+
+from cea.resources.radiation.terrain import calc_detail_mask, select_terrain_points
+
+
+@pytest.fixture
+def terrain():
+    x_coords = np.arange(300) + 0.5
+    y_coords = 300 - np.arange(300) - 0.5
+    xx, yy = np.meshgrid(x_coords, y_coords)
+    elevation = 400 + 15 * np.sin(xx / 60) * np.cos(yy / 80) + np.random.default_rng(0).normal(0, 0.02, xx.shape)
+    return elevation, x_coords, y_coords
+
+
+class TestSelectTerrainPoints:
+    def test_error_is_within_tolerance(self, terrain):
+        elevation, x_coords, y_coords = terrain
+        valid = np.ones(elevation.shape, dtype=bool)
+        selection = select_terrain_points(elevation, x_coords, y_coords, valid, 0.25)
+        assert selection.max_error <= 0.25
+        assert selection.selected.sum() < 0.1 * valid.sum()
+        assert len(selection.triangles) > 0
+
+    def test_error_is_within_tolerance_of_the_returned_triangles(self, terrain):
+        # the terrain mesh of the radiation scene is built from these triangles, check them independently
+        elevation, x_coords, y_coords = terrain
+        valid = np.ones(elevation.shape, dtype=bool)
+        valid[:40, :40] = False
+        selection = select_terrain_points(elevation, x_coords, y_coords, valid, 0.25)
+        rows, columns = np.nonzero(selection.selected)
+        mesh = Triangulation(x_coords[columns], y_coords[rows], selection.triangles)
+        surface = LinearTriInterpolator(mesh, elevation[rows, columns])
+
+        xx, yy = np.meshgrid(x_coords, y_coords)
+        mesh_elevation = surface(xx[valid], yy[valid])
+        assert not np.ma.is_masked(mesh_elevation)
+        assert np.abs(mesh_elevation - elevation[valid]).max() <= selection.max_error + 1e-9
+
+    def test_flat_terrain_only_keeps_the_coarse_grid(self):
+        x_coords = np.arange(100) + 0.5
+        y_coords = 100 - np.arange(100) - 0.5
+        elevation = np.full((100, 100), 400.0)
+        selection = select_terrain_points(elevation, x_coords, y_coords, np.ones((100, 100), dtype=bool), 0.1,
+                                          initial_step=10)
+        assert selection.max_error == pytest.approx(0.0, abs=1e-9)
+        assert selection.selected.sum() == 11 * 11
+
+    def test_nodata_and_detail_cells(self, terrain):
+        elevation, x_coords, y_coords = terrain
+        valid = np.ones(elevation.shape, dtype=bool)
+        valid[:40, :40] = False
+        detail_mask = calc_detail_mask(x_coords, y_coords, [box(100, 100, 120, 110)], 3.0)
+        selection = select_terrain_points(elevation, x_coords, y_coords, valid, 0.5, detail_mask)
+        assert not (selection.selected & ~valid).any()
+        assert (selection.selected[detail_mask]).all()
+        assert selection.max_error <= 0.5
+
+
+def test_detail_mask_covers_buffered_footprint():
+    x_coords = np.arange(50) + 0.5
+    y_coords = 50 - np.arange(50) - 0.5
+    mask = calc_detail_mask(x_coords, y_coords, [box(10, 10, 20, 20)], 2.0)
+    xx, yy = np.meshgrid(x_coords, y_coords)
+    expected = (xx >= 8) & (xx <= 22) & (yy >= 8) & (yy <= 22)
+    # the corners of the buffered square are rounded
+    assert mask[expected].mean() > 0.95
+    assert not mask[~expected].any()
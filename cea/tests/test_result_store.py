@@ -0,0 +1,70 @@
+"""
+Tests for the scenario-level columnar result store
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import cea.inputlocator
+from cea.utilities.result_store import DEMAND, LIFECYCLE_EMISSIONS, ResultStore
+
+
+@pytest.fixture
+def locator(tmp_path):
+    locator = cea.inputlocator.InputLocator(str(tmp_path))
+    os.makedirs(locator.get_demand_results_folder())
+    return locator
+
+
+def write_demand(locator, building, offset):
+    path = locator.get_demand_results_file(building)
+    pd.DataFrame({
+        'date': pd.date_range('2005-01-01', periods=8760, freq='h').astype(str),
+        'name': building,
+        'GRID_kWh': np.arange(8760) + offset,
+        'QH_sys_kWh': 0.5,
+    }).to_csv(path, index=False)
+    return path
+
+
+def test_query_buildings_and_hours(locator):
+    paths = {building: write_demand(locator, building, i) for i, building in enumerate(['B1', 'B2', 'B3'])}
+    store = ResultStore(locator)
+    store.add_files(DEMAND, paths)
+    assert store.is_current(DEMAND, paths)
+
+    july = store.query(DEMAND, ['GRID_kWh', 'missing_kWh'], buildings=['B1', 'B3'], hours=(4344, 5088))
+    assert list(july.columns) == ['name', 'GRID_kWh']
+    assert list(july['name'].unique()) == ['B1', 'B3']
+    assert july['GRID_kWh'].sum() == pytest.approx(2 * np.arange(4344, 5088).sum() + 744 * 2)
+
+
+def test_replace_buildings(locator):
+    paths = {building: write_demand(locator, building, 0) for building in ['B1', 'B2']}
+    store = ResultStore(locator)
+    store.add_files(DEMAND, paths)
+
+    paths['B2'] = write_demand(locator, 'B2', 0.25)
+    os.utime(paths['B2'], ns=(0, 0))  # make sure the change is noticed on coarse file system timestamps
+    assert not store.is_current(DEMAND, paths)
+
+    store.add_files(DEMAND, {'B2': paths['B2']})
+    assert store.is_current(DEMAND, paths)
+    totals = store.query(DEMAND, ['GRID_kWh']).groupby('name')['GRID_kWh'].sum()
+    assert totals['B2'] - totals['B1'] == pytest.approx(0.25 * 8760)
+
+
+def test_yearly_results(locator):
+    path = os.path.join(locator.scenario, 'B1_timeline.csv')
+    pd.DataFrame({'period': ['Y_2020', 'Y_2021'], 'name': 'B1', 'production_roof_kgCO2e': [10.0, 0.0],
+                  'Note': ['Constructed', '']}).to_csv(path, index=False)
+    store = ResultStore(locator)
+    store.add_files(LIFECYCLE_EMISSIONS, {'B1': path})
+
+    df = store.query(LIFECYCLE_EMISSIONS)
+    assert 'hour_of_year' not in df.columns
+    assert df['period'].tolist() == ['Y_2020', 'Y_2021']
+    assert not os.path.exists(store.path(LIFECYCLE_EMISSIONS) + f'.{os.getpid()}.tmp')
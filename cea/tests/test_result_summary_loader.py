@@ -0,0 +1,66 @@
+"""
+Test that reading only the needed columns and hours of CEA result files gives the same results as reading the whole
+file and slicing it
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cea.import_export.result_summary import (add_period_columns, get_standardized_date_column,
+                                              load_cea_results_from_csv_file,
+                                              slice_hourly_results_for_custom_time_period)
+
+RENAMES = {'heat_rejection_kW': 'heat_rejection_kWh'}
+
+
+def read_everything_then_slice(hour_start, hour_end, path, list_cea_column_names):
+    """The loader before only the needed columns and hours were read"""
+    df = pd.read_csv(path).rename(columns=RENAMES)
+    if {'DATE', 'Date', 'date'}.intersection(df.columns):
+        df = add_period_columns(get_standardized_date_column(df))
+        selected_columns = ['date'] + list_cea_column_names + ['period_month'] + ['period_season']
+        df = df[[col for col in selected_columns if col in df.columns]]
+        df['date'] = pd.to_datetime(df['date'], errors='coerce')
+        return slice_hourly_results_for_custom_time_period(hour_start, hour_end, df)
+    selected_columns = ['name'] + list_cea_column_names
+    return df[[col for col in selected_columns if col in df.columns]]
+
+
+@pytest.fixture
+def hourly_file(tmp_path):
+    rng = np.random.default_rng(0)
+    path = str(tmp_path / 'B1001.csv')
+    pd.DataFrame({
+        'name': 'B1001',
+        'DATE': pd.date_range('2005-01-01', periods=8760, freq='h').strftime('%Y-%m-%d %H:%M:%S'),
+        'GRID_kWh': rng.uniform(0, 10, 8760),
+        'heat_rejection_kW': rng.uniform(0, 5, 8760),
+        'unused_kWh': rng.uniform(0, 1, 8760),
+    }).to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize('hour_start, hour_end', [(0, 8760), (0, 24), (100, 300), (8700, 8760), (8000, 500)])
+def test_hourly_columns_and_period(hourly_file, hour_start, hour_end):
+    columns = ['GRID_kWh', 'heat_rejection_kWh']
+    df, message = load_cea_results_from_csv_file(hour_start, hour_end, hourly_file, columns)
+
+    assert message is None
+    assert list(df.columns) == ['date', 'GRID_kWh', 'heat_rejection_kWh', 'period_month', 'period_season']
+    expected_hours = hour_end - hour_start if hour_start <= hour_end else 8760 - hour_start + hour_end
+    assert len(df) == expected_hours
+    pd.testing.assert_frame_equal(df, read_everything_then_slice(hour_start, hour_end, hourly_file, columns))
+
+
+def test_annual_renamed_columns(tmp_path):
+    path = str(tmp_path / 'Total_demand.csv')
+    pd.DataFrame({'name': ['B1001', 'B1002'], 'GFA_m2': [100.0, 200.0], 'heat_rejection_kW': [1.0, 2.0],
+                  'unused_kWh': [3.0, 4.0]}).to_csv(path, index=False)
+    columns = ['heat_rejection_kWh', 'GFA_m2']
+
+    df, message = load_cea_results_from_csv_file(0, 8760, path, columns)
+
+    assert message is None
+    assert list(df.columns) == ['name', 'heat_rejection_kWh', 'GFA_m2']
+    pd.testing.assert_frame_equal(df, read_everything_then_slice(0, 8760, path, columns))
@@ -0,0 +1,133 @@
+"""
+Test the sample scenarios and the analysis of the sensitivity analysis executor
+"""
+
+import os
+import subprocess
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import cea.inputlocator
+from cea.utilities import sensitivity_analysis_executor
+from cea.utilities.sensitivity_analysis_executor import (analyze_results, collect_outputs, get_samples_folder,
+                                                         materialize_sample, parse_variable_input, run_samples)
+from cea.utilities.sensitivity_analysis_sampler import problem_for_salib, sample
+
+
+@pytest.fixture
+def base_scenario(tmp_path):
+    scenario = str(tmp_path / 'baseline')
+    locator = cea.inputlocator.InputLocator(scenario)
+    os.makedirs(locator.get_building_properties_folder())
+    pd.DataFrame({'name': ['B1', 'B2'], 'Es': [0.9, 0.8], 'Hs': [0.8, 0.8]}).to_csv(
+        locator.get_building_architecture(), index=False)
+    pd.DataFrame({'name': ['B1', 'B2'], 'Occ_m2p': [10.0, 20.0]}).to_csv(locator.get_building_internal(), index=False)
+    os.makedirs(locator.get_demand_results_folder())
+    pd.DataFrame({'name': ['B1', 'B2'], 'GRID_MWhyr': [1.5, 2.5]}).to_csv(locator.get_total_demand(), index=False)
+    os.makedirs(os.path.dirname(locator.get_radiation_building('B1')))
+    pd.DataFrame({'Date': ['2005-01-01'], 'roofs_top_kW': [1.0]}).to_csv(locator.get_radiation_building('B1'),
+                                                                          index=False)
+    return scenario
+
+
+def fake_demand(sample_scenarios, failing):
+    """Stands in for running occupancy and demand: GRID_MWhyr is Es, except for the failing samples"""
+    errors = {}
+    for sample_scenario in sample_scenarios:
+        locator = cea.inputlocator.InputLocator(sample_scenario)
+        # the results of demand are computed again, those of radiation are reused
+        assert not os.path.exists(locator.get_demand_results_folder())
+        assert os.path.exists(locator.get_radiation_building('B1'))
+        if os.path.basename(sample_scenario) in failing:
+            errors[sample_scenario] = subprocess.CalledProcessError(1, ['cea', 'demand'], stderr=b'')
+            continue
+        os.makedirs(locator.get_demand_results_folder())
+        envelope = pd.read_csv(locator.get_building_architecture())
+        pd.DataFrame({'name': envelope['name'], 'GRID_MWhyr': envelope['Es']}).to_csv(locator.get_total_demand(),
+                                                                                     index=False)
+    return errors
+
+
+def test_parse_variable_input():
+    assert parse_variable_input('building-properties/envelope.csv:Es') == ('building-properties/envelope.csv', 'Es',
+                                                                          False)
+    assert parse_variable_input(' building-properties/internal_loads.csv:Occ_m2p* ') == (
+        'building-properties/internal_loads.csv', 'Occ_m2p', True)
+    with pytest.raises(ValueError):
+        parse_variable_input('building-properties/envelope.csv')
+
+
+def test_materialize_sample(base_scenario, tmp_path):
+    sample_scenario = str(tmp_path / 'SA_1')
+    materialize_sample(base_scenario, sample_scenario,
+                       ['building-properties/envelope.csv:Es', 'building-properties/envelope.csv:Hs',
+                        'building-properties/internal_loads.csv:Occ_m2p*'], [0.5, 0.6, 1.5])
+
+    base_locator = cea.inputlocator.InputLocator(base_scenario)
+    sample_locator = cea.inputlocator.InputLocator(sample_scenario)
+    envelope = pd.read_csv(sample_locator.get_building_architecture())
+    assert envelope['Es'].tolist() == [0.5, 0.5]
+    assert envelope['Hs'].tolist() == [0.6, 0.6]
+    assert pd.read_csv(sample_locator.get_building_internal())['Occ_m2p'].tolist() == [15.0, 30.0]
+    # the base scenario is unchanged, its results are reused
+    assert pd.read_csv(base_locator.get_building_architecture())['Es'].tolist() == [0.9, 0.8]
+    assert pd.read_csv(base_locator.get_building_internal())['Occ_m2p'].tolist() == [10.0, 20.0]
+    assert collect_outputs(sample_scenario, ['get_total_demand:GRID_MWhyr']).tolist() == [4.0]
+
+    with pytest.raises(ValueError):
+        materialize_sample(base_scenario, sample_scenario, ['building-properties/envelope.csv:missing'], [1.0])
+
+
+def test_existing_scenarios_are_not_overwritten(base_scenario, tmp_path):
+    user_scenario = tmp_path / 'SA_1'
+    os.makedirs(user_scenario)
+    (user_scenario / 'notes.txt').write_text('prepared by the user')
+
+    with pytest.raises(FileExistsError):
+        materialize_sample(base_scenario, str(user_scenario), ['building-properties/envelope.csv:Es'], [0.5])
+    assert (user_scenario / 'notes.txt').read_text() == 'prepared by the user'
+
+
+def test_run_samples_in_batches(base_scenario, tmp_path, monkeypatch):
+    # a scenario of the project with the name of a sample
+    project = str(tmp_path)
+    os.makedirs(os.path.join(project, 'SA_1', 'inputs'))
+    batches = []
+
+    def run_commands_in_parallel(commands, sample_scenarios, cpu_budget, plugins=None, keep_going=False):
+        assert keep_going
+        batches.append([os.path.basename(sample_scenario) for sample_scenario in sample_scenarios])
+        return fake_demand(sample_scenarios, failing={'SA_3'})
+
+    monkeypatch.setattr(sensitivity_analysis_executor, 'run_commands_in_parallel', run_commands_in_parallel)
+    samples_folder = get_samples_folder(project, base_scenario)
+    done = []
+    samples = [[0.1], [0.2], [0.3], [0.4], [0.5]]
+
+    outputs = run_samples(base_scenario, samples_folder, samples, ['building-properties/envelope.csv:Es'],
+                          ['occupancy', 'demand'], ['get_total_demand:GRID_MWhyr'], cpu_budget=2,
+                          on_batch_done=lambda batch, batch_outputs: done.append((batch, batch_outputs.tolist())))
+
+    assert batches == [['SA_1', 'SA_2'], ['SA_3', 'SA_4'], ['SA_5']]
+    np.testing.assert_allclose(outputs[:, 0], [0.2, 0.4, np.nan, 0.8, 1.0])
+    assert [batch for batch, _ in done] == [[0, 1], [2, 3], [4]]
+    assert os.listdir(samples_folder) == []
+    assert os.path.isdir(os.path.join(project, 'SA_1', 'inputs'))
+    # the results of the base scenario are unchanged
+    base_locator = cea.inputlocator.InputLocator(base_scenario)
+    assert pd.read_csv(base_locator.get_total_demand())['GRID_MWhyr'].tolist() == [1.5, 2.5]
+    assert os.path.exists(base_locator.get_radiation_building('B1'))
+
+
+@pytest.mark.parametrize('method', ['sobol', 'morris'])
+def test_analyze_results(method):
+    problem = problem_for_salib(['var_1', 'var_2'], [[0, 1], [0, 1]])
+    samples = sample(problem, 64, method)
+    outputs = 10 * samples[:, 0] + samples[:, 1]
+
+    indices = analyze_results(problem, method, samples, outputs[:, np.newaxis], ['y']).set_index('variable')
+    column = 'ST' if method == 'sobol' else 'mu_star'
+    assert indices.loc['var_1', column] > 5 * indices.loc['var_2', column]
+    assert (indices['target_output'] == 'y').all()
@@ -462,6 +462,23 @@ class TestThermalNetworkPhysics:
             f"DC pipe should warm from inlet to outlet; "
             f"got T_in={t_in:.1f} K, T_out={t_out:.1f} K, T_ground={t_ground:.1f} K"
         )
+
+    def test_calc_temperature_out_broadcasts_over_pipes_and_hours(self):
+        """Array inputs (hours x 1, hours x pipes, pipes) must give the same result as scalar calls."""
+        t_in = np.array([[363.15], [343.15]])
+        m = np.array([[0.5, 1.0, 0.0], [0.2, 0.0, 2.0]])
+        k = np.array([0.2, 0.1, 0.3])
+        t_ground = np.array([[283.15], [288.15]])
+        t_out = calc_temperature_out_per_pipe(t_in=t_in, m=m, k=k, t_ground=t_ground)
+        expected = [[calc_temperature_out_per_pipe(t_in[h, 0], m[h, p], k[p], t_ground[h, 0]) for p in range(3)]
+                    for h in range(2)]
+        np.testing.assert_allclose(t_out, expected)
+
+    def test_calc_temperature_out_array_with_zero_denominator_raises(self):
+        with pytest.raises(ValueError, match="denominator near zero"):
+            calc_temperature_out_per_pipe(t_in=np.array([363.15, 363.15]), m=np.array([0.5, 0.0]),
+                                          k=np.array([0.2, 0.0]), t_ground=283.15)
+
     # ------------------------------------------------------------------ #
     #  Parameter sensitivity — diameter, temperature, network type        #
     # ------------------------------------------------------------------ #
@@ -0,0 +1,75 @@
+"""
+Unit tests for the load-clustered representative hours of the detailed thermal network.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cea.constants import HOURS_IN_YEAR
+from cea.technologies.thermal_network.detailed.representative_hours import k_medoids, select_representative_hours
+
+
+@pytest.fixture
+def buildings_demands():
+    hours = np.arange(HOURS_IN_YEAR)
+    rng = np.random.default_rng(0)
+    demands = {}
+    for i in range(5):
+        load = np.maximum(0.0, 40 * np.cos(2 * np.pi * hours / HOURS_IN_YEAR) + 15 * np.sin(2 * np.pi * hours / 24)
+                          + rng.normal(0, 2, HOURS_IN_YEAR))
+        demands['B100%d' % i] = pd.DataFrame({'Q_substation_heating': load,
+                                              'T_sup_target_DH': np.where(load > 0, 55 + load / 5, np.nan)})
+    return demands
+
+
+class TestRepresentativeHours:
+    def test_weights_cover_the_year(self, buildings_demands):
+        selected = select_representative_hours(buildings_demands, 'DH', 50)
+        assert len(selected.hours) == 50
+        assert selected.weights.sum() == HOURS_IN_YEAR
+        assert (np.diff(selected.hours) > 0).all()
+        assert len(selected.timestep_mapping) == HOURS_IN_YEAR
+
+    def test_representative_hours_map_to_themselves(self, buildings_demands):
+        selected = select_representative_hours(buildings_demands, 'DH', 50)
+        np.testing.assert_array_equal(selected.timestep_mapping[selected.hours], np.arange(50))
+
+    def test_peak_hour_is_simulated(self, buildings_demands):
+        total_load = sum(df['Q_substation_heating'] for df in buildings_demands.values())
+        selected = select_representative_hours(buildings_demands, 'DH', 20)
+        assert int(np.argmax(total_load)) in selected.hours
+
+    def test_error_decreases_with_more_hours(self, buildings_demands):
+        coarse = select_representative_hours(buildings_demands, 'DH', 10)
+        fine = select_representative_hours(buildings_demands, 'DH', 200)
+        assert fine.max_load_deviation_kW < coarse.max_load_deviation_kW
+        assert fine.annual_load_error < 0.02
+
+    def test_k_medoids_separates_clusters(self):
+        features = np.concatenate([np.zeros((10, 2)), np.ones((10, 2)) * 10])
+        medoids, labels = k_medoids(features, 2)
+        assert len(set(labels[:10])) == 1
+        assert len(set(labels[10:])) == 1
+        assert labels[0] != labels[10]
+
+    @pytest.fixture
+    def model(self):
+        # imported here, so that the rest of the tests do not need the thermal network model (and GDAL)
+        from cea.technologies.thermal_network.detailed import model
+        return model
+
+    def test_results_of_previous_run_follow_the_simulated_hours(self, buildings_demands, model):
+        selected = select_representative_hours(buildings_demands, 'DH', 30)
+        simulated = pd.DataFrame({'PIPE0': np.arange(30.0), 'PIPE1': -np.arange(30.0)})
+        # the annual edge mass flows written by the previous run
+        previous_run = model.extrapolate_datapoints_for_representative_weeks(simulated, selected.timestep_mapping)
+        assert len(previous_run) == HOURS_IN_YEAR
+
+        thermal_network = SimpleNamespace(simulated_hours=list(selected.hours))
+        pd.testing.assert_frame_equal(model.cut_out_timesteps_of_previous_run(thermal_network, previous_run), simulated)
+        # every hour is simulated
+        thermal_network.simulated_hours = None
+        assert model.cut_out_timesteps_of_previous_run(thermal_network, previous_run) is previous_run
@@ -0,0 +1,55 @@
+"""
+Unit tests for the persistent EPANET model of the simplified thermal network.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cea.technologies.thermal_network.simplified.epanet_model import EpanetNetworkModel
+
+
+@pytest.fixture
+def network():
+    node_df = pd.DataFrame({'type': ['PLANT', 'NONE', 'CONSUMER', 'CONSUMER'],
+                            'building': ['NONE', 'NONE', 'B1000', 'B1001'],
+                            'coordinates': [(0.0, 0.0), (100.0, 0.0), (200.0, 50.0), (200.0, -50.0)]},
+                           index=['NODE0', 'NODE1', 'NODE2', 'NODE3'])
+    edge_df = pd.DataFrame({'start node': ['NODE0', 'NODE1', 'NODE1'],
+                            'end node': ['NODE1', 'NODE2', 'NODE3'],
+                            'length_m': [100.0, 110.0, 110.0]},
+                           index=['PIPE0', 'PIPE1', 'PIPE2'])
+    return node_df, edge_df
+
+
+class TestEpanetNetworkModel:
+    def setup_method(self):
+        EpanetNetworkModel.model_cache.clear()
+
+    def test_model_is_reused_for_the_same_topology(self, network):
+        node_df, edge_df = network
+        model = EpanetNetworkModel.for_network(node_df, edge_df, 20.0, 100, 0.2)
+        assert EpanetNetworkModel.for_network(node_df, edge_df, 20.0, 100, 0.2) is model
+        assert EpanetNetworkModel.for_network(node_df, edge_df, 25.0, 100, 0.2) is not model
+        assert model.plant_node == 'NODE0'
+        assert model.building_nodes_pairs == {'NODE2': 'B1000', 'NODE3': 'B1001'}
+
+    def test_reset_restores_diameters_and_plant_head(self, network):
+        node_df, edge_df = network
+        model = EpanetNetworkModel.for_network(node_df, edge_df, 20.0, 100, 0.2)
+        model.set_diameters({'PIPE0': 0.5})
+        model.set_plant_head_pattern(30, [1.0, 0.9])
+        model = EpanetNetworkModel.for_network(node_df, edge_df, 20.0, 100, 0.2)
+        assert model.wn.get_link('PIPE0').diameter == model.initial_diameters_m['PIPE0']
+        reservoir = model.wn.get_node('NODE0')
+        assert reservoir.head_timeseries.base_value == model.plant_base_head_m
+        assert reservoir.head_timeseries.pattern is None
+
+    def test_set_demands_patches_patterns_in_place(self, network):
+        node_df, edge_df = network
+        model = EpanetNetworkModel.for_network(node_df, edge_df, 20.0, 100, 0.2)
+        model.set_demands({'B1000': 0.01, 'B1001': 0.02},
+                          {'B1000': [1.0, 0.5], 'B1001': [0.2, 1.0]})
+        junction = model.wn.get_node('NODE3')
+        assert junction.demand_timeseries_list[0].base_value == 0.02
+        np.testing.assert_allclose(model.wn.get_pattern('B1001').multipliers, [0.2, 1.0])
@@ -0,0 +1,62 @@
+"""
+Unit tests for the sparse incidence-matrix solvers of the detailed thermal network.
+
+The sparse solvers must reproduce the dense ``np.linalg`` solutions they replace, including after flow reversals.
+"""
+
+import numpy as np
+import pytest
+
+from cea.technologies.thermal_network.detailed.sparse_solver import (
+    IncidenceMatrixSolver, create_random_network,
+    solve_edge_flows, solve_node_pressures,
+    dense_solve_edge_flows, dense_solve_node_pressures,
+)
+
+
+@pytest.fixture(params=[0, 5], ids=["tree", "looped"])
+def network(request):
+    edge_node_matrix, node_flows = create_random_network(60, number_of_loops=request.param, seed=request.param)
+    reversal = np.where(np.random.default_rng(2).random(edge_node_matrix.shape[1]) < 0.3, -1.0, 1.0)
+    return edge_node_matrix * reversal, node_flows
+
+
+class TestIncidenceMatrixSolver:
+    def setup_method(self):
+        IncidenceMatrixSolver.topology_cache.clear()
+
+    def test_edge_flows_match_dense(self, network):
+        edge_node_matrix, node_flows = network
+        np.testing.assert_allclose(solve_edge_flows(edge_node_matrix, node_flows, 0),
+                                   dense_solve_edge_flows(edge_node_matrix, node_flows, 0), atol=1e-9)
+
+    def test_edge_flows_satisfy_mass_balance(self, network):
+        edge_node_matrix, node_flows = network
+        edge_flows = solve_edge_flows(edge_node_matrix, node_flows, 0)
+        np.testing.assert_allclose(edge_node_matrix @ edge_flows, node_flows, atol=1e-9)
+
+    def test_node_pressures_match_dense(self, network):
+        edge_node_matrix, _ = network
+        edge_pressure_loss = np.random.default_rng(3).uniform(0, 1000, edge_node_matrix.shape[1])
+        np.testing.assert_allclose(solve_node_pressures(edge_node_matrix, edge_pressure_loss),
+                                   dense_solve_node_pressures(edge_node_matrix, edge_pressure_loss), atol=1e-6)
+
+    def test_factorization_reused_across_flow_reversals(self, network):
+        edge_node_matrix, node_flows = network
+        solver, _ = IncidenceMatrixSolver.for_edge_node_matrix(edge_node_matrix)
+        reversed_solver, orientation = IncidenceMatrixSolver.for_edge_node_matrix(-edge_node_matrix)
+        assert solver is reversed_solver
+        assert len(IncidenceMatrixSolver.topology_cache) == 1
+        np.testing.assert_allclose(solve_edge_flows(-edge_node_matrix, node_flows, 0),
+                                   -solve_edge_flows(edge_node_matrix, node_flows, 0), atol=1e-9)
+
+    def test_disconnected_network_falls_back_to_dense(self):
+        edge_node_matrix = np.array([[-1.0, 0.0],
+                                     [1.0, 0.0],
+                                     [0.0, -1.0],
+                                     [0.0, 1.0]])
+        edge_pressure_loss = np.array([10.0, 20.0])
+        solver, _ = IncidenceMatrixSolver.for_edge_node_matrix(edge_node_matrix)
+        assert not solver.is_connected
+        np.testing.assert_allclose(solve_node_pressures(edge_node_matrix, edge_pressure_loss),
+                                   dense_solve_node_pressures(edge_node_matrix, edge_pressure_loss))
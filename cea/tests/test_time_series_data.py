@@ -0,0 +1,55 @@
+"""
+Test the storage of the hourly series of the demand calculation in a reusable buffer
+"""
+
+import numpy as np
+import pandas as pd
+
+from cea.constants import HOURS_IN_YEAR
+from cea.demand.time_series_data import HeatingLoads, TimeSeriesBuffer, TimeSeriesData, Weather
+
+
+def weather():
+    return Weather(*[np.zeros(HOURS_IN_YEAR) for _ in range(5)])
+
+
+def test_series_are_stored_in_buffer():
+    buffer = TimeSeriesBuffer()
+    tsd = TimeSeriesData.from_buffer(weather(), buffer)
+
+    # all float series are rows of one block, the weather and system status are not
+    assert buffer.data.shape == (len(buffer.rows), HOURS_IN_YEAR)
+    assert ('occupancy', 'people') in buffer.rows and ('thermal_resistance', 'RSE_wall') in buffer.rows
+    assert not any(group in ('weather', 'system_status') for group, _ in buffer.rows)
+    assert np.isnan(tsd.heating_loads.Qhs).all()
+
+    # assigning a series copies it into the buffer, also from pandas
+    tsd.heating_loads.Qhs = np.arange(HOURS_IN_YEAR)
+    tsd.electrical_loads.Ea = pd.Series(np.ones(HOURS_IN_YEAR))
+    tsd.cooling_loads.Qcs = tsd.cooling_loads.Qcs_sys = np.zeros(HOURS_IN_YEAR)
+    tsd.heating_loads.Qhs[10] = -1.0
+    assert buffer.row('heating_loads', 'Qhs')[10] == -1.0
+    assert buffer.row('heating_loads', 'Qhs')[11] == 11.0
+    assert isinstance(tsd.electrical_loads.Ea, np.ndarray)
+    assert buffer.row('electrical_loads', 'Ea').sum() == HOURS_IN_YEAR
+    tsd.cooling_loads.Qcs[0] = 1.0
+    assert tsd.cooling_loads.Qcs_sys[0] == 0.0
+    assert tsd.heating_loads.Qhs.base is buffer.data
+
+    float32 = buffer.as_float32()
+    assert float32.dtype == np.float32 and float32[buffer.rows['heating_loads', 'Qhs'], 11] == 11.0
+    assert buffer.as_float32() is float32
+
+    # the next building reuses the memory, starting from NaN again
+    data = buffer.data
+    tsd = TimeSeriesData.from_buffer(weather(), buffer)
+    assert buffer.data is data
+    assert np.isnan(tsd.heating_loads.Qhs).all()
+
+
+def test_unbound_series_are_replaced():
+    heating_loads = HeatingLoads()
+    series = np.zeros(HOURS_IN_YEAR)
+    heating_loads.Qhs = series
+    assert heating_loads.Qhs is series
+    assert np.isnan(TimeSeriesData(weather()).heating_loads.Qhs).all()
@@ -0,0 +1,58 @@
+"""
+Test the mass balance solver of the dynamic infiltration calculation against a minimization of the mass balance.
+"""
+
+import numpy as np
+import pytest
+from scipy.optimize import minimize
+
+from cea.demand import constants
+from cea.demand.ventilation_air_flows_detailed import (NaturalVentilationSolver, allocate_default_leakage_paths,
+                                                       allocate_default_ventilation_openings,
+                                                       calc_air_flow_mass_balance, calc_coeff_lea_zone,
+                                                       calc_coeff_vent_zone, calc_qv_delta_p_ref,
+                                                       lookup_coeff_wind_pressure)
+
+
+def properties_natural_ventilation(area_vent_zone):
+    """The properties of a 10 m high building with a 20 m x 20 m footprint, as in get_properties_natural_ventilation"""
+    height_zone, area_facade_zone, area_roof_zone = 10.0, 80.0 * 10.0, 400.0
+    coeff_lea_path, height_lea_path, orientation_lea_path = allocate_default_leakage_paths(
+        calc_coeff_lea_zone(calc_qv_delta_p_ref(3.0, 4000.0)), area_facade_zone, area_roof_zone, height_zone)
+    coeff_vent_path, height_vent_path, orientation_vent_path = allocate_default_ventilation_openings(
+        calc_coeff_vent_zone(area_vent_zone), height_zone)
+    return {'coeff_lea_path': coeff_lea_path,
+            'height_lea_path': height_lea_path,
+            'coeff_wind_pressure_path_lea': lookup_coeff_wind_pressure(
+                height_lea_path, constants.SHIELDING_CLASS, orientation_lea_path, 0, 0),
+            'coeff_vent_path': coeff_vent_path,
+            'height_vent_path': height_vent_path,
+            'coeff_wind_pressure_path_vent': lookup_coeff_wind_pressure(
+                height_vent_path, constants.SHIELDING_CLASS, orientation_vent_path, 0, 0),
+            'factor_cros': 0}
+
+
+@pytest.mark.parametrize('area_vent_zone', [0.0, 500.0])
+def test_air_flows_balance_the_mass_balance(area_vent_zone):
+    props = properties_natural_ventilation(area_vent_zone)
+    solver = NaturalVentilationSolver(props)
+    rng = np.random.default_rng(42)
+
+    for temp_zone, u_wind, temp_ext in zip(rng.uniform(15, 28, 50), rng.uniform(0, 12, 50),
+                                           rng.uniform(-15, 35, 50)):
+        qm_sum_in, qm_sum_out = solver.calc_air_flows(temp_zone, u_wind, temp_ext)
+        assert qm_sum_in == pytest.approx(-qm_sum_out, rel=1e-6, abs=1e-6)
+
+        # the zone pressure of the previous method: minimize the absolute mass balance
+        res = minimize(calc_air_flow_mass_balance, 1,
+                       args=(temp_zone, u_wind, temp_ext, props, 'minimize',), method='COBYLA',
+                       options={'maxiter': 1000, 'rhobeg': 1.0, 'tol': 1e-8})
+        expected_in, _ = calc_air_flow_mass_balance(res.x, temp_zone, u_wind, temp_ext, props, 'calculate')
+        assert qm_sum_in == pytest.approx(expected_in, rel=1e-3)
+
+
+def test_no_wind_no_stack_effect():
+    solver = NaturalVentilationSolver(properties_natural_ventilation(0.0))
+    qm_sum_in, qm_sum_out = solver.calc_air_flows(20.0, 0.0, 20.0)
+    assert qm_sum_in == pytest.approx(0.0, abs=1e-6)
+    assert qm_sum_out == pytest.approx(0.0, abs=1e-6)
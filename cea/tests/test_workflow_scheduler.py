@@ -0,0 +1,112 @@
+"""
+Test the dependency-aware scheduling of workflow steps.
+"""
+
+import subprocess
+
+import pytest
+
+import cea
+import cea.config
+import cea.scripts
+from cea.utilities.batch_process_workflow import cea_commands, run_commands_in_parallel
+from cea.workflows.scheduler import run_graph, step_dependencies
+from cea.workflows.workflow import completed_steps
+
+WORKFLOW = ["radiation", "occupancy", "demand", "photovoltaic", "solar-collector", "photovoltaic-thermal",
+            "final-energy", "emissions", "anthropogenic-heat"]
+
+
+class FakeStep(object):
+    """A step that is done after it has been polled `duration` times"""
+
+    def __init__(self, duration=1, exit_code=0):
+        self.duration = duration
+        self.exit_code = exit_code
+
+    def __call__(self):
+        self.duration -= 1
+        return self.exit_code if self.duration <= 0 else None
+
+
+def test_step_dependencies():
+    dependencies = step_dependencies(WORKFLOW)
+    index = WORKFLOW.index
+
+    assert dependencies[index("radiation")] == set()
+    assert dependencies[index("occupancy")] == set()
+    assert dependencies[index("demand")] == {index("radiation"), index("occupancy")}
+    for solar in ("photovoltaic", "solar-collector", "photovoltaic-thermal"):
+        assert dependencies[index(solar)] == {index("radiation")}
+    assert index("photovoltaic") in dependencies[index("emissions")]
+    assert index("demand") in dependencies[index("emissions")]
+    # the inputs of anthropogenic-heat are not declared in schemas.yml, so it waits for everything
+    assert dependencies[index("anthropogenic-heat")] == set(range(index("anthropogenic-heat")))
+
+
+def test_invalid_script_fails_before_any_step_starts(monkeypatch):
+    with pytest.raises(cea.ScriptNotFoundException):
+        step_dependencies(["radiation", "no-such-script"])
+
+    def popen(*args, **kwargs):
+        raise AssertionError("no command should be started")
+
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    with pytest.raises(cea.ScriptNotFoundException):
+        run_commands_in_parallel(["radiation", "no-such-script"], ["scenario-1", "scenario-2"], cpu_budget=2)
+
+
+def test_batch_commands_are_scripts():
+    config = cea.config.Configuration(cea.config.DEFAULT_CONFIG)
+    for parameter in config.batch_process_workflow.parameters.values():
+        if isinstance(parameter, cea.config.BooleanParameter):
+            parameter.set(True)
+    config.batch_process_workflow.import_from_rhino_gh = False
+
+    commands = cea_commands(config)
+    assert "database-helper" in commands
+    for command in commands:
+        cea.scripts.by_name(command)
+
+
+def test_run_graph_shares_cpu_budget():
+    dependencies = {0: set(), 1: {0}, 2: {0}, 3: {1, 2}}
+    started = []
+
+    def start_step(step, number_of_processes):
+        started.append((step, number_of_processes))
+        return FakeStep(duration=step + 1)
+
+    finished = run_graph(dependencies, start_step, cpu_budget=8, wait=lambda: None)
+
+    assert finished == [0, 1, 2, 3]
+    assert started == [(0, 8), (1, 4), (2, 4), (3, 8)]
+
+
+def test_run_graph_resume_and_failure():
+    dependencies = {0: set(), 1: set(), 2: {0}, 3: {1}}
+    started = []
+    done = []
+
+    def start_step(step, number_of_processes):
+        started.append(step)
+        return FakeStep(duration=3 if step == 2 else 1, exit_code=1 if step == 3 else 0)
+
+    with pytest.raises(RuntimeError):
+        run_graph(dependencies, start_step, cpu_budget=2, completed=[0, 1], on_step_done=done.append,
+                  wait=lambda: None)
+
+    # the running step is finished when another step fails
+    assert started == [2, 3]
+    assert done == [2]
+
+
+def test_run_graph_circular_dependencies():
+    with pytest.raises(ValueError):
+        run_graph({0: {1}, 1: {0}}, lambda step, n: FakeStep(), cpu_budget=1, wait=lambda: None)
+
+
+def test_completed_steps_of_older_resume_files():
+    assert completed_steps(2) == [0, 1, 2]
+    assert completed_steps([0, 3]) == [0, 3]
+    assert completed_steps(None) == []
@@ -5,11 +5,15 @@ This was originally explored and created for the ETH MiBS IDP 2023.
 
 # TODO: change the hard-coded path; this is subject to a structural separation of project-based CEA Features from scenario-based CEA Features
 
+import multiprocessing
 import os
 import subprocess
 import sys
+import tempfile
 import cea.config
+import cea.scripts
 import time
+from cea.workflows.scheduler import run_graph, step_dependencies
 
 __author__ = "Zhongming Shi, Mathias Niffeler"
 __copyright__ = "Copyright 2023, Architecture and Building Systems - ETH Zurich"
@@ -25,15 +29,14 @@ __status__ = "Production"
 my_env = os.environ.copy()
 my_env['PATH'] = f"{os.path.dirname(sys.executable)}:{my_env['PATH']}"
 
-def exec_cea_commands(config, cea_scenario):
+def cea_commands(config):
     """
-    Automate user-defined CEA commands one after another.
+    The user-defined CEA commands (script names), in the order they are executed.
 
     :param config: the configuration object to use
     :type config: cea.config.Configuration
-    :param cea_scenario: path to the CEA scenario to be assessed using CEA
-    :type cea_scenario: file path
-    :return:
+    :return: the names of the scripts to run on each scenario
+    :rtype: list[str]
     """
     # acquire the user-defined CEA commands
     export_to_rhino_gh = config.batch_process_workflow.export_to_rhino_gh
@@ -66,88 +69,173 @@ def exec_cea_commands(config, cea_scenario):
 
     results_summary_and_analytics = config.batch_process_workflow.results_summary_and_analytics
 
-    # execute selected CEA commands
-    if export_to_rhino_gh and not import_from_rhino_gh:
-        subprocess.run(['cea', 'export-to-rhino-gh', '--scenario', cea_scenario], env=my_env, check=True,
-                       capture_output=True)
-
-    if import_from_rhino_gh and not export_to_rhino_gh:
-        subprocess.run(['cea', 'import-from-rhino-gh', '--scenario', cea_scenario], env=my_env, check=True,
-                       capture_output=True)
-
     if import_from_rhino_gh and export_to_rhino_gh:
         raise ValueError("Cannot import from and export to Rhino/Grasshopper at the same time.")
 
+    commands = []
+    if export_to_rhino_gh:
+        commands.append('export-to-rhino-gh')
+    if import_from_rhino_gh:
+        commands.append('import-from-rhino-gh')
+
     if database_helper:
-        subprocess.run(['cea', 'data-helper', '--scenario', cea_scenario], env=my_env, check=True,
-                       capture_output=True)
+        commands.append('database-helper')
     if archetypes_mapper:
-        subprocess.run(['cea', 'archetypes-mapper', '--scenario', cea_scenario], env=my_env, check=True,
-                       capture_output=True)
+        commands.append('archetypes-mapper')
     if weather_helper:
-        subprocess.run(['cea', 'weather-helper', '--scenario', cea_scenario], env=my_env, check=True,
-                       capture_output=True)
+        commands.append('weather-helper')
     if surroundings_helper:
-        subprocess.run(['cea', 'surroundings-helper', '--scenario', cea_scenario], env=my_env, check=True,
-                       capture_output=True)
+        commands.append('surroundings-helper')
     if terrain_helper:
-        subprocess.run(['cea', 'terrain-helper', '--scenario', cea_scenario], env=my_env, check=True,
-                       capture_output=True)
+        commands.append('terrain-helper')
     if streets_helper:
-        subprocess.run(['cea', 'streets-helper', '--scenario', cea_scenario], env=my_env, check=True,
-                       capture_output=True)
+        commands.append('streets-helper')
 
     if radiation:
-        subprocess.run(['cea', 'radiation', '--scenario', cea_scenario], env=my_env, check=True, capture_output=True)
+        commands.append('radiation')
 
     if solar_pv:
-        subprocess.run(['cea', 'photovoltaic', '--scenario', cea_scenario], env=my_env, check=True, capture_output=True)
-
+        commands.append('photovoltaic')
     if solar_sc:
-        subprocess.run(['cea', 'solar-collector', '--scenario', cea_scenario],
-                       env=my_env, check=True, capture_output=True)
-
+        commands.append('solar-collector')
     if solar_pvt:
-        subprocess.run(['cea', 'photovoltaic-thermal', '--scenario', cea_scenario],
-                       env=my_env, check=True, capture_output=True)
+        commands.append('photovoltaic-thermal')
 
     if shallow_geothermal:
-        subprocess.run(['cea', 'shallow-geothermal-potential', '--scenario', cea_scenario], env=my_env, check=True,
-                       capture_output=True)
+        commands.append('shallow-geothermal-potential')
     if water_body:
-        subprocess.run(['cea', 'water-body-potential', '--scenario', cea_scenario], env=my_env, check=True,
-                       capture_output=True)
+        commands.append('water-body-potential')
 
     if demand_forecasting:
-        subprocess.run(['cea', 'occupancy', '--scenario', cea_scenario], env=my_env, check=True,
-                       capture_output=True)
-        subprocess.run(['cea', 'demand', '--scenario', cea_scenario], env=my_env, check=True, capture_output=True)
+        commands.extend(['occupancy', 'demand'])
 
     if sewage_heat:
-        subprocess.run(['cea', 'sewage-potential', '--scenario', cea_scenario], env=my_env, check=True, capture_output=True)
+        commands.append('sewage-potential')
 
     if thermal_network_layout:
-        subprocess.run(['cea', 'network-layout', '--scenario', cea_scenario], env=my_env, check=True,
-                       capture_output=True)
+        commands.append('network-layout')
     if thermal_network_operation:
-        subprocess.run(['cea', 'thermal-network', '--scenario', cea_scenario], env=my_env, check=True,
-                       capture_output=True)
+        commands.append('thermal-network')
 
     if emissions:
-        subprocess.run(['cea', 'emissions', '--scenario', cea_scenario], env=my_env, check=True, capture_output=True)
+        commands.append('emissions')
 
     if system_costs:
-        subprocess.run(['cea', 'system-costs', '--scenario', cea_scenario], env=my_env, check=True, capture_output=True)
+        commands.append('system-costs')
 
     if optimisation:
-        subprocess.run(['cea', 'decentralized', '--scenario', cea_scenario], env=my_env, check=True,
-                       capture_output=True)
-        subprocess.run(['cea', 'optimization-new', '--scenario', cea_scenario], env=my_env, check=True,
-                       capture_output=True)
+        commands.extend(['decentralized', 'optimization-new'])
 
     if results_summary_and_analytics:
-        subprocess.run(['cea', 'export-results-csv', '--scenario', cea_scenario], env=my_env, check=True,
-                       capture_output=True)
+        commands.append('export-results-csv')
+
+    return commands
+
+
+def exec_cea_commands(config, cea_scenario):
+    """
+    Automate user-defined CEA commands one after another.
+
+    :param config: the configuration object to use
+    :type config: cea.config.Configuration
+    :param cea_scenario: path to the CEA scenario to be assessed using CEA
+    :type cea_scenario: file path
+    :return:
+    """
+    # execute selected CEA commands
+    for command in cea_commands(config):
+        subprocess.run(['cea', command, '--scenario', cea_scenario], env=my_env, check=True, capture_output=True)
+
+
+def exec_cea_commands_in_parallel(config, cea_scenarios):
+    """
+    Automate user-defined CEA commands on several scenarios at once: the commands of each scenario run in order of
+    their dependencies (see :py:mod:`cea.workflows.scheduler`), the scenarios are independent of each other. The
+    CPU budget of the configuration is shared between the commands running at the same time.
+
+    :param config: the configuration object to use
+    :type config: cea.config.Configuration
+    :param cea_scenarios: paths to the CEA scenarios to be assessed using CEA
+    :type cea_scenarios: list[file path]
+    :return:
+    """
+    run_commands_in_parallel(cea_commands(config), cea_scenarios, config.get_number_of_processes(),
+                             plugins=config.plugins)
+
+
+def run_commands_in_parallel(commands, cea_scenarios, cpu_budget, plugins=None, keep_going=False):
+    """
+    Run the same CEA commands on several scenarios at once (see :py:func:`exec_cea_commands_in_parallel`).
+
+    :param commands: the names of the scripts to run on each scenario, in order
+    :type commands: list[str]
+    :param cea_scenarios: paths to the CEA scenarios to run the commands on
+    :type cea_scenarios: list[file path]
+    :param cpu_budget: the number of processes the running commands may use together
+    :type cpu_budget: int
+    :param plugins: the plugins of the configuration (``config.plugins``)
+    :param keep_going: False to stop at the first failed command and raise its error, True to only skip the
+        remaining commands of the scenario of a failed command and carry on with the other scenarios
+    :return: the error of each scenario with a failed command (only with ``keep_going``)
+    :rtype: dict[str, subprocess.CalledProcessError]
+    """
+    # resolve the scripts up front, so that an invalid command fails before any process is started
+    scripts = {command: cea.scripts.by_name(command, plugins=plugins) for command in set(commands)}
+    command_dependencies = step_dependencies(commands, plugins=plugins)
+
+    # one node per (scenario, command) - the dependencies only ever link commands of the same scenario
+    nodes = [(cea_scenario, command) for cea_scenario in cea_scenarios for command in commands]
+    dependencies = {s * len(commands) + j: {s * len(commands) + i for i in command_dependencies[j]}
+                    for s in range(len(cea_scenarios)) for j in range(len(commands))}
+    errors = []
+    processes = []
+    failed_scenarios = {}
+
+    def start_command(node, number_of_processes):
+        cea_scenario, command = nodes[node]
+        if cea_scenario in failed_scenarios:
+            # an earlier command of the scenario failed (keep_going), skip the rest of its commands
+            return lambda: 0
+        cmd = ['cea', command, '--scenario', cea_scenario]
+        if 'general:number-of-cpus-to-keep-free' in scripts[command].parameters:
+            cmd.extend(['--number-of-cpus-to-keep-free',
+                        str(max(0, multiprocessing.cpu_count() - number_of_processes))])
+        stderr = tempfile.TemporaryFile()
+        process = subprocess.Popen(cmd, env=my_env, stdout=subprocess.DEVNULL, stderr=stderr)
+        processes.append(process)
+
+        def handle():
+            returncode = process.poll()
+            if returncode is not None:
+                stderr.seek(0)
+                if returncode != 0:
+                    error = subprocess.CalledProcessError(returncode, cmd, stderr=stderr.read())
+                    errors.append((cea_scenario, error))
+                    if keep_going:
+                        failed_scenarios[cea_scenario] = error
+                        returncode = 0
+                stderr.close()
+            return returncode
+
+        return handle
+
+    try:
+        run_graph(dependencies, start_command, cpu_budget)
+    except RuntimeError:
+        for cea_scenario, e in errors:
+            print(f"CEA simulation for scenario `{os.path.basename(cea_scenario)}` failed at script: {e.cmd[1]}.")
+            if e.stderr:
+                print(e.stderr.decode())
+        raise errors[0][1]
+    except BaseException:
+        # e.g. interrupted: stop the commands that are still running instead of leaving them behind
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+        for process in processes:
+            process.wait()
+        raise
+    return failed_scenarios
 
 
 def main(config: cea.config.Configuration):
@@ -168,23 +256,28 @@ def main(config: cea.config.Configuration):
     scenario_name = config.general.scenario_name
     scenarios_list = config.batch_process_workflow.scenarios_to_simulate
 
-    # Loop over one or all selected scenarios under the project
-    for scenario in scenarios_list:
-        # Ignore hidden directories
-        if scenario.startswith('.') or os.path.isfile(os.path.join(project_path, scenario)):
-            continue
-
-        cea_scenario = os.path.join(project_path, scenario)
-        print(f'Executing CEA simulations on {cea_scenario}.')
-        try:
-            # executing CEA commands
-            exec_cea_commands(config, cea_scenario)
-        except subprocess.CalledProcessError as e:
-            print(f"CEA simulation for scenario `{scenario_name}` failed at script: {e.cmd[1]}.")
-            err_msg = e.stderr
-            if err_msg is not None:
-                print(err_msg.decode())
-            raise e
+    # Ignore hidden directories
+    scenarios_list = [scenario for scenario in scenarios_list
+                      if not (scenario.startswith('.') or os.path.isfile(os.path.join(project_path, scenario)))]
+
+    if config.batch_process_workflow.parallel_steps:
+        cea_scenarios = [os.path.join(project_path, scenario) for scenario in scenarios_list]
+        print(f'Executing CEA simulations on {len(cea_scenarios)} scenario(s) in parallel.')
+        exec_cea_commands_in_parallel(config, cea_scenarios)
+    else:
+        # Loop over one or all selected scenarios under the project
+        for scenario in scenarios_list:
+            cea_scenario = os.path.join(project_path, scenario)
+            print(f'Executing CEA simulations on {cea_scenario}.')
+            try:
+                # executing CEA commands
+                exec_cea_commands(config, cea_scenario)
+            except subprocess.CalledProcessError as e:
+                print(f"CEA simulation for scenario `{scenario_name}` failed at script: {e.cmd[1]}.")
+                err_msg = e.stderr
+                if err_msg is not None:
+                    print(err_msg.decode())
+                raise e
 
     # Print the time used for the entire processing
     time_elapsed = time.perf_counter() - t0
@@ -0,0 +1,328 @@
+"""
+Performance regression benchmark on the reference case.
+
+The bundled reference case (``cea/examples/reference-case-open.zip``) is extracted to the benchmark folder and run
+through the main scripts (radiation, demand, PV, thermal network, optimization, ...) and the dashboard input APIs.
+Each phase runs in a process of its own, so that it starts from the same state in every run, and is measured:
+
+- wall time of the phase (without starting the process and importing the CEA).
+- peak memory: the largest resident set size of the process and its sub-processes (e.g. the workers of the demand)
+  at the same time, sampled every ``POLL_INTERVAL`` seconds.
+- I/O volume: the bytes read and written by the process and its sub-processes (where the OS reports them).
+
+The measurements are written to ``results.json`` in the benchmark folder and compared to ``baseline.json`` (the
+measurements of an earlier run saved with ``save-baseline``). A phase that is slower, or uses more memory or I/O,
+than its baseline by more than the thresholds of the configuration is reported as a regression. Everything runs
+offline - the scripts that download data (e.g. the streets or terrain helpers) are not part of the benchmark.
+
+The phases are steps in the format of a workflow (see :py:mod:`cea.workflows.workflow`), so a different workflow
+file can be benchmarked as well. In addition to ``script`` and ``config`` steps, ``benchmark`` steps measure one of
+the functions of ``BENCHMARK_FUNCTIONS`` (e.g. the dashboard APIs).
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import time
+import traceback
+import zipfile
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import psutil
+import yaml
+
+import cea.config
+import cea.examples
+import cea.inputlocator
+from cea.workflows.workflow import do_config_step, do_script_step
+
+__author__ = "Daren Thomas"
+__copyright__ = "Copyright 2026, Architecture and Building Systems - ETH Zurich"
+__credits__ = ["Daren Thomas"]
+__license__ = "MIT"
+__version__ = "0.1"
+__maintainer__ = "Daren Thomas"
+__email__ = "cea@arch.ethz.ch"
+__status__ = "Production"
+
+RESULTS_VERSION = 1
+
+# seconds between two samples of the memory and I/O of a running phase
+POLL_INTERVAL = 0.05
+
+METRICS = ('wall_time_s', 'peak_rss_mb', 'read_mb', 'write_mb')
+# differences below these are noise, not regressions, whatever the relative change
+ABSOLUTE_TOLERANCE = {'wall_time_s': 1.0, 'peak_rss_mb': 50.0, 'read_mb': 10.0, 'write_mb': 10.0}
+
+REFERENCE_CASE = 'reference-case-open'
+REFERENCE_SCENARIO = 'baseline'
+
+# the phases of the reference case benchmark
+REFERENCE_CASE_PHASES: List[Dict[str, Any]] = [
+    {'script': 'cea4-format-helper', 'parameters': {'scenarios-to-verify-and-migrate': [REFERENCE_SCENARIO]}},
+    {'script': 'database-helper', 'parameters': {'databases-path': 'CH',
+                                                 'databases': ['archetypes', 'assemblies', 'components']}},
+    {'script': 'archetypes-mapper', 'parameters': {'input-databases': ['comfort', 'architecture', 'air-conditioning',
+                                                                      'internal-loads', 'supply', 'schedules']}},
+    {'script': 'weather-helper', 'parameters': {'weather': 'Zug-inducity_1990_2010_TMY'}},
+    {'benchmark': 'dashboard-inputs'},
+    {'script': 'radiation', 'parameters': {'neglect-adjacent-buildings': False}},
+    {'script': 'occupancy'},
+    {'script': 'demand'},
+    {'script': 'photovoltaic'},
+    {'script': 'network-layout', 'parameters': {'network-name': REFERENCE_SCENARIO}},
+    {'script': 'thermal-network', 'parameters': {'network-name': REFERENCE_SCENARIO}},
+    {'script': 'optimization-new', 'parameters': {'network-type': 'DH', 'ga-number-of-generations': 2,
+                                                  'ga-population-size': 5}},
+]
+
+
+def benchmark_dashboard_inputs(config: cea.config.Configuration) -> None:
+    """What the dashboard reads to open a scenario: the building properties and the geometry of the map."""
+    from cea.interfaces.dashboard.api.inputs import df_to_json, get_building_properties
+
+    locator = cea.inputlocator.InputLocator(config.scenario)
+    get_building_properties(config.scenario)
+    for path in (locator.get_zone_geometry(), locator.get_surroundings_geometry(), locator.get_street_network()):
+        if os.path.exists(path):
+            df_to_json(path, zoom=16)
+
+
+BENCHMARK_FUNCTIONS: Dict[str, Callable[[cea.config.Configuration], None]] = {
+    'dashboard-inputs': benchmark_dashboard_inputs,
+}
+
+
+def phase_name(step: Dict[str, Any]) -> Optional[str]:
+    """The name of a measured step (None for config steps)"""
+    return step.get('script') or step.get('benchmark')
+
+
+def _run_phase(config: cea.config.Configuration, i: int, step: Dict[str, Any], connection) -> None:
+    """Run a step in the process of the phase, sending back (wall time, error)"""
+    try:
+        start = time.perf_counter()
+        if 'benchmark' in step:
+            BENCHMARK_FUNCTIONS[step['benchmark']](config)
+        else:
+            do_script_step(config, i, step, trace_input=False)
+        connection.send((time.perf_counter() - start, None))
+    except BaseException:
+        connection.send((None, traceback.format_exc()))
+        raise
+
+
+class ProcessTreeMonitor:
+    """Samples the memory and I/O of a process and its sub-processes."""
+
+    def __init__(self, pid: int):
+        self.process = psutil.Process(pid)
+        self.peak_rss = 0
+        self.io_supported = True
+        # the last I/O counters of each process (of the ones that are gone too)
+        self._io: Dict[Tuple[int, float], Tuple[int, int]] = {}
+
+    def sample(self) -> None:
+        try:
+            processes = [self.process] + self.process.children(recursive=True)
+        except psutil.NoSuchProcess:
+            return
+        rss = 0
+        for process in processes:
+            try:
+                with process.oneshot():
+                    rss += process.memory_info().rss
+                    if self.io_supported:
+                        io = process.io_counters()
+                        # on Linux, *_chars count all reads and writes, *_bytes only those that reach the disk
+                        self._io[(process.pid, process.create_time())] = (
+                            getattr(io, 'read_chars', io.read_bytes), getattr(io, 'write_chars', io.write_bytes))
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            except (AttributeError, NotImplementedError):
+                # e.g. macOS does not report the I/O of processes
+                self.io_supported = False
+        self.peak_rss = max(self.peak_rss, rss)
+
+    def io_volume(self) -> Tuple[Optional[int], Optional[int]]:
+        if not self.io_supported:
+            return None, None
+        return sum(read for read, _ in self._io.values()), sum(write for _, write in self._io.values())
+
+
+def measure_phase(config: cea.config.Configuration, i: int, step: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """
+    Run a step in a process of its own and measure it.
+
+    :return: the measurements of the phase (see ``METRICS``), the I/O volumes are None if the OS does not report them
+    """
+    ctx = multiprocessing.get_context('spawn')
+    receiver, sender = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_run_phase, args=(config, i, step, sender))
+    process.start()
+    sender.close()
+    monitor = ProcessTreeMonitor(process.pid)
+    while process.is_alive():
+        monitor.sample()
+        process.join(POLL_INTERVAL)
+
+    wall_time, error = receiver.recv() if receiver.poll() else (None, None)
+    receiver.close()
+    if error is not None or process.exitcode != 0:
+        raise RuntimeError(f"Benchmark phase {phase_name(step)} failed:\n{error or f'exit code {process.exitcode}'}")
+
+    read, write = monitor.io_volume()
+    mb = 1024 * 1024
+    return {'wall_time_s': wall_time,
+            'peak_rss_mb': monitor.peak_rss / mb,
+            'read_mb': read / mb if read is not None else None,
+            'write_mb': write / mb if write is not None else None}
+
+
+def extract_reference_case(folder: str) -> str:
+    """Extract a fresh copy of the reference case to ``folder``, returning its scenario"""
+    project = os.path.join(folder, REFERENCE_CASE)
+    if os.path.exists(project):
+        shutil.rmtree(project)
+    with zipfile.ZipFile(os.path.join(os.path.dirname(cea.examples.__file__), f'{REFERENCE_CASE}.zip')) as archive:
+        archive.extractall(folder)
+    return os.path.join(project, REFERENCE_SCENARIO)
+
+
+def run_benchmark(config: cea.config.Configuration, steps: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Measure the phases of a benchmark, in order.
+
+    :param config: the configuration the steps are run with (``config`` steps change it)
+    :param steps: the steps, in the format of a workflow
+    :return: the measurements of each phase, by phase (the second run of a script is ``<script> (2)`` etc.)
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    for i, step in enumerate(steps):
+        if 'config' in step:
+            config = do_config_step(config, step)
+            continue
+        name = phase_name(step)
+        if name is None:
+            raise ValueError(f"Invalid benchmark step: {i} - {step}")
+        if 'benchmark' in step and name not in BENCHMARK_FUNCTIONS:
+            raise ValueError(f"Unknown benchmark function: {name}")
+        key, n = name, 1
+        while key in results:
+            n += 1
+            key = f"{name} ({n})"
+
+        print(f"Benchmarking {key}")
+        results[key] = measure_phase(config, i, step)
+        print(f"{key}: " + ", ".join(f"{metric}={value:.2f}" for metric, value in results[key].items()
+                                     if value is not None))
+    return results
+
+
+def compare_to_baseline(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+                        thresholds: Dict[str, float]) -> List[Tuple[str, str, float, float]]:
+    """
+    The regressions of the measurements compared to the baseline.
+
+    :param results: the measurements of each phase
+    :param baseline: the baseline measurements of each phase
+    :param thresholds: the relative increase of each metric that is a regression (e.g. 0.25 for 25 %)
+    :return: (phase, metric, baseline, measured) of each regression
+    """
+    regressions = []
+    for phase, measured in results.items():
+        for metric, threshold in thresholds.items():
+            value, reference = measured.get(metric), baseline.get(phase, {}).get(metric)
+            if value is None or reference is None:
+                continue
+            if value > reference * (1 + threshold) and value - reference > ABSOLUTE_TOLERANCE[metric]:
+                regressions.append((phase, metric, reference, value))
+    return regressions
+
+
+def machine_info(config: cea.config.Configuration) -> Dict[str, Any]:
+    return {'platform': platform.platform(),
+            'python': platform.python_version(),
+            'cpu_count': os.cpu_count(),
+            'number_of_processes': config.get_number_of_processes()}
+
+
+def print_report(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]) -> None:
+    print(f"{'phase':<30}" + "".join(f"{metric:>22}" for metric in METRICS))
+    for phase, measured in results.items():
+        cells = []
+        for metric in METRICS:
+            value, reference = measured.get(metric), baseline.get(phase, {}).get(metric)
+            if value is None:
+                cells.append('-')
+            elif reference:
+                cells.append(f"{value:.2f} ({(value - reference) / reference:+.0%})")
+            else:
+                cells.append(f"{value:.2f}")
+        print(f"{phase:<30}" + "".join(f"{cell:>22}" for cell in cells))
+
+
+def main(config: cea.config.Configuration):
+    folder = config.benchmark.folder
+    os.makedirs(folder, exist_ok=True)
+    results_path = os.path.join(folder, 'results.json')
+    baseline_path = os.path.join(folder, 'baseline.json')
+
+    if config.benchmark.workflow:
+        with open(config.benchmark.workflow, 'r') as f:
+            steps = yaml.safe_load(f)
+        benchmark_config = config
+    else:
+        steps = REFERENCE_CASE_PHASES
+        # the default configuration, so that the benchmark does not depend on the settings of the user
+        benchmark_config = cea.config.Configuration(cea.config.DEFAULT_CONFIG)
+        scenario = extract_reference_case(folder)
+        benchmark_config.project = os.path.dirname(scenario)
+        benchmark_config.scenario_name = REFERENCE_SCENARIO
+        benchmark_config.multiprocessing = config.multiprocessing
+        benchmark_config.general.number_of_cpus_to_keep_free = config.general.number_of_cpus_to_keep_free
+
+    results = {'version': RESULTS_VERSION,
+               'machine': machine_info(benchmark_config),
+               'phases': run_benchmark(benchmark_config, steps)}
+    with open(results_path, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Benchmark results written to {results_path}")
+
+    if config.benchmark.save_baseline:
+        shutil.copyfile(results_path, baseline_path)
+        print(f"Benchmark results saved as the baseline ({baseline_path})")
+        return
+
+    if not os.path.exists(baseline_path):
+        print(f"No baseline to compare to, run the benchmark with save-baseline to create {baseline_path}")
+        print_report(results['phases'], {})
+        return
+
+    with open(baseline_path, 'r') as f:
+        baseline = json.load(f)
+    if baseline.get('version') != RESULTS_VERSION:
+        raise ValueError(f"The baseline {baseline_path} is from an incompatible version of the benchmark, "
+                         "save a new baseline.")
+    if baseline.get('machine') != results['machine']:
+        print(f"Warning: the baseline was measured on a different machine or configuration: {baseline['machine']}")
+
+    print_report(results['phases'], baseline['phases'])
+    regressions = compare_to_baseline(results['phases'], baseline['phases'],
+                                      {'wall_time_s': config.benchmark.time_threshold,
+                                       'peak_rss_mb': config.benchmark.memory_threshold,
+                                       'read_mb': config.benchmark.io_threshold,
+                                       'write_mb': config.benchmark.io_threshold})
+    if regressions:
+        for phase, metric, reference, value in regressions:
+            print(f"Regression in {phase}: {metric} {reference:.2f} -> {value:.2f}")
+        raise AssertionError(f"Performance regression in {len(regressions)} measurement(s) of the benchmark.")
+    print("No performance regressions.")
+
+
+if __name__ == '__main__':
+    main(cea.config.Configuration())
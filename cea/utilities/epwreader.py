@@ -1,9 +1,19 @@
 """
 Energyplus file reader
+
+Parsing an EPW file (and deriving the wet-bulb and sky temperatures) is repeated by every script of a workflow that
+needs the weather. The parsed data is therefore kept in a binary cache per user (``~/.cache/cea/weather``), stored
+under the checksum of the EPW file it was parsed from. Later calls of :py:func:`epw_reader` memory-map the cache instead
+of parsing the EPW file again, as long as the EPW file did not change. The cache is kept out of the scenario, so that it
+is not part of the inputs (their fingerprint, pathway states, sensitivity samples, downloads).
 """
 
+import hashlib
+import os
+
 import pandas as pd
-import math
+import pyarrow as pa
+from pyarrow import feather
 import cea.inputlocator
 import numpy as np
 from cea.constants import BOLTZMANN, KELVIN_CONVERSION, HOURS_IN_YEAR
@@ -24,6 +34,11 @@ from cea.utilities.date import get_date_range_hours_from_year
 HOR_IR_SKY_NO_VALUE = 9999
 OPAQUE_SKY_NO_VALUE = 99
 
+# bump when the columns returned by ``epw_reader`` change, so that older caches are parsed again
+WEATHER_CACHE_VERSION = b'1'
+_CHECKSUM_KEY = b'cea.epw_checksum'
+WEATHER_CACHE_FOLDER = os.path.join(os.path.expanduser("~"), ".cache", "cea", "weather")
+
 def epw_to_dataframe(weather_path):
     epw_labels = ['year', 'month', 'day', 'hour', 'minute', 'datasource', 'drybulb_C', 'dewpoint_C', 'relhum_percent',
                   'atmos_Pa', 'exthorrad_Whm2', 'extdirrad_Whm2', 'horirsky_Whm2', 'glohorrad_Whm2',
@@ -39,6 +54,70 @@ def epw_to_dataframe(weather_path):
 
 
 def epw_reader(weather_path):
+    """
+    Read an EPW file (see :py:func:`parse_epw`), from its binary cache if the EPW file did not change since the
+    cache was written.
+
+    :param weather_path: path to the EPW file
+    :return: the hourly weather data, one row per hour of a non-leap year
+    """
+    checksum = calc_file_checksum(weather_path)
+    cache_path = get_weather_cache_path(checksum)
+    epw_data = read_weather_cache(cache_path, checksum)
+    if epw_data is None:
+        epw_data = parse_epw(weather_path)
+        write_weather_cache(cache_path, epw_data, checksum)
+    return epw_data
+
+
+def get_weather_cache_path(checksum):
+    """The binary cache of a weather file with this checksum, ``~/.cache/cea/weather/<checksum>.feather``"""
+    return os.path.join(WEATHER_CACHE_FOLDER, checksum.decode() + '.feather')
+
+
+def calc_file_checksum(path):
+    """Checksum of the contents of a file (and the version of the cache format)"""
+    digest = hashlib.sha256(WEATHER_CACHE_VERSION)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest().encode()
+
+
+def read_weather_cache(cache_path, checksum):
+    """The cached weather data, or None if there is no cache for a file with this checksum"""
+    try:
+        table = feather.read_table(cache_path, memory_map=True)
+    except (OSError, pa.ArrowException):
+        return None
+    if (table.schema.metadata or {}).get(_CHECKSUM_KEY) != checksum:
+        return None
+    return table.to_pandas()
+
+
+def write_weather_cache(cache_path, epw_data, checksum):
+    """Cache the weather data (best effort - e.g. the cache folder may be read-only)"""
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        table = pa.Table.from_pandas(epw_data)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), _CHECKSUM_KEY: checksum})
+        feather.write_feather(table, temp_path, compression='uncompressed')
+        # replace atomically, other processes may be reading the cache
+        os.replace(temp_path, cache_path)
+    except (OSError, pa.ArrowException):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def parse_epw(weather_path):
+    """
+    Parse an EPW file and derive the columns used by CEA (date, day of year, ratio of diffuse radiation, wet-bulb and
+    sky temperatures). The 29th of February of leap years is dropped.
+
+    :param weather_path: path to the EPW file
+    :return: the hourly weather data
+    """
     epw_data = epw_to_dataframe(weather_path)
 
     year = epw_data["year"][0]
@@ -63,10 +142,12 @@ def epw_reader(weather_path):
     try:
         epw_data['ratio_diffhout'] = epw_data['difhorrad_Whm2'] / epw_data['glohorrad_Whm2']
         epw_data['ratio_diffhout'] = epw_data['ratio_diffhout'].replace(np.inf, np.nan)
-        epw_data['wetbulb_C'] = np.vectorize(calc_wetbulb)(epw_data['drybulb_C'], epw_data['relhum_percent'])
-        epw_data['skytemp_C'] = np.vectorize(calc_skytemp)(epw_data['horirsky_Whm2'],
-                                                           epw_data['drybulb_C'], epw_data['dewpoint_C'],
-                                                           epw_data['opaqskycvr_tenths'])
+        epw_data['wetbulb_C'] = calc_wetbulb(epw_data['drybulb_C'].to_numpy(dtype=float),
+                                             epw_data['relhum_percent'].to_numpy(dtype=float))
+        epw_data['skytemp_C'] = calc_skytemp(epw_data['horirsky_Whm2'].to_numpy(dtype=float),
+                                             epw_data['drybulb_C'].to_numpy(dtype=float),
+                                             epw_data['dewpoint_C'].to_numpy(dtype=float),
+                                             epw_data['opaqskycvr_tenths'].to_numpy(dtype=float))
     except ValueError as e:
         raise ValueError(f"Errors found in the provided weather file: {e}") from e
 
@@ -95,20 +176,22 @@ def calc_horirsky(Tdrybulb, Tdewpoint, N):
     Based on the equation found here:
     https://energyplus.net/assets/nrel_custom/pdfs/pdfs_v24.1.0/EngineeringReference.pdf (Section 5.1.2)
 
+    Works on scalars and arrays.
+
     :param Tdrybulb: Dry bulb temperature [C]
     :param Tdewpoint: Wet bulb temperature [C]
     :param N: opaque skycover in [tenths], minimum is 0, maximum is 10 see: http://glossary.ametsoc.org/wiki/Sky_cover
     :return: horizontal infrared radiation intensity [Whm2]
     """
-
-    if N == OPAQUE_SKY_NO_VALUE:
-        raise ValueError(f"Opaque Sky Cover (column 23) has a missing value. (found {N})")
-    elif N > 10:
-        raise ValueError(f"Opaque Sky Cover (column 23) is above 10. (found {N})")
-    elif N < 0:
-        raise ValueError(f"Opaque Sky Cover (column 23) is below 0. (found {N})")
-
-    sky_e = (0.787 + 0.764 * math.log((Tdewpoint + KELVIN_CONVERSION) / KELVIN_CONVERSION)) * (
+    N_array = np.asarray(N)
+    if np.any(N_array == OPAQUE_SKY_NO_VALUE):
+        raise ValueError(f"Opaque Sky Cover (column 23) has a missing value. (found {OPAQUE_SKY_NO_VALUE})")
+    elif np.any(N_array > 10):
+        raise ValueError(f"Opaque Sky Cover (column 23) is above 10. (found {N_array.max()})")
+    elif np.any(N_array < 0):
+        raise ValueError(f"Opaque Sky Cover (column 23) is below 0. (found {N_array.min()})")
+
+    sky_e = (0.787 + 0.764 * np.log((Tdewpoint + KELVIN_CONVERSION) / KELVIN_CONVERSION)) * (
             1 + 0.0224 * N - 0.0035 * N ** 2 + 0.00028 * N ** 3)
     hor_IR = sky_e * BOLTZMANN * (Tdrybulb + KELVIN_CONVERSION) ** 4
 
@@ -123,28 +206,37 @@ def calc_skytemp(hor_IR_Whm2, Tdrybulb, Tdewpoint, N):
     or:
     https://bigladdersoftware.com/epx/docs/8-6/engineering-reference/climate-calculations.html
 
+    Works on scalars and arrays (of the same shape). Missing values of the horizontal infrared radiation are
+    calculated with :py:func:`calc_horirsky`.
+
     :param hor_IR_Whm2: horizontal infrared radiation intensity [Whm2], minimum is 0
     :param Tdrybulb: Dry bulb temperature [C]
     :param Tdewpoint: Wet bulb temperature [C]
     :param N: opaque skycover in [tenths], minimum is 0, maximum is 10 see: http://glossary.ametsoc.org/wiki/Sky_cover
     :return: sky temperature [C]
     """
-
-    hor_IR = hor_IR_Whm2
-    if hor_IR == HOR_IR_SKY_NO_VALUE:
+    hor_IR = np.array(hor_IR_Whm2, dtype=float)
+    missing = hor_IR == HOR_IR_SKY_NO_VALUE
+    if np.any(hor_IR[~missing] < 0):
+        raise ValueError(f"Horizontal infrared radiation intensity (column 12) is below 0. (found {hor_IR.min()})")
+    if np.any(missing):
         # Calculate value based on equation if missing
-        hor_IR = calc_horirsky(Tdrybulb, Tdewpoint, N)
-    elif hor_IR < 0:
-        raise ValueError(f"Horizontal infrared radiation intensity (column 12) is below 0. (found {hor_IR})")
+        hor_IR[missing] = calc_horirsky(np.broadcast_to(Tdrybulb, hor_IR.shape)[missing],
+                                        np.broadcast_to(Tdewpoint, hor_IR.shape)[missing],
+                                        np.broadcast_to(N, hor_IR.shape)[missing])
 
     sky_T = ((hor_IR / BOLTZMANN) ** 0.25) - KELVIN_CONVERSION
 
-    return sky_T  # sky temperature in C
+    return sky_T if sky_T.ndim else float(sky_T)  # sky temperature in C
 
 
 def calc_wetbulb(Tdrybulb, RH):
-    Tw = Tdrybulb * math.atan(0.151977 * ((RH + 8.313659) ** (0.5))) + math.atan(Tdrybulb + RH) - math.atan(
-        RH - 1.676331) + (0.00391838 * (RH ** (3 / 2))) * math.atan(0.023101 * RH) - 4.686035
+    """
+    Wet-bulb temperature [C] from the dry-bulb temperature [C] and the relative humidity [%], works on scalars and
+    arrays.
+    """
+    Tw = Tdrybulb * np.arctan(0.151977 * ((RH + 8.313659) ** (0.5))) + np.arctan(Tdrybulb + RH) - np.arctan(
+        RH - 1.676331) + (0.00391838 * (RH ** (3 / 2))) * np.arctan(0.023101 * RH) - 4.686035
 
     return Tw  # wetbulb temperature in C
 
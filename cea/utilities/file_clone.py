@@ -0,0 +1,67 @@
+"""
+Copy-on-write file copies.
+
+Pathway states copy the whole input folder of the main scenario once per state year, and consecutive states reuse
+the simulation outputs of buildings that did not change. On Linux file systems that support it (e.g. Btrfs, XFS),
+:func:`clone_file` shares the data blocks of the source instead of duplicating them; the clone is a separate file,
+so writing to it never changes the source. Everywhere else it falls back to a regular copy.
+
+Plain hardlinks are deliberately not used: CEA scripts and the dashboard rewrite input files in place (e.g.
+``shutil.copyfile`` onto ``weather.epw``, ``to_csv`` onto the building properties), which would silently modify the
+main scenario through a hardlinked state folder.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+
+__author__ = "Zhongming Shi"
+__copyright__ = "Copyright 2026, UUEN PTE. LTD."
+__credits__ = ["Zhongming Shi"]
+__license__ = "MIT"
+__version__ = "0.1"
+__maintainer__ = "Reynold Mok"
+__email__ = "cea@arch.ethz.ch"
+__status__ = "Production"
+
+# ioctl request of Linux to share the data of one file with another (``_IOW(0x94, 9, int)``)
+_FICLONE = 0x40049409
+
+
+def _reflink(src: str, dst: str) -> bool:
+    """try to make `dst` a copy-on-write clone of `src`, returning False if the file system does not support it."""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(src, "rb") as source, open(dst, "wb") as target:
+            fcntl.ioctl(target.fileno(), _FICLONE, source.fileno())
+    except OSError:
+        if os.path.exists(dst):
+            os.remove(dst)
+        return False
+    return True
+
+
+def clone_file(src: str, dst: str) -> str:
+    """Copy `src` to `dst` (including permission bits and timestamps), sharing the data blocks where the file system
+    supports it. Can be used as the ``copy_function`` of :func:`shutil.copytree`.
+
+    :param src: path of the file to copy.
+    :param dst: path of the copy, or an existing folder to copy into.
+    :return: the path of the copy.
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if os.path.lexists(dst):
+        os.remove(dst)
+    if _reflink(src, dst):
+        shutil.copystat(src, dst)
+        return dst
+    return shutil.copy2(src, dst)
+
+
+def clone_tree(src: str, dst: str) -> str:
+    """:func:`shutil.copytree` with :func:`clone_file` copies, overwriting existing files in `dst`."""
+    return shutil.copytree(src, dst, copy_function=clone_file, dirs_exist_ok=True)
@@ -2,7 +2,7 @@
 Deterministic state fingerprints — short, stable identifiers used to
 detect when something has changed since the last time we looked at it.
 
-Three primitives:
+Four primitives:
 
 * :func:`hash_folder`  — SHA256 over a folder's relative paths and file
   contents. OS-level junk (Finder / Windows / cloud-sync sidecars) is
@@ -19,6 +19,10 @@ Three primitives:
   objects produce identical hashes regardless of dict-insertion order
   or pretty-print formatting.
 
+* :func:`hash_arrays`  — SHA256 over the dtype, shape and contents of
+  numpy arrays, for numeric data that is too large (or contains NaN)
+  for :func:`hash_payload`.
+
 Used by:
 
 * ``cea/datamanagement/district_pathways/pathway_status.py`` for the
@@ -27,6 +31,8 @@ Used by:
   ``source_log_hash`` of a year's modification log.
 * ``cea/kpi/`` for the three-hash cache gate
   (scenario-inputs / upstream-outputs / KPI-definition).
+* ``cea/resources/radiation/geometry_cache.py`` for the per-building
+  3D geometry cache of the radiation scripts.
 
 Anything that asks "did this state change since I last cached
 something against it?" should reuse these helpers rather than reach
@@ -42,6 +48,8 @@ import json
 import os
 from typing import Any, Iterable, Sequence
 
+import numpy as np
+
 
 __author__ = "Zhongming Shi"
 __copyright__ = "Copyright 2026, UUEN PTE. LTD."
@@ -106,7 +114,7 @@ def hash_folder(
     return outer.hexdigest()
 
 
-def hash_files(paths: Sequence[str]) -> str:
+def hash_files(paths: Sequence[str], *, root: str | None = None) -> str:
     """SHA256 fingerprint over an explicit list of files.
 
     The list is sorted so call order doesn't matter. Each file
@@ -115,11 +123,16 @@ def hash_files(paths: Sequence[str]) -> str:
     rather than raising — callers checking "did anything change?" want
     to see "this file disappeared" as a state change, not as an
     exception.
+
+    With ``root``, paths are hashed relative to it, so the same files
+    in two copies of a folder (e.g. two pathway states) produce the
+    same digest.
     """
     outer = hashlib.sha256()
     for file_path in sorted(paths):
         inner = hashlib.sha256()
-        inner.update(file_path.replace("\\", "/").encode("utf-8"))
+        hashed_path = os.path.relpath(file_path, root) if root is not None else file_path
+        inner.update(hashed_path.replace("\\", "/").encode("utf-8"))
         if not os.path.isfile(file_path):
             inner.update(b"<missing>")
         else:
@@ -143,3 +156,21 @@ def hash_payload(obj: Any) -> str:
     """
     encoded = json.dumps(obj, sort_keys=True, separators=(",", ":"))
     return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def hash_arrays(*arrays: Any) -> str:
+    """SHA256 fingerprint of a sequence of numpy arrays.
+
+    Each array contributes its dtype, shape and raw contents, so arrays
+    with the same values but a different dtype or shape hash
+    differently. NaN values are hashed by their bit pattern (unlike
+    :func:`hash_payload`, which rejects them).
+    """
+    outer = hashlib.sha256()
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        inner = hashlib.sha256()
+        inner.update(f"{array.dtype.str}{array.shape}".encode("utf-8"))
+        inner.update(array.tobytes())
+        outer.update(inner.digest())
+    return outer.hexdigest()
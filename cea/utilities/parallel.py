@@ -10,9 +10,10 @@ was used. Issue [#2344](https://github.com/architecture-building-systems/CityEne
 not applying this technique to the demand script.
 
 This module exports the function `map` which is intended to replace both ``map_async`` and the builtin ``map`` function
-(which was used when ``config.multiprocessing == False``). This simplifies multiprocessing.
+(which was used when ``config.multiprocessing == False``). This simplifies multiprocessing. ``vectorize_as_completed``
+does the same, but yields the results as they become available so they can be aggregated in a streaming fashion.
 """
-from typing import TypeVar, ParamSpec, Callable, Any, List
+from typing import TypeVar, ParamSpec, Callable, Any, Iterator, List
 
 import multiprocessing
 import sys
@@ -116,6 +117,84 @@ def __multiprocess_wrapper(func: Callable[P, T], processes: int, on_complete: Ca
     return wrapper
 
 
+def vectorize_as_completed(func: Callable[P, T], processes: int = 1) -> Callable[..., Iterator[T]]:
+    """
+    Like :py:func:`vectorize`, but the wrapped function returns an iterator that yields the result of each call to
+    ``func`` as soon as it is available instead of a list of all results.
+
+    This lets the caller aggregate results as they arrive (and drop them afterwards), so that memory does not grow
+    with the number of calls. With multiprocessing, results are yielded in the order in which the calls complete,
+    which is not necessarily the order of the arguments - include an identifier in the result if the order matters.
+
+    :param func: The function to vectorize (a module-level function if processes > 1)
+    :param int processes: The number of processes to use (use ``config.get_number_of_processes()``)
+    """
+    if processes > 1:
+        return __multiprocess_iterator_wrapper(func, processes)
+    else:
+        return single_process_iterator_wrapper(func)
+
+
+def __multiprocess_iterator_wrapper(func: Callable[P, T], processes: int) -> Callable[..., Iterator[T]]:
+    """Create a worker pool to map the function lazily, streaming STDOUT and STDERR while waiting for results"""
+
+    def wrapper(*args: ...) -> Iterator[T]:
+        print("Using {processes} CPU's".format(processes=processes))
+        ctx = multiprocessing.get_context("spawn")
+        pool = ctx.Pool(processes)
+        manager = ctx.Manager()
+
+        # a queue for STDOUT and STDERR output of sub-processes (see cea.utilities.workerstream.QueueWorkerStream)
+        queue = manager.Queue()
+
+        args_list = [list(a) for a in args]
+        n = len(args_list[0])
+
+        _args = [repeat(func, n),
+                 repeat(queue, n),
+                 repeat(None, n),  # no on_complete
+                 repeat(None, n),  # no i_queue
+                 repeat(n, n)] + args_list
+        _args = zip(*_args)
+
+        results = pool.imap_unordered(__apply_func_with_worker_stream, _args)
+        try:
+            while True:
+                try:
+                    result = results.next(timeout=0.1)
+                except multiprocessing.TimeoutError:
+                    stream_from_queue(queue)
+                    continue
+                except StopIteration:
+                    break
+                while not queue.empty():
+                    stream_from_queue(queue)
+                yield result
+            pool.close()
+        except BaseException:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+            # process the rest of the queue
+            while not queue.empty():
+                stream_from_queue(queue)
+            manager.shutdown()
+
+    return wrapper
+
+
+def single_process_iterator_wrapper(func: Callable[P, T]) -> Callable[..., Iterator[T]]:
+    """The simplest form of lazy vectorization: Just loop"""
+
+    def wrapper(*args: ...) -> Iterator[T]:
+        print("Using single process")
+        for instance_args in zip(*args):
+            yield func(*instance_args)
+
+    return wrapper
+
+
 def __apply_func_with_worker_stream(args):
     """
     Call func, using ``queue`` to redirect stdout and stderr, with a tuple of args because multiprocessing.Pool.map
@@ -0,0 +1,228 @@
+"""
+Scenario-level columnar store of per-building results.
+
+Demand and emissions write one CSV file per building. Post-processing tools that need a few columns of many
+buildings (e.g. the result summary) used to find and parse all of those files again. After a script has written its
+CSV files, it also collects them in one Parquet file per dataset (``locator.get_result_store_dataset(dataset)``):
+
+- one row group per building, with the building name in the ``name`` column.
+- hourly results get an ``hour_of_year`` column (the row number within the building).
+- the size and modification time of each building's CSV file are kept in the file metadata, so readers can check
+  that the store still matches the CSV files (:py:meth:`ResultStore.is_current`) and fall back to the CSV files
+  otherwise. The CSV files remain the reference output of each script.
+
+A cross-building, time-sliced query is then a single columnar scan, e.g. the electricity demand of the residential
+buildings in July::
+
+    store = ResultStore(locator)
+    july = store.query('demand', ['GRID_kWh'], buildings=residential, hours=(4344, 5088))
+    july['GRID_kWh'].sum()
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+if TYPE_CHECKING:
+    import cea.inputlocator
+
+__author__ = "Daren Thomas"
+__copyright__ = "Copyright 2026, Architecture and Building Systems - ETH Zurich"
+__credits__ = ["Daren Thomas"]
+__license__ = "MIT"
+__version__ = "0.1"
+__maintainer__ = "Daren Thomas"
+__email__ = "cea@arch.ethz.ch"
+__status__ = "Production"
+
+# the datasets written by the scripts
+DEMAND = 'demand'
+OPERATIONAL_EMISSIONS = 'operational_emissions'
+LIFECYCLE_EMISSIONS = 'lifecycle_emissions'
+
+NAME_COLUMN = 'name'
+HOUR_COLUMN = 'hour_of_year'
+
+_DATE_COLUMNS = ('date', 'DATE', 'Date')
+_SOURCES_KEY = b'cea.sources'
+
+
+def _read_sources(path: str) -> Dict[str, List[int]]:
+    """The signatures of the CSV files stored in the footer of a dataset."""
+    metadata = pq.read_metadata(path).metadata or {}
+    return json.loads(metadata.get(_SOURCES_KEY, b'{}'))
+
+
+def _source_signature(path: str) -> Optional[List[int]]:
+    """(size, mtime) of a result file, None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class ResultStore(object):
+    """The result store of a scenario."""
+
+    def __init__(self, locator: cea.inputlocator.InputLocator):
+        self.locator = locator
+
+    def path(self, dataset: str) -> str:
+        return self.locator.get_result_store_dataset(dataset)
+
+    def sources(self, dataset: str) -> Dict[str, List[int]]:
+        """The signature of the CSV file of each building in the store when it was added, empty if there is none."""
+        path = self.path(dataset)
+        if not os.path.exists(path):
+            return {}
+        try:
+            return _read_sources(path)
+        except (OSError, pa.ArrowInvalid):
+            return {}
+
+    def is_current(self, dataset: str, paths: Dict[str, str]) -> bool:
+        """True if the store has the results of all the buildings and their CSV files did not change since."""
+        sources = self.sources(dataset)
+        return bool(paths) and all(
+            building in sources and sources[building] == _source_signature(path) for building, path in paths.items())
+
+    def writer(self, dataset: str) -> ResultStoreWriter:
+        """Add (or replace) the results of buildings, see :py:class:`ResultStoreWriter`."""
+        return ResultStoreWriter(self.path(dataset))
+
+    def add_files(self, dataset: str, paths: Dict[str, str]) -> None:
+        """Add (or replace) the results of buildings from their CSV files (read in a thread pool)."""
+        with self.writer(dataset) as writer, ThreadPoolExecutor() as executor:
+            for building, df in zip(paths, executor.map(pd.read_csv, paths.values())):
+                writer.write(building, df, source=paths[building])
+
+    def query(self, dataset: str, columns: Optional[Sequence[str]] = None,
+              buildings: Optional[Iterable[str]] = None,
+              hours: Optional[Tuple[int, int]] = None) -> pd.DataFrame:
+        """
+        Read a slice of a dataset. Only the requested columns are read, and row groups of other buildings (or hours)
+        are skipped.
+
+        :param dataset: the dataset, e.g. ``DEMAND``.
+        :param columns: the columns to read (in addition to the ``name`` column), all if None. Columns that are not
+            in the dataset are ignored.
+        :param buildings: the buildings to read, all if None.
+        :param hours: the hours of the year to read ``[start, end)`` (hourly datasets only), all if None.
+        :return: the rows of the buildings, in the order they were added to the store.
+        """
+        path = self.path(dataset)
+        if columns is not None:
+            schema_names = pq.read_schema(path).names
+            columns = [NAME_COLUMN] + [c for c in columns if c in schema_names and c != NAME_COLUMN]
+        filters = []
+        if buildings is not None:
+            filters.append((NAME_COLUMN, 'in', list(buildings)))
+        if hours is not None:
+            filters += [(HOUR_COLUMN, '>=', int(hours[0])), (HOUR_COLUMN, '<', int(hours[1]))]
+        table = pq.read_table(path, columns=columns, filters=filters or None)
+        return table.to_pandas()
+
+
+class ResultStoreWriter(object):
+    """
+    Writes the results of buildings to a dataset of the store, one building (row group) at a time::
+
+        with ResultStore(locator).writer(DEMAND) as writer:
+            for building in buildings:
+                writer.write(building, df, source=locator.get_demand_results_file(building))
+
+    The buildings already in the dataset are kept unless they are written again (or their columns differ from the
+    new results). The dataset is replaced when the writer is closed, readers never see a partially written file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.temp_path = f"{path}.{os.getpid()}.tmp"
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._sources: Dict[str, Optional[List[int]]] = {}
+
+    def __enter__(self) -> ResultStoreWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, building: str, df: pd.DataFrame, source: Optional[str] = None) -> None:
+        """
+        Add the results of a building.
+
+        :param building: the name of the building.
+        :param df: the results of the building (as in its CSV file).
+        :param source: the CSV file of the results, used to check that the store is current.
+        """
+        df = df.drop(columns=[NAME_COLUMN], errors='ignore')
+        # integer columns of a CSV file may hold fractions in the file of another building
+        integer_columns = df.select_dtypes(include='integer').columns
+        if len(integer_columns):
+            df = df.astype({col: 'float64' for col in integer_columns})
+        columns = {NAME_COLUMN: pd.Series(building, index=df.index, dtype=object)}
+        if any(col in df.columns for col in _DATE_COLUMNS):
+            columns[HOUR_COLUMN] = pd.Series(range(len(df)), index=df.index, dtype='int32')
+        df = pd.concat([pd.DataFrame(columns), df], axis=1)
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._writer = pq.ParquetWriter(self.temp_path, table.schema, compression='zstd')
+        elif not table.schema.equals(self._writer.schema):
+            table = table.cast(self._writer.schema)
+        self._writer.write_table(table, row_group_size=max(1, len(df)))
+        self._sources[building] = _source_signature(source) if source else None
+
+    def close(self) -> None:
+        if self._writer is None:
+            return
+        sources = {building: signature for building, signature in self._sources.items() if signature is not None}
+        self._copy_previous_buildings(sources)
+        self._writer.add_key_value_metadata({_SOURCES_KEY: json.dumps(sources).encode()})
+        self._writer.close()
+        self._writer = None
+        os.replace(self.temp_path, self.path)
+
+    def abort(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+
+    def _copy_previous_buildings(self, sources: Dict[str, List[int]]) -> None:
+        """Keep the buildings of the previous version of the dataset that were not written again."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            previous = pq.ParquetFile(self.path)
+        except (OSError, pa.ArrowInvalid):
+            return
+        if previous.schema_arrow.names != self._writer.schema.names:
+            # the results have different columns now, the previous buildings are stale
+            return
+        previous_sources = _read_sources(self.path)
+        for i in range(previous.num_row_groups):
+            table = previous.read_row_group(i)
+            building = table.column(NAME_COLUMN)[0].as_py() if table.num_rows else None
+            if building is None or building in self._sources:
+                continue
+            try:
+                table = table.cast(self._writer.schema)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                continue
+            self._writer.write_table(table, row_group_size=max(1, table.num_rows))
+            if building in previous_sources:
+                sources[building] = previous_sources[building]
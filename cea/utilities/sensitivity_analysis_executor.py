@@ -0,0 +1,357 @@
+"""
+Running the samples of a sensitivity analysis and computing the sensitivity indices.
+
+The samples generated by ``cea.utilities.sensitivity_analysis_sampler`` (``sampled_variables.csv`` in the project)
+are simulated as follows:
+
+- each sample is a scenario in a folder owned by the executor (``<project>/.sensitivity/<scenario>/SA_1``, ...),
+  marked as such so that folders it did not create are never overwritten or deleted. The inputs of the scenario are
+  cloned (see :py:mod:`cea.utilities.file_clone`) and only the input tables of the variables are rewritten. The
+  results the selected scripts do not regenerate (e.g. radiation) are linked to the results of the scenario instead
+  of being copied, the results they do regenerate are left out.
+- the samples are run in batches of as many samples as the CPU budget of the configuration, sharing it (see
+  :py:func:`cea.utilities.batch_process_workflow.run_commands_in_parallel`). The target outputs of each batch are
+  collected and appended to ``sensitivity_results.csv`` before its scenarios are deleted and the next batch starts.
+  A sample whose scripts fail gets NaN outputs instead of stopping the study.
+- the target outputs of all samples are analysed with SALib (``sensitivity_indices.csv``).
+"""
+
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+from SALib.analyze import morris, sobol
+
+import cea.config
+import cea.inputlocator
+import cea.schemas
+from cea.utilities.batch_process_workflow import run_commands_in_parallel
+from cea.utilities.file_clone import clone_file, clone_tree
+from cea.utilities.sensitivity_analysis_sampler import (get_sampled_variables_path, problem_for_salib,
+                                                        selected_variables)
+from cea.workflows.scheduler import script_io
+
+__author__ = "Zhongming Shi"
+__copyright__ = "Copyright 2026, Architecture and Building Systems - ETH Zurich"
+__credits__ = ["Zhongming Shi"]
+__license__ = "MIT"
+__version__ = "0.1"
+__maintainer__ = "Zhongming Shi"
+__email__ = "cea@arch.ethz.ch"
+__status__ = "Production"
+
+SAMPLE_SCENARIO_PREFIX = 'SA_'
+# the file marking a scenario as a sample created by the executor (which may be overwritten and deleted)
+SAMPLE_MARKER = '.sensitivity-sample'
+
+
+def parse_variable_input(variable_input):
+    """
+    Split the input of a variable, e.g. ``building-properties/internal_loads.csv:Occ_m2p*``.
+
+    :return: (file relative to the inputs folder, column, True if the sampled value scales the column)
+    :rtype: tuple[str, str, bool]
+    """
+    table, sep, column = variable_input.strip().rpartition(':')
+    if not sep or not table or not column.rstrip('*'):
+        raise ValueError(f"Invalid variable input '{variable_input}', expected <file in the inputs folder>:<column>")
+    scale = column.endswith('*')
+    return table.strip(), column.rstrip('*').strip(), scale
+
+
+def parse_target_output(target_output):
+    """
+    Split a target output, e.g. ``get_total_demand:GRID_MWhyr``.
+
+    :return: (input locator method, column)
+    :rtype: tuple[str, str]
+    """
+    method, sep, column = target_output.strip().partition(':')
+    if not sep or not column or not hasattr(cea.inputlocator.InputLocator, method.strip()):
+        raise ValueError(f"Invalid target output '{target_output}', expected <input locator method>:<column>")
+    return method.strip(), column.strip()
+
+
+def get_samples_folder(project, base_scenario):
+    """The folder the scenarios of the samples of ``base_scenario`` are created in"""
+    return os.path.join(project, '.sensitivity', os.path.basename(os.path.normpath(base_scenario)))
+
+
+def get_sample_scenario(samples_folder, n):
+    """The scenario of the n-th sample (0-based)"""
+    return os.path.join(samples_folder, f'{SAMPLE_SCENARIO_PREFIX}{n + 1}')
+
+
+def regenerated_results(commands, plugins=None):
+    """
+    The entries of ``outputs/data`` (folders, or files directly in it) the commands write to according to
+    ``schemas.yml``.
+
+    :return: the names of the entries, or None if the outputs of a command are not declared
+    :rtype: set[str] | None
+    """
+    schemas = cea.schemas.schemas(plugins)
+    entries = set()
+    for command in commands:
+        _, outputs = script_io(command, plugins)
+        if outputs is None:
+            return None
+        for locator_method in outputs:
+            parts = schemas[locator_method]['file_path'].replace('\\', '/').split('/')
+            if parts[:2] == ['outputs', 'data'] and len(parts) > 2:
+                entries.add(parts[2])
+    return entries
+
+
+def is_sample(scenario):
+    """True if the scenario is a sample created by the executor"""
+    return os.path.isfile(os.path.join(scenario, SAMPLE_MARKER))
+
+
+def remove_sample(sample_scenario):
+    """Delete the scenario of a sample, refusing to delete a folder that is not a sample"""
+    if not os.path.exists(sample_scenario):
+        return
+    if not is_sample(sample_scenario):
+        raise FileExistsError(f"{sample_scenario} was not created by the sensitivity analysis executor, "
+                              f"not deleting it")
+    shutil.rmtree(sample_scenario)
+
+
+def link_results(base_results, sample_results, regenerated):
+    """
+    Make the results of the base scenario available to a sample, except the ``regenerated`` ones (see
+    ``regenerated_results``), which the sample computes itself. The results are linked (symbolic links) to those of
+    the base scenario where the file system allows it, and cloned otherwise - or if ``regenerated`` is None, as a
+    script with undeclared outputs could then write through the links into the base scenario.
+    """
+    os.makedirs(sample_results, exist_ok=True)
+    for entry in os.scandir(base_results):
+        if regenerated is not None and entry.name in regenerated:
+            continue
+        target = os.path.join(sample_results, entry.name)
+        if regenerated is not None:
+            try:
+                os.symlink(entry.path, target, target_is_directory=entry.is_dir())
+                continue
+            except OSError:
+                pass  # e.g. no privilege to create symbolic links on Windows
+        if entry.is_dir():
+            clone_tree(entry.path, target)
+        else:
+            clone_file(entry.path, target)
+
+
+def materialize_sample(base_scenario, sample_scenario, variable_inputs, values, regenerated=None):
+    """
+    Create the scenario of a sample: a clone of the inputs of the base scenario, with the input columns of the
+    variables set to (or scaled by) the sampled values, and the results of the base scenario that are not
+    ``regenerated``.
+
+    :param base_scenario: the scenario the samples are derived from
+    :param sample_scenario: the scenario of the sample, replaced if it is a sample created before
+    :param variable_inputs: the input of each variable (see ``parse_variable_input``)
+    :param values: the sampled value of each variable
+    :param regenerated: the results the commands regenerate (see ``regenerated_results``), None to clone all results
+    """
+    remove_sample(sample_scenario)
+    base_locator = cea.inputlocator.InputLocator(base_scenario)
+    sample_locator = cea.inputlocator.InputLocator(sample_scenario)
+    os.makedirs(sample_scenario)
+    open(os.path.join(sample_scenario, SAMPLE_MARKER), 'w').close()
+    clone_tree(base_locator.get_input_folder(), sample_locator.get_input_folder())
+    base_results = os.path.join(base_scenario, 'outputs', 'data')
+    if os.path.isdir(base_results):
+        link_results(base_results, os.path.join(sample_scenario, 'outputs', 'data'), regenerated)
+
+    # rewrite each input table once, with all the variables applied to it
+    changes = {}
+    for variable_input, value in zip(variable_inputs, values):
+        table, column, scale = parse_variable_input(variable_input)
+        changes.setdefault(table, []).append((column, scale, value))
+
+    for table, table_changes in changes.items():
+        path = os.path.join(sample_locator.get_input_folder(), table)
+        if path.lower().endswith('.shp'):
+            import geopandas as gpd
+            df = gpd.read_file(path)
+        else:
+            df = pd.read_csv(path)
+        for column, scale, value in table_changes:
+            if column not in df.columns:
+                raise ValueError(f"Column '{column}' not found in {table}")
+            df[column] = df[column] * value if scale else value
+        if path.lower().endswith('.shp'):
+            df.to_file(path)
+        else:
+            df.to_csv(path, index=False)
+
+
+def collect_outputs(scenario, target_outputs):
+    """
+    The target outputs of a scenario, each summed over all rows of its file.
+
+    :rtype: numpy.ndarray
+    """
+    locator = cea.inputlocator.InputLocator(scenario)
+    values = []
+    for target_output in target_outputs:
+        method, column = parse_target_output(target_output)
+        df = pd.read_csv(getattr(locator, method)(), usecols=[column])
+        values.append(df[column].sum())
+    return np.array(values, dtype=float)
+
+
+def run_samples(base_scenario, samples_folder, samples, variable_inputs, commands, target_outputs, cpu_budget,
+                plugins=None, keep_sample_scenarios=False, on_batch_done=None):
+    """
+    Simulate the samples of a sensitivity analysis in parallel.
+
+    The samples are run in batches of ``cpu_budget`` samples: the scenarios of a batch are created, run and their
+    outputs collected before the next batch starts, so only one batch of scenarios exists at a time. A sample whose
+    commands fail, or whose target outputs cannot be read, gets NaN outputs.
+
+    :param base_scenario: the scenario the samples are derived from
+    :param samples_folder: the folder the sample scenarios are created in (see ``get_samples_folder``)
+    :param samples: the sampled values, one row per sample and one column per variable
+    :param variable_inputs: the input of each variable (see ``parse_variable_input``)
+    :param commands: the CEA scripts to run on each sample, in order
+    :param target_outputs: the outputs to collect (see ``parse_target_output``)
+    :param cpu_budget: the number of processes the scripts may use together
+    :param plugins: the plugins of the configuration (``config.plugins``)
+    :param keep_sample_scenarios: False to delete the scenarios of each batch once its outputs are collected
+    :param on_batch_done: called with the indices of the samples of each batch and their outputs, when it is done
+    :return: the target outputs, one row per sample and one column per target output
+    :rtype: numpy.ndarray
+    """
+    samples = np.asarray(samples, dtype=float)
+    outputs = np.full((len(samples), len(target_outputs)), np.nan)
+    regenerated = regenerated_results(commands, plugins)
+    batch_size = max(1, cpu_budget)
+
+    for batch_start in range(0, len(samples), batch_size):
+        batch = list(range(batch_start, min(batch_start + batch_size, len(samples))))
+        sample_scenarios = [get_sample_scenario(samples_folder, n) for n in batch]
+        try:
+            for n, sample_scenario in zip(batch, sample_scenarios):
+                materialize_sample(base_scenario, sample_scenario, variable_inputs, samples[n], regenerated)
+
+            print(f"running {', '.join(commands)} on samples {batch[0] + 1} to {batch[-1] + 1} of {len(samples)}")
+            errors = run_commands_in_parallel(commands, sample_scenarios, cpu_budget, plugins=plugins,
+                                              keep_going=True)
+            for n, sample_scenario in zip(batch, sample_scenarios):
+                if sample_scenario in errors:
+                    print(f"sample {n + 1} failed at script: {errors[sample_scenario].cmd[1]}")
+                    if errors[sample_scenario].stderr:
+                        print(errors[sample_scenario].stderr.decode())
+                    continue
+                try:
+                    outputs[n] = collect_outputs(sample_scenario, target_outputs)
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"could not collect the target outputs of sample {n + 1}: {e}")
+        finally:
+            if not keep_sample_scenarios:
+                for sample_scenario in sample_scenarios:
+                    if is_sample(sample_scenario):
+                        remove_sample(sample_scenario)
+
+        if on_batch_done is not None:
+            on_batch_done(batch, outputs[batch])
+
+    return outputs
+
+
+def analyze_results(problem, method, samples, outputs, target_outputs):
+    """
+    The sensitivity indices of each target output to each variable.
+
+    :param problem: problem for SALib (see ``problem_for_salib``)
+    :param method: 'sobol' (first and total order indices) or 'morris' (elementary effects)
+    :param samples: the sampled values, as generated by the sampler
+    :param outputs: the target outputs of each sample (see ``run_samples``)
+    :param target_outputs: the name of each target output
+    :return: one row per target output and variable
+    :rtype: pandas.DataFrame
+    """
+    outputs = np.asarray(outputs, dtype=float).reshape(len(samples), len(target_outputs))
+    indices = []
+    for k, target_output in enumerate(target_outputs):
+        if method == 'sobol':
+            result = sobol.analyze(problem, outputs[:, k], calc_second_order=False)
+            columns = ['S1', 'S1_conf', 'ST', 'ST_conf']
+        elif method == 'morris':
+            result = morris.analyze(problem, np.asarray(samples, dtype=float), outputs[:, k])
+            columns = ['mu', 'mu_star', 'sigma', 'mu_star_conf']
+        else:
+            raise ValueError(f"Unknown sensitivity analysis method: {method}")
+        df = pd.DataFrame({column: np.asarray(result[column], dtype=float) for column in columns})
+        df.insert(0, 'variable', problem['names'])
+        df.insert(0, 'target_output', target_output)
+        indices.append(df)
+    return pd.concat(indices, ignore_index=True)
+
+
+def main(config: cea.config.Configuration):
+    section = config.sensitivity_analysis_tools
+    variables = selected_variables(config)
+    names_vars = [name for name, _, _ in variables]
+    missing_inputs = [name for name, _, variable_input in variables if not variable_input]
+    if missing_inputs:
+        raise ValueError(f"Set the input of the variable(s) {', '.join(missing_inputs)} "
+                         f"(sensitivity-analysis-tools:variable-N-input)")
+    if not section.target_outputs:
+        raise ValueError("Select at least one target output (sensitivity-analysis-tools:target-outputs)")
+
+    samples_path = get_sampled_variables_path(config)
+    if not os.path.exists(samples_path):
+        raise FileNotFoundError(f"No samples found at {samples_path}, run the sensitivity-analysis-sampler first.")
+    samples = pd.read_csv(samples_path, index_col=0)
+    if list(samples.columns) != names_vars:
+        raise ValueError(f"The variables of {samples_path} ({', '.join(samples.columns)}) do not match the "
+                         f"selected variables ({', '.join(names_vars)}), run the sensitivity-analysis-sampler again.")
+
+    # the outputs of the samples are written as the batches complete, so they are kept if the study stops
+    results_path = os.path.join(config.project, 'sensitivity_results.csv')
+    if os.path.exists(results_path):
+        os.remove(results_path)
+
+    def write_batch(batch, batch_outputs):
+        results = samples.iloc[batch].copy()
+        for k, target_output in enumerate(section.target_outputs):
+            results[target_output] = batch_outputs[:, k]
+        results.to_csv(results_path, mode='a', header=not os.path.exists(results_path))
+
+    samples_folder = get_samples_folder(config.project, config.scenario)
+    outputs = run_samples(config.scenario, samples_folder, samples.values,
+                          [variable_input for _, _, variable_input in variables],
+                          section.commands, section.target_outputs, config.get_number_of_processes(),
+                          plugins=config.plugins, keep_sample_scenarios=section.keep_sample_scenarios,
+                          on_batch_done=write_batch)
+    if not section.keep_sample_scenarios:
+        for folder in (samples_folder, os.path.dirname(samples_folder)):
+            try:
+                os.rmdir(folder)
+            except OSError:
+                pass  # not empty
+    print(f"writing the outputs of the samples to {results_path}")
+
+    # SALib needs the outputs of all samples
+    failed = np.isnan(outputs).any(axis=1)
+    complete = [k for k in range(len(section.target_outputs)) if not np.isnan(outputs[:, k]).any()]
+    if complete:
+        problem = problem_for_salib(names_vars, [bounds for _, bounds, _ in variables])
+        indices = analyze_results(problem, section.method, samples.values, outputs[:, complete],
+                                  [section.target_outputs[k] for k in complete])
+        indices_path = os.path.join(config.project, 'sensitivity_indices.csv')
+        indices.to_csv(indices_path, index=False)
+        print(f"writing the {section.method} sensitivity indices to {indices_path}")
+    if failed.any():
+        raise RuntimeError(f"{failed.sum()} of {len(failed)} samples failed (samples "
+                           f"{', '.join(str(n + 1) for n in np.flatnonzero(failed))}), the sensitivity indices of "
+                           f"the target outputs they are missing could not be computed. The outputs of the other "
+                           f"samples are in {results_path}")
+
+
+if __name__ == '__main__':
+    main(cea.config.Configuration())
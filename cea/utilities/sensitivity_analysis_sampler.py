@@ -1,12 +1,12 @@
 """
-Sampling CEA inputs for sensitivity analysis using Sobol Method
+Sampling CEA inputs for sensitivity analysis using Sobol Method (or Morris Method)
 """
 
 import os
 import pandas as pd
 import cea.config
 import cea.inputlocator
-from SALib.sample import sobol
+from SALib.sample import morris, sobol
 
 __author__ = "Zhongming Shi"
 __copyright__ = "Copyright 2023, Architecture and Building Systems - ETH Zurich"
@@ -40,6 +40,50 @@ def problem_for_salib(names_vars, bounds_vars):
     return problem
 
 
+def selected_variables(config):
+    """
+    The variables of the sensitivity analysis that are switched on in the configuration.
+
+    :param config: the configuration object to use
+    :type config: cea.config.Configuration
+    :return: (name, [lower bound, upper bound], input) of each variable, where input is the input column the variable
+        is applied to by the sensitivity-analysis-executor (an empty string if not set)
+    :rtype: list[tuple]
+    """
+    section = config.sensitivity_analysis_tools
+    variables = []
+    for i in range(1, 6):
+        if not getattr(section, f'having_variable_{i}'):
+            continue
+        bounds = [getattr(section, f'variable_{i}_lower_bound'), getattr(section, f'variable_{i}_upper_bound')]
+        if any(bound is None for bound in bounds):
+            raise ValueError("missing upper and/or lower bounds for variable {}".format(i))
+        variables.append((f'var_{i}', bounds, getattr(section, f'variable_{i}_input')))
+    return variables
+
+
+def sample(problem, sample_n, method='sobol'):
+    """
+    Generate the samples of a problem.
+
+    :param problem: problem for SALib (see ``problem_for_salib``)
+    :param sample_n: the number of samples (Sobol) or trajectories (Morris) N
+    :param method: 'sobol' for N*(D+2) Saltelli samples, 'morris' for N*(D+1) samples of Morris trajectories,
+        where D is the number of variables
+    :return: the samples, one row per sample and one column per variable
+    :rtype: numpy.ndarray
+    """
+    if method == 'sobol':
+        return sobol.sample(problem, sample_n, calc_second_order=False)
+    elif method == 'morris':
+        return morris.sample(problem, sample_n)
+    raise ValueError(f"Unknown sensitivity analysis method: {method}")
+
+
+def get_sampled_variables_path(config):
+    return os.path.join(config.project, 'sampled_variables.csv')
+
+
 # Write the results to disk
 def write_results(param_values, names_vars, output_path):
     # Convert numpy array to DataFrame and write to disk
@@ -47,10 +91,7 @@ def write_results(param_values, names_vars, output_path):
     sample.to_csv(output_path)
 
 
-def create_inputs_directory(config, sample_n, n_variable):
-
-    # total number of scenarios
-    n_scenario = sample_n * (2 * n_variable + 2)
+def create_inputs_directory(config, n_scenario):
 
     # create directory for the minimum CEA inputs
     for n in range(1, n_scenario+1):
@@ -65,68 +106,32 @@ def create_inputs_directory(config, sample_n, n_variable):
 
 def main(config: cea.config.Configuration):
 
-    output_path = config.project
-
-    names_vars = ['var_1', 'var_2', 'var_3', 'var_4', 'var_5']
-
-    var_1_l = config.sensitivity_analysis_tools.variable_1_lower_bound
-    var_1_u = config.sensitivity_analysis_tools.variable_1_upper_bound
-    var_2_l = config.sensitivity_analysis_tools.variable_2_lower_bound
-    var_2_u = config.sensitivity_analysis_tools.variable_2_upper_bound
-    var_3_l = config.sensitivity_analysis_tools.variable_3_lower_bound
-    var_3_u = config.sensitivity_analysis_tools.variable_3_upper_bound
-    var_4_l = config.sensitivity_analysis_tools.variable_4_lower_bound
-    var_4_u = config.sensitivity_analysis_tools.variable_4_upper_bound
-    var_5_l = config.sensitivity_analysis_tools.variable_5_lower_bound
-    var_5_u = config.sensitivity_analysis_tools.variable_5_upper_bound
-
-    has_var_1 = config.sensitivity_analysis_tools.having_variable_1
-    has_var_2 = config.sensitivity_analysis_tools.having_variable_2
-    has_var_3 = config.sensitivity_analysis_tools.having_variable_3
-    has_var_4 = config.sensitivity_analysis_tools.having_variable_4
-    has_var_5 = config.sensitivity_analysis_tools.having_variable_5
-    var_boolean = [has_var_1, has_var_2, has_var_3, has_var_4, has_var_5]
+    variables = selected_variables(config)
+    names_vars = [name for name, _, _ in variables]
+    bounds_vars = [bounds for _, bounds, _ in variables]
+    n_variable = len(names_vars)
 
     sample_n = config.sensitivity_analysis_tools.n
+    method = config.sensitivity_analysis_tools.method
 
     create_directory = config.sensitivity_analysis_tools.create_scenario_directory
 
-    bounds_vars = [[var_1_l, var_1_u],
-                   [var_2_l, var_2_u],
-                   [var_3_l, var_3_u],
-                   [var_4_l, var_4_u],
-                   [var_5_l, var_5_u]
-                   ]
-
-    # Clean the lists based on the boolean toggle for each variable
-    names_vars = [i for (i, v) in zip(names_vars, var_boolean) if v]
-    bounds_vars = [i for (i, v) in zip(bounds_vars, var_boolean) if v]
-
-    n_variable = len(names_vars)
-
-    # Check if any of the bounds is missing
-    nan_idx = next((i for i, v in enumerate(bounds_vars) if sum(v) != sum(v)), -1)
-    if not nan_idx:
-        raise ValueError("missing upper and/or lower bounds for variable {}".format(nan_idx))
-
     # Construct the Problem for SALib
     problem = problem_for_salib(names_vars, bounds_vars)
 
     # Generate samples
-    print("sampling {n} variables for sobol' method SA".format(n=n_variable))
-    param_values = sobol.sample(problem, sample_n, calc_second_order=False)
-    # The Saltelli sampler generates samples n*(2D+2), where N is the argument we supplied
-    # and D is the number of model inputs.
+    print("sampling {n} variables for {method} method SA".format(n=n_variable, method=method))
+    param_values = sample(problem, sample_n, method)
 
     # Write the results to disk
-    csv_path = os.path.join(output_path, 'sampled_variables.csv')
+    csv_path = get_sampled_variables_path(config)
     print("writing sampled variables to {output_path}".format(output_path=csv_path))
     write_results(param_values, names_vars, csv_path)
 
     # Create parallel CEA scenario inputs directories under current project
     if create_directory:
         print("creating parallel CEA scenario inputs directories under current project.")
-        create_inputs_directory(config, sample_n, n_variable)
+        create_inputs_directory(config, len(param_values))
 
 
 if __name__ == '__main__':
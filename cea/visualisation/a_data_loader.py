@@ -1,6 +1,6 @@
 """
-InputProcessor - Determines the correct CSV file in the summary folder and triggers the summary feature to generate this file.
-Ensure this file exists or break the script.
+InputProcessor - Determines the correct summary table and triggers the summary feature to generate it.
+The summary tables are kept in memory (see ``collect_plot_frames``), not written to the plots folder.
 
 """
 import os
@@ -13,6 +13,9 @@ from cea.import_export.result_summary import (
     process_building_summary,
     exec_aggregate_time_period,
     slice_hourly_results_for_custom_time_period,
+    collect_plot_frames,
+    read_summary_csv,
+    write_summary_csv,
 )
 from cea.inputlocator import InputLocator
 from cea.utilities.standardize_coordinates import get_geographic_coordinate_system
@@ -284,7 +287,7 @@ def _export_final_energy_to_plots_folder(locator, whatif_names, buildings, bool_
             'final-energy', 'final-energy', 'annually', period_start, period_end
         )
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
-        df_out.to_csv(out_path, index=False, float_format='%.3f')
+        write_summary_csv(df_out, out_path, float_format='%.3f')
 
     elif bool_aggregate_by_building:
         # Building monthly/seasonal view — read per-building hourly files
@@ -333,7 +336,7 @@ def _export_final_energy_to_plots_folder(locator, whatif_names, buildings, bool_
             'final-energy', 'final-energy', time_period, period_start, period_end
         )
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
-        df_out.to_csv(out_path, index=False, float_format='%.3f')
+        write_summary_csv(df_out, out_path, float_format='%.3f')
 
     else:
         # District views
@@ -395,7 +398,7 @@ def _export_final_energy_to_plots_folder(locator, whatif_names, buildings, bool_
             locator.get_export_plots_folder(), 'final-energy', 'final-energy', time_period, period_start, period_end
         )
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
-        df_out.to_csv(out_path, index=False, float_format='%.3f')
+        write_summary_csv(df_out, out_path, float_format='%.3f')
 
 
 def _export_heat_rejection_to_plots_folder(locator, whatif_names, buildings, bool_aggregate_by_building, time_period, period_start, period_end, include_entities=None):
@@ -445,7 +448,7 @@ def _export_heat_rejection_to_plots_folder(locator, whatif_names, buildings, boo
             'heat-rejection', 'heat-rejection', 'annually', period_start, period_end
         )
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
-        df_out.to_csv(out_path, index=False, float_format='%.3f')
+        write_summary_csv(df_out, out_path, float_format='%.3f')
 
     else:
         # District time-series view — use first whatif_name
@@ -486,7 +489,7 @@ def _export_heat_rejection_to_plots_folder(locator, whatif_names, buildings, boo
             locator.get_export_plots_folder(), 'heat-rejection', 'heat-rejection', time_period, period_start, period_end
         )
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
-        df_result.to_csv(out_path, index=False, float_format='%.3f')
+        write_summary_csv(df_result, out_path, float_format='%.3f')
 
 
 def _collect_lifecycle_rows(locator, whatif_names, buildings, include_entities=None):
@@ -581,7 +584,7 @@ def _export_lifecycle_emissions_to_plots_folder(locator, whatif_names, buildings
         )
 
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
-    df_out.to_csv(out_path, index=False, float_format='%.3f')
+    write_summary_csv(df_out, out_path, float_format='%.3f')
 
 
 def _aggregate_op_emission_row(hdf, n=None):
@@ -773,7 +776,7 @@ def _export_operational_emissions_to_plots_folder(locator, whatif_names, buildin
             'operational-emissions', 'operational-emissions', 'annually', period_start, period_end
         )
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
-        df_out.to_csv(out_path, index=False, float_format='%.3f')
+        write_summary_csv(df_out, out_path, float_format='%.3f')
 
     else:
         # District time-series view — use first whatif_name
@@ -808,7 +811,7 @@ def _export_operational_emissions_to_plots_folder(locator, whatif_names, buildin
             locator.get_export_plots_folder(), 'operational-emissions', 'operational-emissions', time_period, period_start, period_end
         )
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
-        df_result.to_csv(out_path, index=False, float_format='%.3f')
+        write_summary_csv(df_result, out_path, float_format='%.3f')
 
 
 # Trigger the summary feature and point to the csv results file
@@ -1077,52 +1080,43 @@ def plot_input_processor(plot_config, plots_building_filter, scenario, plot_cea_
     # Get the summary results CSV path
     summary_results_csv_path = plot_instance_a.get_summary_results_csv_path()
 
-    # Delete the existing file if it exists to prevent loading stale cached data
-    if os.path.exists(summary_results_csv_path):
-        os.remove(summary_results_csv_path)
-
-    # Execute the summary process
-    plot_instance_a.execute_summary(bool_include_advanced_analytics)
-
-    # Load the summary results data
-    try:
-        df_summary_data = pd.read_csv(summary_results_csv_path)
-
-        # Validate data structure based on time period
-        # Hourly/daily data should have 'date' column
-        # Monthly/seasonal/annual/timeline data should have 'period' column
-        if plot_instance_a.time_period in ('hourly', 'daily'):
-            # For hourly/daily operational emissions, expect 'date' column
-            if 'period' in df_summary_data.columns and 'date' not in df_summary_data.columns:
-                error_msg = (
-                    f"Data structure error in summary file: {summary_results_csv_path}\n"
-                    f"Expected {plot_instance_a.time_period} data with 'date' column, but found 'period' column.\n"
-                    f"This suggests aggregated period data was incorrectly written to the {plot_instance_a.time_period} summary file.\n"
-                    f"Available columns: {df_summary_data.columns.tolist()}\n"
-                    "File will be deleted and regenerated."
-                )
-                print(error_msg)
-                # Delete the incorrect file
-                os.remove(summary_results_csv_path)
-                raise ValueError(error_msg)
-        elif plot_instance_a.time_period in ('monthly', 'seasonally', 'annually', 'timeline'):
-            # For monthly/seasonal/annual/timeline data, expect 'period' column
-            if 'date' in df_summary_data.columns and 'period' not in df_summary_data.columns:
-                error_msg = (
-                    f"Data structure error in summary file: {summary_results_csv_path}\n"
-                    f"Expected {plot_instance_a.time_period} data with 'period' column, but found 'date' column.\n"
-                    f"This suggests hourly/daily data was incorrectly written to the {plot_instance_a.time_period} summary file.\n"
-                    f"Available columns: {df_summary_data.columns.tolist()}\n"
-                    "File will be deleted and regenerated."
-                )
-                print(error_msg)
-                # Delete the incorrect file
-                os.remove(summary_results_csv_path)
-                raise ValueError(error_msg)
-
-    except Exception as e:
-        print(f"Error loading csv file: {e}")
-        df_summary_data = None
+    # Execute the summary process, keeping the summary tables in memory instead of writing them to the plots folder
+    with collect_plot_frames():
+        plot_instance_a.execute_summary(bool_include_advanced_analytics)
+
+        # Load the summary results data
+        try:
+            df_summary_data = read_summary_csv(summary_results_csv_path)
+
+            # Validate data structure based on time period
+            # Hourly/daily data should have 'date' column
+            # Monthly/seasonal/annual/timeline data should have 'period' column
+            if plot_instance_a.time_period in ('hourly', 'daily'):
+                # For hourly/daily operational emissions, expect 'date' column
+                if 'period' in df_summary_data.columns and 'date' not in df_summary_data.columns:
+                    error_msg = (
+                        f"Data structure error in summary data: {summary_results_csv_path}\n"
+                        f"Expected {plot_instance_a.time_period} data with 'date' column, but found 'period' column.\n"
+                        f"This suggests aggregated period data was incorrectly written to the {plot_instance_a.time_period} summary.\n"
+                        f"Available columns: {df_summary_data.columns.tolist()}"
+                    )
+                    print(error_msg)
+                    raise ValueError(error_msg)
+            elif plot_instance_a.time_period in ('monthly', 'seasonally', 'annually', 'timeline'):
+                # For monthly/seasonal/annual/timeline data, expect 'period' column
+                if 'date' in df_summary_data.columns and 'period' not in df_summary_data.columns:
+                    error_msg = (
+                        f"Data structure error in summary data: {summary_results_csv_path}\n"
+                        f"Expected {plot_instance_a.time_period} data with 'period' column, but found 'date' column.\n"
+                        f"This suggests hourly/daily data was incorrectly written to the {plot_instance_a.time_period} summary.\n"
+                        f"Available columns: {df_summary_data.columns.tolist()}"
+                    )
+                    print(error_msg)
+                    raise ValueError(error_msg)
+
+        except Exception as e:
+            print(f"Error loading summary data: {e}")
+            df_summary_data = None
 
     # Load the architecture data
     try:
@@ -9,6 +9,7 @@ from cea.visualisation.format.plot_colours import COLOURS_TO_RGB, get_column_col
 from cea.visualisation.b_data_processor import x_to_plot_building
 from cea.import_export.result_summary import month_names, season_names
 from math import ceil
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
@@ -22,6 +23,9 @@ __maintainer__ = "Reynold Mok"
 __email__ = "cea@arch.ethz.ch"
 __status__ = "Production"
 
+# Most bars of hourly/daily results shown in a figure (over all facets), more are downsampled
+MAX_TIME_SERIES_POINTS = 2000
+
 
 def get_display_name_for_column(column_name, y_metric_to_plot, final_energy_carriers=None):
     """
@@ -628,6 +632,9 @@ def plot_faceted_bars(
 
     month_order = {month: i for i, month in enumerate(month_names)}
     is_faceted = facet_col is not None and facet_col in df.columns
+    # hourly/daily results are downsampled so the figure (and its HTML) stays light
+    bool_time_series = len(df) > 0 and is_time_series(df[x_col])
+    bool_stacked = barmode in ('stack', 'relative', 'stack_percentage')
 
     if is_faceted:
         raw_facets = df[facet_col].unique()
@@ -706,6 +713,10 @@ def plot_faceted_bars(
                 # Building names: preserve sort order from sort_df_by_sorting_key
                 pass
 
+            if bool_time_series:
+                facet_df = downsample_min_max(facet_df, value_columns, max(1, MAX_TIME_SERIES_POINTS // num_facets),
+                                              stacked=bool_stacked)
+
             # Enforce pre-sorted x-axis order on the subplot
             x_order = list(facet_df[x_col].unique())
             subplot_index = (row - 1) * cols + col
@@ -795,8 +806,12 @@ def plot_faceted_bars(
         # No faceting
         fig = go.Figure()
 
+        plot_df = df
+        if bool_time_series:
+            plot_df = downsample_min_max(df, value_columns, MAX_TIME_SERIES_POINTS, stacked=bool_stacked)
+
         # Preserve pre-sorted x-axis order (e.g. from sort_df_by_sorting_key)
-        x_order = list(df[x_col].unique())
+        x_order = list(plot_df[x_col].unique())
 
         if barmode == 'stack' or barmode == 'relative' or barmode == 'stack_percentage':
             # For stacked mode with positive and negative values:
@@ -808,13 +823,13 @@ def plot_faceted_bars(
                 bar_color = COLOURS_TO_RGB.get(color_key, "rgb(127,128,134)")
 
                 bar_params = {
-                    'x': df[x_col],
-                    'y': df[val_col],
+                    'x': plot_df[x_col],
+                    'y': plot_df[val_col],
                     'name': heading,
                     'legendgroup': heading,
                     'showlegend': True,
                     'marker': dict(color=bar_color, line=dict(width=0)),
-                    'width': min(0.25, max(0.1, 200/max(1, len(df)))),
+                    'width': min(0.25, max(0.1, 200/max(1, len(plot_df)))),
                 }
 
                 fig.add_trace(go.Bar(**bar_params))
@@ -826,8 +841,8 @@ def plot_faceted_bars(
                 bar_color = COLOURS_TO_RGB.get(color_key, "rgb(127,128,134)")
 
                 bar_params = {
-                    'x': df[x_col],
-                    'y': df[val_col],
+                    'x': plot_df[x_col],
+                    'y': plot_df[val_col],
                     'name': heading,
                     'legendgroup': heading,
                     'showlegend': True,
@@ -892,6 +907,49 @@ def plot_faceted_bars(
     return fig
 
 
+def is_time_series(x_values):
+    """True if the x-axis labels are hours or days of the year (e.g. H_0, D_0, hour_0, day_0)."""
+    return bool(x_values.astype(str).str.match(r'^(H|D|hour|day)_\d').all())
+
+
+def downsample_min_max(df, value_columns, max_points, stacked=False):
+    """
+    Downsample the rows of a time series to at most about ``max_points`` rows, keeping its peaks.
+
+    The rows are split into consecutive buckets and, in each bucket, the rows with the minimum and maximum of each
+    value column are kept (of the positive and negative stack totals if ``stacked``), so the same rows are kept for
+    all the traces of a figure. The first and last rows are always kept, the order of the rows is unchanged.
+
+    :param df: the rows to plot, in the order they are plotted.
+    :param value_columns: the columns plotted as traces.
+    :param max_points: the number of rows from which on the time series is downsampled.
+    :param stacked: True if the traces are stacked.
+    """
+    n = len(df)
+    if n <= max_points or not value_columns:
+        return df
+
+    values = np.nan_to_num(df[value_columns].to_numpy(dtype=float))
+    if stacked:
+        keys = [np.clip(values, 0, None).sum(axis=1), np.clip(values, None, 0).sum(axis=1)]
+    else:
+        keys = list(values.T)
+
+    n_buckets = max(1, max_points // (2 * len(keys)))
+    bucket = np.minimum(np.arange(n) * n_buckets // n, n_buckets - 1)
+    starts = np.flatnonzero(np.diff(bucket, prepend=-1))
+    ends = np.append(starts[1:], n) - 1
+
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, n - 1]] = True
+    for key in keys:
+        # sorted by bucket, then by value: the first row of a bucket is its minimum, the last its maximum
+        order = np.lexsort((key, bucket))
+        keep[order[starts]] = True
+        keep[order[ends]] = True
+    return df[keep]
+
+
 def parse_plot_type(plot_type_str):
     """
     Split a plot_type string like 'bar_plot_stack' into ('bar_plot', 'stack').
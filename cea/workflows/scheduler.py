@@ -0,0 +1,146 @@
+"""
+Dependency-aware scheduling of workflow steps.
+
+The steps of a workflow (and the commands of a batch process) are run in order of their dependencies instead of
+strictly one after the other. The dependencies are derived from the ``created_by`` / ``used_by`` declarations of the
+locator methods in ``schemas.yml``: a step depends on an earlier step if it reads a file the earlier step writes, if
+it writes a file the earlier step reads, or if both write the same file. Scripts that ``schemas.yml`` does not know
+the inputs (or outputs) of are ordered after (or before) every other step, so that undeclared files never race.
+
+Independent steps - e.g. photovoltaic, solar collectors, PVT, shallow geothermal, water body and sewage potentials
+once radiation and demand are done - then run concurrently, sharing the CPU budget of the configuration
+(``config.get_number_of_processes()``) between them.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import cea.schemas
+import cea.scripts
+
+__author__ = "Daren Thomas"
+__copyright__ = "Copyright 2019, Architecture and Building Systems - ETH Zurich"
+__credits__ = ["Daren Thomas"]
+__license__ = "MIT"
+__version__ = "0.1"
+__maintainer__ = "Daren Thomas"
+__email__ = "cea@arch.ethz.ch"
+__status__ = "Production"
+
+# seconds to wait between polls of the running steps (when the caller does not wait itself, e.g. on an output queue)
+POLL_INTERVAL = 0.1
+
+# a started step: returns None while it is running, and its exit code (0 = success) when it is done
+StepHandle = Callable[[], Optional[int]]
+
+
+def script_io(script: str, plugins: Optional[List] = None) -> Tuple[Optional[Set[str]], Optional[Set[str]]]:
+    """
+    The locator methods a script reads and writes according to ``schemas.yml``.
+
+    :param script: the name of the script (e.g. ``photovoltaic-thermal``).
+    :param plugins: the plugins to read the schemas for (use ``config.plugins``).
+    :return: ``(inputs, outputs)`` - either is None if ``schemas.yml`` does not declare any for the script.
+    """
+    name = script.replace("-", "_")
+    inputs: Set[str] = set()
+    outputs: Set[str] = set()
+    for locator_method, schema in cea.schemas.schemas(plugins).items():
+        if name in (schema.get("used_by") or []):
+            inputs.add(locator_method)
+        if name in (schema.get("created_by") or []):
+            outputs.add(locator_method)
+    return inputs or None, outputs or None
+
+
+def step_dependencies(scripts: Sequence[str], plugins: Optional[List] = None) -> Dict[int, Set[int]]:
+    """
+    The earlier steps each step of a workflow depends on.
+
+    :param scripts: the script of each step, in workflow order.
+    :param plugins: the plugins to read the schemas for (use ``config.plugins``).
+    :return: the indices of the steps each step (by index) has to wait for.
+    :raises cea.ScriptNotFoundException: if a script does not exist, before any step is started.
+    """
+    for script in set(scripts):
+        cea.scripts.by_name(script, plugins=plugins)
+    io = {script: script_io(script, plugins) for script in set(scripts)}
+    dependencies: Dict[int, Set[int]] = {}
+    for j, script_j in enumerate(scripts):
+        inputs_j, outputs_j = io[script_j]
+        dependencies[j] = set()
+        for i in range(j):
+            inputs_i, outputs_i = io[scripts[i]]
+            if inputs_j is None or outputs_i is None:
+                # unknown inputs of the later step, or unknown outputs of the earlier step
+                dependencies[j].add(i)
+            elif outputs_i & inputs_j or outputs_i & (outputs_j or set()) or (inputs_i or set()) & (outputs_j or set()):
+                dependencies[j].add(i)
+    return dependencies
+
+
+def run_graph(dependencies: Dict[int, Set[int]],
+              start_step: Callable[[int, int], StepHandle],
+              cpu_budget: int,
+              completed: Iterable[int] = (),
+              on_step_done: Optional[Callable[[int], None]] = None,
+              wait: Optional[Callable[[], None]] = None) -> List[int]:
+    """
+    Run the steps of a dependency graph, starting each step as soon as the steps it depends on are done.
+
+    A started step is given a share of the CPU budget (at least one process): the free processes are split between
+    the steps that are ready to run, so a lone step uses the whole budget and independent steps run side by side.
+    When a step fails, no further steps are started; the running steps are waited for and a ``RuntimeError`` is
+    raised.
+
+    :param dependencies: the steps each step depends on (see :py:func:`step_dependencies`).
+    :param start_step: ``start_step(step, number_of_processes)`` starts a step and returns its handle.
+    :param cpu_budget: the total number of processes the running steps may use.
+    :param completed: steps that are already done (e.g. when resuming a workflow).
+    :param on_step_done: called with each step that completes successfully.
+    :param wait: called while steps are running (e.g. to stream their output), defaults to a short sleep.
+    :return: the steps in the order in which they were completed.
+    """
+    done = set(completed)
+    pending = [step for step in sorted(dependencies) if step not in done]
+    running: Dict[int, Tuple[StepHandle, int]] = {}
+    free = max(1, cpu_budget)
+    finished: List[int] = []
+    failed: List[int] = []
+
+    while (pending and not failed) or running:
+        if not failed:
+            ready = [step for step in pending if dependencies[step] <= done]
+            while ready and free > 0:
+                step = ready.pop(0)
+                share = max(1, free // (len(ready) + 1))
+                pending.remove(step)
+                running[step] = (start_step(step, share), share)
+                free -= share
+            if not running:
+                raise ValueError(f"Circular dependencies between the steps {pending}")
+
+        if wait is not None:
+            wait()
+        else:
+            time.sleep(POLL_INTERVAL)
+
+        for step, (handle, share) in list(running.items()):
+            exit_code = handle()
+            if exit_code is None:
+                continue
+            del running[step]
+            free += share
+            if exit_code == 0:
+                done.add(step)
+                finished.append(step)
+                if on_step_done is not None:
+                    on_step_done(step)
+            else:
+                failed.append(step)
+
+    if failed:
+        raise RuntimeError(f"Workflow step(s) {failed} failed")
+    return finished
@@ -6,12 +6,17 @@ Run a workflow.yml file - this is like a cea-aware "batch" file for running mult
 import os
 import sys
 import datetime
+import multiprocessing
+import pickle
 import tempfile
+import traceback
 import cea.config
 import cea.inputlocator
 import cea.api
 import cea.scripts
 import yaml
+from cea.utilities.workerstream import QueueWorkerStream, stream_from_queue
+from cea.workflows.scheduler import run_graph, step_dependencies
 
 __author__ = "Daren Thomas"
 __copyright__ = "Copyright 2019, Architecture and Building Systems - ETH Zurich"
@@ -67,26 +72,30 @@ def main(config: cea.config.Configuration):
     set_up_environment_variables(config)
 
     resume_dict = read_resume_info(resume_yml, workflow_yml)
-    resume_step = resume_dict[workflow_yml]
+    completed = completed_steps(resume_dict[workflow_yml]) if resume_mode_on else []
 
     if not os.path.exists(workflow_yml):
         raise cea.ConfigError("Workflow YAML file not found: {workflow}".format(workflow=workflow_yml))
 
     # Fail fast, before running any step, if the resume file can't be written.
     try:
-        write_resume_info(resume_yml, resume_dict, workflow_yml, resume_step)
+        write_resume_info(resume_yml, resume_dict, workflow_yml, completed)
     except IOError as e:
         raise cea.ConfigError(f"Could not write resume file: {resume_yml} ({e})")
 
     with open(workflow_yml, 'r') as workflow_fp:
         workflow = yaml.safe_load(workflow_fp)
 
+    if config.workflow.parallel_steps and not trace_input and not multiprocessing.current_process().daemon:
+        # (daemonic processes - e.g. the workers of a pool - are not allowed to start processes of their own)
+        run_steps_in_parallel(config, workflow, completed, resume_yml, resume_dict, workflow_yml)
+        return
+
     for i, step in enumerate(workflow):
         if "script" in step:
-            if resume_mode_on and i <= resume_step:
+            if i in completed:
                 # skip steps already completed while resuming
                 print("Skipping workflow step {i}: script={script}".format(i=i, script=step["script"]))
-                write_resume_info(resume_yml, resume_dict, workflow_yml, i)
                 continue
             try:
                 do_script_step(config, i, step, trace_input)
@@ -97,12 +106,100 @@ def main(config: cea.config.Configuration):
             config = do_config_step(config, step)
         else:
             raise ValueError("Invalid step configuration: {i} - {step}".format(i=i, step=step))
-        write_resume_info(resume_yml, resume_dict, workflow_yml, i)
+        completed.append(i)
+        write_resume_info(resume_yml, resume_dict, workflow_yml, completed)
+
+
+def run_steps_in_parallel(config, workflow, completed, resume_yml, resume_dict, workflow_yml):
+    """
+    Run the script steps of a workflow as a dependency graph (see :py:mod:`cea.workflows.scheduler`): each step runs
+    in its own process as soon as the steps it depends on are done, independent steps share the CPU budget of the
+    configuration.
+
+    The config steps are applied up front, in order - each script step runs with a snapshot of the configuration
+    as it would be when the workflow is run step by step.
+    """
+    script_steps = {}  # step index -> (config snapshot, step)
+    for i, step in enumerate(workflow):
+        if "script" in step:
+            script_steps[i] = (pickle.loads(pickle.dumps(config)), step)
+            # the parameters of a script step stay set for the following steps (see ``cea.api``)
+            apply_step_parameters(config, step)
+        elif "config" in step:
+            config = do_config_step(config, step)
+        else:
+            raise ValueError("Invalid step configuration: {i} - {step}".format(i=i, step=step))
+
+    indices = sorted(script_steps)
+    for i in indices:
+        if i in completed:
+            print("Skipping workflow step {i}: script={script}".format(i=i, script=script_steps[i][1]["script"]))
+    dependencies = step_dependencies([script_steps[i][1]["script"] for i in indices], plugins=config.plugins)
+    dependencies = {indices[j]: {indices[k] for k in deps} for j, deps in dependencies.items()}
+
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+
+    def start_step(i, number_of_processes):
+        step_config, step = script_steps[i]
+        step_config.number_of_cpus_to_keep_free = max(0, multiprocessing.cpu_count() - number_of_processes)
+        process = ctx.Process(target=_run_step_process, args=(step_config, i, step, queue))
+        process.start()
+
+        def handle():
+            if process.is_alive():
+                return None
+            if process.exitcode != 0:
+                print("Error in workflow step {i}: script={script}".format(i=i, script=step["script"]))
+            return process.exitcode
 
+        return handle
 
-def write_resume_info(resume_yml, resume_dict, workflow_yml, i):
+    def on_step_done(i):
+        completed.append(i)
+        write_resume_info(resume_yml, resume_dict, workflow_yml, completed)
+
+    try:
+        run_graph(dependencies, start_step, config.get_number_of_processes(), completed=completed,
+                  on_step_done=on_step_done, wait=lambda: stream_from_queue(queue))
+    finally:
+        while not queue.empty():
+            stream_from_queue(queue)
+
+    # config steps don't need to be repeated when resuming either
+    completed.extend(i for i in range(len(workflow)) if i not in script_steps and i not in completed)
+    write_resume_info(resume_yml, resume_dict, workflow_yml, completed)
+
+
+def _run_step_process(config, i, step, queue):
+    """Run a single script step in a worker process, streaming its output to the parent process"""
+    sys.stdout = QueueWorkerStream("stdout", queue)
+    sys.stderr = QueueWorkerStream("stderr", queue)
+    exit_code = 0
+    try:
+        do_script_step(config, i, step, trace_input=False)
+    except Exception:
+        traceback.print_exc()
+        exit_code = 1
+    # a failed process does not wait for the queue to send its output, so make sure the traceback gets through
+    queue.close()
+    queue.join_thread()
+    sys.exit(exit_code)
+
+
+def completed_steps(resume_info):
+    """
+    The indices of the steps completed in a previous run. Older resume files store the index of the last completed
+    step instead of a list (the workflow was always run step by step).
+    """
+    if isinstance(resume_info, int):
+        return list(range(resume_info + 1))
+    return list(resume_info or [])
+
+
+def write_resume_info(resume_yml, resume_dict, workflow_yml, completed):
     # write out information for resuming
-    resume_dict[workflow_yml] = i
+    resume_dict[workflow_yml] = sorted(set(completed))
     with open(resume_yml, 'w') as resume_fp:
         yaml.dump(resume_dict, resume_fp, indent=4)
 
@@ -112,12 +209,12 @@ def read_resume_info(resume_yml, workflow_yml):
         with open(resume_yml, 'r') as resume_fp:
             resume_dict = yaml.safe_load(resume_fp)
             if not resume_dict:
-                resume_dict = {workflow_yml: 0}
+                resume_dict = {workflow_yml: []}
     except IOError:
         # no resume file found?
-        resume_dict = {workflow_yml: 0}
+        resume_dict = {workflow_yml: []}
     if workflow_yml not in resume_dict:
-        resume_dict[workflow_yml] = 0
+        resume_dict[workflow_yml] = []
     return resume_dict
 
 
@@ -168,6 +265,16 @@ def set_parameter(config, parameter, value):
         parameter.set(parameter.decode(expanded_value))
 
 
+def apply_step_parameters(config, step):
+    """Set the parameters of a script step on the config, the same way running the script through ``cea.api`` does"""
+    script = cea.scripts.by_name(step["script"], plugins=config.plugins)
+    py_parameters = {k.replace("-", "_"): v for k, v in step.get("parameters", {}).items()}
+    with config.ignore_restrictions():
+        for section, parameter in config.matching_parameters(script.parameters):
+            if parameter.py_name in py_parameters:
+                parameter.set(py_parameters[parameter.py_name])
+
+
 def do_script_step(config, i, step, trace_input):
     """Run a script based on the step's "script" and "parameters" (optional) keys."""
     script = cea.scripts.by_name(step["script"], plugins=config.plugins)